@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""按接口分组的准入控制。
+
+排盘接口受CPU限制，AI接口要等外部服务，两组分别限制同时处理的请求数，
+AI服务变慢时不会占满所有线程，排盘接口的延迟不受影响。
+超过并发数的请求进入有上限的等待队列，等待超过期限或队列已满时立即拒绝(Rejected)，
+调用方返回429和Retry-After。Retry-After按最近的平均处理时间和排队人数估计。
+后台任务(命运轨迹的预生成)用try_acquire，只在有空闲名额时占用，不排队，计入同一组的并发数。
+
+环境变量(GROUP为CHART或AI):
+    BAZI_<GROUP>_CONCURRENCY  同时处理的请求数，0为不限制，默认排盘为CPU数的2倍，AI为16
+    BAZI_<GROUP>_QUEUE        等待队列的长度，默认排盘为16，AI为32
+    BAZI_<GROUP>_WAIT         在队列中最多等待的秒数，默认排盘为5，AI为10
+"""
+
+import collections
+import math
+import os
+import threading
+import time
+
+
+class Rejected(Exception):
+    """请求未被接受，retry_after为建议的重试秒数"""
+
+    def __init__(self, message, retry_after):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class Limiter:
+    """一组接口的并发限制和等待队列"""
+
+    def __init__(self, name, limit, queue_size=0, timeout=0):
+        self.name = name
+        self.limit = limit
+        self.queue_size = queue_size
+        self.timeout = timeout
+        self.active = 0
+        self.waiting = 0
+        self.max_waiting = 0
+        # 最近请求的平均处理秒数，用于估计Retry-After
+        self.service_time = 1.0
+        self.condition = threading.Condition()
+        self.stats = collections.Counter()
+
+    def retry_after(self):
+        return max(1, math.ceil(self.service_time * (self.waiting + 1) / self.limit))
+
+    def acquire(self):
+        """取得一个处理名额，返回开始的时间，处理完后要调用release；不能取得时抛出Rejected"""
+        with self.condition:
+            if self.active >= self.limit or self.waiting:
+                if self.waiting >= self.queue_size:
+                    self.stats['rejected'] += 1
+                    raise Rejected("请求过多，等待队列已满", self.retry_after())
+                self.waiting += 1
+                self.max_waiting = max(self.max_waiting, self.waiting)
+                self.stats['queued'] += 1
+                try:
+                    admitted = self.condition.wait_for(lambda: self.active < self.limit, self.timeout)
+                finally:
+                    self.waiting -= 1
+                if not admitted:
+                    self.stats['timeouts'] += 1
+                    raise Rejected("请求过多，等待超时", self.retry_after())
+            self.active += 1
+            self.stats['admitted'] += 1
+            return time.monotonic()
+
+    def try_acquire(self):
+        """不等待地取得一个处理名额，用于后台任务：没有空闲名额或已有请求在排队时返回None"""
+        with self.condition:
+            if self.active >= self.limit or self.waiting:
+                return None
+            self.active += 1
+            self.stats['background'] += 1
+            return time.monotonic()
+
+    def release(self, started):
+        with self.condition:
+            self.active -= 1
+            self.service_time += (time.monotonic() - started - self.service_time) * 0.2
+            self.condition.notify()
+
+    def info(self):
+        with self.condition:
+            result = {'limit': self.limit, 'queue_size': self.queue_size, 'timeout': self.timeout,
+                      'active': self.active, 'waiting': self.waiting, 'max_waiting': self.max_waiting,
+                      'service_time': round(self.service_time, 3)}
+            result.update({name: self.stats[name] for name in ('admitted', 'queued', 'rejected', 'timeouts', 'background')})
+        return result
+
+
+class ReleasingBody:
+    """流式响应的内容，发送完或连接被关闭时调用一次release"""
+
+    def __init__(self, body, release):
+        self.body = body
+        self.release = release
+        self.released = False
+
+    def __iter__(self):
+        try:
+            yield from self.body
+        finally:
+            self.close()
+
+    def close(self):
+        if not self.released:
+            self.released = True
+            self.release()
+            if hasattr(self.body, 'close'):
+                self.body.close()
+
+
+def open_limiters():
+    """按环境变量创建各组的Limiter，返回{组名: Limiter}，并发数为0的组不限制"""
+    defaults = {'chart': (2 * (os.cpu_count() or 1), 16, 5), 'ai': (16, 32, 10)}
+    limiters = {}
+    for name, (limit, queue_size, timeout) in defaults.items():
+        prefix = "BAZI_{}_".format(name.upper())
+        limit = int(os.environ.get(prefix + "CONCURRENCY", limit))
+        if limit > 0:
+            limiters[name] = Limiter(name, limit, int(os.environ.get(prefix + "QUEUE", queue_size)),
+                                     float(os.environ.get(prefix + "WAIT", timeout)))
+    return limiters
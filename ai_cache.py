@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""AI解读的缓存。
+
+同一服务商、模型、请求地址、生成参数和提示词得到的解读只生成一次：键为这些内容的摘要，
+值为完整的解读文本，存放在ResultCache(内存LRU + SQLite)中。
+同一个键正在生成时，后来的请求不再调用AI服务，而是跟随正在进行的生成(single flight)，
+流式请求可以边生成边收到。缓存命中时，流式接口按配置一次或分段重放。
+
+环境变量:
+    BAZI_AI_CACHE_SIZE    内存层条数，默认256
+    BAZI_AI_CACHE_DB      SQLite文件，默认为本目录下的ai_cache.db，空字符串为不用磁盘层
+    BAZI_AI_CACHE_TTL     解读的有效秒数，默认0为不过期
+    BAZI_AI_REPLAY_CHUNK  重放时每段的字数，默认0为一次发送全部
+    BAZI_AI_REPLAY_DELAY  重放时两段之间的秒数，默认0.02
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+
+from result_cache import BASE_DIR, ResultCache
+
+DEFAULT_PATH = os.path.join(BASE_DIR, "ai_cache.db")
+
+
+def content_key(*parts):
+    """内容的摘要，parts需要可json序列化"""
+    data = json.dumps(parts, ensure_ascii=False, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(data.encode('utf-8')).hexdigest()
+
+
+class Flight:
+    """一次正在进行的生成，记录已生成的片段"""
+
+    def __init__(self):
+        self.pieces = []
+        self.done = False
+        self.error = None
+        self.condition = threading.Condition()
+
+    def add(self, piece):
+        with self.condition:
+            self.pieces.append(piece)
+            self.condition.notify_all()
+
+    def finish(self, error=None):
+        with self.condition:
+            self.done = True
+            self.error = error
+            self.condition.notify_all()
+
+    def follow(self, timeout=None):
+        """生成已有的和之后的片段，直到生成结束；出错时看error"""
+        sent = 0
+        while True:
+            with self.condition:
+                if not self.condition.wait_for(lambda: self.done or len(self.pieces) > sent, timeout):
+                    raise TimeoutError("等待生成超时")
+                pieces = self.pieces[sent:]
+                done = self.done
+            sent += len(pieces)
+            yield from pieces
+            if done:
+                return
+
+    def wait(self, timeout=None):
+        """等待生成结束，返回(全文, 错误信息)"""
+        text = ''.join(self.follow(timeout))
+        return (None, self.error) if self.error else (text, None)
+
+
+class SingleFlight:
+    """同一个键同时只有一次生成"""
+
+    def __init__(self):
+        self.flights = {}
+        self.lock = threading.Lock()
+
+    def begin(self, key):
+        """返回(Flight, 是否由调用者生成)；由调用者生成时，结束后要调用end"""
+        with self.lock:
+            flight = self.flights.get(key)
+            if flight is not None:
+                return flight, False
+            flight = self.flights[key] = Flight()
+            return flight, True
+
+    def end(self, key, error=None):
+        with self.lock:
+            flight = self.flights.pop(key)
+        flight.finish(error)
+
+    def __len__(self):
+        return len(self.flights)
+
+
+def replay(text, chunk=0, delay=0.02):
+    """把缓存的全文分段生成，chunk为0时一次生成全部"""
+    if not chunk:
+        yield text
+        return
+    for start in range(0, len(text), chunk):
+        if start:
+            time.sleep(delay)
+        yield text[start:start + chunk]
+
+
+def open_ai_cache(version):
+    """按环境变量创建解读缓存，version为提示词的版本"""
+    return ResultCache(size=int(os.environ.get("BAZI_AI_CACHE_SIZE", 256)),
+                       path=os.environ.get("BAZI_AI_CACHE_DB", DEFAULT_PATH) or None,
+                       ttl=float(os.environ.get("BAZI_AI_CACHE_TTL", 0)),
+                       version="prompt-{}".format(version))
+
+
+def replay_options():
+    return dict(chunk=int(os.environ.get("BAZI_AI_REPLAY_CHUNK", 0)),
+                delay=float(os.environ.get("BAZI_AI_REPLAY_DELAY", 0.02)))
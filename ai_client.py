@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""调用AI服务的HTTP客户端。
+
+每个服务商一个requests.Session，连接池按主机保持长连接，解读请求不再每次重新建立TCP和TLS连接。
+连接超时和读取超时分开配置：连接超时短一些，读取超时要容纳模型生成的时间。
+
+环境变量:
+    BAZI_AI_CONNECT_TIMEOUT  连接超时秒数，默认10
+    BAZI_AI_READ_TIMEOUT     读取超时秒数，默认60
+    BAZI_AI_POOL_SIZE        每个主机保持的连接数，默认10
+"""
+
+import collections
+import os
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+class ProviderClient:
+    """按服务商分开的连接池"""
+
+    def __init__(self, connect_timeout=10, read_timeout=60, pool_size=10):
+        self.timeout = (connect_timeout, read_timeout)
+        self.pool_size = pool_size
+        self.sessions = {}
+        self.lock = threading.Lock()
+        self.stats = collections.Counter()
+
+    def session(self, provider):
+        """服务商的Session，第一次使用时创建"""
+        with self.lock:
+            session = self.sessions.get(provider)
+            if session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=4, pool_maxsize=self.pool_size, max_retries=0)
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
+                self.sessions[provider] = session
+            return session
+
+    def post(self, provider, url, stream=False, **kwargs):
+        """发送POST请求，返回requests.Response"""
+        kwargs.setdefault('timeout', self.timeout)
+        self.stats[provider] += 1
+        return self.session(provider).post(url, stream=stream, **kwargs)
+
+    def info(self):
+        return {'timeout': list(self.timeout), 'pool_size': self.pool_size, 'requests': dict(self.stats)}
+
+    def close(self):
+        with self.lock:
+            for session in self.sessions.values():
+                session.close()
+            self.sessions.clear()
+
+
+def open_client():
+    """按环境变量创建ProviderClient"""
+    return ProviderClient(connect_timeout=float(os.environ.get("BAZI_AI_CONNECT_TIMEOUT", 10)),
+                          read_timeout=float(os.environ.get("BAZI_AI_READ_TIMEOUT", 60)),
+                          pool_size=int(os.environ.get("BAZI_AI_POOL_SIZE", 10)))
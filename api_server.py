@@ -1,67 +1,271 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-from flask import Flask, request, jsonify, render_template, send_from_directory, Response
-import subprocess
-import os
+from flask import Flask, request, jsonify, render_template, Response, stream_with_context, make_response
+import functools
 import sys
-import requests
 import json
-from lunar_python import Solar, Lunar
-from datas import shengxiaos, zhi_atts, tiaohous, jinbuhuan, ges
-from ganzhi import gan5, zhi5, ten_deities
+import time
+from ganzhi import get_current_year
+from report import render_text, render_json, render_markdown, plain, parts as report_parts
+from chart_table import shared_chart_table
+from paipan import convert
+from bazi_struct import ShengxiaoAPI, chart_struct
+from result_cache import open_result_cache
+from workers import open_backend, imap_unordered, PoolBusy, JobTimeout
+from ai_client import open_client
+from ai_cache import open_ai_cache, replay_options, replay, content_key, SingleFlight
+from admission import open_limiters, Rejected, ReleasingBody
+from destiny_sessions import open_sessions, history_options, new_session, choose, rewind, set_story, story_prompt, \
+    summary_prompt, public_state, after_choice, SessionError
+from speculation import open_speculator
+from prompts import chart_summary, clip, estimate_tokens, interpretation_prompt, prompt_options
+from http_cache import open_delivery, content_etag
+from metrics import open_metrics
 
 app = Flask(__name__, template_folder='templates')
 
+# 四柱静态分析预计算表(python chart_table.py build生成)，与排盘的执行后端共用，不存在时现场计算
+chart_table = shared_chart_table()
+# /api/bazi、/api/complete的结果缓存，配置见result_cache.py
+result_cache = open_result_cache()
+# 排盘的执行后端，BAZI_BACKEND=pool时为常驻工作进程池，见workers.py
+backend = open_backend()
+# 调用AI服务的连接池，见ai_client.py
+ai_client = open_client()
+# AI解读提示词的版本，修改提示词时加1，磁盘上旧版本的解读缓存随之清除
+PROMPT_VERSION = 2
+# AI解读的缓存和正在进行的生成，见ai_cache.py
+ai_cache = open_ai_cache(PROMPT_VERSION)
+ai_flights = SingleFlight()
+# 排盘接口(chart)和AI接口(ai)分别限制并发，见admission.py
+limiters = open_limiters()
+# 命运轨迹游戏的服务端会话，见destiny_sessions.py
+destiny_sessions = open_sessions()
+# 命运轨迹下一轮故事的预生成，按会话存储的条数和有效期淘汰，占用AI接口的并发名额，见speculation.py
+speculator = open_speculator(destiny_sessions, limiters.get('ai'))
+# 响应的压缩、条件请求和静态文件的缓存头，见http_cache.py
+delivery = open_delivery()
+# 各阶段的耗时统计(/metrics)和Server-Timing头，见metrics.py
+metrics = open_metrics()
+
+
+def _rule_metrics():
+    """各工作进程(inline时为本进程)的规则统计按规则相加，只输出检查过的规则"""
+    totals = {}
+    for stats in backend.collect('rule_stats'):
+        for item in stats:
+            row = totals.setdefault((('rule', item['name']), ('set', item['set'])), [0, 0, 0.0])
+            row[0] += item['calls']
+            row[1] += item['hits']
+            row[2] += item['seconds']
+    totals = {labels: row for labels, row in totals.items() if row[0]}
+    return {'bazi_rule_checks_total': {labels: row[0] for labels, row in totals.items()},
+            'bazi_rule_hits_total': {labels: row[1] for labels, row in totals.items()},
+            'bazi_rule_seconds_total': {labels: row[2] for labels, row in totals.items()}}
+
+
+metrics.add_collector(_rule_metrics)
+
+
+def admitted(group):
+    """接口的准入控制：按组限制同时处理的请求数，等待队列已满或等待超时时返回429。
+    流式响应的名额在发送完或连接关闭后才释放"""
+    def decorator(view):
+        limiter = limiters.get(group)
+        if limiter is None:
+            return view
+
+        @functools.wraps(view)
+        def wrapper(*args, **kwargs):
+            try:
+                started = limiter.acquire()
+            except Rejected as e:
+                response = jsonify({"error": str(e), "retry_after": e.retry_after})
+                response.status_code = 429
+                response.headers['Retry-After'] = str(e.retry_after)
+                return response
+            try:
+                response = make_response(view(*args, **kwargs))
+            except BaseException:
+                limiter.release(started)
+                raise
+            if response.is_streamed:
+                response.response = ReleasingBody(response.response, lambda: limiter.release(started))
+            else:
+                limiter.release(started)
+            return response
+        return wrapper
+    return decorator
+
+
+def cacheable(view):
+    """结果只由请求参数决定的接口：成功的响应带按内容计算的强ETag，客户端每次重新验证，
+    If-None-Match相同时由after_request返回304"""
+    @functools.wraps(view)
+    def wrapper(*args, **kwargs):
+        response = make_response(view(*args, **kwargs))
+        if response.status_code == 200 and not response.is_streamed:
+            response.set_etag(content_etag(response.get_data()))
+            response.cache_control.no_cache = True
+        return response
+    return wrapper
+
+
+@app.before_request
+def begin_request():
+    metrics.begin()
+
+
+@app.after_request
+def end_request(response):
+    """请求数和处理时间；开启时加上Server-Timing头"""
+    endpoint = request.url_rule.rule if request.url_rule else 'unknown'
+    server_timing = metrics.end(endpoint, request.method, response.status_code)
+    if server_timing:
+        response.headers['Server-Timing'] = server_timing
+    return response
+
+
+@app.after_request
+def deliver(response):
+    """压缩、条件请求和静态文件的缓存头"""
+    return delivery.process(request, response, static=request.endpoint == 'static')
+
+
+def cached_result(key):
+    """查结果缓存，计入cache阶段的耗时和按种类的命中数"""
+    with metrics.span('cache'):
+        value = result_cache.get(key)
+    metrics.inc('bazi_cache_lookups_total', kind=key[0], result='miss' if value is None else 'hit')
+    return value
+
+
+def _request_data():
+    """请求参数：POST为JSON请求体，GET为查询参数(parts以逗号分隔)"""
+    if request.method == 'POST':
+        return request.get_json()
+    data = request.args.to_dict()
+    if data.get('parts'):
+        data['parts'] = data['parts'].split(',')
+    return data
+
 class AIAnalysisAPI:
+    # 各服务商未指定模型时使用的模型
+    default_models = {'openai': 'gpt-3.5-turbo', 'claude': 'claude-3-sonnet-20240229',
+                      'deepseek': 'deepseek-chat', 'custom': 'gpt-3.5-turbo'}
+    # 各服务商未指定地址时使用的地址，自定义服务必须指定
+    default_urls = {'openai': 'https://api.openai.com/v1/chat/completions',
+                    'claude': 'https://api.anthropic.com/v1/messages',
+                    'deepseek': 'https://api.deepseek.com/v1/chat/completions'}
+
+    @staticmethod
+    def interpretation_key(prompt, ai_config):
+        """AI解读的缓存键：服务商、模型、实际请求的地址、生成参数和提示词的摘要。
+        提示词由命盘输入、模板和摘要的长度限制生成，其中任何一项变化都会得到不同的键"""
+        provider = ai_config.get('provider')
+        model = ai_config.get('model') or AIAnalysisAPI.default_models.get(provider)
+        api_url = ai_config.get('api_url', AIAnalysisAPI.default_urls.get(provider))
+        options = [ai_config.get('max_tokens', 2000), ai_config.get('temperature', 0.7)]
+        if provider == 'custom':
+            options.append(ai_config.get('custom_params'))
+        return content_key(provider, model, api_url, options, content_key(prompt))
+
+    @staticmethod
+    def cached_interpretation(key, generate):
+        """取缓存的解读，没有时调用generate()生成；同一个键同时只生成一次。
+        返回(解读, 错误信息, 来源)，来源为hit(缓存)、shared(跟随其他请求的生成)或miss"""
+        content = ai_cache.get(key)
+        if content is not None:
+            return content, None, 'hit'
+        flight, leader = ai_flights.begin(key)
+        if not leader:
+            try:
+                content, error = flight.wait(ai_client.timeout[1])
+            except TimeoutError as e:
+                content, error = None, str(e)
+            return content, error, 'shared'
+        error = None
+        try:
+            result = generate()
+            error = result.get("error")
+            if not error:
+                content = result["content"]
+                ai_cache.put(key, content)
+                flight.add(content)
+        except Exception as e:
+            error = f"AI解读失败: {str(e)}"
+        finally:
+            ai_flights.end(key, error)
+        return content, error, 'miss'
+
+    @staticmethod
+    def chart_text(birth_info, bazi_analysis):
+        """提示词中的命盘摘要：按出生信息由结构化的分析结果生成(存入结果缓存)；
+        出生信息不完整或分析失败时，把客户端发来的分析文本截断到同样的长度"""
+        options = prompt_options()
+        try:
+            birth = (birth_info['date'], str(birth_info['time']), birth_info['gender'], birth_info['calendar_type'])
+            error = BaziAPI.validate_birth(*birth)
+        except (KeyError, TypeError, AttributeError):
+            error = True
+        if error:
+            return clip(bazi_analysis, options['max_chars'])
+
+        cache_key = ('prompt',) + BaziAPI.cache_key(*birth) + (options['max_chars'], options['rule_chars'])
+        text = cached_result(cache_key)
+        if text is None:
+            try:
+                converted = BaziAPI.convert_birth(birth[0], birth[1], birth[3])
+            except ValueError:
+                return clip(bazi_analysis, options['max_chars'])
+            result = BaziAPI.run_bazi_analysis(*birth, birth=converted)
+            if not result["success"]:
+                return clip(bazi_analysis, options['max_chars'])
+            with metrics.span('struct'):
+                struct = chart_struct(converted, birth[2], result["report"], chart_table)
+            with metrics.span('prompt'):
+                text = chart_summary(result["report"], struct, get_current_year(), **options)
+            result_cache.put(cache_key, text)
+        return text
+
+    @staticmethod
+    def build_prompt(birth_info, shengxiao_analysis, bazi_analysis):
+        """AI解读的提示词，返回(提示词, 估计的token数)"""
+        prompt = interpretation_prompt(birth_info, shengxiao_analysis,
+                                       AIAnalysisAPI.chart_text(birth_info, bazi_analysis))
+        return prompt, estimate_tokens(prompt)
+
     @staticmethod
     def get_ai_interpretation(birth_info, shengxiao_analysis, bazi_analysis, ai_config):
         """使用AI解读八字和生肖信息"""
         try:
-            # 构建AI解读的提示词
-            prompt = f"""你是一位专业的命理学专家，请基于以下传统八字和生肖分析结果，为用户提供全面、专业且易懂的命理解读。
-
-## 基本信息：
-- 出生日期：{birth_info['date']} ({birth_info['calendar_type']})
-- 出生时辰：{birth_info['time']}点
-- 性别：{birth_info['gender']}
-- 生肖：{birth_info['shengxiao']}
-
-## 生肖分析结果：
-年支：{shengxiao_analysis['year_zhi']}
-
-相合生肖：
-- 三合：{', '.join(shengxiao_analysis['compatible']['sanhe']) if shengxiao_analysis['compatible']['sanhe'] else '无'}
-- 六合：{', '.join(shengxiao_analysis['compatible']['liuhe']) if shengxiao_analysis['compatible']['liuhe'] else '无'}
-- 三会：{', '.join(shengxiao_analysis['compatible']['sanhui']) if shengxiao_analysis['compatible']['sanhui'] else '无'}
-
-不合生肖：
-- 相冲：{', '.join(shengxiao_analysis['incompatible']['chong']) if shengxiao_analysis['incompatible']['chong'] else '无'}
-- 相刑：{', '.join(shengxiao_analysis['incompatible']['xing']) if shengxiao_analysis['incompatible']['xing'] else '无'}
-- 相害：{', '.join(shengxiao_analysis['incompatible']['hai']) if shengxiao_analysis['incompatible']['hai'] else '无'}
-- 相破：{', '.join(shengxiao_analysis['incompatible']['po']) if shengxiao_analysis['incompatible']['po'] else '无'}
-
-## 八字排盘分析：
-{bazi_analysis}
-
-请基于以上信息，从以下几个方面为用户提供专业解读：
-
-1. **性格特点分析**：根据八字五行和生肖特性，分析此人的性格特点、优缺点
-2. **事业运势**：分析事业发展方向、适合的职业类型、成功的关键因素
-3. **财运分析**：财富积累能力、理财建议、财运周期
-4. **感情婚姻**：感情模式、婚姻运势、与什么类型的人相配
-5. **健康建议**：根据五行分析可能的健康注意事项
-6. **人生建议**：基于命理特点给出的人生发展建议
-
-要求：
-- 语言通俗易懂，避免过于专业的术语
-- 结合现代生活实际，给出实用的建议
-- 保持客观中性，既不过分乐观也不悲观
-- 重点突出个人努力的重要性
-- 字数控制在800-1200字左右
-- 使用温和、积极的语调"""
-
-            # 根据配置的AI服务发送请求
+            prompt, _ = AIAnalysisAPI.build_prompt(birth_info, shengxiao_analysis, bazi_analysis)
+            return AIAnalysisAPI.call_provider(prompt, ai_config)
+        except Exception as e:
+            return {"error": f"AI解读失败: {str(e)}"}
+
+    @staticmethod
+    def call_provider(prompt, ai_config):
+        """根据配置的AI服务发送请求，按服务商统计耗时和出错次数"""
+        provider = AIAnalysisAPI.metric_provider(ai_config)
+        started = time.perf_counter()
+        result = AIAnalysisAPI._call_provider(prompt, ai_config)
+        metrics.observe('bazi_ai_seconds', time.perf_counter() - started, provider=provider, mode='call')
+        if result.get("error"):
+            metrics.inc('bazi_ai_errors_total', provider=provider, mode='call')
+        return result
+
+    @staticmethod
+    def metric_provider(ai_config):
+        """统计用的服务商名称，不支持的服务商都计为other"""
+        provider = ai_config.get('provider')
+        return provider if provider in AIAnalysisAPI.default_models or provider == 'qianfan' else 'other'
+
+    @staticmethod
+    def _call_provider(prompt, ai_config):
+        """按服务商分派请求"""
+        try:
             if ai_config['provider'] == 'openai':
                 return AIAnalysisAPI._call_openai(prompt, ai_config)
             elif ai_config['provider'] == 'claude':
@@ -78,6 +282,63 @@ class AIAnalysisAPI:
         except Exception as e:
             return {"error": f"AI解读失败: {str(e)}"}
     
+    @staticmethod
+    def stream_pieces(prompt, ai_config):
+        """流式调用AI服务，逐个生成内容片段；服务商不支持或返回错误时抛出RuntimeError。
+        按服务商统计首个片段和整个回复的耗时"""
+        provider = AIAnalysisAPI.metric_provider(ai_config)
+        started = time.perf_counter()
+        first = True
+        try:
+            for piece in AIAnalysisAPI._stream_pieces(prompt, ai_config):
+                if first:
+                    metrics.observe('bazi_ai_first_token_seconds', time.perf_counter() - started, provider=provider)
+                    first = False
+                yield piece
+        except Exception:
+            metrics.inc('bazi_ai_errors_total', provider=provider, mode='stream')
+            raise
+        finally:
+            metrics.observe('bazi_ai_seconds', time.perf_counter() - started, provider=provider, mode='stream')
+
+    @staticmethod
+    def _stream_pieces(prompt, ai_config):
+        """按服务商分派流式请求，解析SSE中的内容片段"""
+        provider = ai_config['provider']
+        if provider == 'openai':
+            response = AIAnalysisAPI._call_openai(prompt, ai_config, stream=True)
+        elif provider == 'deepseek':
+            response = AIAnalysisAPI._call_deepseek(prompt, ai_config, stream=True)
+        elif provider == 'custom':
+            response = AIAnalysisAPI._call_custom_stream(prompt, ai_config)
+        else:
+            raise RuntimeError('不支持的AI服务提供商流式输出')
+        try:
+            if response.status_code != 200:
+                raise RuntimeError(f'API错误: {response.status_code}')
+            for line in response.iter_lines():
+                if line:
+                    line = line.decode('utf-8')
+                    if line.startswith('data: '):
+                        data_str = line[6:]
+                        if data_str.strip() == '[DONE]':
+                            break
+                        try:
+                            data_obj = json.loads(data_str)
+                            if 'choices' in data_obj and data_obj['choices']:
+                                delta = data_obj['choices'][0].get('delta', {})
+                                if 'content' in delta:
+                                    yield delta['content']
+                        except json.JSONDecodeError:
+                            continue
+        finally:
+            response.close()
+
+    @staticmethod
+    def _post(provider, api_url, headers, data, stream=False):
+        """经服务商的连接池发送请求"""
+        return ai_client.post(provider, api_url, headers=headers, json=data, stream=stream)
+
     @staticmethod
     def _call_openai(prompt, config, stream=False):
         """调用OpenAI API"""
@@ -94,13 +355,13 @@ class AIAnalysisAPI:
             'stream': stream
         }
         
-        api_url = config.get('api_url', 'https://api.openai.com/v1/chat/completions')
+        api_url = config.get('api_url', AIAnalysisAPI.default_urls['openai'])
         
         if stream:
-            response = requests.post(api_url, headers=headers, json=data, timeout=60, stream=True)
+            response = AIAnalysisAPI._post('openai', api_url, headers, data, stream=True)
             return response
         else:
-            response = requests.post(api_url, headers=headers, json=data, timeout=60)
+            response = AIAnalysisAPI._post('openai', api_url, headers, data)
             
             if response.status_code == 200:
                 result = response.json()
@@ -123,9 +384,9 @@ class AIAnalysisAPI:
             'messages': [{'role': 'user', 'content': prompt}]
         }
         
-        api_url = config.get('api_url', 'https://api.anthropic.com/v1/messages')
+        api_url = config.get('api_url', AIAnalysisAPI.default_urls['claude'])
         
-        response = requests.post(api_url, headers=headers, json=data, timeout=60)
+        response = AIAnalysisAPI._post('claude', api_url, headers, data)
         
         if response.status_code == 200:
             result = response.json()
@@ -149,13 +410,13 @@ class AIAnalysisAPI:
             'stream': stream
         }
         
-        api_url = config.get('api_url', 'https://api.deepseek.com/v1/chat/completions')
+        api_url = config.get('api_url', AIAnalysisAPI.default_urls['deepseek'])
         
         if stream:
-            response = requests.post(api_url, headers=headers, json=data, timeout=60, stream=True)
+            response = AIAnalysisAPI._post('deepseek', api_url, headers, data, stream=True)
             return response
         else:
-            response = requests.post(api_url, headers=headers, json=data, timeout=60)
+            response = AIAnalysisAPI._post('deepseek', api_url, headers, data)
             
             if response.status_code == 200:
                 result = response.json()
@@ -200,7 +461,7 @@ class AIAnalysisAPI:
             if 'custom_params' in config and config['custom_params']:
                 data.update(config['custom_params'])
             
-            response = requests.post(config['api_url'], headers=headers, json=data, timeout=60)
+            response = AIAnalysisAPI._post('custom', config['api_url'], headers, data)
             
             if response.status_code == 200:
                 result = response.json()
@@ -261,351 +522,58 @@ class AIAnalysisAPI:
             if 'custom_params' in config and config['custom_params']:
                 data.update(config['custom_params'])
             
-            response = requests.post(config['api_url'], headers=headers, json=data, timeout=60, stream=True)
+            response = AIAnalysisAPI._post('custom', config['api_url'], headers, data, stream=True)
             return response
                 
         except Exception as e:
             raise Exception(f"自定义API流式调用失败: {str(e)}")
 
-class ShengxiaoAPI:
-    @staticmethod
-    def get_shengxiao_by_year(year):
-        """根据年份获取生肖"""
-        # 计算生肖的基础年份（1900年为鼠年）
-        base_year = 1900
-        zodiac_animals = ["鼠", "牛", "虎", "兔", "龙", "蛇", "马", "羊", "猴", "鸡", "狗", "猪"]
-        
-        # 计算生肖索引
-        zodiac_index = (year - base_year) % 12
-        return zodiac_animals[zodiac_index]
-    
-    @staticmethod
-    def get_shengxiao_info(shengxiao):
-        """获取生肖信息"""
-        if shengxiao not in shengxiaos.inverse:
-            return {
-                "error": "请输入正确的生肖",
-                "valid_shengxiaos": list(shengxiaos.inverse.keys())
-            }
-        
-        zhi = shengxiaos.inverse[shengxiao]
-        
-        result = {
-            "shengxiao": shengxiao,
-            "year_zhi": zhi,
-            "compatible": {
-                "sanhe": [shengxiaos[item] for item in zhi_atts[zhi]['合']],
-                "liuhe": [shengxiaos[item] for item in zhi_atts[zhi]['六']],
-                "sanhui": [shengxiaos[item] for item in zhi_atts[zhi]['会']]
-            },
-            "incompatible": {
-                "chong": [shengxiaos[item] for item in zhi_atts[zhi]['冲']],
-                "xing": [shengxiaos[item] for item in zhi_atts[zhi]['刑']],
-                "beixing": [shengxiaos[item] for item in zhi_atts[zhi]['被刑']],
-                "hai": [shengxiaos[item] for item in zhi_atts[zhi]['害']],
-                "po": [shengxiaos[item] for item in zhi_atts[zhi]['破']]
-            }
-        }
-        
-        return result
-
-
-def calculate_shensha(eight_char, lunar):
-    """计算核心神煞"""
-    day_gan = eight_char.getDayGan()
-    day_zhi = eight_char.getDayZhi()
-    year_zhi = eight_char.getYearZhi()
-    
-    shensha_map = { "year": [], "month": [], "day": [], "time": [] }
-    zhis = [eight_char.getYearZhi(), eight_char.getMonthZhi(), eight_char.getDayZhi(), eight_char.getTimeZhi()]
-    labels = ["year", "month", "day", "time"]
-    
-    # 1. 天乙贵人
-    tianyi_rules = {
-        "甲": ["丑", "未"], "戊": ["丑", "未"], "庚": ["丑", "未"],
-        "乙": ["子", "申"], "己": ["子", "申"],
-        "丙": ["亥", "酉"], "丁": ["亥", "酉"],
-        "壬": ["卯", "巳"], "癸": ["卯", "巳"],
-        "辛": ["午", "寅"]
-    }
-    target_zhis = tianyi_rules.get(day_gan, [])
-    for i, zhi in enumerate(zhis):
-        if zhi in target_zhis: shensha_map[labels[i]].append("天乙贵人")
-            
-    # 2. 桃花
-    taohua_rules = {
-        "申": "酉", "子": "酉", "辰": "酉", "寅": "卯", "午": "卯", "戌": "卯",
-        "巳": "午", "酉": "午", "丑": "午", "亥": "子", "卯": "子", "未": "子"
-    }
-    targets = {taohua_rules.get(year_zhi), taohua_rules.get(day_zhi)}
-    for i, zhi in enumerate(zhis):
-        if zhi in targets: shensha_map[labels[i]].append("桃花")
-            
-    # 3. 驿马
-    yima_rules = {
-        "申": "寅", "子": "寅", "辰": "寅", "寅": "申", "午": "申", "戌": "申",
-        "巳": "亥", "酉": "亥", "丑": "亥", "亥": "巳", "卯": "巳", "未": "巳"
-    }
-    targets = {yima_rules.get(year_zhi), yima_rules.get(day_zhi)}
-    for i, zhi in enumerate(zhis):
-        if zhi in targets: shensha_map[labels[i]].append("驿马")
-            
-    # 4. 空亡
-    xun_kong = eight_char.getDayXunKong()
-    for i, zhi in enumerate(zhis):
-        if zhi in xun_kong: shensha_map[labels[i]].append("空亡")
-            
-    # 5. 羊刃
-    yangren_rules = {"甲": "卯", "乙": "辰", "丙": "午", "戊": "午", "庚": "酉", "壬": "子"}
-    if day_gan in yangren_rules:
-        target = yangren_rules[day_gan]
-        for i, zhi in enumerate(zhis):
-            if zhi == target: shensha_map[labels[i]].append("羊刃")
-            
-    # 6. 文昌
-    wenchang_rules = {
-        "甲": "巳", "乙": "午", "丙": "申", "戊": "申", "丁": "酉", "己": "酉",
-        "庚": "亥", "辛": "子", "壬": "寅", "癸": "卯"
-    }
-    target = wenchang_rules.get(day_gan)
-    for i, zhi in enumerate(zhis):
-        if zhi == target: shensha_map[labels[i]].append("文昌")
-            
-    return shensha_map
-
-# 纳音查找表
-NAYIN = {
-    '甲子': '海中金', '乙丑': '海中金', '丙寅': '炉中火', '丁卯': '炉中火',
-    '戊辰': '大林木', '己巳': '大林木', '庚午': '路旁土', '辛未': '路旁土',
-    '壬申': '剑锋金', '癸酉': '剑锋金', '甲戌': '山头火', '乙亥': '山头火',
-    '丙子': '涧下水', '丁丑': '涧下水', '戊寅': '城头土', '己卯': '城头土',
-    '庚辰': '白蜡金', '辛巳': '白蜡金', '壬午': '杨柳木', '癸未': '杨柳木',
-    '甲申': '泉中水', '乙酉': '泉中水', '丙戌': '屋上土', '丁亥': '屋上土',
-    '戊子': '霹雳火', '己丑': '霹雳火', '庚寅': '松柏木', '辛卯': '松柏木',
-    '壬辰': '长流水', '癸巳': '长流水', '甲午': '沙中金', '乙未': '沙中金',
-    '丙申': '山下火', '丁酉': '山下火', '戊戌': '平地木', '己亥': '平地木',
-    '庚子': '壁上土', '辛丑': '壁上土', '壬寅': '金箔金', '癸卯': '金箔金',
-    '甲辰': '覆灯火', '乙巳': '覆灯火', '丙午': '天河水', '丁未': '天河水',
-    '戊申': '大驿土', '己酉': '大驿土', '庚戌': '钗钏金', '辛亥': '钗钏金',
-    '壬子': '桑柘木', '癸丑': '桑柘木', '甲寅': '大溪水', '乙卯': '大溪水',
-    '丙辰': '沙中土', '丁巳': '沙中土', '戊午': '天上火', '己未': '天上火',
-    '庚申': '石榴木', '辛酉': '石榴木', '壬戌': '大海水', '癸亥': '大海水'
-}
-
 def build_bazi_struct(birth_date, birth_time="8", calendar_type="农历", gender="男"):
     """生成结构化的八字排盘数据，专业版"""
     try:
         year, month, day = [int(x) for x in birth_date.split('-')]
-        hour = int(birth_time)
-        if calendar_type == "公历":
-            lunar = Solar.fromYmdHms(year, month, day, hour, 0, 0).getLunar()
-        else:
-            lunar = Lunar.fromYmdHms(year, month, day, hour, 0, 0)
-
-        eight_char = lunar.getEightChar()
-        gans = [eight_char.getYearGan(), eight_char.getMonthGan(), eight_char.getDayGan(), eight_char.getTimeGan()]
-        zhis = [eight_char.getYearZhi(), eight_char.getMonthZhi(), eight_char.getDayZhi(), eight_char.getTimeZhi()]
-        na_yins = [eight_char.getYearNaYin(), eight_char.getMonthNaYin(), eight_char.getDayNaYin(), eight_char.getTimeNaYin()]
-        
-        day_master = gans[2]
-        shenshas = calculate_shensha(eight_char, lunar)
-        
-        pillars = []
-        labels = ["年柱", "月柱", "日柱", "时柱"]
-        keys = ["year", "month", "day", "time"]
-
-        for i, (label, gan, zhi) in enumerate(zip(labels, gans, zhis)):
-            hidden_stems = list(zhi5.get(zhi, {}).keys())
-            main_hidden = hidden_stems[0] if hidden_stems else None
-            pillars.append({
-                "label": label, "gan": gan, "zhi": zhi,
-                "na_yin": na_yins[i], "shen_sha": shenshas[keys[i]],
-                "gan_element": gan5.get(gan),
-                "zhi_element": gan5.get(main_hidden) if main_hidden else None,
-                "gan_ten_god": ten_deities[day_master][gan],
-                "zhi_ten_god": ten_deities[day_master][main_hidden] if main_hidden else "",
-                "hidden_stems": hidden_stems,
-                "hidden_ten_gods": [ten_deities[day_master][h] for h in hidden_stems],
-                "hidden_elements": [gan5.get(h) for h in hidden_stems]
-            })
-
-        five_elements = {"金": 0, "木": 0, "水": 0, "火": 0, "土": 0}
-        for gan in gans: five_elements[gan5[gan]] += 5
-        for zhi in zhis:
-            if zhi in zhi5:
-                for stem, score in zhi5[zhi].items(): five_elements[gan5[stem]] += score
-                    
-        # 大运计算
-        gender_num = 1 if gender == "男" else 0
-        yun = eight_char.getYun(gender_num)
-        da_yun_list = []
-        da_yuns = yun.getDaYun()
-        for i in range(10):
-            if i >= len(da_yuns): break
-            dy = da_yuns[i]
-            gan_zhi = dy.getGanZhi()
-            start_year = dy.getStartYear()
-            if len(gan_zhi) >= 2:
-                dg, dz = gan_zhi[0], gan_zhi[1]
-                tg_val = ten_deities[day_master].get(dg, '')
-            else:
-                dg, dz = '', ''
-                tg_val = ''
-                
-            da_yun_list.append({
-                "index": i, "gan_zhi": gan_zhi, "gan": dg, "zhi": dz,
-                "start_year": start_year, "start_age": dy.getStartAge(), "end_age": dy.getEndAge(),
-                "ten_god": tg_val,
-                "ten_god": tg_val,
-                "na_yin": NAYIN.get(gan_zhi, '') # Use manual lookup
-            })
-
-
-        # --- 新增专业计算 logic ---
-        
-        # 1. 计算胎元 (Tai Yuan)
-        # 规则: 月干后一位, 月支后三位
-        def get_tai_yuan(month_gan, month_zhi):
-            stems = ["甲", "乙", "丙", "丁", "戊", "己", "庚", "辛", "壬", "癸"]
-            branches = ["子", "丑", "寅", "卯", "辰", "巳", "午", "未", "申", "酉", "戌", "亥"]
-            
-            try:
-                g_idx = stems.index(month_gan)
-                z_idx = branches.index(month_zhi)
-                new_g = stems[(g_idx + 1) % 10]
-                new_z = branches[(z_idx + 3) % 12]
-                return f"{new_g}{new_z}"
-            except:
-                return "未知"
-
-        tai_yuan = get_tai_yuan(gans[1], zhis[1])
-        tai_yuan_nayin = NAYIN.get(tai_yuan, '')
-
-        # 2. 计算身强身弱与喜用神 (Basic Balancing Method)
-        # 此算法基于五行得分对比 (V1.0)
-        
-        # 定义五行生克关系
-        elements_order = ["木", "火", "土", "金", "水"] # 0,1,2,3,4
-        dm_el = gan5.get(day_master) # 日主五行
-        
-        # 计算同党 (帮我) 与 异党 (耗我)
-        # 同党: 日主五行 (比劫) + 生日主五行 (印枭)
-        # 异党: 克日主 (官杀) + 日主生 (食伤) + 日主克 (财才)
-        
-        idx = elements_order.index(dm_el)
-        resource_el = elements_order[(idx - 1) % 5]    # 印
-        output_el = elements_order[(idx + 1) % 5]      # 食
-        wealth_el = elements_order[(idx + 2) % 5]      # 财
-        power_el = elements_order[(idx + 3) % 5]       # 官
-        
-        score_same = (five_elements.get(dm_el, 0) + five_elements.get(resource_el, 0))
-        score_diff = (five_elements.get(output_el, 0) + five_elements.get(wealth_el, 0) + five_elements.get(power_el, 0))
-        
-        total_score = score_same + score_diff
-        weak_strength = "中和"
-        xi_yong = [] # 喜用
-        ji_shen = [] # 忌神
-        
-        # 简化判定标准 (45% - 55% 视为中和，实际应用可能更复杂)
-        # 这里采用倾向性判定
-        if score_same >= total_score * 0.55:
-            weak_strength = "身强"
-            xi_yong = [output_el, wealth_el, power_el] # 喜克泄耗
-            ji_shen = [dm_el, resource_el]
-        elif score_same <= total_score * 0.45:
-            weak_strength = "身弱"
-            xi_yong = [dm_el, resource_el] # 喜生扶
-            ji_shen = [output_el, wealth_el, power_el]
-        else:
-            weak_strength = "中和偏" + ("强" if score_same > score_diff else "弱")
-            # 中和者通常喜平衡，视具体过旺过弱项微调，此处简化为取通关
-            if score_same > score_diff:
-                xi_yong = [output_el, wealth_el, power_el]
-                ji_shen = [dm_el, resource_el]
-            else:
-                 xi_yong = [dm_el, resource_el]
-                 ji_shen = [output_el, wealth_el, power_el]
-
-        advice = {}
-        try:
-            key = f"{day_master}{zhis[1]}"
-            advice = {
-                "tiao_hou": tiaohous.get(key),
-                "jin_bu_huan": jinbuhuan.get(key),
-                "ge_ju": ges.get(ten_deities[day_master]['本'], {}).get(zhis[1])
-            }
-        except: pass
-
-        return {
-            "pillars": pillars,
-            "day_master": day_master,
-            "day_master_element": gan5.get(day_master),
-            "five_elements": five_elements,
-            "advice": advice,
-            "da_yun": da_yun_list,
-            "start_yun_desc": f"{yun.getStartYear()}年{yun.getStartMonth()}月起运",
-            "extras": { 
-                "kong_wang": eight_char.getDayXunKong(), 
-                "ming_gong": eight_char.getMingGong(),
-                "tai_yuan": tai_yuan,
-                "tai_yuan_nayin": tai_yuan_nayin,
-                "strength": weak_strength,
-                "yong_shen": xi_yong,
-                "ji_shen": ji_shen
-            }
-        }
+        with metrics.span('convert'):
+            birth = convert(calendar_type, year, month, day, int(birth_time))
     except Exception as e:
         print(f"结构化八字生成失败: {e}", file=sys.stderr)
         return None
+    with metrics.span('struct'):
+        return chart_struct(birth, gender, table=chart_table)
+
 
 class BaziAPI:
     @staticmethod
-    def run_bazi_analysis(birth_date, birth_time="8", gender="男", calendar_type="农历"):
-        """运行八字分析"""
+    def run_bazi_analysis(birth_date, birth_time="8", gender="男", calendar_type="农历", birth=None):
+        """运行八字分析（由执行后端调用bazi.analyze，不再启动子进程）。
+        birth为已换算好的paipan.Birth时直接按它分析，不再重新换算"""
         try:
-            # 兼容不同操作系统的Python命令
-            import platform
-            if platform.system() == "Windows":
-                python_cmd = "python"
-            else:
-                python_cmd = "python3"
-            
-            # 解析日期格式 YYYY-MM-DD
-            year, month, day = birth_date.split('-')
-            
-            # 构建命令参数
-            cmd = [python_cmd, "bazi.py", year, month, day, str(birth_time)]
-            
-            # 如果是公历，添加 -g 参数
-            if calendar_type == "公历":
-                cmd.append("-g")
-            
-            # 如果是女性，添加 -n 参数
-            if gender == "女":
-                cmd.append("-n")
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                encoding='gbk',  # Windows中文编码
-                errors='ignore',  # 忽略编码错误
-                cwd=os.path.dirname(os.path.abspath(__file__))
-            )
-            
-            # 调试输出
-            print(f"命令执行: {' '.join(cmd)}")
-            print(f"返回码: {result.returncode}")
-            print(f"stdout长度: {len(result.stdout) if result.stdout else 0}")
-            print(f"stderr: {result.stderr if result.stderr else 'None'}")
+            with metrics.span('engine'):
+                if birth is not None:
+                    result = backend.run('analyze_birth', birth, gender)
+                else:
+                    # 解析日期格式 YYYY-MM-DD
+                    year, month, day = birth_date.split('-')
+                    result = backend.run('analyze', int(year), int(month), int(day), int(birth_time), gender,
+                                         calendar_type)
+            with metrics.span('render'):
+                output = render_text(result.report, color=False, links=False)
             
             return {
-                "success": result.returncode == 0,
-                "output": result.stdout,
-                "error": result.stderr if result.stderr else None,
-                "return_code": result.returncode
+                "success": True,
+                "output": output,
+                "report": result.report,
+                "error": None,
+                "return_code": 0
             }
             
+        except (PoolBusy, JobTimeout) as e:
+            return {
+                "success": False,
+                "error": str(e),
+                "output": None,
+                "return_code": -1,
+                "status_code": 503
+            }
         except Exception as e:
             return {
                 "success": False,
@@ -614,6 +582,127 @@ class BaziAPI:
                 "return_code": -1
             }
     
+    @staticmethod
+    def get_analysis(birth_date, birth_time="8", gender="男", calendar_type="农历", output_format="text",
+                     parts=report_parts, store=True):
+        """/api/bazi的分析结果，先查结果缓存。返回(分析结果, None)，失败时返回(None, run_bazi_analysis的结果)。
+        store为False时不写入结果缓存(批量接口的记录多半只查一次，不挤掉常用的结果)"""
+        cache_key = ('bazi',) + BaziAPI.cache_key(birth_date, birth_time, gender, calendar_type) \
+            + (output_format, sorted(parts) if output_format != "text" else None)
+        analysis = cached_result(cache_key)
+        if analysis is not None:
+            return analysis, None
+
+        result = BaziAPI.run_bazi_analysis(birth_date, str(birth_time), gender, calendar_type)
+        if not result["success"]:
+            return None, result
+        if output_format == "json":
+            analysis = render_json(result["report"], parts)
+        elif output_format == "markdown":
+            analysis = render_markdown(result["report"], parts)
+        else:
+            analysis = result["output"] or "八字分析暂无结果"
+        if store:
+            result_cache.put(cache_key, analysis)
+        return analysis, None
+
+    @staticmethod
+    def get_complete(birth_date, birth_time="8", gender="男", calendar_type="农历"):
+        """/api/complete的结果，先查结果缓存。出生信息只解析、换算一次，按换算结果(analyze_birth)分析，
+        结构化排盘的四柱、五行和大运取自分析结果，生肖取自换算结果的农历年。
+        返回([生肖, 生肖信息, 分析文本, 结构化排盘], None)，失败时返回(None, run_bazi_analysis的结果)"""
+        cache_key = ('complete',) + BaziAPI.cache_key(birth_date, birth_time, gender, calendar_type)
+        cached = cached_result(cache_key)
+        if cached is not None:
+            return cached, None
+
+        try:
+            birth = BaziAPI.convert_birth(birth_date, birth_time, calendar_type)
+        except Exception as e:
+            return None, {"success": False, "error": str(e), "output": None, "return_code": -1}
+
+        bazi_result = BaziAPI.run_bazi_analysis(birth_date, str(birth_time), gender, calendar_type, birth=birth)
+        if not bazi_result["success"]:
+            return None, bazi_result
+
+        shengxiao, shengxiao_info = BaziAPI.get_shengxiao(birth)
+        with metrics.span('struct'):
+            bazi_struct = chart_struct(birth, gender, bazi_result["report"], chart_table)
+        # 输出中已去掉推广链接和颜色
+        cleaned_output = bazi_result["output"] or "八字分析暂无结果"
+        complete = [shengxiao, shengxiao_info, cleaned_output, bazi_struct]
+        result_cache.put(cache_key, complete)
+        return complete, None
+
+    @staticmethod
+    def convert_birth(birth_date, birth_time="8", calendar_type="农历"):
+        """解析出生信息并换算为paipan.Birth(四柱、农历和起运)，日期不存在时抛出ValueError"""
+        year, month, day = [int(x) for x in birth_date.split('-')]
+        with metrics.span('convert'):
+            return convert(calendar_type, year, month, day, int(birth_time))
+
+    @staticmethod
+    def get_shengxiao(birth):
+        """生肖按换算结果的农历年，返回(生肖, 生肖信息)"""
+        with metrics.span('shengxiao'):
+            shengxiao = ShengxiaoAPI.get_shengxiao_by_year(birth.lunar[0])
+            return shengxiao, ShengxiaoAPI.get_shengxiao_info(shengxiao)
+
+    @staticmethod
+    def get_chart(birth, gender="男"):
+        """不需要完整分析的部分，返回(生肖, 生肖信息, 结构化排盘)"""
+        shengxiao, shengxiao_info = BaziAPI.get_shengxiao(birth)
+        # 结构化八字排盘（用于前端表格/图表）
+        with metrics.span('struct'):
+            return shengxiao, shengxiao_info, chart_struct(birth, gender, table=chart_table)
+
+    @staticmethod
+    def complete_body(birth_date, birth_time, gender, calendar_type, complete):
+        """/api/complete的响应内容"""
+        shengxiao, shengxiao_info, cleaned_output, bazi_struct = complete
+        return {
+            "birth_info": {
+                "date": birth_date,
+                "time": birth_time,
+                "gender": gender,
+                "calendar_type": calendar_type,
+                "shengxiao": shengxiao
+            },
+            "bazi_analysis": cleaned_output,
+            "shengxiao_analysis": shengxiao_info,
+            "bazi_struct": bazi_struct,
+            "success": True
+        }
+
+    @staticmethod
+    def validate_birth(birth_date, birth_time, gender, calendar_type):
+        """验证出生信息，返回错误信息，正确时返回None"""
+        with metrics.span('validate'):
+            if not BaziAPI.validate_date_format(birth_date):
+                return "日期格式不正确，请使用 YYYY-MM-DD 格式"
+            if not BaziAPI.validate_time(str(birth_time)):
+                return "时辰格式不正确，请使用 0-23 的整数"
+            if gender not in ["男", "女"]:
+                return "性别必须是 '男' 或 '女'"
+            if calendar_type not in ["公历", "农历"]:
+                return "历法类型必须是 '公历' 或 '农历'"
+            return None
+
+    @staticmethod
+    def validate_output(output_format, parts):
+        """验证输出格式和parts，返回错误信息，正确时返回None"""
+        if output_format not in ["text", "json", "markdown"]:
+            return "输出格式必须是 'text'、'json' 或 'markdown'"
+        if not isinstance(parts, list) or not set(parts) <= set(report_parts):
+            return "parts 只能包含: " + ", ".join(report_parts)
+        return None
+
+    @staticmethod
+    def cache_key(birth_date, birth_time, gender, calendar_type):
+        """结果缓存的键，日期和时辰按数值，1990-1-1与1990-01-01相同"""
+        year, month, day = [int(x) for x in birth_date.split('-')]
+        return (year, month, day, int(birth_time), gender, calendar_type)
+
     @staticmethod
     def validate_date_format(date_str):
         """验证日期格式"""
@@ -661,16 +750,34 @@ def api_info():
         "message": "八字生肖分析API服务",
         "endpoints": {
             "/api/shengxiao": "生肖分析 (POST)",
-            "/api/bazi": "八字分析 (POST)",
-            "/api/complete": "完整分析 (POST)",
-            "/health": "健康检查 (GET)"
+            "/api/bazi": "八字分析 (GET/POST)",
+            "/api/bazi/batch": "批量八字分析，NDJSON输出 (POST)",
+            "/api/bazi-stream": "八字分析，按部分流式输出 (POST)",
+            "/api/complete-stream": "完整分析，按部分流式输出 (POST)",
+            "/api/complete": "完整分析 (GET/POST)",
+            "/api/cache-stats": "结果缓存和AI解读缓存统计 (GET)",
+            "/health": "健康检查 (GET)",
+            "/metrics": "各阶段耗时统计，Prometheus格式 (GET)"
         }
     })
 
 @app.route('/health', methods=['GET'])
 def health():
     """健康检查"""
-    return jsonify({"status": "healthy"})
+    return jsonify({"status": "healthy", "backend": backend.info(), "ai_client": ai_client.info(),
+                    "admission": {name: limiter.info() for name, limiter in limiters.items()},
+                    "destiny_sessions": destiny_sessions.info(), "speculation": speculator.info(),
+                    "delivery": delivery.info()})
+
+@app.route('/metrics', methods=['GET'])
+def prometheus_metrics():
+    """各阶段耗时、请求数、AI服务耗时和规则统计，Prometheus的文本格式"""
+    return Response(metrics.render(), mimetype='text/plain; version=0.0.4')
+
+@app.route('/api/cache-stats', methods=['GET'])
+def cache_stats():
+    """结果缓存的命中统计"""
+    return jsonify(dict(result_cache.info(), ai=dict(ai_cache.info(), generating=len(ai_flights))))
 
 @app.route('/api/shengxiao', methods=['POST'])
 def shengxiao_analysis():
@@ -696,11 +803,13 @@ def shengxiao_analysis():
     except Exception as e:
         return jsonify({"error": f"服务器错误: {str(e)}"}), 500
 
-@app.route('/api/bazi', methods=['POST'])
+@app.route('/api/bazi', methods=['GET', 'POST'])
+@admitted('chart')
+@cacheable
 def bazi_analysis():
     """八字分析接口"""
     try:
-        data = request.get_json()
+        data = _request_data()
         
         if not data or 'birth_date' not in data:
             return jsonify({
@@ -718,24 +827,17 @@ def bazi_analysis():
         birth_time = data.get('birth_time', '8')
         gender = data.get('gender', '男')
         calendar_type = data.get('calendar_type', '农历')
+        output_format = data.get('format', 'text')
+        parts = data.get('parts') or list(report_parts)
         
         # 验证输入
-        if not BaziAPI.validate_date_format(birth_date):
-            return jsonify({"error": "日期格式不正确，请使用 YYYY-MM-DD 格式"}), 400
-        
-        if not BaziAPI.validate_time(str(birth_time)):
-            return jsonify({"error": "时辰格式不正确，请使用 0-23 的整数"}), 400
-        
-        if gender not in ["男", "女"]:
-            return jsonify({"error": "性别必须是 '男' 或 '女'"}), 400
+        error = BaziAPI.validate_birth(birth_date, birth_time, gender, calendar_type) \
+            or BaziAPI.validate_output(output_format, parts)
+        if error:
+            return jsonify({"error": error}), 400
         
-        if calendar_type not in ["公历", "农历"]:
-            return jsonify({"error": "历法类型必须是 '公历' 或 '农历'"}), 400
-        
-        # 运行分析
-        result = BaziAPI.run_bazi_analysis(birth_date, str(birth_time), gender, calendar_type)
-        
-        if not result["success"]:
+        analysis, result = BaziAPI.get_analysis(birth_date, birth_time, gender, calendar_type, output_format, parts)
+        if result:
             return jsonify({
                 "error": result["error"],
                 "birth_info": {
@@ -743,17 +845,7 @@ def bazi_analysis():
                     "time": birth_time,
                     "gender": gender
                 }
-            }), 500
-        
-        # 清理分析结果
-        cleaned_output = result["output"] or "八字分析暂无结果"
-        if cleaned_output != "八字分析暂无结果":
-            lines = cleaned_output.split('\n')
-            filtered_lines = []
-            for line in lines:
-                if not any(keyword in line for keyword in ['t.cn', 'http', '建议参见', 'pythontesting']):
-                    filtered_lines.append(line)
-            cleaned_output = '\n'.join(filtered_lines)
+            }), result.get("status_code", 500)
         
         return jsonify({
             "birth_info": {
@@ -761,18 +853,107 @@ def bazi_analysis():
                 "time": birth_time,
                 "gender": gender
             },
-            "analysis": cleaned_output,
+            "analysis": analysis,
             "success": True
         })
         
     except Exception as e:
         return jsonify({"error": f"服务器错误: {str(e)}"}), 500
 
-@app.route('/api/complete', methods=['POST'])
+def _batch_records():
+    """批量接口的输入，逐条生成(序号, 记录, 错误信息)：JSON数组，或NDJSON(请求体或上传文件)。
+    NDJSON逐行读取，内存占用与条数无关；JSON数组要整个解析，只适合较小的批量"""
+    if 'file' in request.files:
+        lines = request.files['file'].stream
+    elif request.mimetype in ('application/x-ndjson', 'application/jsonl', 'text/plain'):
+        lines = request.stream
+    else:
+        data = request.get_json(silent=True)
+        records = data.get('records') if isinstance(data, dict) else data
+        if not isinstance(records, list):
+            yield 0, None, "请求体必须是出生信息的JSON数组或NDJSON"
+            return
+        for index, record in enumerate(records):
+            yield index, record, None
+        return
+
+    index = 0
+    for lineno, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield index, json.loads(line), None
+        except ValueError as e:
+            yield index, None, f"第{lineno}行不是合法的JSON: {e}"
+        index += 1
+
+
+def _batch_item(item, output_format, parts):
+    """计算一条记录，返回NDJSON的一行。每条记录计算时占用一个排盘接口的名额，
+    与单个请求一起排队，不能取得时该行为错误和retry_after"""
+    index, record, error = item
+    line = {"index": index}
+    if error or not isinstance(record, dict):
+        line.update(success=False, error=error or "每条记录必须是JSON对象")
+        return line
+    if 'id' in record:
+        line["id"] = record['id']
+    birth_date = record.get('birth_date')
+    birth_time = record.get('birth_time', '8')
+    gender = record.get('gender', '男')
+    calendar_type = record.get('calendar_type', '农历')
+    line["birth_info"] = {"date": birth_date, "time": birth_time, "gender": gender, "calendar_type": calendar_type}
+    error = "缺少参数 birth_date" if not birth_date else BaziAPI.validate_birth(birth_date, birth_time, gender,
+                                                                              calendar_type)
+    limiter = limiters.get('chart')
+    if not error:
+        try:
+            started = limiter.acquire() if limiter else None
+        except Rejected as e:
+            line.update(success=False, error=str(e), retry_after=e.retry_after)
+            return line
+        try:
+            analysis, result = BaziAPI.get_analysis(birth_date, birth_time, gender, calendar_type, output_format,
+                                                    parts, store=False)
+            error = result and result["error"]
+        except Exception as e:
+            error = f"服务器错误: {str(e)}"
+        finally:
+            if limiter:
+                limiter.release(started)
+    if error:
+        line.update(success=False, error=error)
+    else:
+        line.update(success=True, analysis=analysis)
+    return line
+
+
+@app.route('/api/bazi/batch', methods=['POST'])
+def bazi_batch():
+    """批量八字分析：每条记录算完就输出一行NDJSON，单条出错不影响其他记录。
+    准入控制按记录计算(见_batch_item)，整个请求不另占名额；结果不写入结果缓存"""
+    output_format = request.args.get('format', 'json')
+    parts = request.args.get('parts', ','.join(report_parts)).split(',')
+    error = BaziAPI.validate_output(output_format, parts)
+    if error:
+        return jsonify({"error": error}), 400
+
+    def generate():
+        # 同时计算的记录数与执行后端的并发数相同，输入边读边算
+        for line in imap_unordered(lambda item: _batch_item(item, output_format, parts), _batch_records(),
+                                   backend.concurrency):
+            yield json.dumps(line, ensure_ascii=False) + "\n"
+
+    return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+
+@app.route('/api/complete', methods=['GET', 'POST'])
+@admitted('chart')
+@cacheable
 def complete_analysis():
     """完整分析接口：同时返回八字和生肖信息"""
     try:
-        data = request.get_json()
+        data = _request_data()
         
         if not data or 'birth_date' not in data:
             return jsonify({
@@ -787,33 +968,15 @@ def complete_analysis():
         calendar_type = data.get('calendar_type', '农历')
         
         # 验证输入
-        if not BaziAPI.validate_date_format(birth_date):
-            return jsonify({"error": "日期格式不正确，请使用 YYYY-MM-DD 格式"}), 400
-        
-        if not BaziAPI.validate_time(str(birth_time)):
-            return jsonify({"error": "时辰格式不正确，请使用 0-23 的整数"}), 400
-        
-        if gender not in ["男", "女"]:
-            return jsonify({"error": "性别必须是 '男' 或 '女'"}), 400
-        
-        if calendar_type not in ["公历", "农历"]:
-            return jsonify({"error": "历法类型必须是 '公历' 或 '农历'"}), 400
+        error = BaziAPI.validate_birth(birth_date, birth_time, gender, calendar_type)
+        if error:
+            return jsonify({"error": error}), 400
         
-        # 获取年份并计算生肖
-        year = int(birth_date.split('-')[0])
-        shengxiao = ShengxiaoAPI.get_shengxiao_by_year(year)
-        
-        # 获取生肖详细信息
-        shengxiao_info = ShengxiaoAPI.get_shengxiao_info(shengxiao)
-        
-        # 运行八字分析
-        bazi_result = BaziAPI.run_bazi_analysis(birth_date, str(birth_time), gender, calendar_type)
-        
-        if not bazi_result["success"]:
+        complete, bazi_result = BaziAPI.get_complete(birth_date, birth_time, gender, calendar_type)
+        if complete is None:
             return jsonify({
                 "error": f"八字分析失败: {bazi_result['error']}",
                 "debug_info": {
-                    "command": f"python bazi.py {birth_date.replace('-', ' ')} {birth_time}",
                     "return_code": bazi_result.get('return_code'),
                     "stderr": bazi_result.get('error')
                 },
@@ -822,45 +985,125 @@ def complete_analysis():
                     "time": birth_time,
                     "gender": gender
                 }
-            }), 500
+            }), bazi_result.get("status_code", 500)
         
-        # 调试输出
-        print(f"八字分析结果长度: {len(bazi_result['output']) if bazi_result['output'] else 0}")
-        print(f"八字分析前100字符: {bazi_result['output'][:100] if bazi_result['output'] else 'None'}")
-        
-        # 清理八字分析结果中的推广链接
-        cleaned_output = bazi_result["output"] or "八字分析暂无结果"
-        if cleaned_output != "八字分析暂无结果":
-            # 删除推广链接行
-            lines = cleaned_output.split('\n')
-            filtered_lines = []
-            for line in lines:
-                # 过滤掉包含网址和推广信息的行
-                if not any(keyword in line for keyword in ['t.cn', 'http', '建议参见', 'pythontesting']):
-                    filtered_lines.append(line)
-            cleaned_output = '\n'.join(filtered_lines)
-
-        # 结构化八字排盘（用于前端表格/图表）
-        bazi_struct = build_bazi_struct(birth_date, birth_time, calendar_type)
-        
-        return jsonify({
-            "birth_info": {
-                "date": birth_date,
-                "time": birth_time,
-                "gender": gender,
-                "calendar_type": calendar_type,
-                "shengxiao": shengxiao
-            },
-            "bazi_analysis": cleaned_output,
-            "shengxiao_analysis": shengxiao_info,
-            "bazi_struct": bazi_struct,
-            "success": True
-        })
+        return jsonify(BaziAPI.complete_body(birth_date, birth_time, gender, calendar_type, complete))
         
     except Exception as e:
         return jsonify({"error": f"服务器错误: {str(e)}"}), 500
 
+def _analysis_sections(birth_date, birth_time, gender, calendar_type, output_format=None, parts=report_parts):
+    """按前端展示的先后生成分析的各部分(名称, 数据)。
+
+    chart(出生信息、生肖、结构化排盘)不需要完整分析，最先生成；之后是排盘引擎每算完一部分就发出的
+    pillars(四柱、五行和强弱)、relations(干支关系和神煞)、ge(格局和格局规则)、classics(《穷通宝鉴》
+    《三命通会》摘录)、逐条的dayun(大运及其流年)、rules(其余规则)，见bazi.iter_pillars；
+    最后是与/api/complete相同的complete，output_format不为None时是该格式的analysis。
+    结果缓存中已有完整结果时直接生成chart和最后一部分。出错时生成('error', 错误信息)后结束。
+    """
+    key = BaziAPI.cache_key(birth_date, birth_time, gender, calendar_type)
+    analysis_key = ('bazi',) + key + (output_format, sorted(parts) if output_format != "text" else None)
+    complete = cached_result(('complete',) + key)
+    analysis = cached_result(analysis_key) if complete is not None and output_format not in (None, "text") else None
+    if complete is not None and (output_format in (None, "text") or analysis is not None):
+        shengxiao, shengxiao_info, cleaned_output, bazi_struct = complete
+        birth_info = {"date": birth_date, "time": birth_time, "gender": gender, "calendar_type": calendar_type,
+                      "shengxiao": shengxiao}
+        yield 'chart', {"birth_info": birth_info, "shengxiao_analysis": shengxiao_info, "bazi_struct": bazi_struct}
+        if output_format is None:
+            yield 'complete', BaziAPI.complete_body(birth_date, birth_time, gender, calendar_type, complete)
+        else:
+            yield 'analysis', cleaned_output if output_format == "text" else analysis
+        return
+
+    try:
+        birth = BaziAPI.convert_birth(birth_date, birth_time, calendar_type)
+        shengxiao, shengxiao_info, bazi_struct = BaziAPI.get_chart(birth, gender)
+    except Exception as e:
+        yield 'error', f"服务器错误: {str(e)}"
+        return
+    birth_info = {"date": birth_date, "time": birth_time, "gender": gender, "calendar_type": calendar_type,
+                  "shengxiao": shengxiao}
+    yield 'chart', {"birth_info": birth_info, "shengxiao_analysis": shengxiao_info, "bazi_struct": bazi_struct}
+
+    result = None
+    try:
+        for name, data in backend.stream('iter_birth', birth, gender):
+            if name == 'result':
+                result = data
+            else:
+                yield name, plain(data)
+    except Exception as e:
+        yield 'error', f"八字分析失败: {str(e)}"
+        return
+    report = result.report
+
+    with metrics.span('render'):
+        cleaned_output = render_text(report, color=False, links=False) or "八字分析暂无结果"
+    # 结构化排盘与由分析结果生成的相同，沿用chart中的
+    complete = [shengxiao, shengxiao_info, cleaned_output, bazi_struct]
+    result_cache.put(('complete',) + key, complete)
+    if output_format is None:
+        yield 'complete', BaziAPI.complete_body(birth_date, birth_time, gender, calendar_type, complete)
+        return
+    if output_format == "json":
+        analysis = render_json(report, parts)
+    elif output_format == "markdown":
+        analysis = render_markdown(report, parts)
+    else:
+        analysis = cleaned_output
+    result_cache.put(analysis_key, analysis)
+    yield 'analysis', analysis
+
+def _sections_stream(sections):
+    """把_analysis_sections转为SSE：每部分一个data: {"section": 名称, "data": 数据}事件"""
+    for name, data in sections:
+        if name == 'error':
+            yield f"data: {json.dumps({'error': data}, ensure_ascii=False)}\n\n"
+            return
+        yield f"data: {json.dumps({'section': name, 'data': data}, ensure_ascii=False)}\n\n"
+    yield f"data: {json.dumps({'done': True})}\n\n"
+
+@app.route('/api/complete-stream', methods=['POST'])
+@admitted('chart')
+def complete_analysis_stream():
+    """完整分析流式接口：排盘各部分算完就以SSE事件发出，最后一个部分与/api/complete的响应相同"""
+    data = request.get_json(silent=True)
+    if not data or 'birth_date' not in data:
+        return jsonify({"error": "缺少参数", "required": ["birth_date"], "optional": ["birth_time", "gender"]}), 400
+    birth_date = data['birth_date']
+    birth_time = data.get('birth_time', '8')
+    gender = data.get('gender', '男')
+    calendar_type = data.get('calendar_type', '农历')
+    error = BaziAPI.validate_birth(birth_date, birth_time, gender, calendar_type)
+    if error:
+        return jsonify({"error": error}), 400
+    sections = _analysis_sections(birth_date, birth_time, gender, calendar_type)
+    return Response(stream_with_context(_sections_stream(sections)), mimetype='text/event-stream')
+
+@app.route('/api/bazi-stream', methods=['POST'])
+@admitted('chart')
+def bazi_analysis_stream():
+    """八字分析流式接口：与/api/complete-stream相同，最后一个部分为format指定格式的analysis"""
+    data = request.get_json(silent=True)
+    if not data or 'birth_date' not in data:
+        return jsonify({"error": "缺少参数", "required": ["birth_date"],
+                        "optional": ["birth_time", "gender", "calendar_type", "format", "parts"]}), 400
+    birth_date = data['birth_date']
+    birth_time = data.get('birth_time', '8')
+    gender = data.get('gender', '男')
+    calendar_type = data.get('calendar_type', '农历')
+    output_format = data.get('format', 'text')
+    parts = data.get('parts') or list(report_parts)
+    error = BaziAPI.validate_birth(birth_date, birth_time, gender, calendar_type) \
+        or BaziAPI.validate_output(output_format, parts)
+    if error:
+        return jsonify({"error": error}), 400
+    sections = _analysis_sections(birth_date, birth_time, gender, calendar_type, output_format, parts)
+    return Response(stream_with_context(_sections_stream(sections)), mimetype='text/event-stream')
+
 @app.route('/api/ai-interpretation', methods=['POST'])
+@admitted('ai')
 def ai_interpretation():
     """AI解读接口"""
     try:
@@ -877,20 +1120,21 @@ def ai_interpretation():
         if 'provider' not in ai_config or 'api_key' not in ai_config:
             return jsonify({"error": "AI配置不完整，需要provider和api_key"}), 400
         
-        # 调用AI解读
-        result = AIAnalysisAPI.get_ai_interpretation(
-            data['birth_info'],
-            data['shengxiao_analysis'], 
-            data['bazi_analysis'],
-            ai_config
-        )
+        # 调用AI解读，相同的命盘和模型只生成一次
+        prompt, prompt_tokens = AIAnalysisAPI.build_prompt(data['birth_info'], data['shengxiao_analysis'],
+                                                           data['bazi_analysis'])
+        key = AIAnalysisAPI.interpretation_key(prompt, ai_config)
+        content, error, source = AIAnalysisAPI.cached_interpretation(
+            key, lambda: AIAnalysisAPI.call_provider(prompt, ai_config))
         
-        if "error" in result:
-            return jsonify(result), 500
+        if error:
+            return jsonify({"error": error}), 500
         
         return jsonify({
             "success": True,
-            "interpretation": result["content"],
+            "interpretation": content,
+            "cache": source,
+            "prompt_tokens": prompt_tokens,
             "timestamp": __import__('datetime').datetime.now().isoformat()
         })
         
@@ -898,6 +1142,7 @@ def ai_interpretation():
         return jsonify({"error": f"服务器错误: {str(e)}"}), 500
 
 @app.route('/api/ai-interpretation-stream', methods=['POST'])
+@admitted('ai')
 def ai_interpretation_stream():
     """AI解读流式接口"""
     try:
@@ -918,102 +1163,166 @@ def ai_interpretation_stream():
         birth_info = data['birth_info']
         shengxiao_analysis = data['shengxiao_analysis']
         bazi_analysis = data['bazi_analysis']
+        prompt, prompt_tokens = AIAnalysisAPI.build_prompt(birth_info, shengxiao_analysis, bazi_analysis)
         
-        prompt = f"""你是一位专业的命理学专家，请基于以下传统八字和生肖分析结果，为用户提供全面、专业且易懂的命理解读。
-
-## 基本信息：
-- 出生日期：{birth_info['date']} ({birth_info['calendar_type']})
-- 出生时辰：{birth_info['time']}点
-- 性别：{birth_info['gender']}
-- 生肖：{birth_info['shengxiao']}
-
-## 生肖分析结果：
-年支：{shengxiao_analysis['year_zhi']}
-
-相合生肖：
-- 三合：{', '.join(shengxiao_analysis['compatible']['sanhe']) if shengxiao_analysis['compatible']['sanhe'] else '无'}
-- 六合：{', '.join(shengxiao_analysis['compatible']['liuhe']) if shengxiao_analysis['compatible']['liuhe'] else '无'}
-- 三会：{', '.join(shengxiao_analysis['compatible']['sanhui']) if shengxiao_analysis['compatible']['sanhui'] else '无'}
-
-不合生肖：
-- 相冲：{', '.join(shengxiao_analysis['incompatible']['chong']) if shengxiao_analysis['incompatible']['chong'] else '无'}
-- 相刑：{', '.join(shengxiao_analysis['incompatible']['xing']) if shengxiao_analysis['incompatible']['xing'] else '无'}
-- 相害：{', '.join(shengxiao_analysis['incompatible']['hai']) if shengxiao_analysis['incompatible']['hai'] else '无'}
-- 相破：{', '.join(shengxiao_analysis['incompatible']['po']) if shengxiao_analysis['incompatible']['po'] else '无'}
-
-## 八字排盘分析：
-{bazi_analysis}
-
-请基于以上信息，从以下几个方面为用户提供专业解读：
-
-1. **性格特点分析**：根据八字五行和生肖特性，分析此人的性格特点、优缺点
-2. **事业运势**：分析事业发展方向、适合的职业类型、成功的关键因素
-3. **财运分析**：财富积累能力、理财建议、财运周期
-4. **感情婚姻**：感情模式、婚姻运势、与什么类型的人相配
-5. **健康建议**：根据五行分析可能的健康注意事项
-6. **人生建议**：基于命理特点给出的人生发展建议
-
-要求：
-- 语言通俗易懂，避免过于专业的术语
-- 结合现代生活实际，给出实用的建议
-- 保持客观中性，既不过分乐观也不悲观
-- 重点突出个人努力的重要性
-- 字数控制在800-1200字左右
-- 使用温和、积极的语调"""
-        
+        key = AIAnalysisAPI.interpretation_key(prompt, ai_config)
+        cached = ai_cache.get(key)
+
         def generate_stream():
-            try:
-                provider = ai_config['provider']
-                
-                if provider == 'openai':
-                    response = AIAnalysisAPI._call_openai(prompt, ai_config, stream=True)
-                elif provider == 'deepseek':
-                    response = AIAnalysisAPI._call_deepseek(prompt, ai_config, stream=True)
-                elif provider == 'custom':
-                    response = AIAnalysisAPI._call_custom_stream(prompt, ai_config)
-                else:
-                    yield f"data: {json.dumps({'error': '不支持的AI服务提供商流式输出'})}\n\n"
+            # 缓存命中时重放缓存的解读
+            if cached is not None:
+                for content in replay(cached, **replay_options()):
+                    yield f"data: {json.dumps({'content': content})}\n\n"
+                yield f"data: {json.dumps({'done': True})}\n\n"
+                return
+
+            provider = ai_config['provider']
+            if provider not in ('openai', 'deepseek', 'custom'):
+                yield f"data: {json.dumps({'error': '不支持的AI服务提供商流式输出'})}\n\n"
+                return
+
+            # 同一个键正在生成时跟随它，不再调用AI服务
+            flight, leader = ai_flights.begin(key)
+            if not leader:
+                try:
+                    for content in flight.follow(ai_client.timeout[1]):
+                        yield f"data: {json.dumps({'content': content})}\n\n"
+                except TimeoutError as e:
+                    yield f"data: {json.dumps({'error': str(e)})}\n\n"
                     return
-                
-                if response.status_code != 200:
-                    yield f"data: {json.dumps({'error': f'API错误: {response.status_code}'})}\n\n"
+                if flight.error:
+                    yield f"data: {json.dumps({'error': flight.error})}\n\n"
+                else:
+                    yield f"data: {json.dumps({'done': True})}\n\n"
+                return
+
+            error = "生成被中断"
+            try:
+                try:
+                    for content in AIAnalysisAPI.stream_pieces(prompt, ai_config):
+                        flight.add(content)
+                        yield f"data: {json.dumps({'content': content})}\n\n"
+                except RuntimeError as e:
+                    error = str(e)
+                    yield f"data: {json.dumps({'error': error})}\n\n"
                     return
                 
-                for line in response.iter_lines():
-                    if line:
-                        line = line.decode('utf-8')
-                        if line.startswith('data: '):
-                            data_str = line[6:]
-                            if data_str.strip() == '[DONE]':
-                                break
-                            try:
-                                data_obj = json.loads(data_str)
-                                if 'choices' in data_obj and data_obj['choices']:
-                                    delta = data_obj['choices'][0].get('delta', {})
-                                    if 'content' in delta:
-                                        content = delta['content']
-                                        yield f"data: {json.dumps({'content': content})}\n\n"
-                            except json.JSONDecodeError:
-                                continue
-                
+                if flight.pieces:
+                    ai_cache.put(key, ''.join(flight.pieces))
+                error = None
                 yield f"data: {json.dumps({'done': True})}\n\n"
                 
             except Exception as e:
-                yield f"data: {json.dumps({'error': f'流式处理错误: {str(e)}'})}\n\n"
+                error = f'流式处理错误: {str(e)}'
+                yield f"data: {json.dumps({'error': error})}\n\n"
+            finally:
+                ai_flights.end(key, error)
         
-        return Response(generate_stream(), mimetype='text/event-stream')
+        return Response(generate_stream(), mimetype='text/event-stream',
+                        headers={'X-AI-Cache': 'hit' if cached is not None else 'miss',
+                                 'X-Prompt-Tokens': str(prompt_tokens)})
         
     except Exception as e:
         return jsonify({"error": f"服务器错误: {str(e)}"}), 500
 
+def _parse_story(content):
+    """从AI返回的内容中解析故事，格式不对时抛出ValueError(json.JSONDecodeError也是ValueError)"""
+    import re
+    json_match = re.search(r'```json\s*(\{.*?\})\s*```', content, re.DOTALL)
+    if json_match:
+        story_json = json_match.group(1)
+    else:
+        # 如果没有代码块，尝试直接解析
+        story_json = content.strip()
+    
+    story_data = json.loads(story_json)
+    
+    # 验证故事数据格式
+    required_story_fields = ['title', 'story', 'choices']
+    for field in required_story_fields:
+        if field not in story_data:
+            raise ValueError(f"故事数据缺少字段: {field}")
+    
+    if not isinstance(story_data['choices'], list) or len(story_data['choices']) < 2:
+        raise ValueError("choices必须是包含至少2个元素的数组")
+    return story_data
+
+def _story_key(prompt, ai_config):
+    """预生成按服务商、模型、地址和提示词匹配"""
+    return content_key(ai_config.get('provider'), ai_config.get('model'), ai_config.get('api_url'), prompt)
+
+def _story_generated(session, story_data, ai_config):
+    """会话记录新的故事，开启预生成时在后台按每个选项生成下一轮。
+    会话已被其他请求修改时抛出SessionError(409)，不开始预生成"""
+    set_story(session, story_data)
+    destiny_sessions.put(session)
+    if speculator.active(session) and ai_config.get('provider') in ('openai', 'deepseek', 'custom'):
+        prompts = [story_prompt(after_choice(session, index), **history_options())
+                   for index in range(len(story_data['choices']))]
+        if speculator.start(session, [(_story_key(prompt, ai_config), prompt) for prompt in prompts],
+                            lambda prompt: AIAnalysisAPI.stream_pieces(prompt, ai_config)):
+            destiny_sessions.put(session)
+
+def _destiny_prompt(data):
+    """命运轨迹接口的提示词，返回(提示词, 会话, 是否为人生总结)。
+    有session_id时按服务端的会话生成提示词，choice为玩家所选的选项，action为summary时生成人生总结；
+    否则使用请求中的prompt"""
+    if not data.get('session_id'):
+        return data['prompt'], None, False
+    session = destiny_sessions.get(data['session_id'])
+    if data.get('action') == 'summary':
+        speculator.cancel(session['id'])
+        return summary_prompt(session, **history_options()), session, True
+    if data.get('choice') is not None and choose(session, int(data['choice'])):
+        destiny_sessions.put(session)
+    return story_prompt(session, **history_options()), session, False
+
+@app.route('/api/destiny-session', methods=['POST'])
+@admitted('chart')
+def create_destiny_session():
+    """建立命运轨迹游戏的会话"""
+    data = request.get_json() or {}
+    bazi_data = data.get('bazi_data')
+    if not isinstance(bazi_data, dict) or 'birth_info' not in bazi_data:
+        return jsonify({"error": "缺少必需参数: bazi_data"}), 400
+    bazi_data['chart_summary'] = AIAnalysisAPI.chart_text(bazi_data['birth_info'], bazi_data.get('bazi_analysis', ''))
+    session = new_session(bazi_data, data.get('settings'))
+    destiny_sessions.put(session)
+    return jsonify({"success": True, "session_id": session['id'], "state": public_state(session)})
+
+@app.route('/api/destiny-session/<session_id>', methods=['GET', 'DELETE'])
+def destiny_session(session_id):
+    """查看或删除命运轨迹游戏的会话"""
+    if request.method == 'DELETE':
+        speculator.cancel(session_id)
+        destiny_sessions.delete(session_id)
+        return jsonify({"success": True})
+    try:
+        return jsonify({"success": True, "state": public_state(destiny_sessions.get(session_id), turns=True)})
+    except SessionError as e:
+        return jsonify({"error": str(e)}), e.status
+
+@app.route('/api/destiny-session/<session_id>/rewind', methods=['POST'])
+def rewind_destiny_session(session_id):
+    """回到之前的某一轮重新选择，event为轮次(从0开始)"""
+    try:
+        session = destiny_sessions.get(session_id)
+        rewind(session, int((request.get_json() or {}).get('event', -1)))
+        speculator.cancel(session_id)
+        destiny_sessions.put(session)
+    except (SessionError, ValueError, TypeError) as e:
+        return jsonify({"error": str(e)}), getattr(e, 'status', 400)
+    return jsonify({"success": True, "state": public_state(session)})
+
 @app.route('/api/destiny-story', methods=['POST'])
+@admitted('ai')
 def destiny_story():
     """命运轨迹故事生成接口"""
     try:
         data = request.get_json()
         
-        # 验证必需参数
-        required_fields = ['prompt', 'ai_config', 'game_state']
+        # 验证必需参数，有会话时只需要会话ID
+        required_fields = ['session_id', 'ai_config'] if data.get('session_id') else ['prompt', 'ai_config', 'game_state']
         for field in required_fields:
             if field not in data:
                 return jsonify({"error": f"缺少必需参数: {field}"}), 400
@@ -1023,11 +1332,19 @@ def destiny_story():
         if 'api_key' not in ai_config or not ai_config['api_key']:
             return jsonify({"error": "AI配置不完整，需要api_key"}), 400
         
-        prompt = data['prompt']
+        try:
+            prompt, session, summary = _destiny_prompt(data)
+        except (SessionError, ValueError) as e:
+            return jsonify({"error": str(e)}), getattr(e, 'status', 400)
         
-        # 调用AI生成故事
+        # 已有预生成时等它完成，否则调用AI生成故事
         try:
-            if ai_config['provider'] == 'openai':
+            flight = speculator.adopt(session['id'], _story_key(prompt, ai_config)) \
+                if session is not None and not summary else None
+            content, error = flight.wait(ai_client.timeout[1]) if flight else (None, True)
+            if not error:
+                result = {"success": True, "content": content}
+            elif ai_config['provider'] == 'openai':
                 result = AIAnalysisAPI._call_openai(prompt, ai_config)
             elif ai_config['provider'] == 'claude':
                 result = AIAnalysisAPI._call_claude(prompt, ai_config)
@@ -1041,35 +1358,25 @@ def destiny_story():
             if "error" in result:
                 return jsonify({"success": False, "error": result["error"]}), 500
             
+            if summary:
+                return jsonify({"success": True, "summary": result["content"], "state": public_state(session)})
+            
             # 解析AI返回的JSON格式故事
             try:
-                content = result["content"]
-                # 尝试提取JSON部分
-                import re
-                json_match = re.search(r'```json\s*(\{.*?\})\s*```', content, re.DOTALL)
-                if json_match:
-                    story_json = json_match.group(1)
-                else:
-                    # 如果没有代码块，尝试直接解析
-                    story_json = content.strip()
+                story_data = _parse_story(result["content"])
                 
-                story_data = json.loads(story_json)
-                
-                # 验证故事数据格式
-                required_story_fields = ['title', 'story', 'choices']
-                for field in required_story_fields:
-                    if field not in story_data:
-                        raise ValueError(f"故事数据缺少字段: {field}")
-                
-                if not isinstance(story_data['choices'], list) or len(story_data['choices']) < 2:
-                    raise ValueError("choices必须是包含至少2个元素的数组")
-                
-                return jsonify({
+                result = {
                     "success": True,
                     "story": story_data,
                     "timestamp": __import__('datetime').datetime.now().isoformat()
-                })
+                }
+                if session is not None:
+                    _story_generated(session, story_data, ai_config)
+                    result['state'] = public_state(session)
+                return jsonify(result)
                 
+            except SessionError as e:
+                return jsonify({"success": False, "error": str(e)}), e.status
             except (json.JSONDecodeError, ValueError) as e:
                 return jsonify({
                     "success": False,
@@ -1087,13 +1394,14 @@ def destiny_story():
         return jsonify({"error": f"服务器错误: {str(e)}"}), 500
 
 @app.route('/api/destiny-story-stream', methods=['POST'])
+@admitted('ai')
 def destiny_story_stream():
     """命运轨迹故事生成流式接口"""
     try:
         data = request.get_json()
         
-        # 验证必需参数
-        required_fields = ['prompt', 'ai_config', 'game_state']
+        # 验证必需参数，有会话时只需要会话ID
+        required_fields = ['session_id', 'ai_config'] if data.get('session_id') else ['prompt', 'ai_config', 'game_state']
         for field in required_fields:
             if field not in data:
                 return jsonify({"error": f"缺少必需参数: {field}"}), 400
@@ -1103,74 +1411,63 @@ def destiny_story_stream():
         if 'api_key' not in ai_config or not ai_config['api_key']:
             return jsonify({"error": "AI配置不完整，需要api_key"}), 400
         
-        prompt = data['prompt']
+        try:
+            prompt, session, summary = _destiny_prompt(data)
+        except (SessionError, ValueError) as e:
+            return jsonify({"error": str(e)}), getattr(e, 'status', 400)
+        
+        # 玩家的选择已经预生成时接着它输出，否则调用AI生成
+        flight = speculator.adopt(session['id'], _story_key(prompt, ai_config)) \
+            if session is not None and not summary else None
         
         def generate_stream():
             try:
-                provider = ai_config['provider']
+                if session is not None:
+                    yield f"data: {json.dumps({'state': public_state(session)})}\n\n"
                 
-                if provider == 'openai':
-                    response = AIAnalysisAPI._call_openai(prompt, ai_config, stream=True)
-                elif provider == 'deepseek':
-                    response = AIAnalysisAPI._call_deepseek(prompt, ai_config, stream=True)
-                elif provider == 'custom':
-                    response = AIAnalysisAPI._call_custom_stream(prompt, ai_config)
-                else:
-                    yield f"data: {json.dumps({'error': '不支持的AI服务提供商流式输出'})}\n\n"
+                full_content = ""
+                try:
+                    pieces = flight.follow(ai_client.timeout[1]) if flight else AIAnalysisAPI.stream_pieces(prompt, ai_config)
+                    for content in pieces:
+                        full_content += content
+                        yield f"data: {json.dumps({'content': content})}\n\n"
+                    if flight and flight.error and not full_content:
+                        # 预生成在发出任何内容之前就结束了(被取消或跳过)，与非流式接口一样改为正常生成
+                        for content in AIAnalysisAPI.stream_pieces(prompt, ai_config):
+                            full_content += content
+                            yield f"data: {json.dumps({'content': content})}\n\n"
+                    elif flight and flight.error:
+                        raise RuntimeError(flight.error)
+                except RuntimeError as e:
+                    yield f"data: {json.dumps({'error': str(e)})}\n\n"
                     return
                 
-                if response.status_code != 200:
-                    yield f"data: {json.dumps({'error': f'API错误: {response.status_code}'})}\n\n"
+                if summary:
+                    yield f"data: {json.dumps({'done': True})}\n\n"
                     return
                 
-                full_content = ""
-                for line in response.iter_lines():
-                    if line:
-                        line = line.decode('utf-8')
-                        if line.startswith('data: '):
-                            data_str = line[6:]
-                            if data_str.strip() == '[DONE]':
-                                break
-                            try:
-                                data_obj = json.loads(data_str)
-                                if 'choices' in data_obj and data_obj['choices']:
-                                    delta = data_obj['choices'][0].get('delta', {})
-                                    if 'content' in delta:
-                                        content = delta['content']
-                                        full_content += content
-                                        yield f"data: {json.dumps({'content': content})}\n\n"
-                            except json.JSONDecodeError:
-                                continue
-                
                 # 流式传输完成后，解析完整内容
                 try:
-                    import re
-                    json_match = re.search(r'```json\s*(\{.*?\})\s*```', full_content, re.DOTALL)
-                    if json_match:
-                        story_json = json_match.group(1)
-                    else:
-                        story_json = full_content.strip()
-                    
-                    story_data = json.loads(story_json)
-                    
-                    # 验证故事数据格式
-                    required_story_fields = ['title', 'story', 'choices']
-                    for field in required_story_fields:
-                        if field not in story_data:
-                            raise ValueError(f"故事数据缺少字段: {field}")
-                    
-                    if not isinstance(story_data['choices'], list) or len(story_data['choices']) < 2:
-                        raise ValueError("choices必须是包含至少2个元素的数组")
+                    story_data = _parse_story(full_content)
                     
-                    yield f"data: {json.dumps({'story_data': story_data, 'done': True})}\n\n"
+                    event = {'story_data': story_data, 'done': True}
+                    if session is not None:
+                        _story_generated(session, story_data, ai_config)
+                        event['state'] = public_state(session)
+                    yield f"data: {json.dumps(event)}\n\n"
                     
+                except SessionError as e:
+                    yield f"data: {json.dumps({'error': str(e)})}\n\n"
                 except (json.JSONDecodeError, ValueError) as e:
                     yield f"data: {json.dumps({'error': f'故事解析错误: {str(e)}', 'raw_content': full_content})}\n\n"
                 
             except Exception as e:
                 yield f"data: {json.dumps({'error': f'流式处理错误: {str(e)}'})}\n\n"
         
-        return Response(generate_stream(), mimetype='text/event-stream')
+        response = Response(generate_stream(), mimetype='text/event-stream')
+        if flight is not None:
+            response.headers['X-Speculative'] = 'served' if flight.done else 'adopted'
+        return response
         
     except Exception as e:
         return jsonify({"error": f"服务器错误: {str(e)}"}), 500
@@ -1182,12 +1479,18 @@ if __name__ == '__main__':
     print("API端点:")
     print("  POST /api/shengxiao - 生肖分析")
     print("  POST /api/bazi - 八字分析")
+    print("  POST /api/bazi/batch - 批量八字分析(NDJSON)")
     print("  POST /api/complete - 完整分析")
+    print("  POST /api/complete-stream - 完整分析流式(按部分)")
+    print("  POST /api/bazi-stream - 八字分析流式(按部分)")
     print("  POST /api/ai-interpretation - AI解读")
     print("  POST /api/ai-interpretation-stream - AI解读流式")
     print("  POST /api/destiny-story - 命运轨迹故事生成")
     print("  POST /api/destiny-story-stream - 命运轨迹故事生成流式")
+    print("  POST /api/destiny-session - 命运轨迹游戏会话")
     print("  GET /health - 健康检查")
+    print("  GET /metrics - 耗时统计(Prometheus)")
+    print("  GET /api/cache-stats - 结果缓存统计")
     print("  GET /api - API文档")
     print()
     
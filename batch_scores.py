@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""批量计算五行分数、强弱和湿度，用于大量八字的统计分析（需要numpy）。
+
+八字用整数编码，每行8列：年干 月干 日干 时干 年支 月支 日支 时支，
+天干0-9、地支0-11，与ganzhi.gan_nums/zhi_nums一致。
+各项结果与bazi.analyze()中的scores、gan_scores、strong、weak、temps_scores相同，
+strength与bazi_struct.chart_struct中的身强身弱判断相同。
+"""
+
+import collections
+
+import numpy as np
+
+from ganzhi import Gan, Zhi, gan5, gan_nums, zhi_nums, temps, zhi5, zhi5_weights, ten_god_table
+
+# 与bazi.py中scores的顺序一致
+elements = ("金", "木", "水", "火", "土")
+
+strength_names = ("身强", "身弱", "中和偏强", "中和偏弱")
+
+BatchScores = collections.namedtuple("BatchScores", "scores gan_scores strong weak temps_scores strength")
+
+_zhi5_weights = np.array(zhi5_weights, dtype=np.int32)                          # 12x10
+_gan_elements = np.array([[gan5[gan] == item for item in elements] for gan in Gan],
+                         dtype=np.int32)                                         # 10x5
+_ten_gods = np.array(ten_god_table, dtype=np.int8)                             # 10x22
+_gan_temps = np.array([temps[item] for item in Gan], dtype=np.int32)
+_zhi_temps = np.array([temps[item] for item in Zhi], dtype=np.int32)
+# 地支主气(分数最高的藏干)
+_zhi_main = np.array([gan_nums[max(zhi5[item], key=zhi5[item].get)] for item in Zhi], dtype=np.int8)
+
+# 十神编码：比0 劫1 枭8 印9
+_helps = np.zeros(22, dtype=bool)
+_helps[[0, 1, 8, 9]] = True
+# 十二长生编码：长10 建13 帝14
+_roots = np.zeros(22, dtype=bool)
+_roots[[10, 13, 14]] = True
+
+
+def encode(charts):
+    """把四柱字符串转换成整数数组，charts中每项形如("己巳", "丁丑", "壬辰", "甲辰")"""
+    rows = []
+    for chart in charts:
+        rows.append([gan_nums[item[0]] for item in chart] + [zhi_nums[item[1]] for item in chart])
+    return np.array(rows, dtype=np.int8).reshape(-1, 8)
+
+
+def batch_scores(pillars):
+    """计算一批八字的分数，pillars为Nx8的整数数组，返回BatchScores，每项为长度N的数组
+
+    scores: Nx5，列顺序同elements
+    gan_scores: Nx10，列顺序同Gan
+    strong: 网上的强弱算法(比劫枭印分数之和)，中值29
+    weak: True表示无强根
+    strength: strength_names的编码
+    """
+    pillars = np.asarray(pillars)
+    gans = pillars[:, :4].astype(np.intp)
+    zhis = pillars[:, 4:].astype(np.intp)
+    rows = np.arange(len(pillars))
+
+    # 天干各5分，地支按藏干计分
+    base = np.zeros((len(pillars), 10), dtype=np.int32)
+    for col in range(4):
+        base[rows, gans[:, col]] += 5
+        base += _zhi5_weights[zhis[:, col]]
+    # bazi.py中月支计算两次
+    gan_scores = base + _zhi5_weights[zhis[:, 1]]
+    scores = gan_scores @ _gan_elements
+
+    me_gods = _ten_gods[gans[:, 2]]                                               # Nx22
+    helps = _helps[me_gods[:, :10]]
+    strong = (gan_scores * helps).sum(axis=1)
+
+    # 强根：地支有日主的长生、建禄、帝旺；否则天干和地支主气的比肩超过2个
+    statuses = np.take_along_axis(me_gods, zhis + 10, axis=1)
+    weak = ~_roots[statuses].any(axis=1)
+    gan_bi = (np.take_along_axis(me_gods, gans[:, [0, 1, 3]], axis=1) == 0).sum(axis=1)
+    zhi_bi = (np.take_along_axis(me_gods, _zhi_main[zhis].astype(np.intp), axis=1) == 0).sum(axis=1)
+    weak &= gan_bi + zhi_bi <= 2
+
+    temps_scores = _gan_temps[gans].sum(axis=1) + _zhi_temps[zhis].sum(axis=1) + _zhi_temps[zhis[:, 1]]
+
+    # chart_struct：同党(比劫印枭)占55%以上身强，45%以下身弱
+    same = (base * helps).sum(axis=1)
+    total = base.sum(axis=1)
+    diff = total - same
+    strength = np.where(same > diff, 2, 3)
+    strength = np.where(same <= total * 0.45, 1, strength)
+    strength = np.where(same >= total * 0.55, 0, strength)
+
+    return BatchScores(scores=scores, gan_scores=gan_scores, strong=strong, weak=weak,
+                       temps_scores=temps_scores, strength=strength.astype(np.int8))
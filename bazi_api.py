@@ -2,11 +2,9 @@
 # -*- coding: utf-8 -*-
 
 import sys
-import subprocess
-import tempfile
-import os
-from io import StringIO
-from contextlib import redirect_stdout, redirect_stderr
+
+from bazi import analyze
+from report import render_json
 
 def run_bazi_analysis(birth_date, birth_time="8", gender="男"):
     """
@@ -21,23 +19,15 @@ def run_bazi_analysis(birth_date, birth_time="8", gender="男"):
         dict: 包含分析结果和可能的错误信息
     """
     try:
-        # 构建命令
-        cmd = ["python", "bazi.py", birth_date, birth_time, gender]
-        
-        # 运行命令并捕获输出
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            encoding='utf-8',
-            cwd=os.path.dirname(os.path.abspath(__file__))
-        )
+        year, month, day = birth_date.split('-')
+        result = analyze(int(year), int(month), int(day), int(birth_time), gender)
         
         return {
             "success": True,
-            "output": result.stdout,
-            "error": result.stderr if result.stderr else None,
-            "return_code": result.returncode
+            "output": result.text,
+            "report": result.report,
+            "error": None,
+            "return_code": 0
         }
         
     except Exception as e:
@@ -72,7 +62,6 @@ def get_bazi_info(birth_date, birth_time="8", gender="男"):
             }
         }
     
-    # 解析输出（这里可以根据需要进一步结构化输出）
     return {
         "birth_info": {
             "date": birth_date,
@@ -80,7 +69,8 @@ def get_bazi_info(birth_date, birth_time="8", gender="男"):
             "gender": gender
         },
         "analysis": result["output"],
-        "raw_output": result["output"]
+        "raw_output": result["output"],
+        "structured": render_json(result["report"])
     }
 
 def validate_date_format(date_str):
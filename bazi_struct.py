@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""结构化的八字排盘(四柱、五行、大运、胎元、喜用)和生肖信息，/api/complete、/api/chart的数据部分。
+
+这里的内容影响结果缓存，列在result_cache.engine_files中；接口代码在api_server.py，修改接口不会使缓存失效。
+"""
+
+import sys
+
+from datas import shengxiaos, zhi_atts, tiaohous, jinbuhuan, ges
+from ganzhi import gan5, zhi5, ten_deities
+from paipan import DaYun, get_dayuns, get_ming_gong, get_xun_kong
+from shensha import core_shensha
+
+class ShengxiaoAPI:
+    @staticmethod
+    def get_shengxiao_by_year(year):
+        """根据年份获取生肖"""
+        # 计算生肖的基础年份（1900年为鼠年）
+        base_year = 1900
+        zodiac_animals = ["鼠", "牛", "虎", "兔", "龙", "蛇", "马", "羊", "猴", "鸡", "狗", "猪"]
+        
+        # 计算生肖索引
+        zodiac_index = (year - base_year) % 12
+        return zodiac_animals[zodiac_index]
+    
+    @staticmethod
+    def get_shengxiao_info(shengxiao):
+        """获取生肖信息"""
+        if shengxiao not in shengxiaos.inverse:
+            return {
+                "error": "请输入正确的生肖",
+                "valid_shengxiaos": list(shengxiaos.inverse.keys())
+            }
+        
+        zhi = shengxiaos.inverse[shengxiao]
+        
+        result = {
+            "shengxiao": shengxiao,
+            "year_zhi": zhi,
+            "compatible": {
+                "sanhe": [shengxiaos[item] for item in zhi_atts[zhi]['合']],
+                "liuhe": [shengxiaos[item] for item in zhi_atts[zhi]['六']],
+                "sanhui": [shengxiaos[item] for item in zhi_atts[zhi]['会']]
+            },
+            "incompatible": {
+                "chong": [shengxiaos[item] for item in zhi_atts[zhi]['冲']],
+                "xing": [shengxiaos[item] for item in zhi_atts[zhi]['刑']],
+                "beixing": [shengxiaos[item] for item in zhi_atts[zhi]['被刑']],
+                "hai": [shengxiaos[item] for item in zhi_atts[zhi]['害']],
+                "po": [shengxiaos[item] for item in zhi_atts[zhi]['破']]
+            }
+        }
+        
+        return result
+
+
+def calculate_shensha(gans, zhis):
+    """计算核心神煞"""
+    masks = core_shensha.natal(gans, zhis).masks
+    return {label: core_shensha.names_of(mask) for label, mask in zip(["year", "month", "day", "time"], masks)}
+
+# 纳音查找表
+NAYIN = {
+    '甲子': '海中金', '乙丑': '海中金', '丙寅': '炉中火', '丁卯': '炉中火',
+    '戊辰': '大林木', '己巳': '大林木', '庚午': '路旁土', '辛未': '路旁土',
+    '壬申': '剑锋金', '癸酉': '剑锋金', '甲戌': '山头火', '乙亥': '山头火',
+    '丙子': '涧下水', '丁丑': '涧下水', '戊寅': '城头土', '己卯': '城头土',
+    '庚辰': '白蜡金', '辛巳': '白蜡金', '壬午': '杨柳木', '癸未': '杨柳木',
+    '甲申': '泉中水', '乙酉': '泉中水', '丙戌': '屋上土', '丁亥': '屋上土',
+    '戊子': '霹雳火', '己丑': '霹雳火', '庚寅': '松柏木', '辛卯': '松柏木',
+    '壬辰': '长流水', '癸巳': '长流水', '甲午': '沙中金', '乙未': '沙中金',
+    '丙申': '山下火', '丁酉': '山下火', '戊戌': '平地木', '己亥': '平地木',
+    '庚子': '壁上土', '辛丑': '壁上土', '壬寅': '金箔金', '癸卯': '金箔金',
+    '甲辰': '覆灯火', '乙巳': '覆灯火', '丙午': '天河水', '丁未': '天河水',
+    '戊申': '大驿土', '己酉': '大驿土', '庚戌': '钗钏金', '辛亥': '钗钏金',
+    '壬子': '桑柘木', '癸丑': '桑柘木', '甲寅': '大溪水', '乙卯': '大溪水',
+    '丙辰': '沙中土', '丁巳': '沙中土', '戊午': '天上火', '己未': '天上火',
+    '庚申': '石榴木', '辛酉': '石榴木', '壬戌': '大海水', '癸亥': '大海水'
+}
+
+def report_dayuns(report):
+    """由分析结果的大运生成与paipan.get_dayuns相同的列表，起运前的一行由第一步大运推出"""
+    first = report.dayuns[0]
+    dayuns = [DaYun('', first.year - first.age + 1, 1, first.age - 1)]
+    dayuns.extend(DaYun(row.ganzhi, row.year, row.age, row.age + 9) for row in report.dayuns)
+    return dayuns
+
+def chart_struct(birth, gender="男", report=None, table=None):
+    """由排盘结果(paipan.Birth)生成结构化的八字排盘数据。
+
+    有完整分析的结果(report)时，四柱、五行分数和大运都取自report，不再另外计算；起运时间取自birth。
+    table为四柱静态分析的预计算表(chart_table.ChartTable)，有时五行分数和身强身弱从中查出"""
+    try:
+        if report is not None:
+            gans = [pillar.gan for pillar in report.pillars]
+            zhis = [pillar.zhi for pillar in report.pillars]
+        else:
+            gans = list(birth.gans)
+            zhis = list(birth.zhis)
+        na_yins = [NAYIN[gan + zhi] for gan, zhi in zip(gans, zhis)]
+        
+        day_master = gans[2]
+        shenshas = calculate_shensha(gans, zhis)
+        
+        pillars = []
+        labels = ["年柱", "月柱", "日柱", "时柱"]
+        keys = ["year", "month", "day", "time"]
+
+        for i, (label, gan, zhi) in enumerate(zip(labels, gans, zhis)):
+            hidden_stems = list(zhi5.get(zhi, {}).keys())
+            main_hidden = hidden_stems[0] if hidden_stems else None
+            pillars.append({
+                "label": label, "gan": gan, "zhi": zhi,
+                "na_yin": na_yins[i], "shen_sha": shenshas[keys[i]],
+                "gan_element": gan5.get(gan),
+                "zhi_element": gan5.get(main_hidden) if main_hidden else None,
+                "gan_ten_god": ten_deities[day_master][gan],
+                "zhi_ten_god": ten_deities[day_master][main_hidden] if main_hidden else "",
+                "hidden_stems": hidden_stems,
+                "hidden_ten_gods": [ten_deities[day_master][h] for h in hidden_stems],
+                "hidden_elements": [gan5.get(h) for h in hidden_stems]
+            })
+
+        record = table.lookup(gans, zhis) if table else None
+        if record:
+            five_elements = record.five_elements
+        elif report is not None:
+            # 分析的五行分数把月支算了两次，结构化排盘只算一次
+            five_elements = {element: report.scores[element] for element in ("金", "木", "水", "火", "土")}
+            for stem, score in zhi5[zhis[1]].items(): five_elements[gan5[stem]] -= score
+        else:
+            five_elements = {"金": 0, "木": 0, "水": 0, "火": 0, "土": 0}
+            for gan in gans: five_elements[gan5[gan]] += 5
+            for zhi in zhis:
+                if zhi in zhi5:
+                    for stem, score in zhi5[zhi].items(): five_elements[gan5[stem]] += score
+                    
+        # 大运计算
+        yun = birth.yuns[gender != "男"]
+        da_yun_list = []
+        da_yuns = report_dayuns(report) if report is not None else get_dayuns(birth, gender)
+        for i in range(10):
+            if i >= len(da_yuns): break
+            dy = da_yuns[i]
+            gan_zhi = dy.ganzhi
+            start_year = dy.start_year
+            if len(gan_zhi) >= 2:
+                dg, dz = gan_zhi[0], gan_zhi[1]
+                tg_val = ten_deities[day_master].get(dg, '')
+            else:
+                dg, dz = '', ''
+                tg_val = ''
+                
+            da_yun_list.append({
+                "index": i, "gan_zhi": gan_zhi, "gan": dg, "zhi": dz,
+                "start_year": start_year, "start_age": dy.start_age, "end_age": dy.end_age,
+                "ten_god": tg_val,
+                "ten_god": tg_val,
+                "na_yin": NAYIN.get(gan_zhi, '') # Use manual lookup
+            })
+
+
+        # --- 新增专业计算 logic ---
+        
+        # 1. 计算胎元 (Tai Yuan)
+        # 规则: 月干后一位, 月支后三位
+        def get_tai_yuan(month_gan, month_zhi):
+            stems = ["甲", "乙", "丙", "丁", "戊", "己", "庚", "辛", "壬", "癸"]
+            branches = ["子", "丑", "寅", "卯", "辰", "巳", "午", "未", "申", "酉", "戌", "亥"]
+            
+            try:
+                g_idx = stems.index(month_gan)
+                z_idx = branches.index(month_zhi)
+                new_g = stems[(g_idx + 1) % 10]
+                new_z = branches[(z_idx + 3) % 12]
+                return f"{new_g}{new_z}"
+            except:
+                return "未知"
+
+        tai_yuan = get_tai_yuan(gans[1], zhis[1])
+        tai_yuan_nayin = NAYIN.get(tai_yuan, '')
+
+        # 2. 计算身强身弱与喜用神 (Basic Balancing Method)
+        # 此算法基于五行得分对比 (V1.0)
+        
+        # 定义五行生克关系
+        elements_order = ["木", "火", "土", "金", "水"] # 0,1,2,3,4
+        dm_el = gan5.get(day_master) # 日主五行
+        
+        # 计算同党 (帮我) 与 异党 (耗我)
+        # 同党: 日主五行 (比劫) + 生日主五行 (印枭)
+        # 异党: 克日主 (官杀) + 日主生 (食伤) + 日主克 (财才)
+        
+        idx = elements_order.index(dm_el)
+        resource_el = elements_order[(idx - 1) % 5]    # 印
+        output_el = elements_order[(idx + 1) % 5]      # 食
+        wealth_el = elements_order[(idx + 2) % 5]      # 财
+        power_el = elements_order[(idx + 3) % 5]       # 官
+        
+        score_same = (five_elements.get(dm_el, 0) + five_elements.get(resource_el, 0))
+        score_diff = (five_elements.get(output_el, 0) + five_elements.get(wealth_el, 0) + five_elements.get(power_el, 0))
+        
+        total_score = score_same + score_diff
+        
+        # 简化判定标准 (45% - 55% 视为中和，实际应用可能更复杂)
+        # 这里采用倾向性判定，有预计算表时直接取表中的结果
+        if record:
+            weak_strength = record.strength
+        elif score_same >= total_score * 0.55:
+            weak_strength = "身强"
+        elif score_same <= total_score * 0.45:
+            weak_strength = "身弱"
+        else:
+            weak_strength = "中和偏" + ("强" if score_same > score_diff else "弱")
+        # 身强喜克泄耗，身弱喜生扶；中和者通常喜平衡，视具体过旺过弱项微调，此处简化为取通关
+        if weak_strength in ("身强", "中和偏强"):
+            xi_yong = [output_el, wealth_el, power_el] # 喜用
+            ji_shen = [dm_el, resource_el] # 忌神
+        else:
+            xi_yong = [dm_el, resource_el]
+            ji_shen = [output_el, wealth_el, power_el]
+
+        advice = {}
+        try:
+            key = f"{day_master}{zhis[1]}"
+            advice = {
+                "tiao_hou": tiaohous.get(key),
+                "jin_bu_huan": jinbuhuan.get(key),
+                "ge_ju": ges.get(ten_deities[day_master]['本'], {}).get(zhis[1])
+            }
+        except: pass
+
+        return {
+            "pillars": pillars,
+            "day_master": day_master,
+            "day_master_element": gan5.get(day_master),
+            "five_elements": five_elements,
+            "advice": advice,
+            "da_yun": da_yun_list,
+            "start_yun_desc": f"{yun.years}年{yun.months}月起运",
+            "extras": { 
+                "kong_wang": get_xun_kong(gans, zhis), 
+                "ming_gong": get_ming_gong(gans, zhis),
+                "tai_yuan": tai_yuan,
+                "tai_yuan_nayin": tai_yuan_nayin,
+                "strength": weak_strength,
+                "yong_shen": xi_yong,
+                "ji_shen": ji_shen
+            }
+        }
+    except Exception as e:
+        print(f"结构化八字生成失败: {e}", file=sys.stderr)
+        return None
@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""四柱静态分析的预计算表。
+
+年柱60 x 月支12 x 日柱60 x 时支12 = 518400种四柱（月干由年干、时干由日干推出），
+另加23点后的夜子时(时干按次日日干推出)共561600种。性别只影响大运顺逆，
+所以与出生时间无关的部分(五行分数、强弱、格局、各柱神煞、地支关系)可以一次算完
+写入定长二进制文件，服务端用mmap打开，查询时只需计算下标。bazi.analyze_pillars的这些部分、
+bazi_struct.chart_struct的五行分数和身强身弱都直接取自查询结果。
+
+依赖规则执行过程的格局(all_ges)、与性别有关的内容不在表中。文件头里记录生成时的引擎版本
+(result_cache.engine_version)，排盘代码修改后旧表不再使用，需要重新生成。
+
+生成: python chart_table.py build [文件名] [-j 进程数]   （需要numpy）
+"""
+
+import argparse
+import collections
+import mmap
+import os
+import struct
+import sys
+import threading
+
+from datas import *
+from shensha import bazi_shensha, Natal
+from result_cache import engine_version
+
+
+MAGIC = b"BZCT"
+VERSION = 2
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "chart_table.bin")
+# 时辰下标0-11为子到亥，12为夜子时
+HOURS = 13
+COUNT = 60 * 12 * 60 * HOURS
+YEAR_SIZE = COUNT // 60
+
+# 魔数 格式版本 记录长度 记录数 引擎版本
+HEADER = struct.Struct("<4sHHI12s")
+# 分数5 结构化五行5 天干分数10 强弱 强根 湿度 身强弱 格局 各柱神煞(位)4 日干神煞(位) 地支关系(位)6
+RECORD = struct.Struct("<5B5B10BB?bBB4HH6H")
+
+elements = ("金", "木", "水", "火", "土")
+strength_names = ("身强", "身弱", "中和偏强", "中和偏弱")
+ge_names = ('', '建', '月刃') + tuple('比劫食伤才财杀官枭印')
+shen_names = bazi_shensha.names
+# 地支两两组合，顺序同relations
+zhi_pairs = ((0, 1), (0, 2), (0, 3), (1, 2), (1, 3), (2, 3))
+
+# natal为各柱的神煞(shensha.Natal，其中天干命中的只记日柱)，relations为地支两两之间的关系
+ChartRecord = collections.namedtuple("ChartRecord",
+    "scores five_elements gan_scores strong weak temps_scores strength ge natal relations")
+
+
+def chart_index(gans, zhis):
+    """四柱在表中的下标，月干、时干与年干、日干不配套时抛出ValueError"""
+    year = jiazi_nums[gans[0] + zhis[0]]
+    month = zhi_nums[zhis[1]]
+    day = jiazi_nums[gans[2] + zhis[2]]
+    time = zhi_nums[zhis[3]]
+    # 五鼠遁，子时的时干是次日的则为夜子时
+    if time == 0 and gan_nums[gans[3]] == (day + 1) % 5 * 2:
+        time = 12
+    # 五虎遁
+    if gan_nums[gans[1]] != (year % 5 * 2 + 2 + (month - 2) % 12) % 10 \
+            or (time != 12 and gan_nums[gans[3]] != (day % 5 * 2 + time) % 10):
+        raise ValueError("四柱不合法: {}".format(' '.join(a + b for a, b in zip(gans, zhis))))
+    return ((year * 12 + month) * 60 + day) * HOURS + time
+
+
+def chart_pillars(index):
+    """chart_index的逆运算，返回(gans, zhis)"""
+    index, time = divmod(index, HOURS)
+    index, day = divmod(index, 60)
+    year, month = divmod(index, 12)
+    gans = (Gan[year % 10], Gan[(year % 5 * 2 + 2 + (month - 2) % 12) % 10],
+            Gan[day % 10], Gan[(day % 5 * 2 + time) % 10])
+    zhis = (Zhi[year % 12], Zhi[month], Zhi[day % 12], Zhi[time % 12])
+    return gans, zhis
+
+
+def _names(mask, names):
+    return [name for n, name in enumerate(names) if mask >> n & 1]
+
+
+def get_pillar_shens(gans, zhis):
+    """各柱的神煞位图和日干命中的神煞位图，位序同shen_names"""
+    natal = bazi_shensha.natal(gans, zhis)
+    return natal.masks, natal.gan_masks[2]
+
+
+class ChartTable:
+    """用mmap只读打开的预计算表，多个进程打开同一文件时共享页缓存。
+
+    version为期望的引擎版本，默认为当前代码的版本，与文件头不符时抛出ValueError"""
+
+    def __init__(self, path=DEFAULT_PATH, version=None):
+        self.path = path
+        with open(path, "rb") as f:
+            self.mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, fmt, size, count, built = HEADER.unpack_from(self.mm, 0)
+        if magic != MAGIC or fmt != VERSION or size != RECORD.size or count != COUNT \
+                or len(self.mm) != HEADER.size + RECORD.size * COUNT:
+            self.mm.close()
+            raise ValueError("预计算表格式不符: {}".format(path))
+        self.version = built.decode('ascii')
+        if self.version != (version or engine_version()):
+            self.mm.close()
+            raise ValueError("预计算表由其他版本的排盘代码生成({})，需要重新生成: {}".format(self.version, path))
+
+    def close(self):
+        self.mm.close()
+
+    def raw(self, index):
+        return RECORD.unpack_from(self.mm, HEADER.size + index * RECORD.size)
+
+    def lookup(self, gans, zhis):
+        """查询四柱的静态分析结果，返回ChartRecord"""
+        values = self.raw(chart_index(gans, zhis))
+        return ChartRecord(
+            scores=dict(zip(elements, values[0:5])),
+            five_elements=dict(zip(elements, values[5:10])),
+            gan_scores=dict(zip(Gan, values[10:20])),
+            strong=values[20],
+            weak=values[21],
+            temps_scores=values[22],
+            strength=strength_names[values[23]],
+            ge=ge_names[values[24]],
+            natal=Natal(list(values[25:29]), [0, 0, values[29], 0]),
+            relations={pair: _names(mask, zhi_att_types) for pair, mask in zip(zhi_pairs, values[30:36])},
+        )
+
+
+def open_chart_table(path=None):
+    """打开预计算表，文件不存在或由其他版本的代码生成时返回None(现场计算)"""
+    path = path or os.environ.get("BAZI_CHART_TABLE", DEFAULT_PATH)
+    if not os.path.exists(path):
+        return None
+    try:
+        return ChartTable(path)
+    except ValueError as e:
+        print("不使用预计算表: {}".format(e), file=sys.stderr)
+        return None
+
+
+_shared = {}
+_shared_lock = threading.Lock()
+
+
+def shared_chart_table():
+    """本进程共用的预计算表，第一次用到时按open_chart_table打开"""
+    with _shared_lock:
+        if 'table' not in _shared:
+            _shared['table'] = open_chart_table()
+        return _shared['table']
+
+
+def _build_year(year):
+    """计算年柱为jiazis[year]的所有四柱中需要逐个计算的字段：格局、各柱神煞、日干神煞"""
+    from bazi import get_ge
+
+    rows = []
+    for index in range(year * YEAR_SIZE, (year + 1) * YEAR_SIZE):
+        gans, zhis = chart_pillars(index)
+        masks, day_mask = get_pillar_shens(gans, zhis)
+        rows.append((ge_names.index(get_ge(gans, zhis)), masks, day_mask))
+    return rows
+
+
+def build(path=DEFAULT_PATH, processes=None, years=range(60)):
+    """生成预计算表，数值部分用batch_scores批量计算，格局和神煞逐个计算。
+
+    years为逐个计算的年柱(jiazis的下标)，其余年柱的这些字段为空，只用于测试；processes=0时在本进程中计算"""
+    import multiprocessing
+    import numpy as np
+    from batch_scores import batch_scores
+
+    index = np.arange(COUNT)
+    index, time = np.divmod(index, HOURS)
+    index, day = np.divmod(index, 60)
+    year, month = np.divmod(index, 12)
+    pillars = np.stack([year % 10, (year % 5 * 2 + 2 + (month - 2) % 12) % 10, day % 10, (day % 5 * 2 + time) % 10,
+                        year % 12, month, day % 12, time % 12], axis=1)
+    scores = batch_scores(pillars)
+
+    # 结构化五行不重复计算月支
+    five_elements = scores.scores.copy()
+    for n, gan in enumerate(Gan):
+        five_elements[:, elements.index(gan5[gan])] -= np.array(zhi5_weights)[pillars[:, 5], n]
+
+    dtype = np.dtype([("scores", "u1", 5), ("five_elements", "u1", 5), ("gan_scores", "u1", 10),
+                      ("strong", "u1"), ("weak", "?"), ("temps_scores", "i1"), ("strength", "u1"),
+                      ("ge", "u1"), ("shens", "<u2", 4), ("day_shens", "<u2"), ("relations", "<u2", 6)])
+    assert dtype.itemsize == RECORD.size
+    records = np.zeros(COUNT, dtype=dtype)
+    records["scores"] = scores.scores
+    records["five_elements"] = five_elements
+    records["gan_scores"] = scores.gan_scores
+    records["strong"] = scores.strong
+    records["weak"] = scores.weak
+    records["temps_scores"] = scores.temps_scores
+    records["strength"] = scores.strength
+    rel_table = np.array(zhi_rel_table, dtype=np.uint16)
+    for n, (a, b) in enumerate(zhi_pairs):
+        records["relations"][:, n] = rel_table[pillars[:, 4 + a], pillars[:, 4 + b]]
+
+    def fill(results):
+        for year, rows in zip(years, results):
+            part = records[year * YEAR_SIZE:(year + 1) * YEAR_SIZE]
+            part["ge"], part["shens"], part["day_shens"] = (np.array(item) for item in zip(*rows))
+
+    if processes == 0:
+        fill(map(_build_year, years))
+    else:
+        with multiprocessing.Pool(processes) as pool:
+            fill(pool.imap(_build_year, years))
+
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, RECORD.size, COUNT, engine_version().encode('ascii')))
+        records.tofile(f)
+    os.replace(tmp, path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="四柱静态分析预计算表",
+                                     formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+    parser.add_argument('action', choices=['build'])
+    parser.add_argument('path', nargs='?', default=DEFAULT_PATH)
+    parser.add_argument('-j', type=int, default=None, help="进程数，默认CPU数")
+    options = parser.parse_args()
+    build(options.path, options.j)
+
+
+if __name__ == '__main__':
+    main()
@@ -23,19 +23,17 @@ def check_gan(gan, gans):
     return result
 
 def yinyang(item):
-    if item in Gan:
-        return '＋' if Gan.index(item)%2 == 0 else '－'
-    else:
-        return '＋' if Zhi.index(item)%2 == 0 else '－'
+    seq = gan_nums[item] if item in gan_nums else zhi_nums[item]
+    return '＋' if seq%2 == 0 else '－'
     
-def yinyangs(zhis):
+def yinyangs(zhis, file=None):
     result = []
     for item in zhis:
         result.append(yinyang(item))
     if set(result) == set('＋'):
-        print("四柱全阳")
+        print("四柱全阳", file=file)
     if set(result) == set('－'):
-        print("四柱全阴")
+        print("四柱全阴", file=file)
     
     
     
@@ -60,4 +58,23 @@ def check_gong(zhis, n1, n2, me, hes, desc='三合拱'):
         if gong not in zhis:
             result += "\t{}：{}{}-{}[{}]".format(
                 desc, zhis[n1], zhis[n2], gong, get_zhi_detail(gong, me))
-    return result
\ No newline at end of file
+    return result
+
+def jin_jiao(first, second):
+    return True if zhi_nums[second] - zhi_nums[first] == 1 else False
+
+def is_ku(zhi):
+    return True if zhi in "辰戌丑未" else False  
+
+def zhi_ku(zhi, items):
+    return True if is_ku(zhi) and min(zhi5[zhi], key=zhi5[zhi].get) in items else False
+
+def is_yang(me):
+    return True if gan_nums[me] % 2 == 0 else False
+
+def not_yang(me):
+    return False if gan_nums[me] % 2 == 0 else True
+
+def gan_ke(gan1, gan2):
+    # 财(我克)或官杀(克我)
+    return ten_god_table[gan_nums[gan1]][gan_nums[gan2]] in (4, 5, 6, 7)
@@ -0,0 +1,20 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""测试时把结果缓存、AI解读缓存和命运轨迹会话的SQLite文件放到临时目录。
+
+api_server导入时按环境变量打开这些文件，这里在导入测试模块之前设置好，
+测试中清空缓存不会影响本目录下正在使用的文件。
+"""
+
+import os
+import shutil
+import tempfile
+
+_db_dir = tempfile.mkdtemp(prefix="bazi-test-")
+for _name, _filename in (("BAZI_CACHE_DB", "result_cache.db"), ("BAZI_AI_CACHE_DB", "ai_cache.db"),
+                         ("BAZI_SESSION_DB", "destiny_sessions.db")):
+    os.environ[_name] = os.path.join(_db_dir, _filename)
+
+
+def pytest_sessionfinish(session, exitstatus):
+    shutil.rmtree(_db_dir, ignore_errors=True)
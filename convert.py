@@ -4,22 +4,28 @@
 # CreateDate: 2019-2-21
 
 import argparse
-import subprocess
+
+from bazi import Gans, Zhis, analyze_pillars
+from jieqi import find_birth_times
 
 description = '''
 '''
 parser = argparse.ArgumentParser(description=description,
                                  formatter_class=argparse.RawTextHelpFormatter)
-parser.add_argument('gans', action="store", help=u'天干')
-parser.add_argument('zhis', action="store", help=u'地支')
+parser.add_argument('charts', action="store", nargs='+', help=u'天干 地支，可以输入多组，如: 甲丙戊壬 子寅辰子')
+parser.add_argument("--start", help="start year", type=int, default=1850)
+parser.add_argument("--end", help="end year", type=int, default=2030)
 parser.add_argument('--version', action='version',
                     version='%(prog)s 0.1 Rongzhong xu 2019 4 12 钉钉或微信pythontesting')
 options = parser.parse_args()
+if len(options.charts) % 2:
+    parser.error("天干和地支需要成对输入")
 
-result = ''
-for item in zip(options.gans, options.zhis):
-    result = result + "".join(item) + " "
+charts = zip(options.charts[::2], options.charts[1::2])
+for gans, zhis, birth_times in find_birth_times(charts, options.start, options.end):
+    result = ''
+    for item in zip(gans, zhis):
+        result = result + "".join(item) + " "
 
-#subprocess.call("cls", shell=True)
-print(result)
-print(subprocess.check_output("python bazi.py -b " + result, shell=True).decode('gbk'))
+    print(result)
+    print(analyze_pillars(Gans(*gans), Zhis(*zhis), birth_times=birth_times).text)
@@ -0,0 +1,473 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""命运轨迹游戏的服务端会话。
+
+以前每一轮客户端都要发送完整的提示词和游戏状态，提示词随着历史选择越来越长。
+现在游戏开始时建立会话，保存命盘、设置、年龄、命运值和每一轮的故事与选择，
+之后每一轮只需发送会话ID和所选的选项，提示词在服务端生成。
+
+提示词中只有最近几轮保留故事原文，更早的事件滚动压缩为一行摘要(年龄、标题、选择)，
+摘要超过字数上限时从最早的事件开始省略，只记数量，所以提示词的长度不随游戏进行而增长。
+
+会话先放在内存中(LRU)，可以再接一个持久的存储(默认为SQLite)，进程重启后仍可继续游戏。
+存储只需实现load、save、delete、purge四个方法，见SQLiteBackend。
+get返回会话的副本，同一会话的并发请求各改各的副本；put时检查会话的version，
+会话在这期间已被其他请求保存时抛出SessionError(409)，不会互相覆盖。
+
+环境变量:
+    BAZI_SESSION_SIZE     内存中保留的会话数，默认1000
+    BAZI_SESSION_DB       SQLite文件，默认为本目录下的destiny_sessions.db，空字符串为只保存在内存中
+    BAZI_SESSION_TTL      会话最后一次使用后保留的秒数，默认7天
+    BAZI_SESSION_RECENT   提示词中保留故事原文的最近轮数，默认3
+    BAZI_SESSION_SUMMARY  更早事件的摘要最多的字数，默认600
+"""
+
+import collections
+import copy
+import json
+import os
+import random
+import sqlite3
+import threading
+import time
+import uuid
+
+from result_cache import BASE_DIR
+
+DEFAULT_PATH = os.path.join(BASE_DIR, "destiny_sessions.db")
+
+# 人生阶段，与页面上的一致
+Stage = collections.namedtuple("Stage", "name age_range description")
+life_stages = (Stage('童年', '0-8岁', '天真烂漫的启蒙时期'), Stage('少年', '9-18岁', '求学成长的关键时期'),
+               Stage('青年', '19-28岁', '事业起步的奋斗时期'), Stage('壮年', '29-38岁', '事业家庭的双线发展'),
+               Stage('中年', '39-48岁', '人生巅峰的收获时期'), Stage('中老年', '49-58岁', '智慧沉淀的传承时期'),
+               Stage('老年', '59-68岁', '回首人生的总结时期'))
+
+
+class SessionError(Exception):
+    """会话不存在(status为404)或请求与会话的状态不符"""
+
+    def __init__(self, message, status=400):
+        super().__init__(message)
+        self.status = status
+
+
+class SQLiteBackend:
+    """会话的持久存储"""
+
+    def __init__(self, path):
+        self.lock = threading.Lock()
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self.db.execute("CREATE TABLE IF NOT EXISTS sessions (id TEXT PRIMARY KEY, updated REAL, value TEXT)")
+        self.db.commit()
+
+    def load(self, session_id):
+        with self.lock:
+            row = self.db.execute("SELECT updated, value FROM sessions WHERE id = ?", (session_id,)).fetchone()
+        return (row[0], json.loads(row[1])) if row else None
+
+    def save(self, session_id, updated, session):
+        with self.lock:
+            self.db.execute("INSERT OR REPLACE INTO sessions VALUES (?, ?, ?)",
+                            (session_id, updated, json.dumps(session, ensure_ascii=False)))
+            self.db.commit()
+
+    def delete(self, session_id):
+        with self.lock:
+            self.db.execute("DELETE FROM sessions WHERE id = ?", (session_id,))
+            self.db.commit()
+
+    def purge(self, before):
+        """删除before之前最后使用的会话"""
+        with self.lock:
+            self.db.execute("DELETE FROM sessions WHERE updated < ?", (before,))
+            self.db.commit()
+
+    def __len__(self):
+        with self.lock:
+            return self.db.execute("SELECT COUNT(*) FROM sessions").fetchone()[0]
+
+
+class SessionStore:
+    """内存LRU，后面可以接一个持久存储(backend)"""
+
+    def __init__(self, size=1000, backend=None, ttl=7 * 86400):
+        self.size = size
+        self.backend = backend
+        self.ttl = ttl
+        self.items = collections.OrderedDict()
+        self.lock = threading.Lock()
+        self.stats = collections.Counter()
+        if backend is not None and ttl:
+            backend.purge(time.time() - ttl)
+
+    def _expired(self, updated):
+        return self.ttl and time.time() - updated > self.ttl
+
+    def get(self, session_id):
+        """取出会话的副本，不存在或已过期时抛出SessionError"""
+        with self.lock:
+            item = self.items.get(session_id)
+            if item is None and self.backend is not None:
+                item = self.backend.load(session_id)
+                if item is not None:
+                    self.stats['loads'] += 1
+            if item is None or self._expired(item[0]):
+                self.items.pop(session_id, None)
+                raise SessionError("会话不存在或已过期: {}".format(session_id), 404)
+            self._remember(session_id, item)
+            return copy.deepcopy(item[1])
+
+    def _remember(self, session_id, item):
+        self.items[session_id] = item
+        self.items.move_to_end(session_id)
+        while len(self.items) > self.size:
+            self.items.popitem(last=False)
+            self.stats['evictions'] += 1
+
+    def put(self, session):
+        """保存会话：会话的version与存储中的不同(取出后已被其他请求保存)时抛出SessionError(409)，
+        保存后version加1"""
+        updated = time.time()
+        with self.lock:
+            item = self.items.get(session['id'])
+            if item is None and self.backend is not None:
+                item = self.backend.load(session['id'])
+            if item is not None and item[1].get('version', 0) != session.get('version', 0):
+                self.stats['conflicts'] += 1
+                raise SessionError("会话已被其他请求修改，请重新读取: {}".format(session['id']), 409)
+            session['version'] = session.get('version', 0) + 1
+            self._remember(session['id'], (updated, copy.deepcopy(session)))
+            if self.backend is not None:
+                self.backend.save(session['id'], updated, session)
+                self.stats['saves'] += 1
+                if self.ttl and self.stats['saves'] % 256 == 0:
+                    self.backend.purge(updated - self.ttl)
+
+    def delete(self, session_id):
+        with self.lock:
+            self.items.pop(session_id, None)
+            if self.backend is not None:
+                self.backend.delete(session_id)
+
+    def info(self):
+        with self.lock:
+            result = {'memory_size': len(self.items), 'memory_limit': self.size, 'ttl': self.ttl,
+                      'stored': len(self.backend) if self.backend is not None else None}
+            result.update({name: self.stats[name] for name in ('loads', 'saves', 'evictions', 'conflicts')})
+        return result
+
+
+def new_session(bazi_data, settings=None):
+    """新的游戏会话，bazi_data含birth_info、bazi_analysis、shengxiao_analysis，
+    有chart_summary(命盘摘要，见prompts.py)时提示词中用它代替bazi_analysis"""
+    settings = dict({'storyStyle': 'realistic', 'startTime': 'birth'}, **(settings or {}))
+    age = 0
+    if settings['storyStyle'] == 'realistic' and settings['startTime'] == 'current':
+        age = time.localtime().tm_year - birth_year(bazi_data)
+    return {'id': uuid.uuid4().hex, 'bazi': bazi_data, 'settings': settings, 'age': age,
+            'destiny_score': 100, 'turns': [], 'current': None, 'version': 0}
+
+
+def birth_year(session_or_bazi):
+    bazi = session_or_bazi.get('bazi', session_or_bazi)
+    return int(bazi['birth_info']['date'].split('-')[0])
+
+
+def stage(age):
+    return life_stages[min(age // 10, len(life_stages) - 1)]
+
+
+def set_story(session, story, rng=random):
+    """记录本轮生成的故事，等待玩家选择。
+    每个选项的随机结果(命运值的变化、增长的岁数)此时就确定，选择后的提示词可以预先生成"""
+    session['current'] = {'age': session['age'], 'title': story['title'], 'story': story['story'],
+                          'choices': story['choices'],
+                          'rolls': [[rng.randint(-4, 4), rng.randint(1, 3)] for _ in story['choices']]}
+
+
+def choose(session, index):
+    """玩家选择当前故事的第index个选项：记录这一轮，命运值和年龄随之变化。
+    当前没有等待选择的故事时(如上一次选择后生成失败，重试时)不做改变"""
+    current = session['current']
+    if current is None:
+        return False
+    if not 0 <= index < len(current['choices']):
+        raise SessionError("选项不存在: {}".format(index))
+    choice = current['choices'][index]
+    variation, years = current['rolls'][index]
+    # 与页面上相同：基础影响加上-4到+4的随机变化，限制在-15到+15；年龄增长1-3岁
+    impact = max(-15, min(15, int(choice.get('destiny_impact') or 0) + variation))
+    session['turns'].append(dict(current, choice=choice['text'], impact=impact))
+    session['destiny_score'] += impact
+    session['age'] += years
+    session['current'] = None
+    return True
+
+
+def rewind(session, event):
+    """回到第event轮(从0开始)重新选择"""
+    if not 0 <= event < len(session['turns']):
+        raise SessionError("事件不存在: {}".format(event))
+    turn = session['turns'][event]
+    session['destiny_score'] -= sum(t['impact'] for t in session['turns'][event:])
+    session['turns'] = session['turns'][:event]
+    session['age'] = turn['age']
+    session['current'] = {name: turn[name] for name in ('age', 'title', 'story', 'choices', 'rolls')}
+
+
+def history(session, recent=3, summary_size=600, excerpt=200):
+    """提示词中的历史：(更早事件的摘要行, 省略的事件数, 最近几轮)"""
+    turns = session['turns']
+    split = max(len(turns) - recent, 0)
+    lines = ["{}岁《{}》选择：{}".format(t['age'], t['title'], t['choice']) for t in turns[:split]]
+    size = omitted = 0
+    for n in range(len(lines) - 1, -1, -1):
+        size += len(lines[n])
+        if size > summary_size:
+            omitted = n + 1
+            break
+    recent_turns = [dict(t, story=t['story'][:excerpt]) for t in turns[split:]]
+    return lines[omitted:], omitted, recent_turns
+
+
+def history_text(session, recent=3, summary_size=600, excerpt=200):
+    lines, omitted, recent_turns = history(session, recent, summary_size, excerpt)
+    if not lines and not recent_turns:
+        return '暂无历史选择'
+    parts = []
+    if omitted:
+        parts.append("（更早的{}个事件从略）".format(omitted))
+    parts.extend(lines)
+    for t in recent_turns:
+        parts.append("{}岁《{}》{}\n选择：{}".format(t['age'], t['title'], t['story'], t['choice']))
+    return '\n'.join(parts)
+
+
+def style_text(session):
+    """故事风格的(背景设定, 要求)"""
+    age = session['age']
+    style = session['settings']['storyStyle']
+    if style == 'fantasy':
+        return ("""
+## 故事背景设定：
+- 故事风格：奇幻冒险
+- 世界观：命理法则化为魔法力量的奇幻世界
+- 八字对应：五行成为魔法元素，十神化为天赋技能
+- 神煞系统：古代神煞成为神秘力量的源泉""", """
+- 将八字命理概念融入奇幻元素（如五行魔法、命格天赋等）
+- 创造充满想象力的奇幻场景和生物
+- 保持命理学逻辑的同时，增加魔法冒险元素
+- 故事要有奇幻色彩但仍体现人生选择的重要性""")
+    if style == 'historical':
+        return ("""
+## 故事背景设定：
+- 故事风格：古代传奇
+- 时代背景：中国古代传统社会
+- 文化环境：传统命理学盛行的时代
+- 社会结构：古代的家族、官场、江湖体系""", """
+- 故事发生在中国古代，体现传统文化和社会制度
+- 融入古代的科举、家族、师承等社会元素
+- 使用符合古代背景的语言风格和情节设定
+- 强调传统命理学在古代社会中的作用和影响""")
+    if style == 'modern':
+        return ("""
+## 故事背景设定：
+- 故事风格：都市传说
+- 时代背景：现代都市
+- 科技环境：命理与现代科技的神秘融合
+- 社会背景：现代都市中隐藏的命理秘密""", """
+- 故事设定在现代都市环境中
+- 将传统命理学与现代科技巧妙结合
+- 创造都市传说般的神秘氛围
+- 体现现代人生活中的命理元素和选择""")
+    year = birth_year(session) + age
+    start = '从出生开始' if session['settings']['startTime'] == 'birth' else '从现在开始'
+    return ("""
+## 故事背景设定：
+- 故事风格：现实写实
+- 时代背景：{year}年
+- 历史环境：请结合{year}年前后的真实历史事件和社会背景
+- 开始时间：{start}
+- 当前实际年龄：{age}岁""".format(year=year, start=start, age=age), """
+- 故事必须基于真实的历史事件和社会背景
+- 融入{year}年代的时代特色（科技、文化、政治环境等）
+- 事件要符合当时的社会现实和历史可能性
+- 如果涉及重大历史事件，要保持历史准确性
+- 故事不必过于玄乎，随机事件不应太统一类型，大事件也有可能是黑天鹅事件，比如疫情、地震、经济危机、战争、科技变革等
+- 重要：故事中提到的年龄必须与当前游戏年龄({age}岁)保持一致""".format(year=year, age=age))
+
+
+story_template = """你是一位精通命理学的游戏剧情设计师，请基于以下八字信息为用户创建一个命运轨迹游戏的情节。
+
+## 用户八字信息：
+- 出生日期：{birth[date]} ({birth[calendar_type]})
+- 出生时辰：{birth[time]}点
+- 性别：{birth[gender]}
+- 生肖：{birth[shengxiao]}
+
+## 八字分析：
+{bazi_analysis}
+
+## 生肖分析：
+年支：{shengxiao[year_zhi]}
+相合生肖：{compatible}
+相冲生肖：{incompatible}
+
+{style_context}
+
+## 当前游戏状态：
+- 当前年龄：{age}岁
+- 人生阶段：{stage.name} ({stage.description})
+- 命运值：{score}
+- 已发生事件：{events}个
+
+## 历史选择记录：
+{history}
+
+## 任务要求：
+请创建一个符合用户命理特征的人生情节，包含：
+
+1. **情节描述**：根据用户的八字特点和当前年龄阶段，描述一个具体的人生事件或情况
+2. **3-4个选择项**：提供3-4个不同的应对方式，体现不同的人生态度和价值观
+
+## 重要注意事项：
+- 故事中提到的年龄必须严格与当前游戏年龄({age}岁)保持一致
+- 不要在故事中出现与当前年龄不符的描述
+- 如果是0岁，应该描述婴儿时期的事件
+- 如果是成年人，不要描述童年场景
+
+## 故事风格要求：
+{style_requirements}
+
+## 输出格式：
+请严格按照以下JSON格式输出：
+
+```json
+{{
+  "title": "情节标题",
+  "story": "详细的故事描述，要生动有趣，符合命理特征和故事风格",
+  "choices": [
+    {{
+      "text": "选择1的描述",
+      "consequence": "这个选择可能带来的结果",
+      "destiny_impact": 5
+    }},
+    {{
+      "text": "选择2的描述",
+      "consequence": "这个选择可能带来的结果",
+      "destiny_impact": -3
+    }},
+    {{
+      "text": "选择3的描述",
+      "consequence": "这个选择可能带来的结果",
+      "destiny_impact": 0
+    }}
+  ]
+}}
+```
+
+要求：
+- 故事要符合用户的八字命理特征和选择的故事风格
+- 选择要有明确的后果预示
+- destiny_impact范围在-10到+10之间，但不应固定顺序和数值，要随机分布
+- 语言要生动有趣，适合游戏体验
+- 体现命理学中的因果关系
+- **关键要求：故事中的年龄描述必须与当前游戏年龄({age}岁)完全一致，不得出现年龄错误**"""
+
+
+summary_template = """你是一位德高望重的命理大师，现在需要为一个人的完整人生做出总结和盖棺定论。
+
+## 基本信息：
+- 出生日期：{birth[date]}
+- 性别：{birth[gender]}
+- 生肖：{birth[shengxiao]}
+
+## 八字分析：
+{bazi_analysis}
+
+## 人生轨迹：
+{history}
+
+## 人生数据：
+- 最终年龄：{age}岁
+- 命运值：{score}
+- 经历事件：{events}个
+- 故事风格：{style}
+
+## 任务要求：
+请基于以上信息，写一篇深刻的人生总结，包含：
+
+1. **人生回顾**：总结这个人的主要人生阶段和关键事件
+2. **性格特点**：基于八字分析和人生选择，分析其性格特征
+3. **成就与遗憾**：客观评价人生的成功和不足
+4. **人生感悟**：从命理角度分析人生的因果关系
+5. **盖棺定论**：给出最终的人生评价和启示
+
+## 写作要求：
+- 语言优美，富有哲理
+- 结合命理学知识，体现因果关系
+- 既要客观公正，又要充满人文关怀
+- 篇幅适中，约500-800字
+- 以第三人称叙述，语调庄重而温暖
+
+请以纯文本形式输出，不需要JSON格式。"""
+
+
+def story_prompt(session, **options):
+    """生成下一轮故事的提示词"""
+    bazi = session['bazi']
+    shengxiao = bazi.get('shengxiao_analysis') or {}
+    style_context, style_requirements = style_text(session)
+    return story_template.format(
+        birth=collections.defaultdict(str, bazi['birth_info']), bazi_analysis=bazi.get('chart_summary') or bazi.get('bazi_analysis', ''),
+        shengxiao=collections.defaultdict(str, shengxiao),
+        compatible=json.dumps(shengxiao.get('compatible'), ensure_ascii=False),
+        incompatible=json.dumps(shengxiao.get('incompatible'), ensure_ascii=False),
+        style_context=style_context, style_requirements=style_requirements, age=session['age'],
+        stage=stage(session['age']), score=session['destiny_score'], events=len(session['turns']),
+        history=history_text(session, **options))
+
+
+def summary_prompt(session, **options):
+    """游戏结束时人生总结的提示词"""
+    bazi = session['bazi']
+    return summary_template.format(
+        birth=collections.defaultdict(str, bazi['birth_info']), bazi_analysis=bazi.get('chart_summary') or bazi.get('bazi_analysis', ''),
+        history=history_text(session, **options), age=session['age'], score=session['destiny_score'],
+        events=len(session['turns']), style=session['settings']['storyStyle'])
+
+
+def hidden(turn):
+    """去掉页面上不显示的随机结果"""
+    return turn and {name: value for name, value in turn.items() if name != 'rolls'}
+
+
+def after_choice(session, index):
+    """选择第index个选项之后的会话(副本)"""
+    session = json.loads(json.dumps(session))
+    choose(session, index)
+    return session
+
+
+def public_state(session, turns=False):
+    """返回给页面的游戏状态"""
+    result = {'session_id': session['id'], 'age': session['age'], 'stage': stage(session['age']).name,
+              'destiny_score': session['destiny_score'], 'event_count': len(session['turns']),
+              'settings': session['settings'], 'current': hidden(session['current'])}
+    if turns:
+        result['turns'] = [hidden(turn) for turn in session['turns']]
+    return result
+
+
+def open_sessions():
+    """按环境变量创建会话存储"""
+    path = os.environ.get("BAZI_SESSION_DB", DEFAULT_PATH)
+    return SessionStore(size=int(os.environ.get("BAZI_SESSION_SIZE", 1000)),
+                        backend=SQLiteBackend(path) if path else None,
+                        ttl=float(os.environ.get("BAZI_SESSION_TTL", 7 * 86400)))
+
+
+def history_options():
+    return dict(recent=int(os.environ.get("BAZI_SESSION_RECENT", 3)),
+                summary_size=int(os.environ.get("BAZI_SESSION_SUMMARY", 600)))
@@ -10,6 +10,14 @@ Gan = ["甲", "乙", "丙", "丁", "戊", "己", "庚", "辛", "壬", "癸"]
 
 Zhi = ["子", "丑", "寅", "卯", "辰", "巳", "午", "未", "申", "酉", "戌", "亥"]
 
+# 整数编码：天干0-9，地支0-11，用来代替Gan.index/Zhi.index
+gan_nums = {item: seq for seq, item in enumerate(Gan)}
+zhi_nums = {item: seq for seq, item in enumerate(Zhi)}
+
+# 60甲子，jiazis[0]为甲子
+jiazis = tuple(Gan[seq % 10] + Zhi[seq % 12] for seq in range(60))
+jiazi_nums = {item: seq for seq, item in enumerate(jiazis)}
+
 datouxiu = ("壬子", "癸丑", "丙辰", "丁巳", "戊午", "己未", "庚申", "辛酉")
 
 xiaotouxiu = ("壬午", "癸未", "庚子", "辛丑", "戊子", "己丑")
@@ -55,6 +63,12 @@ zhi5 = {
     "戌":OrderedDict({"戊":5, "辛":2, "丁":1 }),
     "亥":OrderedDict({"壬":5, "甲":3, })}
 
+# 地支藏干的整数形式：zhi5_table[地支] = ((天干, 分数), ...)，顺序同zhi5
+zhi5_table = tuple(tuple((gan_nums[gan], score) for gan, score in zhi5[zhi].items()) for zhi in Zhi)
+
+# 12x10：各地支中每个天干的藏干分数
+zhi5_weights = tuple(tuple(zhi5[zhi].get(gan, 0) for gan in Gan) for zhi in Zhi)
+
 zhi5_list = {
     "子":["癸"], 
     "丑":["己", "癸", "辛"], 
@@ -78,60 +92,50 @@ ymc = ["十一", "十二", "正", "二", "三", "四", "五", "六", "七", "八
 rmc = ["初一", "初二", "初三", "初四", "初五", "初六", "初七", "初八", "初九", "初十", "十一", "十二", "十三", "十四", "十五", "十六", "十七", "十八", "十九", "二十", "廿一", "廿二", "廿三", "廿四", "廿五", "廿六", "廿七", "廿八", "廿九", "三十", "卅一"]
 
 
-ten_deities = {
-    '甲':bidict({'甲':'比', "乙":'劫', "丙":'食', "丁":'伤', "戊":'才',
-                  "己":'财', "庚":'杀', "辛":'官', "壬":'枭', "癸":'印', "子":'沐', 
-                  "丑":'冠', "寅":'建', "卯":'帝', "辰":'衰', "巳":'病', "午":'死', 
-                  "未":'墓', "申":'绝', "酉":'胎', "戌":'养', "亥":'长', '库':'未_', 
-                  '本':'木', '克':'土', '被克':'金', '生我':'水', '生':'火','合':'己','冲':'庚'}),
-    '乙':bidict({'甲':'劫', "乙":'比', "丙":'伤', "丁":'食', "戊":'财',
-                  "己":'才', "庚":'官', "辛":'杀', "壬":'印',"癸":'枭', "子":'病', 
-                  "丑":'衰', "寅":'帝', "卯":'建', "辰":'冠', "巳":'沐', "午":'长',
-                  "未":'养', "申":'胎', "酉":'绝', "戌":'墓', "亥":'死', '库':'未_',
-                  '本':'木', '克':'土', '被克':'金', '生我':'水', '生':'火','合':'庚','冲':'辛'}),
-    '丙':bidict({'丙':'比', "丁":'劫', "戊":'食', "己":'伤', "庚":'才',
-                  "辛":'财', "壬":'杀', "癸":'官', "甲":'枭', "乙":'印',"子":'胎', 
-                  "丑":'养', "寅":'长', "卯":'沐', "辰":'冠', "巳":'建', "午":'帝',
-                  "未":'衰', "申":'病', "酉":'死', "戌":'墓', "亥":'绝', '库':'戌_',
-                  '本':'火', '克':'金', '被克':'水', '生我':'木', '生':'土','合':'辛','冲':'壬'}),
-    '丁':bidict({'丙':'劫', "丁":'比', "戊":'伤', "己":'食', "庚":'财',
-                  "辛":'才', "壬":'官', "癸":'杀', "甲":'印',"乙":'枭', "子":'绝', 
-                  "丑":'墓', "寅":'死', "卯":'病', "辰":'衰', "巳":'帝', "午":'建',
-                  "未":'冠', "申":'沐', "酉":'长', "戌":'养', "亥":'胎', '库':'戌_',
-                  '本':'火', '克':'金', '被克':'水', '生我':'木', '生':'土','合':'壬','冲':'癸'}),
-    '戊':bidict({'戊':'比', "己":'劫', "庚":'食', "辛":'伤', "壬":'才',
-                  "癸":'财', "甲":'杀', "乙":'官', "丙":'枭', "丁":'印',"子":'胎', 
-                  "丑":'养', "寅":'长', "卯":'沐', "辰":'冠', "巳":'建', "午":'帝',
-                  "未":'衰', "申":'病', "酉":'死', "戌":'墓', "亥":'绝', '库':'辰_',
-                  '本':'土', '克':'水', '被克':'木', '生我':'火', '生':'金','合':'癸','冲':''}),
-    '己':bidict({'戊':'劫', "己":'比', "庚":'伤', "辛":'食', "壬":'财',
-                  "癸":'才', "甲":'官', "乙":'杀', "丙":'印',"丁":'枭',"子":'绝', 
-                  "丑":'墓', "寅":'死', "卯":'病', "辰":'衰', "巳":'帝', "午":'建',
-                  "未":'冠', "申":'沐', "酉":'长', "戌":'养', "亥":'胎', '库':'辰_',
-                  '本':'土', '克':'水', '被克':'木', '生我':'火', '生':'金','合':'甲','冲':''}),
-    '庚':bidict({'庚':'比', "辛":'劫', "壬":'食', "癸":'伤', "甲":'才',
-                  "乙":'财', "丙":'杀', "丁":'官', "戊":'枭', "己":'印',"子":'死', 
-                  "丑":'墓', "寅":'绝', "卯":'胎', "辰":'养', "巳":'长', "午":'沐',
-                  "未":'冠', "申":'建', "酉":'帝', "戌":'衰', "亥":'病', '库':'丑_',
-                  '本':'金', '克':'木', '被克':'火', '生我':'土', '生':'水','合':'乙','冲':'甲'}), 
-    '辛':bidict({'庚':'劫', "辛":'比', "壬":'伤', "癸":'食', "甲":'财',
-                  "乙":'才', "丙":'官', "丁":'杀', "戊":'印', "己":'枭', "子":'长', 
-                  "丑":'养', "寅":'胎', "卯":'绝', "辰":'墓', "巳":'死', "午":'病',
-                  "未":'衰', "申":'帝', "酉":'建', "戌":'冠', "亥":'沐', '库':'丑_',
-                  '本':'金', '克':'木', '被克':'火', '生我':'土', '生':'水','合':'丙','冲':'乙'}),
-    '壬':bidict({'壬':'比', "癸":'劫', "甲":'食', "乙":'伤', "丙":'才',
-                  "丁":'财', "戊":'杀', "己":'官', "庚":'枭', "辛":'印',"子":'帝', 
-                  "丑":'衰', "寅":'病', "卯":'死', "辰":'墓', "巳":'绝', "午":'胎',
-                  "未":'养', "申":'长', "酉":'沐', "戌":'冠', "亥":'建', '库':'辰_',
-                  '本':'水', '克':'火', '被克':'土', '生我':'金', '生':'木','合':'丁','冲':'丙'}),
-    '癸':bidict({'壬':'劫', "癸":'比', "甲":'伤', "乙":'食', "丙":'财',
-                  "丁":'才', "戊":'官', "己":'杀', "庚":'印',"辛":'枭', "子":'建', 
-                  "丑":'冠', "寅":'沐', "卯":'长', "辰":'养', "巳":'胎', "午":'绝',
-                  "未":'墓', "申":'死', "酉":'病', "戌":'衰', "亥":'帝', '库':'辰_',
-                  '本':'水', '克':'火', '被克':'土', '生我':'金', '生':'木','合':'戊','冲':'丁'}), 
-
+# 十神(0-9)与十二长生(10-21)共用一套编码
+deity_names = ('比', '劫', '食', '伤', '才', '财', '杀', '官', '枭', '印',
+               '长', '沐', '冠', '建', '帝', '衰', '病', '死', '墓', '绝', '胎', '养')
+
+# 各天干长生所在的地支，阳干顺行，阴干逆行
+zhangsheng_zhis = (11, 6, 2, 9, 2, 9, 5, 0, 8, 3)
+
+def _ten_god_row(me):
+    row = []
+    for gan in range(10):
+        # 五行按木火土金水排列：相差0为比劫，1食伤，2财，3官杀，4印；阴阳相同取前者
+        row.append((gan//2 - me//2) % 5 * 2 + (me % 2 != gan % 2))
+    start = zhangsheng_zhis[me]
+    for zhi in range(12):
+        row.append(10 + ((zhi - start) % 12 if me % 2 == 0 else (start - zhi) % 12))
+    return tuple(row)
+
+# 10x22：行为日主，列为10天干加12地支(地支列号为10+地支编码)，值为deity_names的编码
+ten_god_table = tuple(_ten_god_row(me) for me in range(10))
+
+gan_attrs = {
+    '甲':{'库':'未_', '本':'木', '克':'土', '被克':'金', '生我':'水', '生':'火', '合':'己', '冲':'庚'},
+    '乙':{'库':'未_', '本':'木', '克':'土', '被克':'金', '生我':'水', '生':'火', '合':'庚', '冲':'辛'},
+    '丙':{'库':'戌_', '本':'火', '克':'金', '被克':'水', '生我':'木', '生':'土', '合':'辛', '冲':'壬'},
+    '丁':{'库':'戌_', '本':'火', '克':'金', '被克':'水', '生我':'木', '生':'土', '合':'壬', '冲':'癸'},
+    '戊':{'库':'辰_', '本':'土', '克':'水', '被克':'木', '生我':'火', '生':'金', '合':'癸', '冲':''},
+    '己':{'库':'辰_', '本':'土', '克':'水', '被克':'木', '生我':'火', '生':'金', '合':'甲', '冲':''},
+    '庚':{'库':'丑_', '本':'金', '克':'木', '被克':'火', '生我':'土', '生':'水', '合':'乙', '冲':'甲'},
+    '辛':{'库':'丑_', '本':'金', '克':'木', '被克':'火', '生我':'土', '生':'水', '合':'丙', '冲':'乙'},
+    '壬':{'库':'辰_', '本':'水', '克':'火', '被克':'土', '生我':'金', '生':'木', '合':'丁', '冲':'丙'},
+    '癸':{'库':'辰_', '本':'水', '克':'火', '被克':'土', '生我':'金', '生':'木', '合':'戊', '冲':'丁'},
 }
 
+def _build_ten_deities():
+    result = {}
+    for me, gan in enumerate(Gan):
+        items = {item: deity_names[code] for item, code in zip(Gan + Zhi, ten_god_table[me])}
+        items.update(gan_attrs[gan])
+        result[gan] = bidict(items)
+    return result
+
+# 由ten_god_table生成的查询视图，用法不变：ten_deities[日主][干支]
+ten_deities = _build_ten_deities()
+
 ju = {
     '本':'刃', '被克':'杀',  '克':'才', '生':'伤', '生我':'枭',
 }
@@ -159,6 +163,19 @@ zhi_atts = {
 
 
 
+zhi_att_types = ('冲', '刑', '被刑', '合', '会', '害', '破', '六', '暗')
+
+# 12x12：zhi_rel_table[a][b]的第n位表示地支b是地支a的zhi_att_types[n]
+zhi_rel_table = tuple(
+    tuple(sum(1 << n for n, type_ in enumerate(zhi_att_types) if Zhi[b] in zhi_atts[Zhi[a]][type_])
+          for b in range(12))
+    for a in range(12))
+
+# 由zhi_rel_table展开的关系名：zhi_rel_names[a][b] = ('冲', ...)
+zhi_rel_names = tuple(
+    tuple(tuple(type_ for n, type_ in enumerate(zhi_att_types) if mask >> n & 1) for mask in row)
+    for row in zhi_rel_table)
+
 kus = {'辰':"水土", '戌':'火土', '丑':'金', '未':'木',}
 
 gan_hes = {
@@ -389,8 +406,8 @@ def getGZ(gzStr):
 
 def get_jizhu(gan, zhi):
     
-    gan_index = Gan.index(gan)
-    zhi_index = Zhi.index(zhi) 
+    gan_index = gan_nums[gan]
+    zhi_index = zhi_nums[zhi]
     result = {}
     alls = []
     for i in range(6):
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""响应的压缩和条件请求。
+
+/api/complete的响应带完整的分析文本和结构化排盘，通常有几十KB，大部分是汉字；
+JSON和文本响应超过一定大小、客户端的Accept-Encoding接受gzip时压缩后返回，并加上Vary: Accept-Encoding。
+流式响应(SSE、NDJSON)逐条发送，不压缩。
+
+排盘结果只由出生信息决定，GET请求的排盘接口带按内容计算的强ETag，If-None-Match相同时返回304，
+只需重新验证(Cache-Control: no-cache)，因为当前大运等内容会随年份变化。
+静态文件的ETag也按内容计算(部署后修改时间变化不影响)，带版本号(?v=...)的静态文件可以长期缓存。
+压缩后的表示与原来的不同，ETag加上-gzip后缀；静态文件压缩后的内容按ETag缓存，不必每次重新压缩。
+
+环境变量:
+    BAZI_COMPRESS           为0时不压缩，默认1
+    BAZI_COMPRESS_MIN_SIZE  压缩的最小字节数，默认1024
+    BAZI_COMPRESS_LEVEL     gzip的压缩级别，默认6
+    BAZI_STATIC_MAX_AGE     带版本号的静态文件的缓存秒数，默认一年
+"""
+
+import collections
+import gzip
+import hashlib
+import os
+import threading
+
+# 可以压缩的类型，text/*之外
+compressible_types = {'application/json', 'application/javascript', 'image/svg+xml'}
+# 支持的编码和压缩函数
+encoders = {'gzip': lambda data, level: gzip.compress(data, level, mtime=0)}
+
+
+def content_etag(data):
+    """按内容计算的强ETag"""
+    return hashlib.sha256(data).hexdigest()[:32]
+
+
+class Delivery:
+    """在after_request中处理响应：条件请求、压缩和缓存头"""
+
+    def __init__(self, compress=True, min_size=1024, level=6, static_max_age=365 * 24 * 3600, static_size=64):
+        self.compress = compress
+        self.min_size = min_size
+        self.level = level
+        self.static_max_age = static_max_age
+        self.static_size = static_size
+        # 静态文件：werkzeug的ETag(修改时间、大小) -> 按内容计算的ETag；(ETag, 编码) -> 压缩后的内容
+        self.static = collections.OrderedDict()
+        self.lock = threading.Lock()
+        self.stats = collections.Counter()
+
+    def compressible(self, response, size):
+        """响应是否可以压缩(还要看客户端是否接受)"""
+        if not self.compress or size < self.min_size or 'Content-Encoding' in response.headers:
+            return False
+        if 'no-transform' in response.headers.get('Cache-Control', ''):
+            return False
+        return response.mimetype.startswith('text/') or response.mimetype in compressible_types
+
+    def _remember(self, key, value):
+        with self.lock:
+            self.static[key] = value
+            self.static.move_to_end(key)
+            while len(self.static) > self.static_size:
+                self.static.popitem(last=False)
+
+    def _cached(self, key, make):
+        with self.lock:
+            value = self.static.get(key)
+            if value is not None:
+                self.static.move_to_end(key)
+                return value
+        value = make()
+        self._remember(key, value)
+        return value
+
+    def _encode(self, data, name):
+        encoded = encoders[name](data, self.level)
+        with self.lock:
+            self.stats['compressed'] += 1
+            self.stats['bytes_in'] += len(data)
+            self.stats['bytes_out'] += len(encoded)
+        return encoded
+
+    def process(self, request, response, static=False):
+        """处理响应，返回处理后的响应；static为静态文件"""
+        if response.status_code != 200:
+            return response
+        if static:
+            # 读出文件内容，按内容计算ETag
+            response.direct_passthrough = False
+            data = response.get_data()
+            etag = self._cached(('etag', response.get_etag()[0]), lambda: content_etag(data))
+            response.set_etag(etag)
+            if request.args.get('v'):
+                response.cache_control.public = True
+                response.cache_control.max_age = self.static_max_age
+                response.cache_control.immutable = True
+                response.cache_control.no_cache = None
+        elif response.is_streamed:
+            return response
+
+        data = response.get_data()
+        etag, weak = response.get_etag()
+        name = None
+        if self.compressible(response, len(data)):
+            response.vary.add('Accept-Encoding')
+            name = next((name for name in encoders if request.accept_encodings[name]), None)
+        if etag and name is not None:
+            etag = etag + '-' + name
+            response.set_etag(etag, weak)
+        if etag and request.method in ('GET', 'HEAD') and request.if_none_match.contains_weak(etag):
+            with self.lock:
+                self.stats['not_modified'] += 1
+            response.status_code = 304
+            response.set_data(b'')
+            for header in ('Content-Length', 'Content-Type', 'Content-Disposition', 'Accept-Ranges'):
+                response.headers.pop(header, None)
+            return response
+        if name is None:
+            return response
+
+        if static:
+            response.set_data(self._cached((etag, name), lambda: self._encode(data, name)))
+        else:
+            response.set_data(self._encode(data, name))
+        response.headers['Content-Encoding'] = name
+        response.headers.pop('Accept-Ranges', None)
+        return response
+
+    def info(self):
+        with self.lock:
+            result = {'compress': self.compress, 'min_size': self.min_size, 'level': self.level,
+                      'static_cached': len(self.static)}
+            result.update({name: self.stats[name] for name in ('compressed', 'bytes_in', 'bytes_out', 'not_modified')})
+        return result
+
+
+def open_delivery():
+    """按环境变量创建Delivery"""
+    return Delivery(compress=os.environ.get("BAZI_COMPRESS", "1") != "0",
+                    min_size=int(os.environ.get("BAZI_COMPRESS_MIN_SIZE", 1024)),
+                    level=int(os.environ.get("BAZI_COMPRESS_LEVEL", 6)),
+                    static_max_age=int(os.environ.get("BAZI_STATIC_MAX_AGE", 365 * 24 * 3600)))
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""节气时刻表和四柱反查出生时间。
+
+jieqi_data.jies是1850-2151年每年12个节的时刻，qis是同样排列的12个中气，lunar_months是1850-2150年的农历月表
+(都由lunar_python算出后保存)，
+月柱由节划分，年柱由立春划分，日柱60天一循环，所以给定四柱后
+只需算出符合年柱的年份、月柱对应的节的区间，再在区间内找日柱和时辰，不用逐日扫描。
+
+重新生成节气表: python jieqi.py
+"""
+
+import datetime
+import functools
+import os
+
+from ganzhi import gan_nums, zhi_nums, jiazi_nums
+
+# 每年的12个节，寅月开始，最后一个是次年的小寒
+jie_names = ('立春', '惊蛰', '清明', '立夏', '芒种', '小暑', '立秋', '白露', '寒露', '立冬', '大雪', '小寒')
+# 每个节之后的中气，最后一个是次年的大寒
+qi_names = ('雨水', '春分', '谷雨', '小满', '夏至', '大暑', '处暑', '秋分', '霜降', '小雪', '冬至', '大寒')
+
+
+def _to_datetime(value):
+    value, second = divmod(value, 100)
+    value, minute = divmod(value, 100)
+    value, hour = divmod(value, 100)
+    value, day = divmod(value, 100)
+    year, month = divmod(value, 100)
+    return datetime.datetime(year, month, day, hour, minute, second)
+
+
+@functools.lru_cache(maxsize=1)
+def get_jie_table():
+    """返回(起始年份, 节的时刻列表)，第(年-起始年份)*12+n项是该年第n个节"""
+    from jieqi_data import jie_start, jies
+    return jie_start, [_to_datetime(value) for row in jies for value in row]
+
+
+@functools.lru_cache(maxsize=1)
+def get_jieqi_table():
+    """返回(节气的时刻列表, 名称列表)，按时刻排列，立春、雨水、惊蛰...小寒、大寒，与节气表的年份范围相同"""
+    from jieqi_data import jies, qis
+    moments, names = [], []
+    for jie_row, qi_row in zip(jies, qis):
+        for jie, qi, jie_name, qi_name in zip(jie_row, qi_row, jie_names, qi_names):
+            moments += [_to_datetime(jie), _to_datetime(qi)]
+            names += [jie_name, qi_name]
+    return moments, names
+
+
+@functools.lru_cache(maxsize=1)
+def get_lunar_table():
+    """返回(起始年份, 农历月表)，每年一项(正月初一的公历日期, 闰几月(0为无闰), 各月大小)，
+    各月大小为'0'(29天)'1'(30天)组成的字符串，闰月排在所闰月份之后"""
+    from jieqi_data import lunar_start, lunar_months
+    return lunar_start, [(_to_datetime(first * 1000000).date(), leap, bits) for first, leap, bits in lunar_months]
+
+
+def _day_num(date):
+    """日柱在60甲子中的序号，2000-01-01为戊午"""
+    return (date.toordinal() + 1721474) % 60
+
+
+def _hour_range(date, time):
+    """时辰(0-11为子到亥，12为夜子时)在date这天的起止时刻"""
+    begin = datetime.datetime.combine(date, datetime.time())
+    if time == 0:
+        return begin, begin + datetime.timedelta(hours=1)
+    if time == 12:
+        return begin + datetime.timedelta(hours=23), begin + datetime.timedelta(hours=24)
+    return begin + datetime.timedelta(hours=time * 2 - 1), begin + datetime.timedelta(hours=time * 2 + 1)
+
+
+def get_birth_times(gans, zhis, start=1850, end=2030):
+    """四柱在[start, end]年内可能的出生时间列表，每项为(年, 月, 日, 时, 分, 秒)"""
+    jie_start, table = get_jie_table()
+    start = max(start, jie_start)
+    end = min(end, jie_start + len(table) // 12 - 2)
+
+    year = jiazi_nums[gans[0] + zhis[0]]
+    day = jiazi_nums[gans[2] + zhis[2]]
+    month = (zhi_nums[zhis[1]] - 2) % 12
+    time = zhi_nums[zhis[3]]
+    # 五虎遁、五鼠遁，子时的时干是次日的则为夜子时
+    if time == 0 and gan_nums[gans[3]] == (day + 1) % 5 * 2:
+        time = 12
+    if gan_nums[gans[1]] != (year % 5 * 2 + 2 + month) % 10 \
+            or (time != 12 and gan_nums[gans[3]] != (day % 5 * 2 + time) % 10):
+        return []
+
+    results = []
+    # 1864年是甲子年
+    for solar_year in range(start + (year - start + 1864) % 60, end + 1, 60):
+        index = (solar_year - jie_start) * 12 + month
+        begin, stop = table[index], table[index + 1]
+        date = begin.date() + datetime.timedelta(days=(day - _day_num(begin.date())) % 60)
+        while date <= stop.date():
+            low, high = _hour_range(date, time)
+            low, high = max(low, begin), min(high, stop)
+            if low < high:
+                results.append((low.year, low.month, low.day, low.hour, low.minute, low.second))
+            date += datetime.timedelta(days=60)
+    return results
+
+
+def find_birth_times(charts, start=1850, end=2030):
+    """批量反查，charts中每项为(天干, 地支)，如("甲丙戊壬", "子寅辰子")，逐个生成(天干, 地支, 出生时间列表)"""
+    for gans, zhis in charts:
+        yield gans, zhis, get_birth_times(gans, zhis, start, end)
+
+
+def build(path=os.path.join(os.path.dirname(os.path.abspath(__file__)), "jieqi_data.py"), start=1850, end=2151):
+    """用lunar_python计算节气表和农历月表并保存"""
+    from lunar_python import Solar, LunarYear
+
+    lines = ["#!/usr/bin/env python3", "# -*- coding: utf-8 -*-",
+             "# 由 python jieqi.py 生成，每年12个节(立春 惊蛰 ... 大雪 次年小寒)的时刻，格式为年月日时分秒",
+             "# 每年12个中气(雨水 春分 ... 冬至 次年大寒)的时刻，以及每年的农历月表", "",
+             "jie_start = {}".format(start)]
+    # 节气表中本年的冬至和次年的小寒、大寒另有名称
+    tables = [Solar.fromYmd(year, 6, 1).getLunar().getJieQiTable() for year in range(start, end + 1)]
+    for name, names in (('jies', jie_names), ('qis', qi_names)):
+        lines += ["", "{} = (".format(name)]
+        for year, table in zip(range(start, end + 1), tables):
+            row = [table[{'小寒': 'XIAO_HAN', '冬至': 'DONG_ZHI', '大寒': 'DA_HAN'}.get(item, item)] for item in names]
+            lines.append("    ({}),  # {}".format(", ".join(
+                "{:04d}{:02d}{:02d}{:02d}{:02d}{:02d}".format(item.getYear(), item.getMonth(), item.getDay(),
+                                                              item.getHour(), item.getMinute(), item.getSecond())
+                for item in row), year))
+        lines.append(")")
+
+    # 农历月表：(正月初一的公历日期, 闰几月, 各月大小，1为30天)
+    lines += ["", "lunar_start = {}".format(start), "", "lunar_months = ("]
+    for year in range(start, end):
+        months = LunarYear.fromYear(year).getMonthsInYear()
+        first = datetime.date.fromordinal(months[0].getFirstJulianDay() - 1721425)
+        leap = [-month.getMonth() for month in months if month.getMonth() < 0]
+        bits = ''.join('1' if month.getDayCount() == 30 else '0' for month in months)
+        lines.append("    ({}, {}, '{}'),  # {}".format(first.strftime("%Y%m%d"), leap[0] if leap else 0, bits, year))
+    lines.append(")")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines) + "\n")
+
+if __name__ == '__main__':
+    build()
@@ -0,0 +1,922 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# 由 python jieqi.py 生成，每年12个节(立春 惊蛰 ... 大雪 次年小寒)的时刻，格式为年月日时分秒
+# 每年12个中气(雨水 春分 ... 冬至 次年大寒)的时刻，以及每年的农历月表
+
+jie_start = 1850
+
+jies = (
+    (18500204105455, 18500306054306, 18500405113711, 18500506060259, 18500606110247, 18500707213620, 18500808070411, 18500908090729, 18501008233812, 18501108014346, 18501207174852, 18510106044635),  # 1850
+    (18510204164218, 18510306112816, 18510405171841, 18510506114019, 18510606163753, 18510708031320, 18510808124623, 18510908145541, 18511009053119, 18511108073916, 18511207234345, 18520106103904),  # 1851
+    (18520204223242, 18520305171804, 18520404230929, 18520505173256, 18520605223203, 18520707090854, 18520807184324, 18520907205251, 18521008112659, 18521107133223, 18521207053356, 18530105162644),  # 1852
+    (18530204041902, 18530305230437, 18530405045735, 18530505232250, 18530606042226, 18530707145732, 18530808002944, 18530908023839, 18531008171342, 18531107192023, 18531207112246, 18540105221535),  # 1853
+    (18540204100717, 18540306045157, 18540405104322, 18540506050636, 18540606100429, 18540707203813, 18540808060931, 18540908081920, 18541008225741, 18541108010904, 18541207171604, 18550106041155),  # 1854
+    (18550204160402, 18550306104645, 18550405163531, 18550506105651, 18550606155358, 18550708022743, 18550808115829, 18550908140708, 18551009044509, 18551108065658, 18551207230418, 18560106095944),  # 1855
+    (18560204215020, 18560305163030, 18560404221629, 18560505163551, 18560605213240, 18560707080834, 18560807174315, 18560907195426, 18561008103200, 18561107124216, 18561207044857, 18570105154510),  # 1856
+    (18570204033733, 18570305221942, 18570405040713, 18570505222743, 18570606032457, 18570707135949, 18570807233304, 18570908014320, 18571008161950, 18571107182848, 18571207103459, 18580105213234),  # 1857
+    (18580204092812, 18580306041420, 18580405100435, 18580506042458, 18580606091931, 18580707195023, 18580808051929, 18580908072746, 18581008220504, 18581108001548, 18581207162255, 18590106031940),  # 1858
+    (18590204151247, 18590306095540, 18590405154246, 18590506100021, 18590606145311, 18590708012446, 18590808105646, 18590908130847, 18591009035016, 18591108060441, 18591207221330, 18600106090929),  # 1859
+    (18600204210034, 18600305154147, 18600404212907, 18600505154917, 18600605204537, 18600707071957, 18600807165308, 18600907190348, 18601008094211, 18601107115347, 18601207040117, 18610105145720),  # 1860
+    (18610204024857, 18610305213035, 18610405031824, 18610505213925, 18610606023630, 18610707131006, 18610807224110, 18610908004945, 18611008152619, 18611107173640, 18611207094402, 18620105204116),  # 1861
+    (18620204083444, 18620306031731, 18620405090413, 18620506032212, 18620606081631, 18620707184914, 18620808042101, 18620908063131, 18621008211036, 18621107232328, 18621207153309, 18630106023225),  # 1862
+    (18630204142719, 18630306091039, 18630405145717, 18630506091449, 18630606140836, 18630708004130, 18630808101408, 18630908122531, 18631009030514, 18631108051721, 18631207212427, 18640106082008),  # 1863
+    (18640204201142, 18640305145254, 18640404203854, 18640505145645, 18640605195117, 18640707062545, 18640807160114, 18640907181526, 18641008085623, 18641107110820, 18641207031423, 18650105140835),  # 1864
+    (18650204015859, 18650305204008, 18650405022728, 18650505204750, 18650606014432, 18650707121907, 18650807215326, 18650908000653, 18651008144802, 18651107170100, 18651207090836, 18660105200421),  # 1865
+    (18660204075601, 18660306023758, 18660405082536, 18660506024526, 18660606074057, 18660707181335, 18660808034452, 18660908055604, 18661008203733, 18661107225259, 18661207150334, 18670106020046),  # 1866
+    (18670204135048, 18670306082815, 18670405141000, 18670506082431, 18670606131706, 18670707235035, 18670808092537, 18670908114052, 18671009022548, 18671108044409, 18671207205647, 18680106075508),  # 1867
+    (18680204194534, 18680305142237, 18680404200332, 18680505141756, 18680605191142, 18680707054720, 18680807152435, 18680907174004, 18681008082222, 18681107103655, 18681207024702, 18690105134520),  # 1868
+    (18690204013758, 18690305201816, 18690405020155, 18690505201714, 18690606010950, 18690707114227, 18690807211609, 18690907232945, 18691008141127, 18691107162515, 18691207083424, 18700105193235),  # 1869
+    (18700204072633, 18700306020855, 18700405075318, 18700506020639, 18700606065514, 18700707172407, 18700808025559, 18700908051017, 18701008195518, 18701107221325, 18701207142544, 18710106012456),  # 1870
+    (18710204131817, 18710306075942, 18710405134421, 18710506075919, 18710606124932, 18710707231900, 18710808085032, 18710908110406, 18711009014840, 18711108040629, 18711207201749, 18720106071445),  # 1871
+    (18720204190446, 18720305134303, 18720404192613, 18720505134157, 18720605183429, 18720707050610, 18720807143900, 18720907165229, 18721008073532, 18721107095149, 18721207020241, 18730105130000),  # 1872
+    (18730204005027, 18730305192846, 18730405011156, 18730505192835, 18730606002257, 18730707105603, 18730807202849, 18730907224106, 18731008132232, 18731107153735, 18731207074833, 18740105184738),  # 1873
+    (18740204064051, 18740306012136, 18740405070546, 18740506012142, 18740606061444, 18740707164707, 18740808021909, 18740908043026, 18741008191117, 18741107212617, 18741207133725, 18750106003608),  # 1874
+    (18750204122743, 18750306070530, 18750405124535, 18750506065700, 18750606114632, 18750707221844, 18750808075451, 18750908101204, 18751009005749, 18751108031512, 18751207192550, 18760106062218),  # 1875
+    (18760204181141, 18760305124811, 18760404182818, 18760505124104, 18760605173254, 18760707040738, 18760807134611, 18760907160500, 18761008065042, 18761107090629, 18761207011449, 18770105120913),  # 1876
+    (18770203235735, 18770305183445, 18770405001656, 18770505183154, 18770605232436, 18770707095743, 18770807193254, 18770907214937, 18771008123543, 18771107145320, 18771207070337, 18780105175913),  # 1877
+    (18780204054745, 18780306002353, 18780405060323, 18780506001415, 18780606050230, 18780707153226, 18780808010618, 18780908032345, 18781008181313, 18781107203610, 18781207125149, 18790105235057),  # 1878
+    (18790204114006, 18790306061414, 18790405115112, 18790506060058, 18790606104957, 18790707212137, 18790808065716, 18790908091524, 18791009000436, 18791108022702, 18791207184227, 18800106054136),  # 1879
+    (18800204173030, 18800305120347, 18800404173920, 18800505114749, 18800605163625, 18800707030839, 18800807124528, 18800907150416, 18801008055214, 18801107081233, 18801207002648, 18810105112635),  # 1880
+    (18810203231738, 18810305175328, 18810404233048, 18810505173939, 18810605222711, 18810707085733, 18810807183238, 18810907205052, 18811008113909, 18811107135936, 18811207061353, 18820105171441),  # 1881
+    (18820204050821, 18820305234800, 18820405052856, 18820505233927, 18820606042617, 18820707145433, 18820808002659, 18820908024308, 18821008173122, 18821107195330, 18821207120920, 18830105230943),  # 1882
+    (18830204110047, 18830306053650, 18830405111422, 18830506052214, 18830606100709, 18830707203438, 18830808060818, 18830908082705, 18831008231810, 18831108014238, 18831207175929, 18840106045923),  # 1883
+    (18840204164901, 18840305112339, 18840404170059, 18840505111049, 18840605155939, 18840707023114, 18840807120704, 18840907142518, 18841008051351, 18841107073517, 18841206235011, 18850105104950),  # 1884
+    (18850203224031, 18850305171654, 18850404225623, 18850505170826, 18850605215859, 18850707083042, 18850807180430, 18850907201945, 18851008110543, 18851107132534, 18851207054006, 18860105164037),  # 1885
+    (18860204043252, 18860305231000, 18860405044748, 18860505225546, 18860606034131, 18860707141015, 18860807234402, 18860908020109, 18861008164933, 18861107191144, 18861207112805, 18870105222940),  # 1886
+    (18870204102208, 18870306045851, 18870405103619, 18870506044443, 18870606093154, 18870707200247, 18870808053926, 18870908075930, 18871008224931, 18871108011045, 18871207172400, 18880106042135),  # 1887
+    (18880204161033, 18880305104522, 18880404162247, 18880505103214, 18880605152050, 18880707015302, 18880807113039, 18880907135131, 18881008044147, 18881107070239, 18881206231446, 18890105101039),  # 1888
+    (18890203215755, 18890305163145, 18890404220920, 18890505161936, 18890605210816, 18890707073926, 18890807171538, 18890907193549, 18891008102701, 18891107125005, 18891207050441, 18900105160231),  # 1889
+    (18900204035047, 18900305222450, 18900405040215, 18900505221225, 18900606030114, 18900707133224, 18900807230800, 18900908012718, 18901008161850, 18901107184411, 18901207110154, 18910105220115),  # 1890
+    (18910204094746, 18910306041652, 18910405094735, 18910506035136, 18910606083646, 18910707190722, 18910808044506, 18910908070737, 18911008220143, 18911108002846, 18911207164738, 18920106034804),  # 1891
+    (18920204153534, 18920305100451, 18920404153438, 18920505093725, 18920605142244, 18920707005525, 18920807103540, 18920907125929, 18921008035249, 18921107061724, 18921206223407, 18930105093425),  # 1892
+    (18930203212409, 18930305155709, 18930404213038, 18930505153516, 18930605201949, 18930707064949, 18930807162643, 18930907184806, 18931008094038, 18931107120507, 18931207042136, 18940105152157),  # 1893
+    (18940204031237, 18940305214648, 18940405032001, 18940505212155, 18940606020108, 18940707122516, 18940807215852, 18940908002016, 18941008151533, 18941107174424, 18941207100448, 18950105210704),  # 1894
+    (18950204085733, 18950306033044, 18950405090351, 18950506030720, 18950606074918, 18950707181535, 18950808035016, 18950908061226, 18951008210803, 18951107233624, 18951207155534, 18960106025549),  # 1895
+    (18960204144341, 18960305091446, 18960404144730, 18960505085235, 18960605133731, 18960707000631, 18960807094141, 18960907120207, 18961008025504, 18961107052120, 18961206213944, 18970105084025),  # 1896
+    (18970203202909, 18970305150046, 18970404203342, 18970505143850, 18970605192320, 18970707055145, 18970807152609, 18970907174510, 18971008083642, 18971107110220, 18971207032124, 18980105142407),  # 1897
+    (18980204021542, 18980305204951, 18980405022404, 18980505202924, 18980606011411, 18980707114331, 18980807211921, 18980907233925, 18981008143114, 18981107165652, 18981207091544, 18990105201727),  # 1898
+    (18990204080656, 18990306023811, 18990405080849, 18990506021028, 18990606065238, 18990707172127, 18990808025933, 18990908052358, 18991008201942, 18991107224649, 18991207150433, 19000106020357),  # 1899
+    (19000204135131, 19000306082152, 19000405135241, 19000506075512, 19000606123855, 19000707231008, 19000808085034, 19000908111638, 19001009021309, 19001108043944, 19001207205550, 19010106075323),  # 1900
+    (19010204193952, 19010306141053, 19010405194421, 19010506135024, 19010606183627, 19010708050734, 19010808144606, 19010908171015, 19011009080628, 19011108103429, 19011208025237, 19020106135133),  # 1901
+    (19020205013810, 19020306200732, 19020406013726, 19020506193848, 19020607001947, 19020708104619, 19020808202216, 19020908224625, 19021009134510, 19021108161746, 19021208084101, 19030106194343),  # 1902
+    (19030205073117, 19030307015852, 19030406072553, 19030507012522, 19030607060707, 19030708163636, 19030809021550, 19030909044221, 19031009194144, 19031108221323, 19031208143519, 19040107013702),  # 1903
+    (19040205132407, 19040306075139, 19040405131851, 19040506071834, 19040606120058, 19040707223141, 19040808081151, 19040908103758, 19041009013534, 19041108040458, 19041207202520, 19050106072706),  # 1904
+    (19050204191549, 19050306134536, 19050405191428, 19050506131404, 19050606175333, 19050708041959, 19050808135657, 19050908162146, 19051009071936, 19051108094946, 19051208021047, 19060106131327),  # 1905
+    (19060205010354, 19060306193606, 19060406010716, 19060506190829, 19060606234854, 19060708101516, 19060808195134, 19060908221612, 19061009131453, 19061108154654, 19061208080925, 19070106191125),  # 1906
+    (19070205065849, 19070307012705, 19070406065447, 19070507005335, 19070607053256, 19070708155910, 19070809013558, 19070909040202, 19071009190242, 19071108213617, 19071208135926, 19080107010107),  # 1907
+    (19080205124713, 19080306071334, 19080405123946, 19080506063820, 19080606111903, 19080707214800, 19080808072642, 19080908095216, 19081009005051, 19081108032201, 19081207194337, 19090106064513),  # 1908
+    (19090204183231, 19090306130047, 19090405182925, 19090506123050, 19090606171356, 19090708034357, 19090808132228, 19090908154635, 19091009064308, 19091108091303, 19091208013449, 19100106123757),  # 1909
+    (19100205002722, 19100306185630, 19100406002255, 19100506181920, 19100606225620, 19100708092102, 19100808185708, 19100908212210, 19101009122105, 19101108145323, 19101208071653, 19110106182052),  # 1910
+    (19110205061016, 19110307003850, 19110406060432, 19110507000018, 19110607043752, 19110708150455, 19110809004425, 19110909031316, 19111009181456, 19111108204700, 19111208130734, 19120107000729),  # 1911
+    (19120205115331, 19120306062059, 19120405114815, 19120506054703, 19120606102729, 19120707205642, 19120808063710, 19120908090539, 19121009000642, 19121108023838, 19121207185853, 19130106055754),  # 1912
+    (19130204174238, 19130306120858, 19130405173551, 19130506113439, 19130606161324, 19130708023852, 19130808121547, 19130908144224, 19131009054340, 19131108081742, 19131208004101, 19140106114251),  # 1913
+    (19140204232916, 19140306175548, 19140405232150, 19140506172003, 19140606215956, 19140708082712, 19140808180511, 19140908203226, 19141009113447, 19141108141101, 19141208063705, 19150106174016),  # 1914
+    (19150205052526, 19150306234816, 19150406050915, 19150506230244, 19150607034007, 19150708140745, 19150808234741, 19150909021705, 19151009172052, 19151108195738, 19151208122353, 19160106232747),  # 1915
+    (19160205111358, 19160306053721, 19160405105749, 19160506044945, 19160606092539, 19160707195333, 19160808053455, 19160908080459, 19161008230751, 19161108014215, 19161207180609, 19170106050927),  # 1916
+    (19170204165732, 19170306112448, 19170405164954, 19170506104542, 19170606152310, 19170708015013, 19170808113007, 19170908135921, 19171009050208, 19171108073654, 19171208000059, 19180106110423),  # 1917
+    (19180204225305, 19180306172055, 19180405224512, 19180506163811, 19180606211057, 19180708073207, 19180808170724, 19180908193526, 19181009104017, 19181108131852, 19181208054629, 19190106165128),  # 1918
+    (19190205043923, 19190306230529, 19190406042844, 19190506222200, 19190607025636, 19190708132030, 19190808225801, 19190909012737, 19191009163320, 19191108191130, 19191208113747, 19200106224047),  # 1919
+    (19200205102626, 19200306045102, 19200405101454, 19200506041117, 19200606085022, 19200707191836, 19200808045814, 19200908072632, 19201008222908, 19201108010454, 19201207173016, 19210106043340),  # 1920
+    (19210204162012, 19210306104509, 19210405160841, 19210506100417, 19210606144125, 19210708010634, 19210808104325, 19210908130939, 19211009041036, 19211108064530, 19211207231125, 19220106101655),  # 1921
+    (19220204220624, 19220306163349, 19220405215800, 19220506155250, 19220606203015, 19220708065725, 19220808163708, 19220908190619, 19221009100925, 19221108124512, 19221208051038, 19230106161400),  # 1922
+    (19230205040017, 19230306222426, 19230406034547, 19230506213814, 19230607021418, 19230708124211, 19230808222429, 19230909005709, 19231009160322, 19231108184020, 19231208110433, 19240106220533),  # 1923
+    (19240205094932, 19240306041212, 19240405093307, 19240506032539, 19240606080131, 19240707182924, 19240808041214, 19240908064530, 19241008215209, 19241108002911, 19241207165259, 19250106035314),  # 1924
+    (19250204153645, 19250306095950, 19250405152227, 19250506091751, 19250606135622, 19250708002454, 19250808100705, 19250908124001, 19251009034722, 19251108062613, 19251207225217, 19260106095417),  # 1925
+    (19260204213816, 19260306155941, 19260405211817, 19260506150820, 19260606194137, 19260708060536, 19260808154412, 19260908181551, 19261009092451, 19261108120742, 19261208043839, 19270106154437),  # 1926
+    (19270205033002, 19270306215016, 19270406030606, 19270506205304, 19270607012445, 19270708114955, 19270808213123, 19270909000525, 19271009151505, 19271108175654, 19271208102618, 19280106213111),  # 1927
+    (19280205091622, 19280306033714, 19280405085431, 19280506024329, 19280606071709, 19280707174415, 19280808032730, 19280908060145, 19281008210951, 19281107234930, 19281207161716, 19290106032201),  # 1928
+    (19290204150843, 19290306093157, 19290405145113, 19290506084020, 19290606131047, 19290707233138, 19290808090841, 19290908113934, 19291009024702, 19291108052727, 19291207215624, 19300106090232),  # 1929
+    (19300204205107, 19300306151633, 19300405203722, 19300506142659, 19300606185802, 19300708051940, 19300808145658, 19300908172822, 19301009083728, 19301108112012, 19301208035037, 19310106145535),  # 1930
+    (19310205024038, 19310306210206, 19310406022026, 19310506200935, 19310607004145, 19310708110534, 19310808204452, 19310908231715, 19311009142651, 19311108170951, 19311208094015, 19320106204503),  # 1931
+    (19320205082920, 19320306024919, 19320405080619, 19320506015508, 19320606062743, 19320707165215, 19320808023148, 19320908050252, 19321008200938, 19321107224940, 19321207151822, 19330106022320),  # 1932
+    (19330204140916, 19330306083124, 19330405135029, 19330506074145, 19330606121719, 19330707224417, 19330808082530, 19330908105726, 19331009020353, 19331108044258, 19331207211105, 19340106081627),  # 1933
+    (19340204200337, 19340306142620, 19340405194339, 19340506133044, 19340606180121, 19340708042425, 19340808140338, 19340908163608, 19341009074459, 19341108102641, 19341208025631, 19350106140219),  # 1934
+    (19350205014841, 19350306201010, 19350406012621, 19350506191202, 19350606234135, 19350708100532, 19350808194748, 19350908222404, 19351009133540, 19351108161731, 19351208084450, 19360106194637),  # 1935
+    (19360205072916, 19360306014906, 19360405070644, 19360506005630, 19360606053040, 19360707155818, 19360808014310, 19360908042035, 19361008193225, 19361107221438, 19361207144213, 19370106014344),  # 1936
+    (19370204132533, 19370306074424, 19370405130122, 19370506065035, 19370606112248, 19370707214555, 19370808072520, 19370908095923, 19371009011054, 19371108035515, 19371207202616, 19380106073108),  # 1937
+    (19380204191458, 19380306133346, 19380405184839, 19380506123509, 19380606170637, 19380708033121, 19380808131241, 19380908154808, 19381009070124, 19381108094819, 19381208022158, 19390106132751),  # 1938
+    (19390205011026, 19390306192611, 19390406003724, 19390506182102, 19390606225138, 19390708091820, 19390808190327, 19390908214201, 19391009125636, 19391108154330, 19391208081700, 19400106192340),  # 1939
+    (19400205070732, 19400306012358, 19400405063434, 19400506001616, 19400606044402, 19400707150801, 19400808005129, 19400908032914, 19401008184223, 19401107212646, 19401207135751, 19410106010354),  # 1940
+    (19410204124944, 19410306071004, 19410405122455, 19410506060950, 19410606103912, 19410707210304, 19410808064552, 19410908092348, 19411009003812, 19411108032403, 19411207195558, 19420106070218),  # 1941
+    (19420204184834, 19420306130920, 19420405182350, 19420506120650, 19420606163231, 19420708025146, 19420808123018, 19420908150607, 19421009062142, 19421108091107, 19421208014647, 19430106125450),  # 1942
+    (19430205004004, 19430306185830, 19430406001110, 19430506175321, 19430606221857, 19430708083850, 19430808181830, 19430908205508, 19431009121029, 19431108145843, 19431208073250, 19440106183915),  # 1943
+    (19440205062255, 19440306004026, 19440405055358, 19440505233943, 19440606041053, 19440707143602, 19440808001851, 19440908025532, 19441008180843, 19441107205439, 19441207132738, 19450106003426),  # 1944
+    (19450204121922, 19450306063759, 19450405115146, 19450506053635, 19450606100524, 19450707202646, 19450808060503, 19450908083807, 19451008234907, 19451108023411, 19451207190739, 19460106061619),  # 1945
+    (19460204180353, 19460306122438, 19460405173832, 19460506112129, 19460606154842, 19460708021048, 19460808115135, 19460908142725, 19461009054047, 19461108082709, 19461208010011, 19470106120620),  # 1946
+    (19470204235021, 19470306180756, 19470405232008, 19470506170257, 19470606213112, 19470708075548, 19470808174051, 19470908202103, 19471009113717, 19471108142422, 19471208065611, 19480106180013),  # 1947
+    (19480205054200, 19480305235753, 19480405050920, 19480505225213, 19480606032019, 19480707134328, 19480807232617, 19480908020459, 19481008172016, 19481107200632, 19481207123737, 19490105234108),  # 1948
+    (19490204112249, 19490306053916, 19490405105156, 19490506043634, 19490606090649, 19490707193135, 19490808051456, 19490908075409, 19491008231102, 19491108015946, 19491207183324, 19500106053843),  # 1949
+    (19500204172046, 19500306113526, 19500405164427, 19500506102441, 19500606145100, 19500708011317, 19500808105511, 19500908133339, 19501009045139, 19501108074343, 19501208002140, 19510106113022),  # 1950
+    (19510204231326, 19510306172640, 19510405223238, 19510506160915, 19510606203232, 19510708065351, 19510808163726, 19510908191810, 19511009103623, 19511108132636, 19511208060218, 19520106170945),  # 1951
+    (19520205045254, 19520305230718, 19520405041502, 19520505215401, 19520606022018, 19520707124438, 19520807223057, 19520908011342, 19521008163225, 19521107192134, 19521207115533, 19530105230202),  # 1952
+    (19530204104553, 19530306050226, 19530405101236, 19530506035218, 19530606081604, 19530707183454, 19530808041435, 19530908065243, 19531008221025, 19531108010057, 19531207173659, 19540106044517),  # 1953
+    (19540204163041, 19540306104832, 19540405155910, 19540506093810, 19540606140049, 19540708001910, 19540808095904, 19540908123751, 19541009035718, 19541108065034, 19541207232829, 19550106103552),  # 1954
+    (19550204221736, 19550306163057, 19550405213844, 19550506151758, 19550606194325, 19550708060552, 19550808155002, 19550908183146, 19551009095208, 19551108124509, 19551208052246, 19560106163017),  # 1955
+    (19560205041155, 19560305222427, 19560405033109, 19560505210958, 19560606013547, 19560707115759, 19560807214012, 19560908001856, 19561008153553, 19561107182554, 19561207110206, 19570105221025),  # 1956
+    (19570204095437, 19570306041007, 19570405091849, 19570506025822, 19570606072443, 19570707174809, 19570808033203, 19570908061211, 19571008212958, 19571108002001, 19571207165556, 19580106040420),  # 1957
+    (19580204154911, 19580306100452, 19580405151221, 19580506084910, 19580606131211, 19580707233325, 19580808091710, 19580908115849, 19581009031908, 19581108061153, 19581207224935, 19590106095818),  # 1958
+    (19590204214210, 19590306155635, 19590405210302, 19590506143842, 19590606190003, 19590708051952, 19590808150404, 19590908174754, 19591009090948, 19591108120203, 19591208043716, 19600106154227),  # 1959
+    (19600205032309, 19600305213606, 19600405024333, 19600505202233, 19600606004834, 19600707111239, 19600807205944, 19600907234522, 19601008150839, 19601107180201, 19601207103744, 19610105214236),  # 1960
+    (19610204092226, 19610306033439, 19610405084207, 19610506022116, 19610606064600, 19610707170635, 19610808024819, 19610908052912, 19611008205056, 19611107234611, 19611207162554, 19620106033456),  # 1961
+    (19620204151720, 19620306092929, 19620405143414, 19620506080928, 19620606123115, 19620707225105, 19620808083340, 19620908111520, 19621009023753, 19621108053454, 19621207221639, 19630106092626),  # 1962
+    (19630204210744, 19630306151709, 19630405201839, 19630506135157, 19630606181426, 19630708043737, 19630808142524, 19630908171150, 19631009083614, 19631108113219, 19631208041236, 19640106152220),  # 1963
+    (19640205030455, 19640305211559, 19640405021820, 19640505195101, 19640606001143, 19640707103207, 19640807201609, 19640907225926, 19641008142130, 19641107171506, 19641207095303, 19650105210157),  # 1964
+    (19650204084606, 19650306030038, 19650405080643, 19650506014132, 19650606060206, 19650707162122, 19650808020436, 19650908044750, 19651008201107, 19651107230632, 19651207154532, 19660106025420),  # 1965
+    (19660204143748, 19660306085121, 19660405135629, 19660506073026, 19660606114937, 19660707220659, 19660808074856, 19660908103201, 19661009015643, 19661108045515, 19661207213745, 19670106084819),  # 1966
+    (19670204203049, 19670306144153, 19670405194441, 19670506131726, 19670606173618, 19670708035319, 19670808133451, 19670908161742, 19671009074111, 19671108103723, 19671208031728, 19680106142610),  # 1967
+    (19680205020723, 19680305201745, 19680405012053, 19680505185547, 19680605231905, 19680707094137, 19680807192711, 19680907221124, 19681008133423, 19681107162917, 19681207090815, 19690105201648),  # 1968
+    (19690204075852, 19690306021034, 19690405071451, 19690506004947, 19690606051129, 19690707153131, 19690808011406, 19690908035525, 19691008191640, 19691107221120, 19691207145118, 19700106020139),  # 1969
+    (19700204134542, 19700306075827, 19700405130144, 19700506063347, 19700606105213, 19700707211031, 19700808065406, 19700908093753, 19701009010132, 19701108035743, 19701207203719, 19710106074506),  # 1970
+    (19710204192525, 19710306133444, 19710405183600, 19710506120808, 19710606162851, 19710708025107, 19710808124012, 19710908153012, 19711009065834, 19711108095637, 19711208023542, 19720106134150),  # 1971
+    (19720205012013, 19720305192804, 19720405002850, 19720505180110, 19720605222159, 19720707084253, 19720807182829, 19720907211506, 19721008124145, 19721107153923, 19721207081842, 19730105192519),  # 1972
+    (19730204070412, 19730306011236, 19730405061353, 19730505234623, 19730606040650, 19730707142721, 19730808001248, 19730908025924, 19731008182715, 19731107212738, 19731207141023, 19740106011955),  # 1973
+    (19740204130005, 19740306070706, 19740405120500, 19740506053352, 19740606095139, 19740707201106, 19740808055710, 19740908084504, 19741009001439, 19741108031758, 19741207200437, 19750106071730),  # 1974
+    (19750204185912, 19750306130547, 19750405180130, 19750506112711, 19750606154201, 19750708015924, 19750808114453, 19750908143317, 19751009060204, 19751108090236, 19751208014609, 19760106125722),  # 1975
+    (19760205003928, 19760305184806, 19760404234627, 19760505171424, 19760605213113, 19760707075050, 19760807173821, 19760907202812, 19761008115803, 19761107145834, 19761207074056, 19770105185103),  # 1976
+    (19770204063325, 19770306004409, 19770405054544, 19770505231600, 19770606033201, 19770707134752, 19770807233014, 19770908021541, 19771008174356, 19771107204549, 19771207133049, 19780106004312),  # 1977
+    (19780204122657, 19780306063811, 19780405113920, 19780506050832, 19780606092305, 19780707193657, 19780808051740, 19780908080224, 19781008233054, 19781108023401, 19781207192001, 19790106063133),  # 1978
+    (19790204181218, 19790306121938, 19790405171757, 19790506104710, 19790606150511, 19790708012437, 19790808111053, 19790908135945, 19791009053002, 19791108083247, 19791208011748, 19800106122853),  # 1979
+    (19800205000928, 19800305181629, 19800404231442, 19800505164428, 19800605210344, 19800707072356, 19800807170830, 19800907195327, 19801008111914, 19801107141813, 19801207070115, 19810105181238),  # 1980
+    (19810204055523, 19810306000507, 19810405050502, 19810505223447, 19810606025239, 19810707131152, 19810807225709, 19810908014313, 19811008170932, 19811107200829, 19811207125115, 19820106000235),  # 1981
+    (19820204114528, 19820306055434, 19820405105241, 19820506041959, 19820606083553, 19820707185435, 19820808044145, 19820908073143, 19821008230209, 19821108020406, 19821207184805, 19830106055842),  # 1982
+    (19830204173942, 19830306114712, 19830405164423, 19830506101051, 19830606142542, 19830708004313, 19830808102937, 19830908132003, 19831009045104, 19831108075212, 19831208003340, 19840106114051),  # 1983
+    (19840204231844, 19840305172439, 19840404222220, 19840505155057, 19840605200837, 19840707062906, 19840807161753, 19840907190950, 19841008104235, 19841107134532, 19841207062803, 19850105173505),  # 1984
+    (19850204051147, 19850305231621, 19850405041335, 19850505214232, 19850606015956, 19850707121835, 19850807220416, 19850908005301, 19851008162433, 19851107192929, 19851207121621, 19860105232802),  # 1985
+    (19860204110742, 19860306051208, 19860405100607, 19860506033036, 19860606074423, 19860707180045, 19860808034536, 19860908063437, 19861008220645, 19861108011249, 19861207180056, 19870106051300),  # 1986
+    (19870204165140, 19870306105337, 19870405154408, 19870506090535, 19870606131858, 19870707233839, 19870808092913, 19870908122407, 19871009035940, 19871108070540, 19871207235212, 19880106110330),  # 1987
+    (19880204224249, 19880305164632, 19880404213904, 19880505150143, 19880605191453, 19880707053254, 19880807152015, 19880907181131, 19881008094430, 19881107124855, 19881207053428, 19890105164555),  # 1988
+    (19890204042709, 19890305223408, 19890405032954, 19890505205355, 19890606010513, 19890707111925, 19890807210352, 19890907235353, 19891008152719, 19891107183332, 19891207112057, 19900105223314),  # 1989
+    (19900204101400, 19900306041918, 19900405091256, 19900506023526, 19900606064618, 19900707170028, 19900808024532, 19900908053728, 19901008211349, 19901108002330, 19901207171410, 19910106042807),  # 1990
+    (19910204160824, 19910306101215, 19910405150442, 19910506082653, 19910606123817, 19910707225259, 19910808083715, 19910908112721, 19911009030107, 19911108060750, 19911207225600, 19920106100831),  # 1991
+    (19920204214817, 19920305155208, 19920404204508, 19920505140840, 19920605182219, 19920707044015, 19920807142724, 19920907171820, 19921008085129, 19921107115702, 19921207044412, 19930105155631),  # 1992
+    (19930204033709, 19930305214232, 19930405023711, 19930505200143, 19930606001513, 19930707103202, 19930807201758, 19930907230747, 19931008144002, 19931107174533, 19931207103349, 19940105214807),  # 1993
+    (19940204093056, 19940306033742, 19940405083148, 19940506015405, 19940606060452, 19940707161922, 19940808020422, 19940908045507, 19941008202905, 19941107233536, 19941207162253, 19950106033405),  # 1994
+    (19950204151251, 19950306091604, 19950405140806, 19950506073003, 19950606114228, 19950707220100, 19950808075144, 19950908104834, 19951009022712, 19951108053535, 19951207222215, 19960106093127),  # 1995
+    (19960204210754, 19960305150939, 19960404200201, 19960505132602, 19960605174047, 19960707040000, 19960807134849, 19960907164225, 19961008081842, 19961107112633, 19961207041400, 19970105152428),  # 1996
+    (19970204030157, 19970305210407, 19970405015616, 19970505191926, 19970605233231, 19970707094923, 19970807193618, 19970907222849, 19971008140510, 19971107171438, 19971207100452, 19980105211809),  # 1997
+    (19980204085652, 19980306025715, 19980405074457, 19980506010310, 19980606051322, 19980707153025, 19980808011950, 19980908041555, 19981008195545, 19981107230823, 19981207160135, 19990106031709),  # 1998
+    (19990204145703, 19990306085742, 19990405134437, 19990506070100, 19990606110907, 19990707212459, 19990808071406, 19990908100959, 19991009014821, 19991108045751, 19991207214727, 20000106090042),  # 1999
+    (20000204204024, 20000305144240, 20000404193158, 20000505125010, 20000605165834, 20000707031356, 20000807130259, 20000907155910, 20001008073813, 20001107104804, 20001207033702, 20010105144916),  # 2000
+    (20010204022849, 20010305203228, 20010405012422, 20010505184450, 20010605225335, 20010707090642, 20010807185221, 20010907214611, 20011008132501, 20011107163652, 20011207092853, 20020105204330),  # 2001
+    (20020204082405, 20020306022733, 20020405071817, 20020506003718, 20020606044446, 20020707145611, 20020808003918, 20020908033102, 20021008190918, 20021107222149, 20021207151414, 20030106022743),  # 2002
+    (20030204140520, 20030306080452, 20030405125229, 20030506061029, 20030606101943, 20030707203539, 20030808062418, 20030908092014, 20031009010033, 20031108041311, 20031207210509, 20040106081833),  # 2003
+    (20040204195613, 20040305135538, 20040404184319, 20040505120228, 20040605161346, 20040707023116, 20040807121936, 20040907151255, 20041008064918, 20041107095833, 20041207024857, 20050105140259),  # 2004
+    (20050204014302, 20050305194510, 20050405003417, 20050505175250, 20050605220152, 20050707081634, 20050807180321, 20050907205640, 20051008123318, 20051107154226, 20051207083241, 20060105194657),  # 2005
+    (20060204072716, 20060306012840, 20060405061531, 20060505233039, 20060606033659, 20060707135127, 20060807234047, 20060908023901, 20061008182123, 20061107213451, 20061207142649, 20070106014010),  # 2006
+    (20070204131812, 20070306071759, 20070405120439, 20070506052024, 20070606092704, 20070707194144, 20070808053115, 20070908082929, 20071009001129, 20071108032401, 20071207201405, 20080106072450),  # 2007
+    (20080204190024, 20080305125848, 20080404174552, 20080505110326, 20080605151144, 20080707012649, 20080807111610, 20080907141408, 20081008055638, 20081107091034, 20081207020218, 20090105131408),  # 2008
+    (20090204004948, 20090305184731, 20090404233347, 20090505165050, 20090605205904, 20090707071329, 20090807170109, 20090907195737, 20091008114004, 20091107145616, 20091207075214, 20100105190847),  # 2009
+    (20100204064751, 20100306004622, 20100405053030, 20100505224402, 20100606024924, 20100707130223, 20100807224907, 20100908014441, 20101008172629, 20101107204230, 20101207133823, 20110106005437),  # 2010
+    (20110204123256, 20110306062959, 20110405111159, 20110506042313, 20110606082720, 20110707184200, 20110808043326, 20110908073414, 20111008231906, 20111108023456, 20111207192900, 20120106064355),  # 2011
+    (20120204182224, 20120305122103, 20120404170537, 20120505101941, 20120605142554, 20120707004043, 20120807103033, 20120907132901, 20121008051143, 20121107082557, 20121207011856, 20130105123338),  # 2012
+    (20130204001325, 20130305181451, 20130404230227, 20130505161810, 20130605202319, 20130707063436, 20130807162022, 20130907191616, 20131008105830, 20131107141353, 20131207070832, 20140105182411),  # 2013
+    (20140204060316, 20140306000216, 20140405044640, 20140505215926, 20140606020302, 20140707121446, 20140807220228, 20140908010125, 20141008164730, 20141107200640, 20141207130405, 20150106002032),  # 2014
+    (20150204115827, 20150306055540, 20150405103907, 20150506035236, 20150606075810, 20150707181215, 20150808040124, 20150908065934, 20151008224249, 20151108015837, 20151207185321, 20160106060823),  # 2015
+    (20160204174603, 20160305114333, 20160404162731, 20160505094153, 20160605134830, 20160707000321, 20160807095301, 20160907125105, 20161008043323, 20161107074741, 20161207004107, 20170105115545),  # 2016
+    (20170203233404, 20170305173243, 20170404221719, 20170505153102, 20170605193636, 20170707055042, 20170807154001, 20170907183838, 20171008102209, 20171107133749, 20171207063239, 20180105174845),  # 2017
+    (20180204052830, 20180305232811, 20180405041247, 20180505212522, 20180606012909, 20180707114153, 20180807213040, 20180908002942, 20181008161443, 20181107193145, 20181207122555, 20190105233858),  # 2018
+    (20190204111421, 20190306050946, 20190405095128, 20190506030248, 20190606070626, 20190707172033, 20190808031305, 20190908061654, 20191008220540, 20191108012424, 20191207181830, 20200106053006),  # 2019
+    (20200204170319, 20200305105652, 20200404153809, 20200505085123, 20200605125826, 20200706231428, 20200807090611, 20200907120802, 20201008035516, 20201107071355, 20201207000930, 20210105112326),  # 2020
+    (20210203225848, 20210305165342, 20210404213507, 20210505144711, 20210605185206, 20210707050529, 20210807145358, 20210907175256, 20211008093903, 20211107125847, 20211207055706, 20220105171404),  # 2021
+    (20220204045047, 20220305224345, 20220405032014, 20220505202557, 20220606002549, 20220707103801, 20220807202908, 20220907233218, 20221008152228, 20221107184530, 20221207114616, 20230105230451),  # 2022
+    (20230204104233, 20230306043614, 20230405091304, 20230506021846, 20230606061821, 20230707163041, 20230808022253, 20230908052643, 20231008211534, 20231108003535, 20231207173255, 20240106044922),  # 2023
+    (20240204162707, 20240305102245, 20240404150217, 20240505081005, 20240605120954, 20240706222003, 20240807080916, 20240907111120, 20241008025957, 20241107062004, 20241206231703, 20250105103247),  # 2024
+    (20250203221028, 20250305160718, 20250404204836, 20250505135713, 20250605175632, 20250707040459, 20250807135135, 20250907165157, 20251008084113, 20251107120404, 20251207050437, 20260105162310),  # 2025
+    (20260204040208, 20260305215900, 20260405024000, 20260505194844, 20260605234821, 20260707095657, 20260807194243, 20260907224116, 20261008142917, 20261107175205, 20261207105232, 20270105220958),  # 2026
+    (20270204094618, 20270306033933, 20270405081731, 20270506012512, 20270606052548, 20270707153703, 20270808012646, 20270908042828, 20271008201706, 20271107233835, 20271207163741, 20280106035439),  # 2027
+    (20280204153113, 20280305092447, 20280404140306, 20280505071212, 20280605111600, 20280706213018, 20280807072111, 20280907102210, 20281008020831, 20281107052716, 20281206222441, 20290105094155),  # 2028
+    (20290203212047, 20290305151737, 20290404195824, 20290505130746, 20290605170958, 20290707032223, 20290807131144, 20290907161154, 20291008075808, 20291107111646, 20291207041348, 20300105153034),  # 2029
+    (20300204030828, 20300305210318, 20300405014101, 20300505184618, 20300605224430, 20300707085529, 20300807184720, 20300907215250, 20301008134517, 20301107170844, 20301207100737, 20310105212309),  # 2030
+    (20310204085819, 20310306025103, 20310405072824, 20310506003512, 20310606043542, 20310707144851, 20310808004256, 20310908035011, 20311008194259, 20311107230540, 20311207160253, 20320106031607),  # 2031
+    (20320204144859, 20320305084015, 20320404131736, 20320505062552, 20320605102759, 20320706204054, 20320807063244, 20320907093755, 20321008013025, 20321107045417, 20321206215320, 20330105090807),  # 2032
+    (20330203204136, 20330305143222, 20330404190809, 20330505121347, 20330605161327, 20330707022457, 20330807121546, 20330907152022, 20331008071357, 20331107104105, 20331207034456, 20340105150431),  # 2033
+    (20340204024110, 20340305203224, 20340405010615, 20340505180910, 20340605220641, 20340707081739, 20340807180907, 20340907211359, 20341008130707, 20341107163340, 20341207093649, 20350105205543),  # 2034
+    (20350204083135, 20350306022139, 20350405065352, 20350505235457, 20350606035050, 20350707140111, 20350807235421, 20350908030230, 20351008185742, 20351107222352, 20351207152532, 20360106024332),  # 2035
+    (20360204141957, 20360305081151, 20360404124617, 20360505054924, 20360605094701, 20360706195734, 20360807054857, 20360907085500, 20361008004900, 20361107041441, 20361206211603, 20370105083405),  # 2036
+    (20370203201139, 20370305140613, 20370404184404, 20370505114929, 20370605154652, 20370707015509, 20370807114303, 20370907144535, 20371008063751, 20371107100406, 20371207030719, 20380105142649),  # 2037
+    (20380204020348, 20380305195530, 20380405002929, 20380505173113, 20380605212539, 20380707073233, 20380807172120, 20380907202618, 20381008122136, 20381107155053, 20381207085624, 20390105201641),  # 2038
+    (20390204075256, 20390306014304, 20390405061548, 20390505231811, 20390606031531, 20390707132611, 20390807231807, 20390908022404, 20391008181718, 20391107214255, 20391207144506, 20400106020339),  # 2039
+    (20400204133956, 20400305073116, 20400404120533, 20400505050923, 20400605090804, 20400706191916, 20400807051005, 20400907081408, 20401008000534, 20401107032920, 20401206203005, 20410105074810),  # 2040
+    (20410203192511, 20410305131752, 20410404175238, 20410505105433, 20410605144948, 20410707005831, 20410807104843, 20410907135336, 20411008054700, 20411107091308, 20411207021550, 20420105133510),  # 2041
+    (20420204011253, 20420305190550, 20420404234041, 20420505164253, 20420605203815, 20420707064718, 20420807163850, 20420907194531, 20421008114037, 20421107150741, 20421207080916, 20430105192523),  # 2042
+    (20430204065848, 20430306004748, 20430405052018, 20430505222207, 20430606021811, 20430707122753, 20430807222048, 20430908013013, 20431008172745, 20431107205552, 20431207135724, 20440106011234),  # 2043
+    (20440204124421, 20440305063139, 20440404110309, 20440505040532, 20440605080404, 20440706181559, 20440807040840, 20440907071635, 20441007231322, 20441107024203, 20441206194516, 20450105070235),  # 2044
+    (20450203183622, 20450305122506, 20450404165722, 20450505095935, 20450605135705, 20450707000808, 20450807095943, 20450907130531, 20451008050043, 20451107082955, 20451207013538, 20460105125604),  # 2045
+    (20460204003109, 20460305181752, 20460404224503, 20460505154046, 20460605193219, 20460707054021, 20460807153324, 20460907184323, 20461008104230, 20461107141415, 20461207072122, 20470105184227),  # 2046
+    (20470204061805, 20470306000522, 20470405043246, 20470505212837, 20470606012057, 20470707113034, 20470807212557, 20470908003815, 20471008163746, 20471107200725, 20471207131106, 20480106002929),  # 2047
+    (20480204120444, 20480305055414, 20480404102524, 20480505032436, 20480605071824, 20480706172654, 20480807031858, 20480907062812, 20481007222650, 20481107015656, 20481206190055, 20490105061848),  # 2048
+    (20490203175327, 20490305114301, 20490404161429, 20490505091244, 20490605130350, 20490706230855, 20490807085801, 20490907120538, 20491008040507, 20491107073830, 20491207004644, 20500105120800),  # 2049
+    (20500203234354, 20500305173250, 20500404220321, 20500505150206, 20500605185457, 20500707050200, 20500807145237, 20500907180047, 20501008100017, 20501107133347, 20501207064154, 20510105180218),  # 2050
+    (20510204053614, 20510305232210, 20510405034948, 20510505204714, 20510606004050, 20510707104934, 20510807204157, 20510907235126, 20511008155035, 20511107192215, 20511207122845, 20520105234840),  # 2051
+    (20520204112305, 20520305050940, 20520404093727, 20520505023454, 20520605062934, 20520706164006, 20520807023322, 20520907054216, 20521007213956, 20521107010959, 20521206181536, 20530105053614),  # 2052
+    (20530203171309, 20530305110324, 20530404153436, 20530505083340, 20530605122745, 20530706223715, 20530807083007, 20530907113844, 20531008033610, 20531107070615, 20531207001158, 20540105113223),  # 2053
+    (20540203230801, 20540305165537, 20540404212310, 20540505141757, 20540605180735, 20540707041353, 20540807140704, 20540907171940, 20541008092219, 20541107125623, 20541207060330, 20550105172240),  # 2054
+    (20550204045554, 20550305224132, 20550405030819, 20550505200357, 20550605235559, 20550707100519, 20550807200108, 20550907231538, 20551008151908, 20551107185250, 20551207115834, 20560105231546),  # 2055
+    (20560204104714, 20560305043213, 20560404090004, 20560505015804, 20560605055225, 20560706160226, 20560807015609, 20560907050723, 20561007210911, 20561107004325, 20561206175100, 20570105051008),  # 2056
+    (20570203164235, 20570305102705, 20570404145241, 20570505074643, 20570605113623, 20570706214231, 20570807073400, 20570907104410, 20571008024614, 20571107062252, 20571206233443, 20580105105837),  # 2057
+    (20580203223435, 20580305161958, 20580404204403, 20580505133604, 20580605172449, 20580707033136, 20580807132520, 20580907163805, 20581008084118, 20581107121712, 20581207052710, 20590105164915),  # 2058
+    (20590204042401, 20590305220848, 20590405023230, 20590505192402, 20590605231220, 20590707091853, 20590807191247, 20590907222638, 20591008143041, 20591107180544, 20591207111340, 20600105223355),  # 2059
+    (20600204100814, 20600305035409, 20600404081948, 20600505011252, 20600605050137, 20600706150719, 20600807005912, 20600907041040, 20601007201334, 20601106234856, 20601206165737, 20610105041830),  # 2060
+    (20610203155347, 20610305094142, 20610404141026, 20610505070633, 20610605105641, 20610706210208, 20610807065253, 20610907100236, 20611008020410, 20611107053955, 20611206225026, 20620105101245),  # 2061
+    (20620203214705, 20620305153127, 20620404195529, 20620505124729, 20620605163449, 20620707023828, 20620807122858, 20620907154028, 20621008074436, 20621107112234, 20621207043431, 20630105155716),  # 2062
+    (20630204033112, 20630305211426, 20630405013657, 20630505182821, 20630605221737, 20630707082530, 20630807182008, 20630907213335, 20631008133657, 20631107171208, 20631207102047, 20640105214118),  # 2063
+    (20640204091452, 20640305025925, 20640404072424, 20640505001834, 20640605041010, 20640706141939, 20640807001422, 20640907032624, 20641007192801, 20641106230141, 20641206160919, 20650105032934),  # 2064
+    (20650203150341, 20650305084910, 20650404131358, 20650505060527, 20650605095213, 20650706195652, 20650807054919, 20650907090159, 20651008010557, 20651107044237, 20651206215254, 20660105091449),  # 2065
+    (20660203204922, 20660305143408, 20660404185746, 20660505114842, 20660605153554, 20660707014155, 20660807113657, 20660907145321, 20661008070052, 20661107103916, 20661207034830, 20670105150705),  # 2066
+    (20670204023720, 20670305201832, 20670405004037, 20670505173212, 20670605212121, 20670707072910, 20670807172506, 20670907204219, 20671008125058, 20671107163028, 20671207094038, 20680105205927),  # 2067
+    (20680204082903, 20680305020856, 20680404062944, 20680504232036, 20680605030934, 20680706131653, 20680806231109, 20680907022551, 20681007183305, 20681106221325, 20681206152611, 20690105024818),  # 2068
+    (20690203142050, 20690305080234, 20690404122400, 20690505051443, 20690605090320, 20690706191058, 20690807050601, 20690907082039, 20691008002701, 20691107040728, 20691206212220, 20700105084732),  # 2069
+    (20700203202148, 20700305140225, 20700404181947, 20700505110447, 20700605144801, 20700707005204, 20700807104636, 20700907140348, 20701008061321, 20701107095533, 20701207031045, 20710105143555),  # 2070
+    (20710204021050, 20710305195235, 20710405001036, 20710505165513, 20710605203757, 20710707064247, 20710807163909, 20710907195757, 20711008120758, 20711107154842, 20711207090047, 20720105202257),  # 2071
+    (20720204075700, 20720305014056, 20720404060341, 20720504225342, 20720605023956, 20720706124510, 20720806223920, 20720907015508, 20721007180316, 20721106214350, 20721206145627, 20730105021850),  # 2072
+    (20730203135244, 20730305073642, 20730404115916, 20730505044747, 20730605083039, 20730706183050, 20730807042013, 20730907073318, 20731007234116, 20731107032405, 20731206204024, 20740105080603),  # 2073
+    (20740203194115, 20740305132417, 20740404174507, 20740505103309, 20740605141740, 20740707002058, 20740807101313, 20740907132816, 20741008053713, 20741107091942, 20741207023425, 20750105135751),  # 2074
+    (20750204013036, 20750305191121, 20750404233100, 20750505161941, 20750605200641, 20750707061328, 20750807160822, 20750907192356, 20751008113126, 20751107151136, 20751207082427, 20760105194703),  # 2075
+    (20760204071952, 20760305010054, 20760404052020, 20760504220822, 20760605015433, 20760706120023, 20760806215433, 20760907010900, 20761007171452, 20761106205328, 20761206140529, 20770105012828),  # 2076
+    (20770203130306, 20770305064650, 20770404110843, 20770505035803, 20770605074433, 20770706175051, 20770807034629, 20770907070309, 20771007231047, 20771107025015, 20771206200226, 20780105072446),  # 2077
+    (20780203185721, 20780305123753, 20780404165605, 20780505094137, 20780605132445, 20780706232847, 20780807092408, 20780907124338, 20781008045559, 20781107083922, 20781207015245, 20790105131329),  # 2078
+    (20790204004311, 20790305182059, 20790404223724, 20790505152218, 20790605190555, 20790707051143, 20790807150921, 20790907183017, 20791008104326, 20791107142706, 20791207074001, 20800105185935),  # 2079
+    (20800204062757, 20800305000509, 20800404042242, 20800504211039, 20800605005747, 20800706110538, 20800806210306, 20800907002226, 20801007163420, 20801106201839, 20801206133351, 20810105005601),  # 2080
+    (20810203122555, 20810305060243, 20810404101714, 20810505025957, 20810605064110, 20810706164331, 20810807023702, 20810907055437, 20811007220634, 20811107015247, 20811206191147, 20820105063836),  # 2081
+    (20820203181212, 20820305115009, 20820404160308, 20820505084257, 20820605122210, 20820706222506, 20820807082119, 20820907114235, 20821008035731, 20821107074416, 20821207010134, 20830105122610),  # 2082
+    (20830203235822, 20830305173614, 20830404215018, 20830505143137, 20830605181158, 20830707041550, 20830807141250, 20830907173430, 20831008094929, 20831107133542, 20831207065148, 20840105181501),  # 2083
+    (20840204054637, 20840304232504, 20840404034028, 20840504202257, 20840605000244, 20840706100329, 20840806195622, 20840906231422, 20841007152715, 20841106191333, 20841206123111, 20850104235619),  # 2084
+    (20850203112953, 20850305051031, 20850404092820, 20850505021303, 20850605055436, 20850706155620, 20850807014927, 20850907050729, 20851007212028, 20851107010738, 20851206182705, 20860105055341),  # 2085
+    (20860203172626, 20860305110354, 20860404151738, 20860505075856, 20860605113840, 20860706214005, 20860807073327, 20860907105227, 20861008030705, 20861107065543, 20861207001554, 20870105114235),  # 2086
+    (20870203231512, 20870305165200, 20870404210432, 20870505134444, 20870605172431, 20870707032759, 20870807132420, 20870907164423, 20871008085732, 20871107124313, 20871207060021, 20880105172517),  # 2087
+    (20880204045809, 20880304223702, 20880404025248, 20880504193644, 20880604232001, 20880706092558, 20880806192337, 20880906224359, 20881007145621, 20881106184042, 20881206115643, 20890104232114),  # 2088
+    (20890203105439, 20890305043440, 20890404085026, 20890505013151, 20890605051031, 20890706151107, 20890807010440, 20890907042401, 20891007203758, 20891107002448, 20891206174257, 20900105050842),  # 2089
+    (20900203164217, 20900305102131, 20900404143613, 20900505071643, 20900605105458, 20900706205635, 20900807065247, 20900907101551, 20901008023344, 20901107062242, 20901206233950, 20910105110157),  # 2090
+    (20910203223049, 20910305160620, 20910404202009, 20910505130305, 20910605164529, 20910707025053, 20910807124928, 20910907161325, 20911008083124, 20911107122042, 20911207053830, 20920105170046),  # 2091
+    (20920204042849, 20920304220237, 20920404021434, 20920504185616, 20920604223744, 20920706084056, 20920806183600, 20920906215613, 20921007141139, 20921106180052, 20921206112103, 20930104224702),  # 2092
+    (20930203101835, 20930305035424, 20930404080614, 20930505004619, 20930605042636, 20930706143037, 20930807002742, 20930907034942, 20931007200600, 20931106235546, 20931206171717, 20940105044459),  # 2093
+    (20940203161703, 20940305095126, 20940404140001, 20940505063543, 20940605101158, 20940706201400, 20940807061137, 20940907093604, 20941008015518, 20941107054643, 20941206230806, 20950105103502),  # 2094
+    (20950203220704, 20950305154200, 20950404195053, 20950505122554, 20950605160024, 20950707020100, 20950807115838, 20950907152327, 20951008074228, 20951107113239, 20951207045136, 20960105161556),  # 2095
+    (20960204034651, 20960304212311, 20960404013544, 20960504181540, 20960604215425, 20960706075636, 20960806175325, 20960906211700, 20961007133523, 20961106172554, 20961206104550, 20970104221053),  # 2096
+    (20970203094159, 20970305031819, 20970404073015, 20970505000812, 20970605034343, 20970706134123, 20970806233254, 20970907025252, 20971007191054, 20971106230352, 20971206162746, 20980105035626),  # 2097
+    (20980203152900, 20980305090401, 20980404131317, 20980505054853, 20980605092323, 20980706192221, 20980807051632, 20980907083841, 20981008005756, 20981107045040, 20981206221254, 20990105093916),  # 2098
+    (20990203210929, 20990305144237, 20990404185126, 20990505112904, 20990605150746, 20990707011141, 20990807111012, 20990907143409, 20991008065210, 20991107104238, 20991207040315, 21000105152916),  # 2099
+    (21000204030017, 21000305203433, 21000405004348, 21000505172056, 21000605205807, 21000707065902, 21000807165405, 21000907201518, 21001008123113, 21001107162006, 21001207094007, 21010105210651),  # 2100
+    (21010204083953, 21010306021650, 21010405062801, 21010505230507, 21010606024124, 21010707124244, 21010807223944, 21010908020403, 21011008182311, 21011107221413, 21011207153450, 21020106030028),  # 2101
+    (21020204143043, 21020306080419, 21020405121247, 21020506044808, 21020606082317, 21020707182429, 21020808042250, 21020908075000, 21021009001311, 21021108040751, 21021207212956, 21030106085434),  # 2102
+    (21030204202228, 21030306135320, 21030405175938, 21030506103354, 21030606140837, 21030708000932, 21030808100758, 21030908133452, 21031009055730, 21031108095148, 21031208031340, 21040106143801),  # 2103
+    (21040205020537, 21040305193628, 21040404234341, 21040505162022, 21040605195845, 21040707060238, 21040807160200, 21040907192846, 21041008115105, 21041107154600, 21041207090953, 21050105203701),  # 2104
+    (21050204080700, 21050306013847, 21050405054415, 21050505221634, 21050606014936, 21050707114846, 21050807214423, 21050908010851, 21051008173048, 21051107212715, 21051207145421, 21060106022530),  # 2105
+    (21060204135842, 21060306073132, 21060405113549, 21060506040513, 21060606073451, 21060707173231, 21060808032941, 21060908065717, 21061008232148, 21061108031814, 21061207204246, 21070106081039),  # 2106
+    (21070204194143, 21070306131423, 21070405172037, 21070506095337, 21070606132715, 21070707232809, 21070808092742, 21070908125643, 21071009052130, 21071108091731, 21071208024104, 21080106140735),  # 2107
+    (21080205013751, 21080305191058, 21080404231838, 21080505155309, 21080605192644, 21080707052419, 21080807151807, 21080907184141, 21081008110317, 21081107145844, 21081207082334, 21090105195159),  # 2108
+    (21090204072357, 21090306005831, 21090405050719, 21090505214211, 21090606011551, 21090707111418, 21090807210909, 21090908003330, 21091008165558, 21091107205246, 21091207141919, 21100106014835),  # 2109
+    (21100204131902, 21100306064959, 21100405105454, 21100506032738, 21100606070128, 21100707170159, 21100808025949, 21100908062644, 21101008225053, 21101108024832, 21101207201503, 21110106074351),  # 2110
+    (21110204191347, 21110306124338, 21110405164642, 21110506091736, 21110606125031, 21110707225111, 21110808084947, 21110908121631, 21111009043831, 21111108083244, 21111208015601, 21120106132307),  # 2111
+    (21120205005327, 21120305182524, 21120404223108, 21120505150432, 21120605184000, 21120707044305, 21120807144337, 21120907181218, 21121008103542, 21121107143010, 21121207075252, 21130105191916),  # 2112
+    (21130204064927, 21130306002149, 21130405042712, 21130505205805, 21130606002907, 21130707102738, 21130807202452, 21130907235224, 21131008161720, 21131107201451, 21131207134022, 21140106010813),  # 2113
+    (21140204123803, 21140306060839, 21140405101202, 21140506024109, 21140606061008, 21140707160710, 21140808020511, 21140908053526, 21141008220342, 21141108020319, 21141207192834, 21150106065357),  # 2114
+    (21150204182009, 21150306114732, 21150405154949, 21150506082105, 21150606115446, 21150707215626, 21150808075730, 21150908112927, 21151009035823, 21151108075840, 21151208012459, 21160106125110),  # 2115
+    (21160205001723, 21160305174355, 21160404214450, 21160505141449, 21160605174715, 21160707034629, 21160807134254, 21160907170929, 21161008093447, 21161107133427, 21161207070306, 21170105183330),  # 2116
+    (21170204060407, 21170305233330, 21170405033433, 21170505200151, 21170605233047, 21170707092848, 21170807192636, 21170907225503, 21171008152131, 21171107192200, 21171207125151, 21180106002329),  # 2117
+    (21180204115413, 21180306052214, 21180405092055, 21180506014546, 21180606051300, 21180707151056, 21180808011110, 21180908044336, 21181008211333, 21181108011532, 21181207184441, 21190106061458),  # 2118
+    (21190204174521, 21190306111402, 21190405151332, 21190506073832, 21190606110445, 21190707210027, 21190808065811, 21190908102835, 21191009025651, 21191108065701, 21191208002402, 21200106115222),  # 2119
+    (21200204232213, 21200305165236, 21200404205535, 21200505132434, 21200605165408, 21200707025130, 21200807124854, 21200907161842, 21201008084717, 21201107124837, 21201207061702, 21210105174610),  # 2120
+    (21210204051604, 21210305224615, 21210405024848, 21210505191645, 21210605224426, 21210707083920, 21210807183341, 21210907220038, 21211008142824, 21211107183135, 21211207120333, 21220105233608),  # 2121
+    (21220204110729, 21220306043624, 21220405083625, 21220506010207, 21220606042820, 21220707142251, 21220808001822, 21220908034648, 21221008201501, 21221108001703, 21221207174647, 21230106051700),  # 2122
+    (21230204164625, 21230306101402, 21230405141347, 21230506064129, 21230606101231, 21230707201309, 21230808061401, 21230908094540, 21231009021402, 21231108061416, 21231207234157, 21240106111059),  # 2123
+    (21240204224034, 21240305160925, 21240404201031, 21240505123845, 21240605160903, 21240707020734, 21240807120501, 21240907153305, 21241008075859, 21241107115756, 21241207052523, 21250105165517),  # 2124
+    (21250204042638, 21250305215734, 21250405015956, 21250505182718, 21250605215505, 21250707075205, 21250807175039, 21250907212132, 21251008135034, 21251107175158, 21251207112018, 21260105224847),  # 2125
+    (21260204101630, 21260306034302, 21260405074202, 21260506000823, 21260606033713, 21260707133629, 21260807233837, 21260908031414, 21261008194802, 21261107235257, 21261207172232, 21270106045006),  # 2126
+    (21270204161543, 21270306093944, 21270405133639, 21270506060155, 21270606093038, 21270707192935, 21270808053010, 21270908090333, 21271009013534, 21271108053930, 21271207230850, 21280106103632),  # 2127
+    (21280204220220, 21280305152626, 21280404192324, 21280505114855, 21280605151837, 21280707011910, 21280807112052, 21280907145434, 21281008072648, 21281107113149, 21281207050317, 21290105163342),  # 2128
+    (21290204040153, 21290305212658, 21290405012226, 21290505174421, 21290605210935, 21290707070631, 21290807170628, 21290907203944, 21291008131233, 21291107171925, 21291207105407, 21300105222825),  # 2129
+    (21300204095937, 21300306032534, 21300405071940, 21300505233814, 21300606025859, 21300707125152, 21300807225025, 21300908022510, 21301008185951, 21301107230616, 21301207163805, 21310106040853),  # 2130
+    (21310204153748, 21310306090333, 21310405125919, 21310506052057, 21310606084536, 21310707184212, 21310808044314, 21310908081933, 21311009005515, 21311108050212, 21311207223346, 21320106100335),  # 2131
+    (21320204213152, 21320305145825, 21320404185631, 21320505112043, 21320605144558, 21320707004003, 21320807103540, 21320907140536, 21321008063700, 21321107104311, 21321207041639, 21330105154915),  # 2132
+    (21330204031941, 21330305204717, 21330405004530, 21330505170847, 21330605203216, 21330707062449, 21330807162002, 21330907195002, 21331008122135, 21331107162829, 21331207100317, 21340105213632),  # 2133
+    (21340204090533, 21340306022946, 21340405062412, 21340505224546, 21340606021055, 21340707120724, 21340807220724, 21340908014148, 21341008181559, 21341107222328, 21341207155730, 21350106032955),  # 2134
+    (21350204145845, 21350306082250, 21350405121637, 21350506043711, 21350606080201, 21350707175853, 21350808035825, 21350908073051, 21351009000200, 21351108040543, 21351207213617, 21360106090647),  # 2135
+    (21360204203554, 21360305140209, 21360404175838, 21360505102059, 21360605134622, 21360706234349, 21360807094441, 21360907131853, 21361008055133, 21361107095558, 21361207032617, 21370105145605),  # 2136
+    (21370204022449, 21370305195109, 21370404234724, 21370505160835, 21370605193140, 21370707052634, 21370807152625, 21370907190138, 21371008113656, 21371107154453, 21371207091815, 21380105204926),  # 2137
+    (21380204081722, 21380306014122, 21380405053517, 21380505215446, 21380606011615, 21380707110908, 21380807210755, 21380908004418, 21381008172149, 21381107213049, 21381207150317, 21390106023149),  # 2138
+    (21390204135611, 21390306071702, 21390405110929, 21390506033011, 21390606065548, 21390707165400, 21390808025637, 21390908063459, 21391008231348, 21391108032419, 21391207205823, 21400106082802),  # 2139
+    (21400204195241, 21400305131307, 21400404170502, 21400505092528, 21400605125032, 21400706224730, 21400807084719, 21400907122107, 21401008045600, 21401107090536, 21401207024204, 21410105141609),  # 2140
+    (21410204014519, 21410305190824, 21410404225956, 21410505151659, 21410605183717, 21410707043042, 21410807143002, 21410907180516, 21411008104115, 21411107145122, 21411207082829, 21420105200310),  # 2141
+    (21420204073210, 21420306005359, 21420405044318, 21420505205814, 21420606001805, 21420707101307, 21420807201616, 21420907235707, 21421008163812, 21421107205032, 21421207142640, 21430106015915),  # 2142
+    (21430204132709, 21430306064926, 21430405104009, 21430506025618, 21430606061625, 21430707161034, 21430808021103, 21430908054812, 21431008222622, 21431108023646, 21431207201121, 21440106074237),  # 2143
+    (21440204191008, 21440305123344, 21440404162716, 21440505084620, 21440605120749, 21440706220131, 21440807080056, 21440907113721, 21441008041538, 21441107082722, 21441207020355, 21450105133643),  # 2144
+    (21450204010435, 21450305182717, 21450404221900, 21450505143619, 21450605175635, 21450707034920, 21450807134803, 21450907172414, 21451008100308, 21451107141652, 21451207075636, 21460105193227),  # 2145
+    (21460204070139, 21460306002320, 21460405041246, 21460505202751, 21460605234644, 21460707093844, 21460807193708, 21460907231324, 21461008155156, 21461107200349, 21461207134054, 21470106011429),  # 2146
+    (21470204124224, 21470306060341, 21470405095317, 21470506020918, 21470606053047, 21470707152712, 21470808013004, 21470908050904, 21471008214813, 21471108015919, 21471207193454, 21480106070712),  # 2147
+    (21480204183453, 21480305115715, 21480404154845, 21480505080627, 21480605112759, 21480706212255, 21480807072337, 21480907110001, 21481008033701, 21481107074712, 21481207012305, 21490105125640),  # 2148
+    (21490204002614, 21490305175029, 21490404214250, 21490505135921, 21490605171750, 21490707030910, 21490807130806, 21490907164528, 21491008092444, 21491107133702, 21491207071354, 21500105184612),  # 2149
+    (21500204061214, 21500305233155, 21500405032020, 21500505193503, 21500605225436, 21500707084907, 21500807185215, 21500907223453, 21501008151938, 21501107193545, 21501207131344, 21510106004503),  # 2150
+    (21510204120903, 21510306052637, 21510405091350, 21510506012839, 21510606044915, 21510707144449, 21510808004651, 21510908042549, 21511008210654, 21511108012111, 21511207185910, 21520106063133),  # 2151
+)
+
+qis = (
+    (18500219070320, 18500321070145, 18500420191325, 18500521192412, 18500622035836, 18500723145259, 18500823212201, 18500923180002, 18501024021233, 18501122224908, 18501222113719, 18510120221657),  # 1850
+    (18510219125800, 18510321125355, 18510421010213, 18510522010942, 18510622094238, 18510723203802, 18510824030930, 18510923235020, 18511024080458, 18511123044151, 18511222172827, 18520121040600),  # 1851
+    (18520219184541, 18520320184102, 18520420064901, 18520521065549, 18520621152811, 18520723022442, 18520823085816, 18520923054009, 18521023135403, 18521122102839, 18521221231220, 18530120094735),  # 1852
+    (18530219002640, 18530321002341, 18530420123520, 18530521124632, 18530621212200, 18530723081925, 18530823145319, 18530923113600, 18531023195057, 18531122162631, 18531222051036, 18540120154534),  # 1853
+    (18540219062356, 18540321061938, 18540420182844, 18540521183614, 18540622030702, 18540723135913, 18540823202918, 18540923171145, 18541024012947, 18541122220954, 18541222105805, 18550120213501),  # 1854
+    (18550219121224, 18550321120459, 18550421001048, 18550522001617, 18550622084726, 18550723194143, 18550824021352, 18550923225808, 18551024071756, 18551123035905, 18551222164709, 18560121032249),  # 1855
+    (18560219175810, 18560320174853, 18560420055409, 18560521060108, 18560621143534, 18560723013411, 18560823080920, 18560923045312, 18561023131035, 18561122095006, 18561221223823, 18570120091542),  # 1856
+    (18570218235303, 18570320234455, 18570420114950, 18570521115443, 18570621202450, 18570723071817, 18570823135004, 18570923103216, 18571023184819, 18571122152648, 18571222041524, 18580120145505),  # 1857
+    (18580219053612, 18580321053136, 18580420173811, 18580521174245, 18580622021218, 18580723130527, 18580823193740, 18580923162154, 18581024004044, 18581122212105, 18581222100940, 18590120204718),  # 1858
+    (18590219112525, 18590321111814, 18590420232308, 18590521232636, 18590622075541, 18590723184908, 18590824012200, 18590923220738, 18591024062855, 18591123031132, 18591222160040, 18600121023705),  # 1859
+    (18600219171313, 18600320170422, 18600420050844, 18600521051229, 18600621134148, 18600723003537, 18600823070822, 18600923035229, 18601023121133, 18601122085229, 18601221214103, 18610120081741),  # 1860
+    (18610218225416, 18610320224617, 18610420105240, 18610521110006, 18610621193327, 18610723062938, 18610823130300, 18610923094635, 18611023180426, 18611122144437, 18611222033339, 18620120141150),  # 1861
+    (18620219045008, 18620321044228, 18620420164638, 18620521165004, 18620622011917, 18620723121156, 18620823184258, 18620923152603, 18621023234458, 18621122202708, 18621222091830, 18630120195845),  # 1862
+    (18630219103800, 18630321102946, 18630420223213, 18630521223327, 18630622070142, 18630723175549, 18630824002954, 18630923211610, 18631024053646, 18631123021747, 18631222150547, 18640121014206),  # 1863
+    (18640219161835, 18640320160952, 18640420041416, 18640521041907, 18640621125140, 18640722235020, 18640823062813, 18640923031606, 18641023113630, 18641122081636, 18641221210320, 18650120073825),  # 1864
+    (18650218221414, 18650320220545, 18650420101056, 18650521101554, 18650621184554, 18650723053942, 18650823121320, 18650923085919, 18651023171944, 18651122140102, 18651222024925, 18660120132559),  # 1865
+    (18660219040245, 18660321035430, 18660420155912, 18660521160331, 18660622003349, 18660723112820, 18660823180240, 18660923145022, 18661023231350, 18661122195832, 18661222084915, 18670120192531),  # 1866
+    (18670219095908, 18670321094616, 18670420214651, 18670521214901, 18670622061939, 18670723171627, 18670823235309, 18670923204230, 18671024050741, 18671123015424, 18671222144648, 18680121012412),  # 1867
+    (18680219155752, 18680320154335, 18680420034140, 18680521034110, 18680621120947, 18680722230603, 18680823054259, 18680923023105, 18681023105312, 18681122073646, 18681221202752, 18690120070621),  # 1868
+    (18690218214253, 18690320213157, 18690420093245, 18690521093411, 18690621180413, 18690723050106, 18690823113839, 18690923082751, 18691023165018, 18691122133308, 18691222022325, 18700120130215),  # 1869
+    (18700219034041, 18700321033153, 18700420153252, 18700521153121, 18700621235609, 18700723104728, 18700823172100, 18700923140926, 18701023223417, 18701122192030, 18701222081302, 18710120185219),  # 1870
+    (18710219092945, 18710321091937, 18710420211950, 18710521211745, 18710622054144, 18710723163237, 18710823230633, 18710923195601, 18711024042157, 18711123010810, 18711222135902, 18720121003506),  # 1871
+    (18720219150907, 18720320145716, 18720420025857, 18720521030138, 18720621113148, 18720722222747, 18720823050418, 18720923015323, 18721023101727, 18721122070230, 18721221195325, 18730120063005),  # 1872
+    (18730218210422, 18730320205219, 18730420085343, 18730521085608, 18730621172457, 18730723041738, 18730823104949, 18730923073504, 18731023155628, 18731122124033, 18731222013230, 18740120121145),  # 1873
+    (18740219024843, 18740321023753, 18740420143824, 18740521143850, 18740621230706, 18740723100123, 18740823163544, 18740923132249, 18741023214531, 18741122183013, 18741222072203, 18750120180000),  # 1874
+    (18750219083443, 18750321082111, 18750420201915, 18750521201814, 18750622044656, 18750723154422, 18750823222333, 18750923191456, 18751024034017, 18751123002528, 18751222131550, 18760120235140),  # 1875
+    (18760219142436, 18760320140953, 18760420020702, 18760521020457, 18760621103208, 18760722212819, 18760823040717, 18760923005839, 18761023092300, 18761122060612, 18761221185418, 18770120052830),  # 1876
+    (18770218200112, 18770320194751, 18770420074728, 18770521074815, 18770621161757, 18770723031516, 18770823095458, 18770923064808, 18771023151506, 18771122120042, 18771222005016, 18780120112451),  # 1877
+    (18780219015708, 18780321014237, 18780420134005, 18780521133745, 18780621220342, 18780723085717, 18780823153355, 18780923122631, 18781023205620, 18781122174654, 18781222064114, 18790120171820),  # 1878
+    (18790219074948, 18790321073155, 18790420192529, 18790521192002, 18790622034419, 18790723143758, 18790823211544, 18790923180917, 18791024023933, 18791122233010, 18791222122425, 18800120230116),  # 1879
+    (18800219133211, 18800320131335, 18800420010705, 18800521010327, 18800621093140, 18800722203010, 18800823031157, 18800923000643, 18801023083531, 18801122052422, 18801221181815, 18810120045631),  # 1880
+    (18810218192959, 18810320191352, 18810420070831, 18810521070344, 18810621152808, 18810723022114, 18810823085808, 18810923055007, 18811023141744, 18811122110606, 18811222000030, 18820120104051),  # 1881
+    (18820219011734, 18820321010436, 18820420130033, 18820521125430, 18820621211637, 18820723080805, 18820823144434, 18820923113742, 18821023200750, 18821122165837, 18821222055337, 18830120163201),  # 1882
+    (18830219070530, 18830321064946, 18830420184441, 18830521183927, 18830622030329, 18830723135730, 18830823203647, 18830923173218, 18831024020427, 18831122225643, 18831222115203, 18840120222937),  # 1883
+    (18840219130134, 18840320124432, 18840420003906, 18840521003431, 18840621085902, 18840722195212, 18840823022904, 18840922232114, 18841023074946, 18841122043916, 18841221173333, 18850120041142),  # 1884
+    (18850218184502, 18850320182938, 18850420062559, 18850521062334, 18850621145051, 18850723014617, 18850823082406, 18850923051611, 18851023134409, 18851122103307, 18851221232731, 18860120100639),  # 1885
+    (18860219004123, 18860321002625, 18860420122129, 18860521121635, 18860621204114, 18860723073501, 18860823141215, 18860923110431, 18861023193328, 18861122162358, 18861222051954, 18870120160000),  # 1886
+    (18870219063437, 18870321061830, 18870420181144, 18870521180438, 18870622022723, 18870723132042, 18870823195936, 18870923165418, 18871024012401, 18871122221239, 18871222110454, 18880120214101),  # 1887
+    (18880219121249, 18880320115558, 18880419235036, 18880520234649, 18880621081426, 18880722191300, 18880823015620, 18880922225346, 18881023072425, 18881122041234, 18881221170314, 18890120033721),  # 1888
+    (18890218180744, 18890320175053, 18890420054653, 18890521054400, 18890621141002, 18890723010442, 18890823074331, 18890923043813, 18891023130849, 18891122095850, 18891221225157, 18900120092754),  # 1889
+    (18900218235849, 18900320234103, 18900420113502, 18900521112945, 18900621195358, 18900723064749, 18900823132645, 18900923102236, 18901023185551, 18901122154920, 18901222044458, 18910120152036),  # 1890
+    (18910219054803, 18910321052456, 18910420171401, 18910521170645, 18910622013239, 18910723123044, 18910823191431, 18910923161354, 18911024004906, 18911122214351, 18911222104035, 18920120211726),  # 1891
+    (18920219114537, 18920320112202, 18920419230915, 18920520225935, 18920621072331, 18920722182004, 18920823010214, 18920922215937, 18921023063157, 18921122032348, 18921221161922, 18930120025729),  # 1892
+    (18930218172843, 18930320170828, 18930420045737, 18930521044737, 18930621131005, 18930723000534, 18930823064747, 18930923034620, 18931023122000, 18931122091213, 18931221220725, 18940120084538),  # 1893
+    (18940218231807, 18940320225922, 18940420104904, 18940521103745, 18940621185653, 18940723054845, 18940823122851, 18940923092731, 18941023180350, 18941122150000, 18941222035818, 18950120143734),  # 1894
+    (18950219050917, 18950321044918, 18950420163812, 18950521162619, 18950622004407, 18950723113342, 18950823181211, 18950923151031, 18951023234636, 18951122204158, 18951222093844, 18960120201538),  # 1895
+    (18960219104449, 18960320102324, 18960419221304, 18960520220440, 18960621062816, 18960722172328, 18960823000500, 18960922210335, 18961023053832, 18961122023253, 18961221152925, 18970120020647),  # 1896
+    (18970218163641, 18970320161613, 18970420040719, 18970521040006, 18970621122324, 18970722231638, 18970823055430, 18970923024900, 18971023112109, 18971122081449, 18971221211248, 18980120075305),  # 1897
+    (18980218222551, 18980320220631, 18980420095617, 18980521094615, 18980621180708, 18980723045945, 18980823113843, 18980923083436, 18981023170741, 18981122140143, 18981222025910, 18990120133741),  # 1898
+    (18990219040754, 18990321034546, 18990420153312, 18990521152235, 18990621234536, 18990723104257, 18990823172820, 18990923143009, 18991023230633, 18991122200044, 18991222085612, 19000120193225),  # 1899
+    (19000219100114, 19000321093901, 19000420212706, 19000521211655, 19000622053945, 19000723163607, 19000823231949, 19000923202011, 19001024045516, 19001123014750, 19001222144134, 19010121011628),  # 1900
+    (19010219154454, 19010321152335, 19010421031326, 19010522030439, 19010622112746, 19010723222345, 19010824050729, 19010924020856, 19011024104614, 19011123074113, 19011222203635, 19020121071156),  # 1901
+    (19020219213942, 19020321211633, 19020421090408, 19020522085331, 19020622171508, 19020724040952, 19020824105303, 19020924075520, 19021024163538, 19021123133523, 19021223023531, 19030121131332),  # 1902
+    (19030220034048, 19030322031446, 19030421145839, 19030522144501, 19030622230455, 19030724095845, 19030824164135, 19030924134341, 19031024222303, 19031123192124, 19031223082025, 19040121185751),  # 1903
+    (19040220092451, 19040321085834, 19040420204208, 19040521202855, 19040622045121, 19040723154935, 19040823223624, 19040923194012, 19041024041902, 19041123011553, 19041222141356, 19050121005156),  # 1904
+    (19050219152058, 19050321145731, 19050421024345, 19050522023116, 19050622105122, 19050723214537, 19050824042836, 19050924012956, 19051024100755, 19051123070453, 19051222200341, 19060121064314),  # 1905
+    (19060219211427, 19060321205247, 19060421083910, 19060522082455, 19060622164148, 19060724033232, 19060824101332, 19060924071459, 19061024155443, 19061123125351, 19061223015316, 19070121123047),  # 1906
+    (19070220025818, 19070322023259, 19070421141713, 19070522140314, 19070622222259, 19070724091756, 19070824160323, 19070924130852, 19071024215130, 19071123185203, 19071223075132, 19080121182804),  # 1907
+    (19080220085354, 19080321082714, 19080420201115, 19080521195806, 19080622041901, 19080723151405, 19080823215659, 19080923185815, 19081024033647, 19081123003437, 19081222133324, 19090121001055),  # 1908
+    (19090219143819, 19090321141256, 19090421015744, 19090522014452, 19090622100531, 19090723210026, 19090824034330, 19090924004429, 19091024092230, 19091123062015, 19091222191947, 19100121055856),  # 1909
+    (19100219202807, 19100321200252, 19100421074542, 19100522073008, 19100622154841, 19100724024256, 19100824092720, 19100924063044, 19101024151108, 19101123121050, 19101223011143, 19110121115123),  # 1910
+    (19110220022016, 19110322015420, 19110421133555, 19110522131833, 19110622213530, 19110724082836, 19110824151257, 19110924121730, 19111024205811, 19111123175553, 19111223065309, 19120121172906),  # 1911
+    (19120220075534, 19120321072919, 19120420191221, 19120521185706, 19120622031651, 19120723141340, 19120823210119, 19120923180759, 19121024025000, 19121122234808, 19121222124439, 19130120231904),  # 1912
+    (19130219134412, 19130321131755, 19130421010251, 19130522004951, 19130622090926, 19130723200341, 19130824024809, 19130923235241, 19131024083449, 19131123053512, 19131222183451, 19140121051149),  # 1913
+    (19140219193754, 19140321191042, 19140421065312, 19140522063738, 19140622145500, 19140724014652, 19140824082934, 19140924053347, 19141024141716, 19141123112021, 19141223002222, 19150121105930),  # 1914
+    (19150220012303, 19150322005114, 19150421122846, 19150522121023, 19150622202920, 19150724072621, 19150824141458, 19150924112345, 19151024200939, 19151123171326, 19151223061544, 19160121165333),  # 1915
+    (19160220071759, 19160321064650, 19160420182435, 19160521180550, 19160622022421, 19160723132108, 19160823200831, 19160923171443, 19161024015711, 19161122225744, 19161222115829, 19170120223718),  # 1916
+    (19170219130444, 19170321123711, 19170421001722, 19170521235831, 19170622081416, 19170723190745, 19170824015338, 19170923230006, 19171024074337, 19171123044452, 19171222174537, 19180121042432),  # 1917
+    (19180219185241, 19180321182537, 19180421060523, 19180522054527, 19180622135934, 19180724005123, 19180824073707, 19180924044537, 19181024133247, 19181123103802, 19181222234127, 19190121102040),  # 1918
+    (19190220004725, 19190322001905, 19190421115835, 19190522113904, 19190622195330, 19190724064426, 19190824132816, 19190924103518, 19191024192114, 19191123162507, 19191223052701, 19200121160420),  # 1919
+    (19200220062857, 19200321055915, 19200420173907, 19200521172143, 19200622013945, 19200723123453, 19200823192115, 19200923162805, 19201024011239, 19201122221523, 19201222111656, 19210120215439),  # 1920
+    (19210219121956, 19210321115058, 19210420233214, 19210521231640, 19210622073535, 19210723183015, 19210824011507, 19210923221942, 19211024070215, 19211123040427, 19211222170723, 19220121034754),  # 1921
+    (19220219181609, 19220321174833, 19220421052832, 19220522051013, 19220622132639, 19220724001938, 19220824070409, 19220924040932, 19221024125252, 19221123095509, 19221222225652, 19230121093445),  # 1922
+    (19230219235940, 19230321232842, 19230421110533, 19230522104513, 19230622190242, 19230724060029, 19230824125145, 19230924100330, 19231024185049, 19231123155336, 19231223045313, 19240121152821),  # 1923
+    (19240220055116, 19240321052005, 19240420165833, 19240521164025, 19240622005918, 19240723115727, 19240823184753, 19240923155813, 19241024004422, 19241122214622, 19241222104524, 19250120212008),  # 1924
+    (19250219114259, 19250321111206, 19250420225105, 19250521223253, 19250622064954, 19250723174447, 19250824003305, 19250923214319, 19251024063102, 19251123033524, 19251222163635, 19260121031225),  # 1925
+    (19260219173443, 19260321170108, 19260421043603, 19260522041426, 19260622122958, 19260723232444, 19260824061354, 19260924032632, 19261024121814, 19261123092733, 19261222223318, 19270121091148),  # 1926
+    (19270219233413, 19270321225902, 19270421103138, 19270522100747, 19270622182207, 19270724051641, 19270824120523, 19270924091652, 19271024180637, 19271123151355, 19271223041826, 19280121145636),  # 1927
+    (19280220051912, 19280321044411, 19280420161640, 19280521155219, 19280622000623, 19280723110213, 19280823175305, 19280923150526, 19281023235428, 19281122210012, 19281222100336, 19290120204210),  # 1928
+    (19290219110648, 19290321103445, 19290420221015, 19290521214733, 19290622060033, 19290723165314, 19290823234112, 19290923205215, 19291024054124, 19291123024803, 19291222155241, 19300121023256),  # 1929
+    (19300219165945, 19300321162942, 19300421040545, 19300522034159, 19300622115245, 19300723224153, 19300824052617, 19300924023552, 19301024112557, 19301123083425, 19301222213929, 19310121081727),  # 1930
+    (19310219224014, 19310321220614, 19310421093945, 19310522091521, 19310622172800, 19310724042120, 19310824111013, 19310924082315, 19311024171526, 19311123142438, 19311223032931, 19320121140645),  # 1931
+    (19320220042819, 19320321035332, 19320420152801, 19320521150633, 19320621232234, 19320723101759, 19320823170610, 19320923141549, 19321023230350, 19321122201005, 19321222091412, 19330120195239),  # 1932
+    (19330219101615, 19330321094303, 19330420211814, 19330521205645, 19330622051145, 19330723160522, 19330823225219, 19330923200106, 19331024044803, 19331123015324, 19331222145726, 19340121013651),  # 1933
+    (19340219160137, 19340321152753, 19340421030007, 19340522023451, 19340622104751, 19340723214207, 19340824043200, 19340924014508, 19341024103615, 19341123074420, 19341222204922, 19350121072817),  # 1934
+    (19350219215156, 19350321211743, 19350421085004, 19350522082447, 19350622163751, 19350724033254, 19350824102356, 19350924073807, 19351024162909, 19351123133522, 19351223023703, 19360121131213),  # 1935
+    (19360220033300, 19360321025748, 19360420143104, 19360521140724, 19360621222134, 19360723091750, 19360823161028, 19360923132554, 19361023221802, 19361122192500, 19361222082637, 19370120190057),  # 1936
+    (19370219092041, 19370321084501, 19370420201908, 19370521195707, 19370622041156, 19370723150653, 19370823215749, 19370923191254, 19371024040630, 19371123011627, 19371222142136, 19380121005842),  # 1937
+    (19380219151933, 19380321144302, 19380421021441, 19380522015008, 19380622100332, 19380723205702, 19380824034546, 19380924005927, 19381024095344, 19381123070602, 19381222201321, 19390121065040),  # 1938
+    (19390219210915, 19390321202826, 19390421075505, 19390522072638, 19390622153922, 19390724023636, 19390824093108, 19390924064925, 19391024154549, 19391123125828, 19391223020555, 19400121124403),  # 1939
+    (19400220030342, 19400321022341, 19400420135052, 19400521132300, 19400621213622, 19400723083403, 19400823152830, 19400923124532, 19401023213918, 19401122184855, 19401222075441, 19410120183337),  # 1940
+    (19410219085621, 19410321082019, 19410420195024, 19410521192247, 19410622033315, 19410723142608, 19410823211651, 19410923183242, 19411024032709, 19411123003747, 19411222134406, 19420121002328),  # 1941
+    (19420219144646, 19420321141034, 19420421013905, 19420522010838, 19420622091613, 19420723200723, 19420824025810, 19420924001624, 19421024091508, 19421123063021, 19421222193931, 19430121061852),  # 1942
+    (19430219204013, 19430321200234, 19430421073129, 19430522070249, 19430622151217, 19430724020430, 19430824085459, 19430924061141, 19431024150815, 19431123122126, 19431223012904, 19440121120704),  # 1943
+    (19440220022705, 19440321014832, 19440420131745, 19440521125046, 19440621210214, 19440723075549, 19440823144626, 19440923120135, 19441023205556, 19441122180730, 19441222071445, 19450120175336),  # 1944
+    (19450219081451, 19450321073710, 19450420190651, 19450521184012, 19450622025200, 19450723134523, 19450823203516, 19450923174944, 19451024024334, 19451122235511, 19451222130332, 19460120234435),  # 1945
+    (19460219140830, 19460321133237, 19460421010208, 19460522003353, 19460622084417, 19460723193700, 19460824022619, 19460923234034, 19461024083439, 19461123054615, 19461222185317, 19470121053130),  # 1946
+    (19470219195153, 19470321191238, 19470421063922, 19470522060900, 19470622141847, 19470724011409, 19470824080856, 19470924052835, 19471024142550, 19471123113736, 19471223004243, 19480121111822),  # 1947
+    (19480220013638, 19480321005643, 19480420122450, 19480521115735, 19480621201032, 19480723070729, 19480823140230, 19480923112139, 19481023201757, 19481122172847, 19481222063313, 19490120170832),  # 1948
+    (19490219072703, 19490321064801, 19490420181715, 19490521175038, 19490622020243, 19490723125639, 19490823194811, 19490923170548, 19491024020257, 19491122231602, 19491222122251, 19500120225935),  # 1949
+    (19500219131729, 19500321123506, 19500420235906, 19500521232707, 19500622073600, 19500723182953, 19500824012309, 19500923224332, 19501024074443, 19501123050229, 19501222181318, 19510121045202),  # 1950
+    (19510219190938, 19510321182541, 19510421054803, 19510522051522, 19510622132448, 19510724002037, 19510824071605, 19510924043650, 19511024133600, 19511123105103, 19511223000001, 19520121103822),  # 1951
+    (19520220005640, 19520321001342, 19520420113637, 19520521110349, 19520621191230, 19520723060725, 19520823130247, 19520923102339, 19521023192210, 19521122163536, 19521222054306, 19530120162118),  # 1952
+    (19530219064105, 19530321060030, 19530420172521, 19530521165247, 19530622005953, 19530723115206, 19530823184509, 19530923160552, 19531024010614, 19531122222203, 19531222113125, 19540120221101),  # 1953
+    (19540219123218, 19540321115323, 19540420231932, 19540521224722, 19540622065400, 19540723174454, 19540824003552, 19540923215513, 19541024065619, 19541123041410, 19541222172419, 19550121040150),  # 1954
+    (19550219181845, 19550321173504, 19550421045750, 19550522042419, 19550622123119, 19550723232430, 19550824061853, 19550924034050, 19551024124301, 19551123100051, 19551222231052, 19560121094816),  # 1955
+    (19560220000437, 19560320232015, 19560420104325, 19560521101232, 19560621182341, 19560723051952, 19560823121446, 19560923093502, 19561023183419, 19561122154950, 19561222045927, 19570120153835),  # 1956
+    (19570219055758, 19570321051627, 19570420164112, 19570521161023, 19570622002028, 19570723111448, 19570823180731, 19570923152602, 19571024002410, 19571122213900, 19571222104834, 19580120212827),  # 1957
+    (19580219114826, 19580321110547, 19580420222658, 19580521215100, 19580622055651, 19580723165026, 19580823234553, 19580923210849, 19581024061118, 19581123032906, 19581222163940, 19590121031850),  # 1958
+    (19590219173733, 19590321165429, 19590421041627, 19590522034205, 19590622114944, 19590723224525, 19590824054329, 19590924030824, 19591024121058, 19591123092653, 19591222223418, 19600121091002),  # 1959
+    (19600219232617, 19600320224238, 19600420100551, 19600521093328, 19600621174215, 19600723043725, 19600823113422, 19600923085850, 19601023180149, 19601122151820, 19601222042553, 19610120150106),  # 1960
+    (19610219051627, 19610321043204, 19610420155502, 19610521152214, 19610621233004, 19610723102334, 19610823171830, 19610923144225, 19611023234721, 19611122210740, 19611222101926, 19620120205753),  # 1961
+    (19620219111434, 19620321102931, 19620420215040, 19620521211630, 19620622052405, 19620723161756, 19620823231227, 19620923203511, 19621024053959, 19621123030150, 19621222161514, 19630121025351),  # 1962
+    (19630219170834, 19630321161939, 19630421033607, 19630522025807, 19630622110400, 19630723215911, 19630824045729, 19630924022327, 19631024112848, 19631123084920, 19631222220152, 19640121084103),  # 1963
+    (19640219225717, 19640320220950, 19640420092708, 19640521084945, 19640621165647, 19640723035243, 19640823105101, 19640923081638, 19641023172040, 19641122143853, 19641222034931, 19650120142851),  # 1964
+    (19650219044748, 19650321040444, 19650420152603, 19650521145013, 19650621225540, 19650723094809, 19650823164240, 19650923140557, 19651023230955, 19651122202908, 19651222094023, 19660120201939),  # 1965
+    (19660219103747, 19660321095254, 19660420211130, 19660521203201, 19660622043321, 19660723152310, 19660823221742, 19660923194308, 19661024045045, 19661123021405, 19661222152808, 19670121020730),  # 1966
+    (19670219162338, 19670321153646, 19670421025507, 19670522021752, 19670622102249, 19670723211549, 19670824041224, 19670924013801, 19671024104344, 19671123080426, 19671222211617, 19680121075406),  # 1967
+    (19680219220913, 19680320212201, 19680420084107, 19680521080550, 19680621161316, 19680723030723, 19680823100251, 19680923072610, 19681023162934, 19681122134831, 19681222025945, 19690120133810),  # 1968
+    (19690219035428, 19690321030804, 19690420142651, 19690521134942, 19690621215501, 19690723084808, 19690823154320, 19690923130653, 19691023221102, 19691122193104, 19691222084341, 19700120192347),  # 1969
+    (19700219094146, 19700321085619, 19700420201456, 19700521193719, 19700622034238, 19700723143652, 19700823213353, 19700923185859, 19701024040414, 19701123012432, 19701222143540, 19710121011239),  # 1970
+    (19710219152655, 19710321143806, 19710421015413, 19710522011459, 19710622091934, 19710723201443, 19710824031514, 19710924004452, 19711024095308, 19711123071356, 19711222202353, 19720121065859),  # 1971
+    (19720219211123, 19720320202125, 19720420073729, 19720521065929, 19720621150610, 19720723020230, 19720823090301, 19720923063245, 19721023154127, 19721122130241, 19721222021253, 19730120124812),  # 1972
+    (19730219030109, 19730321021226, 19730420133021, 19730521125349, 19730621210034, 19730723075532, 19730823145327, 19730923122106, 19731023213009, 19731122185400, 19731222080741, 19740120184540),  # 1973
+    (19740219085841, 19740321080638, 19740420191851, 19740521183602, 19740622023736, 19740723133010, 19740823202840, 19740923175826, 19741024031036, 19741123003827, 19741222135556, 19750121003614),  # 1974
+    (19750219144941, 19750321135639, 19750421010712, 19750522002340, 19750622082625, 19750723192144, 19750824022337, 19750923235512, 19751024090601, 19751123063042, 19751222194533, 19760121062506),  # 1975
+    (19760219203955, 19760320194936, 19760420070256, 19760521062104, 19760621142411, 19760723011826, 19760823081815, 19760923054811, 19761023145801, 19761122122128, 19761222013506, 19770120121425),  # 1976
+    (19770219023025, 19770321014215, 19770420125712, 19770521121420, 19770621201344, 19770723070338, 19770823140014, 19770923112913, 19771023204039, 19771122180659, 19771222072308, 19780120180359),  # 1977
+    (19780219082057, 19780321073334, 19780420184932, 19780521180826, 19780622020933, 19780723130014, 19780823195646, 19780923172524, 19781024023709, 19781123000436, 19781222132057, 19790120235956),  # 1978
+    (19790219141313, 19790321132155, 19790421003521, 19790521235350, 19790622075609, 19790723184832, 19790824014643, 19790923231622, 19791024082750, 19791123055406, 19791222190945, 19800121054837),  # 1979
+    (19800219200138, 19800320190940, 19800420062241, 19800521054202, 19800621134700, 19800723004159, 19800823074038, 19800923050840, 19801023141730, 19801122114123, 19801222005604, 19810120113558),  # 1980
+    (19810219015138, 19810321010249, 19810420121831, 19810521113925, 19810621194440, 19810723063943, 19810823133810, 19810923110511, 19811023201249, 19811122173556, 19811222065031, 19820120173053),  # 1981
+    (19820219074631, 19820321065550, 19820420180727, 19820521172253, 19820622012259, 19820723121523, 19820823191513, 19820923164611, 19821024015747, 19821122232318, 19821222123809, 19830120231656),  # 1982
+    (19830219133034, 19830321123844, 19830420235009, 19830521230626, 19830622070841, 19830723180407, 19830824010729, 19830923224137, 19831024075417, 19831123051820, 19831222182955, 19840121050502),  # 1983
+    (19840219191613, 19840320182419, 19840420053806, 19840521045736, 19840621130214, 19840722235812, 19840823070010, 19840923043253, 19841023134539, 19841122111038, 19841222002248, 19850120105733),  # 1984
+    (19850219010721, 19850321001343, 19850420112546, 19850521104255, 19850621184407, 19850723053626, 19850823123541, 19850923100727, 19851023192152, 19851122165046, 19851222060740, 19860120164612),  # 1985
+    (19860219065731, 19860321060241, 19860420171208, 19860521162755, 19860622002957, 19860723112423, 19860823182547, 19860923155852, 19861024011411, 19861122224420, 19861222120207, 19870120224023),  # 1986
+    (19870219124957, 19870321115158, 19870420225732, 19870521221001, 19870622061045, 19870723170602, 19870824000950, 19870923214516, 19871024070052, 19871123042923, 19871222174552, 19880121042417),  # 1987
+    (19880219183507, 19880320173835, 19880420044447, 19880521035640, 19880621115631, 19880722225105, 19880823055400, 19880923032850, 19881023124406, 19881122101159, 19881221232753, 19890120100659),  # 1988
+    (19890219002030, 19890320232815, 19890420103856, 19890521095332, 19890621175300, 19890723044528, 19890823114613, 19890923091937, 19891023183508, 19891122160437, 19891222052200, 19900120160133),  # 1989
+    (19900219061401, 19900321051915, 19900420162632, 19900521153723, 19900621233246, 19900723102130, 19900823172049, 19900923145529, 19901024001356, 19901122214655, 19901222110659, 19910120214705),  # 1990
+    (19910219115820, 19910321110156, 19910420220823, 19910521212014, 19910622051847, 19910723161108, 19910823231251, 19910923204806, 19911024060510, 19911123033545, 19911222165338, 19920121033229),  # 1991
+    (19920219174330, 19920320164804, 19920420035653, 19920521031208, 19920621111408, 19920722220849, 19920823051006, 19920923024246, 19921023115707, 19921122092551, 19921221224313, 19930120092249),  # 1992
+    (19930218233510, 19930320224039, 19930420094901, 19930521090143, 19930621165944, 19930723035049, 19930823105018, 19930923082230, 19931023173708, 19931122150651, 19931222042548, 19940120150724),  # 1993
+    (19940219052138, 19940321042801, 19940420153600, 19940521144828, 19940621224732, 19940723094100, 19940823164345, 19940923141913, 19941023233601, 19941122210558, 19941222102243, 19950120210027),  # 1994
+    (19950219111044, 19950321101427, 19950420212129, 19950521203411, 19950622043422, 19950723152940, 19950823223450, 19950923201300, 19951024053131, 19951123030123, 19951222161647, 19960121025230),  # 1995
+    (19960219170043, 19960320160304, 19960420030953, 19960521022306, 19960621102344, 19960722211842, 19960823042250, 19960923020006, 19961023111842, 19961122084924, 19961221220553, 19970120084231),  # 1996
+    (19970218225129, 19970320215440, 19970420090249, 19970521081753, 19970621161956, 19970723031526, 19970823101911, 19970923075547, 19971023171445, 19971122144733, 19971222040702, 19980120144604),  # 1997
+    (19980219045453, 19980321035432, 19980420145643, 19980521140526, 19980621220234, 19980723085522, 19980823155856, 19980923133711, 19981023225835, 19981122203412, 19981222095627, 19990120203721),  # 1998
+    (19990219104650, 19990321094550, 19990420204600, 19990521195225, 19990622034907, 19990723144406, 19990823215105, 19990923193131, 19991024045214, 19991123022450, 19991222154348, 20000121022303),  # 1999
+    (20000219163318, 20000320153515, 20000420023930, 20000521014924, 20000621094743, 20000722204241, 20000823034831, 20000923012735, 20001023104728, 20001122081920, 20001221213726, 20010120081618),  # 2000
+    (20010218222716, 20010320213044, 20010420083553, 20010521074412, 20010621153743, 20010723022614, 20010823092708, 20010923070428, 20011023162536, 20011122140028, 20011222032130, 20020120140201),  # 2001
+    (20020219041318, 20020321031607, 20020420142028, 20020521132906, 20020621212424, 20020723081451, 20020823151658, 20020923125523, 20021023221749, 20021122195344, 20021222091422, 20030120195235),  # 2002
+    (20030219100013, 20030321085946, 20030420200248, 20030521191225, 20030622031028, 20030723140408, 20030823210810, 20030923184649, 20031024040827, 20031123014321, 20031222150348, 20040121014222),  # 2003
+    (20040219154959, 20040320144838, 20040420015025, 20040521005912, 20040621085651, 20040722195009, 20040823025315, 20040923002950, 20041023094849, 20041122072140, 20041221204136, 20050120072134),  # 2004
+    (20050218213157, 20050320203326, 20050420073715, 20050521064724, 20050621144607, 20050723014042, 20050823084527, 20050923062311, 20051023154220, 20051122131458, 20051222023456, 20060120131518),  # 2005
+    (20060219032534, 20060321022534, 20060420132603, 20060521123133, 20060621202552, 20060723071742, 20060823142235, 20060923120322, 20061023212628, 20061122190145, 20061222082206, 20070120190050),  # 2006
+    (20070219090856, 20070321080726, 20070420190705, 20070521181157, 20070622020626, 20070723130010, 20070823200757, 20070923175114, 20071024031524, 20071123004953, 20071222140748, 20080121004332),  # 2007
+    (20080219144933, 20080320134817, 20080420005108, 20080521000054, 20080621075921, 20080722185448, 20080823020214, 20080922234430, 20081023090839, 20081122064420, 20081221200345, 20090120064020),  # 2008
+    (20090218204607, 20090320194339, 20090420064425, 20090521055110, 20090621134530, 20090723003542, 20090823073834, 20090923051836, 20091023144328, 20091122122234, 20091222014647, 20100120122742),  # 2009
+    (20100219023538, 20100321013213, 20100420122948, 20100521113354, 20100621192825, 20100723062113, 20100823132657, 20100923110903, 20101023203504, 20101122181434, 20101222073827, 20110120181832),  # 2010
+    (20110219082520, 20110321072044, 20110420181726, 20110521172110, 20110622011630, 20110723121149, 20110823192038, 20110923170438, 20111024023019, 20111123000749, 20111222133002, 20120121000950),  # 2011
+    (20120219141736, 20120320131426, 20120420001205, 20120520231531, 20120621070848, 20120722180052, 20120823010650, 20120922224859, 20121023081334, 20121122055008, 20121221191136, 20130120055143),  # 2012
+    (20130218200136, 20130320190156, 20130420060318, 20130521050930, 20130621130356, 20130722235558, 20130823070142, 20130923044408, 20131023140948, 20131122114807, 20131222011100, 20140120115115),  # 2013
+    (20140219015930, 20140321005706, 20140420115533, 20140521105902, 20140621185113, 20140723054121, 20140823124559, 20140923102905, 20141023195703, 20141122173811, 20141222070301, 20150120174314),  # 2014
+    (20150219074948, 20150321064508, 20150420174151, 20150521164446, 20150622003754, 20150723113026, 20150823183717, 20150923162032, 20151024014643, 20151122232517, 20151222124756, 20160120232706),  # 2015
+    (20160219133343, 20160320123011, 20160419232926, 20160520223629, 20160621063411, 20160722173012, 20160823003829, 20160922222108, 20161023074533, 20161122052223, 20161221184410, 20170120052336),  # 2016
+    (20170218193119, 20170320182838, 20170420052701, 20170521043056, 20170621122409, 20170722231521, 20170823062013, 20170923040147, 20171023132640, 20171122110438, 20171222002757, 20180120110902),  # 2017
+    (20180219011801, 20180321001528, 20180420111233, 20180521101438, 20180621180718, 20180723050021, 20180823120835, 20180923095407, 20181023192224, 20181122170130, 20181222062245, 20190120165934),  # 2018
+    (20190219070358, 20190321055827, 20190420165517, 20190521155909, 20190621235417, 20190723105024, 20190823180201, 20190923155011, 20191024011946, 20191122225857, 20191222121928, 20200120225440),  # 2019
+    (20200219125700, 20200320114937, 20200419224529, 20200520214917, 20200621054341, 20200722163652, 20200822234456, 20200922213040, 20201023065934, 20201122043946, 20201221180221, 20210120043951),  # 2020
+    (20210218184358, 20210320173728, 20210420043323, 20210521033707, 20210621113210, 20210722222625, 20210823053458, 20210923032105, 20211023125110, 20211122103345, 20211221235919, 20220120103906),  # 2021
+    (20220219004301, 20220320233326, 20220420102418, 20220521092236, 20220621171351, 20220723040700, 20220823111611, 20220923090343, 20221023183543, 20221122162030, 20221222054812, 20230120162932),  # 2022
+    (20230219063417, 20230321052426, 20230420161337, 20230521150910, 20230621225749, 20230723095027, 20230823170118, 20230923144958, 20231024002050, 20231122220241, 20231222112720, 20240120220722),  # 2023
+    (20240219121312, 20240320110625, 20240419215947, 20240520205931, 20240621045100, 20240722154426, 20240822225503, 20240922204342, 20241023061447, 20241122035631, 20241221172035, 20250120040008),  # 2024
+    (20250218180634, 20250320170129, 20250420035601, 20250521025439, 20250621104216, 20250722212927, 20250823043351, 20250923021920, 20251023115056, 20251122093535, 20251221230305, 20260120094456),  # 2025
+    (20260218235156, 20260320224559, 20260420093908, 20260521083645, 20260621162430, 20260723031305, 20260823101849, 20260923080514, 20261023173757, 20261122152321, 20261222045014, 20270120152950),  # 2026
+    (20270219053329, 20270321042442, 20270420151738, 20270521141814, 20270621221050, 20270723090439, 20270823161419, 20270923140143, 20271023233252, 20271122211614, 20271222104210, 20280120212157),  # 2027
+    (20280219112602, 20280320101710, 20280419210931, 20280520200949, 20280621040200, 20280722145359, 20280822220056, 20280922194520, 20281023051324, 20281122025424, 20281221161941, 20290120030053),  # 2028
+    (20290218170756, 20290320160159, 20290420025542, 20290521015552, 20290621094817, 20290722204205, 20290823035137, 20290923013831, 20291023110808, 20291122084924, 20291221221408, 20300120085424),  # 2029
+    (20300218225957, 20300320215207, 20300420084336, 20300521074106, 20300621153118, 20300723022453, 20300823093624, 20300923072655, 20301023170035, 20301122144436, 20301222040937, 20310120144758),  # 2030
+    (20310219045055, 20310321034058, 20310420143114, 20310521132755, 20310621211708, 20310723081028, 20310823152320, 20310923131519, 20311023224927, 20311122203236, 20311222095533, 20320120203119),  # 2031
+    (20320219103215, 20320320092155, 20320419201410, 20320520191500, 20320621030846, 20320722140445, 20320822211821, 20320922191055, 20321023044615, 20321122023112, 20321221155557, 20330120023248),  # 2032
+    (20330218163350, 20330320152245, 20330420021308, 20330521011059, 20330621090109, 20330722195249, 20330823030151, 20330923005141, 20331023102737, 20331122081611, 20331221214601, 20340120082719),  # 2033
+    (20340218223013, 20340320211730, 20340420080344, 20340521065654, 20340621144412, 20340723013621, 20340823084746, 20340923063935, 20341023161628, 20341122140458, 20341222033401, 20350120141416),  # 2034
+    (20350219041610, 20350321030243, 20350420134859, 20350521124327, 20350621203309, 20350723072842, 20350823144411, 20350923123858, 20351023221611, 20351122200313, 20351222093053, 20360120201104),  # 2035
+    (20360219101419, 20360320090252, 20360419195031, 20360520184454, 20360621023215, 20360722132241, 20360822203225, 20360922182320, 20361023035851, 20361122014519, 20361221151254, 20370120015345),  # 2036
+    (20370218155856, 20370320145018, 20370420014021, 20370521003529, 20370621082227, 20370722191237, 20370823022203, 20370923001307, 20371023094954, 20371122073825, 20371221210747, 20380120074852),  # 2037
+    (20380218215209, 20380320204040, 20380420072834, 20380521062244, 20380621140925, 20380723005955, 20380823081009, 20380923060216, 20381023154042, 20381122133121, 20381222030221, 20390120134341),  # 2038
+    (20390219034546, 20390321023203, 20390420131748, 20390521121054, 20390621195727, 20390723064811, 20390823135841, 20390923114938, 20391023212505, 20391122191213, 20391222084037, 20400120192105),  # 2039
+    (20400219092351, 20400320081144, 20400419185936, 20400520175546, 20400621014625, 20400722124050, 20400822195321, 20400922174457, 20401023031947, 20401122010533, 20401221143253, 20410120011320),  # 2040
+    (20410218151719, 20410320140651, 20410420005458, 20410520234853, 20410621073553, 20410722182643, 20410823013619, 20410922232636, 20411023090200, 20411122064920, 20411221201821, 20420120070005),  # 2041
+    (20420218210430, 20420320195321, 20420420063949, 20420521053118, 20420621131552, 20420723000621, 20420823071809, 20420923051134, 20421023144935, 20421122123725, 20421222020406, 20430120124138),  # 2042
+    (20430219024143, 20430321012750, 20430420121430, 20430521110912, 20430621185825, 20430723055330, 20430823130950, 20430923110700, 20431023204653, 20431122183507, 20431222080117, 20440120183729),  # 2043
+    (20440219083552, 20440320072037, 20440419180647, 20440520170157, 20440621005111, 20440722114324, 20440822185444, 20440922164755, 20441023022622, 20441122001522, 20441221134339, 20450120002217),  # 2044
+    (20450218142226, 20450320130742, 20450419235256, 20450520224604, 20450621063358, 20450722172652, 20450823003914, 20450922223301, 20451023081236, 20451122060355, 20451221193511, 20460120061556),  # 2045
+    (20460218201542, 20460320185757, 20460420053901, 20460521042835, 20460621121443, 20460722230846, 20460823062436, 20460923042148, 20461023140338, 20461122115621, 20461222012833, 20470120121002),  # 2046
+    (20470219021028, 20470321005245, 20470420113238, 20470521102000, 20470621180334, 20470723045533, 20470823121057, 20470923100811, 20471023194840, 20471122173821, 20471222070719, 20480120174713),  # 2047
+    (20480219074836, 20480320063356, 20480419171733, 20480520160809, 20480620235402, 20480722104702, 20480822180236, 20480922160045, 20481023014250, 20481121233336, 20481221130221, 20490119234119),  # 2048
+    (20490218134223, 20490320122844, 20490419231335, 20490520220355, 20490621054724, 20490722163624, 20490822234727, 20490922214244, 20491023072518, 20491122051923, 20491221185215, 20500120053356),  # 2049
+    (20500218193513, 20500320181943, 20500420050219, 20500521035057, 20500621113308, 20500722222130, 20500823053248, 20500923032839, 20501023131157, 20501122110626, 20501222003848, 20510120111854),  # 2050
+    (20510219011735, 20510320235919, 20510420104047, 20510521093132, 20510621171847, 20510723041305, 20510823112917, 20510923092730, 20511023191014, 20511122170258, 20511222063414, 20520120171420),  # 2051
+    (20520219071345, 20520320055613, 20520419163803, 20520520152906, 20520620231620, 20520722100858, 20520822172136, 20520922151548, 20521023005517, 20521121224606, 20521221121719, 20530119225921),  # 2052
+    (20530218130201, 20530320114730, 20530419223022, 20530520211940, 20530621050415, 20530722155619, 20530822231021, 20530922210625, 20531023064721, 20531122043853, 20531221181003, 20540120045106),  # 2053
+    (20540218185140, 20540320173434, 20540420041511, 20540521030305, 20540621104718, 20540722214045, 20540823045833, 20540923025936, 20541023124456, 20541122103858, 20541222001003, 20550120104907),  # 2054
+    (20550219004725, 20550320232844, 20550420100839, 20550521085619, 20550621163959, 20550723033208, 20550823104840, 20550923084852, 20551023183325, 20551122162616, 20551222055542, 20560120163301),  # 2055
+    (20560219063002, 20560320051110, 20560419155212, 20560520144202, 20560620222820, 20560722092220, 20560822163909, 20560922143936, 20561023002527, 20561121222020, 20561221115144, 20570119223016),  # 2056
+    (20570218122730, 20570320110802, 20570419214737, 20570520203520, 20570621041911, 20570722151048, 20570822222507, 20570922202323, 20571023060906, 20571122040647, 20571221174257, 20580120042607),  # 2057
+    (20580218182543, 20580320170507, 20580420034058, 20580521022409, 20580621100409, 20580722205353, 20580823040850, 20580923020830, 20581023115429, 20581122095052, 20581221232503, 20590120100637),  # 2058
+    (20590219000518, 20590320224422, 20590420092021, 20590521080439, 20590621154722, 20590723024058, 20590823100015, 20590923080337, 20591023175052, 20591122154602, 20591222051803, 20600120155812),  # 2059
+    (20600219055719, 20600320043835, 20600419151726, 20600520140334, 20600620214543, 20600722083549, 20600822154937, 20600922134816, 20601022233328, 20601121212841, 20601221110131, 20610119214241),  # 2060
+    (20610218114314, 20610320102620, 20610419210635, 20610520195221, 20610621033218, 20610722142024, 20610822213311, 20610922193127, 20611023051717, 20611122031415, 20611221164855, 20620120033014),  # 2061
+    (20620218172819, 20620320160733, 20620420024442, 20620521012950, 20620621091127, 20620722200214, 20620823031822, 20620923011959, 20621023110825, 20621122090711, 20621221224244, 20630120092401),  # 2062
+    (20630218232123, 20630320215916, 20630420083503, 20630521071941, 20630621150158, 20630723015323, 20630823090852, 20630923070818, 20631023165322, 20631122144825, 20631222042109, 20640120150125),  # 2063
+    (20640219045923, 20640320033842, 20640419141555, 20640520130148, 20640620204543, 20640722073926, 20640822145644, 20640922125708, 20641022224220, 20641121203649, 20641221100850, 20650119204854),  # 2064
+    (20650218104738, 20650320092815, 20650419200557, 20650520185046, 20650621023232, 20650722132428, 20650822204124, 20650922184239, 20651023042943, 20651122022637, 20651221160049, 20660120024208),  # 2065
+    (20660218164045, 20660320151952, 20660420015518, 20660521003730, 20660621081627, 20660722190620, 20660823022332, 20660923002703, 20661023101626, 20661122081338, 20661221214534, 20670120082256),  # 2066
+    (20670218221723, 20670320205340, 20670420072838, 20670521061257, 20670621135603, 20670723005039, 20670823081216, 20670923061941, 20671023161149, 20671122141038, 20671222034308, 20680120142000),  # 2067
+    (20680219041326, 20680320024903, 20680419132425, 20680520121002, 20680620195348, 20680722064642, 20680822140357, 20680922120648, 20681022215659, 20681121195701, 20681221093242, 20690119201309),  # 2068
+    (20690218100902, 20690320084505, 20690419191845, 20690520180102, 20690621014118, 20690722123222, 20690822194917, 20690922175154, 20691023034211, 20691122014338, 20691221152204, 20700120020501),  # 2069
+    (20700218160114, 20700320143455, 20700420010431, 20700520234318, 20700621072236, 20700722181542, 20700823013710, 20700922234451, 20701023093823, 20701122074056, 20701221211920, 20710120080225),  # 2070
+    (20710218215941, 20710320203441, 20710420070452, 20710521054259, 20710621132050, 20710723001215, 20710823073153, 20710923053744, 20711023152910, 20711122132842, 20711222030352, 20720120134509),  # 2071
+    (20720219034307, 20720320022104, 20720419125500, 20720520113539, 20720620191348, 20720722060408, 20720822132230, 20720922112750, 20721022211952, 20721121192026, 20721221085601, 20730119193658),  # 2072
+    (20730218093445, 20730320081320, 20730419184813, 20730520172928, 20730621010700, 20730722115513, 20730822191113, 20730922171517, 20731023030801, 20731122011127, 20731221145042, 20740120013408),  # 2073
+    (20740218153203, 20740320140852, 20740420004143, 20740520232138, 20740621065826, 20740722174543, 20740823010033, 20740922230347, 20741023085548, 20741122065753, 20741221203514, 20750120071630),  # 2074
+    (20750218211159, 20750320194633, 20750420061823, 20750521045935, 20750621124026, 20750722233328, 20750823065313, 20750923045849, 20751023145036, 20751122125110, 20751222022704, 20760120130740),  # 2075
+    (20760219030325, 20760320013851, 20760419121157, 20760520105448, 20760620183646, 20760722052940, 20760822124741, 20760922105015, 20761022203900, 20761121183742, 20761221081322, 20770119185523),  # 2076
+    (20770218085332, 20770320073104, 20770419180425, 20770520164500, 20770621002327, 20770722111350, 20770822183147, 20770922163550, 20771023022559, 20771122002520, 20771221140048, 20780120004123),  # 2077
+    (20780218143646, 20780320131051, 20780419234054, 20780520221922, 20780621055756, 20780722165056, 20780823001354, 20780922222431, 20781023082030, 20781122062253, 20781221195757, 20790120063554),  # 2078
+    (20790218202823, 20790320190040, 20790420053034, 20790521040951, 20790621114918, 20790722224231, 20790823060420, 20790923041309, 20791023140757, 20791122120939, 20791222014400, 20800120122058),  # 2079
+    (20800219021224, 20800320004407, 20800419111421, 20800520095425, 20800620173406, 20800722042651, 20800822114758, 20800922095626, 20801022195201, 20801121175551, 20801221073248, 20810119181144),  # 2080
+    (20810218080345, 20810320063414, 20810419170133, 20810520153838, 20810620231624, 20810722100809, 20810822172904, 20810922153749, 20811023013432, 20811121234113, 20811221132231, 20820120000548),  # 2081
+    (20820218140022, 20820320123039, 20820419225524, 20820520212847, 20820621050318, 20820722155302, 20820822231326, 20820922212258, 20821023072005, 20821122052528, 20821221190440, 20830120054620),  # 2082
+    (20830218194014, 20830320181031, 20830420043527, 20830521030850, 20830621104354, 20830722213545, 20830823045915, 20830923031138, 20831023131021, 20831122111537, 20831222005322, 20840120113336),  # 2083
+    (20840219012726, 20840319235930, 20840419102741, 20840520090425, 20840620164035, 20840722033035, 20840822105028, 20840922085908, 20841022185557, 20841121170142, 20841221064117, 20850119172338),  # 2084
+    (20850218071934, 20850320055333, 20850419162249, 20850520145859, 20850620223250, 20850722091928, 20850822163626, 20850922144331, 20851023004011, 20851121224715, 20851221122845, 20860119231137),  # 2085
+    (20860218130523, 20860320113520, 20860419220034, 20860520203441, 20860621040937, 20860722145941, 20860822222055, 20860922203215, 20861023063211, 20861122044055, 20861221182241, 20870120050515),  # 2086
+    (20870218185841, 20870320172822, 20870420035349, 20870521022903, 20870621100600, 20870722205817, 20870823041942, 20870923022821, 20871023122415, 20871122102911, 20871222000832, 20880120105040),  # 2087
+    (20880219004524, 20880319231706, 20880419094415, 20880520082013, 20880620155644, 20880722024814, 20880822100933, 20880922081820, 20881022181346, 20881121161745, 20881221055615, 20890119163815),  # 2088
+    (20890218063352, 20890320050639, 20890419153334, 20890520140801, 20890620214301, 20890722083343, 20890822155550, 20890922140700, 20891023000524, 20891121221158, 20891221115206, 20900119223441),  # 2089
+    (20900218122956, 20900320110200, 20900419212825, 20900520200208, 20900621033558, 20900722142532, 20900822214713, 20900922195925, 20901023055923, 20901122040553, 20901221174338, 20910120042209),  # 2090
+    (20910218181301, 20910320164158, 20910420030738, 20910521014245, 20910621091902, 20910722201136, 20910823033621, 20910923015057, 20911023115235, 20911122100022, 20911221233837, 20920120101632),  # 2091
+    (20920219000601, 20920319223340, 20920419085924, 20920520073633, 20920620151504, 20920722020747, 20920822093022, 20920922074153, 20921022174149, 20921121155034, 20921221053200, 20930119161346),  # 2092
+    (20930218060610, 20930320043437, 20930419145835, 20930520133208, 20930620210709, 20930722075726, 20930822151829, 20930922132900, 20931022232821, 20931121213739, 20931221112050, 20940119220404),  # 2093
+    (20940218115601, 20940320102138, 20940419204056, 20940520190940, 20940621024224, 20940722133425, 20940822210018, 20940922191637, 20941023052015, 20941122033056, 20941221171323, 20950120035548),  # 2094
+    (20950218174804, 20950320161501, 20950420023559, 20950521010554, 20950621083855, 20950722193058, 20950823025623, 20950923011111, 20951023111248, 20951122092103, 20951221230052, 20960120094133),  # 2095
+    (20960218233359, 20960319220257, 20960419082643, 20960520065834, 20960620143050, 20960722011931, 20960822084135, 20960922065446, 20961022165619, 20961121150530, 20961221044614, 20970119152714),  # 2096
+    (20970218051939, 20970320034827, 20970419141122, 20970520124202, 20970620201324, 20970722070101, 20970822142209, 20970922123552, 20971022223949, 20971121205244, 20971221103726, 20980119212057),  # 2097
+    (20980218111324, 20980320094027, 20980419200146, 20980520183137, 20980621020259, 20980722125058, 20980822201138, 20980922182412, 20981023042654, 20981122023806, 20981221162048, 20990120030218),  # 2098
+    (20990218165239, 20990320151742, 20990420013757, 20990521000818, 20990621074138, 20990722183256, 20990823015706, 20990923001105, 20991023101254, 20991122082236, 20991221220419, 21000120084553),  # 2099
+    (21000218223715, 21000320210339, 21000420072512, 21000521055717, 21000621133211, 21000723002356, 21000823074738, 21000923060028, 21001023160041, 21001122140912, 21001222035052, 21010120143347),  # 2100
+    (21010219042738, 21010321025636, 21010420131902, 21010521114923, 21010621192128, 21010723061046, 21010823133316, 21010923114636, 21011023214805, 21011122195726, 21011222093856, 21020120202006),  # 2101
+    (21020219101044, 21020321083600, 21020420185459, 21020521172233, 21020622005329, 21020723114433, 21020823191134, 21020923173059, 21021024033820, 21021123015110, 21021222153246, 21030121021146),  # 2102
+    (21030219155941, 21030321142308, 21030421004223, 21030521231212, 21030622064547, 21030723173848, 21030824010614, 21030923232430, 21031024093030, 21031123074238, 21031222212402, 21040121080256),  # 2103
+    (21040219215044, 21040320201409, 21040420063344, 21040521050410, 21040621123735, 21040722232832, 21040823065312, 21040923050932, 21041023151502, 21041122132826, 21041222031224, 21050120135402),  # 2104
+    (21050219034333, 21050321020626, 21050420122238, 21050521104829, 21050621181845, 21050723050851, 21050823123411, 21050923105206, 21051023205946, 21051122191606, 21051222090344, 21060120194855),  # 2105
+    (21060219094040, 21060321080407, 21060420181942, 21060521164400, 21060622001240, 21060723110219, 21060823182813, 21060923164650, 21061024025416, 21061123010828, 21061222145302, 21070121013543),  # 2106
+    (21070219152621, 21070321135003, 21070421000643, 21070521223202, 21070622060052, 21070723165031, 21070824001719, 21070923223704, 21071024084502, 21071123065857, 21071222204215, 21080121072335),  # 2107
+    (21080219211358, 21080320193857, 21080420055807, 21080521042631, 21080621115720, 21080722224624, 21080823061044, 21080923042804, 21081023143500, 21081122124938, 21081222023436, 21090120131737),  # 2108
+    (21090219030931, 21090321013606, 21090420115633, 21090521102504, 21090621175504, 21090723044220, 21090823120358, 21090923101903, 21091023202518, 21091122184051, 21091222082722, 21100120191027),  # 2109
+    (21100219085942, 21100321072136, 21100420173718, 21100521160240, 21100621233208, 21100723102153, 21100823174747, 21100923160656, 21101024021559, 21101123003237, 21101222141848, 21110121010109),  # 2110
+    (21110219144937, 21110321131037, 21110420232603, 21110521215259, 21110622052541, 21110723161907, 21110823234711, 21110923220530, 21111024081120, 21111123062412, 21111222200747, 21120121064932),  # 2111
+    (21120219203924, 21120320190248, 21120420052008, 21120521034738, 21120621111937, 21120722221109, 21120823053733, 21120923035521, 21121023140054, 21121122121312, 21121222015605, 21130120123730),  # 2112
+    (21130219022733, 21130321005044, 21130420110556, 21130521092922, 21130621165725, 21130723034719, 21130823111438, 21130923093533, 21131023194523, 21131122180128, 21131222074629, 21140120182807),  # 2113
+    (21140219081658, 21140321063853, 21140420165403, 21140521151807, 21140621224626, 21140723093642, 21140823170506, 21140923152735, 21141024013859, 21141122235526, 21141222133906, 21150121001751),  # 2114
+    (21150219140310, 21150321122211, 21150420223612, 21150521210102, 21150622043030, 21150723152059, 21150823224930, 21150923211224, 21151024072426, 21151123054159, 21151222192642, 21160121060550),  # 2115
+    (21160219195038, 21160320180830, 21160420042127, 21160521024627, 21160621101709, 21160722210807, 21160823043510, 21160923025559, 21161023130706, 21161122112558, 21161222011403, 21170120115729),  # 2116
+    (21170219014604, 21170321000559, 21170420101838, 21170521084110, 21170621160914, 21170723025845, 21170823102443, 21170923084414, 21171023185425, 21171122171330, 21171222070259, 21180120174731),  # 2117
+    (21180219073532, 21180321055250, 21180420160113, 21180521141853, 21180621214306, 21180723083210, 21180823160142, 21180923142620, 21181024004014, 21181122230012, 21181222124825, 21190120233148),  # 2118
+    (21190219132001, 21190321113838, 21190420214858, 21190521200854, 21190622033513, 21190723142537, 21190823215534, 21190923201940, 21191024063215, 21191123045015, 21191222183614, 21200121051811),  # 2119
+    (21200219190657, 21200320172822, 21200420034230, 21200521020515, 21200621093148, 21200722201908, 21200823034439, 21200923020544, 21201023121732, 21201122103621, 21201222002335, 21210120110610),  # 2120
+    (21210219005449, 21210320231520, 21210420092728, 21210521074723, 21210621151115, 21210723015659, 21210823092144, 21210923074318, 21211023175723, 21211122161949, 21211222061045, 21220120165538),  # 2121
+    (21220219064416, 21220321050323, 21220420151454, 21220521133552, 21220621210152, 21220723075006, 21220823151651, 21220923133850, 21221023235143, 21221122221154, 21221222120028, 21230120224325),  # 2122
+    (21230219123031, 21230321104824, 21230420205923, 21230521192118, 21230622024918, 21230723133922, 21230823210727, 21230923192930, 21231024054047, 21231123035849, 21231222174543, 21240121042812),  # 2123
+    (21240219181601, 21240320163504, 21240420024649, 21240521010905, 21240621083732, 21240722192809, 21240823025620, 21240923011817, 21241023112921, 21241122094709, 21241221233415, 21250120101746),  # 2124
+    (21250219000735, 21250320222908, 21250420084243, 21250521070455, 21250621143216, 21250723012217, 21250823085040, 21250923071321, 21251023172538, 21251122154429, 21251222053127, 21260120161239),  # 2125
+    (21260219055818, 21260321041508, 21260420142444, 21260521124409, 21260621200941, 21260723065944, 21260823143111, 21260923125859, 21261023231611, 21261122213752, 21261222112456, 21270120220424),  # 2126
+    (21270219114737, 21270321100219, 21270420201109, 21270521183207, 21270622020105, 21270723125425, 21270823202719, 21270923185506, 21271024051148, 21271123033310, 21271222172010, 21280121035941),  # 2127
+    (21280219174300, 21280320155800, 21280420020727, 21280521002902, 21280621075808, 21280722185009, 21280823022014, 21280923004512, 21281023110040, 21281122092257, 21281221231230, 21290120095459),  # 2128
+    (21290218234011, 21290320215419, 21290420075928, 21290521061437, 21290621133746, 21290723002652, 21290823075715, 21290923062407, 21291023164214, 21291122150747, 21291222050102, 21300120154654),  # 2129
+    (21300219053403, 21300321034832, 21300420135300, 21300521120706, 21300621192923, 21300723061838, 21300823135054, 21300923122013, 21301023223900, 21301122210230, 21301222105218, 21310120213512),  # 2130
+    (21310219112110, 21310321093620, 21310420194233, 21310521175823, 21310622012123, 21310723120940, 21310823194016, 21310923180830, 21311024042657, 21311123025019, 21311222163930, 21320121032136),  # 2131
+    (21320219170731, 21320320152350, 21320420013154, 21320520234901, 21320621071147, 21320722175822, 21320823012558, 21320922235129, 21321023100913, 21321122083400, 21321221222538, 21330120090956),  # 2132
+    (21330218225723, 21330320211501, 21330420072430, 21330521054245, 21330621130604, 21330722235238, 21330823071927, 21330923054325, 21331023160007, 21331122142522, 21331222041816, 21340120150236),  # 2133
+    (21340219044740, 21340321030055, 21340420130550, 21340521112113, 21340621184343, 21340723053105, 21340823130020, 21340923112709, 21341023214528, 21341122201040, 21341222100238, 21350120204627),  # 2134
+    (21350219103125, 21350321084421, 21350420184841, 21350521170432, 21350622002955, 21350723112126, 21350823185319, 21350923172018, 21351024033629, 21351123015821, 21351222154727, 21360121023011),  # 2135
+    (21360219161625, 21360320143227, 21360420004010, 21360520225810, 21360621062401, 21360722171450, 21360823004530, 21360922231124, 21361023092655, 21361122074815, 21361221213647, 21370120081912),  # 2136
+    (21370218220524, 21370320202045, 21370420062605, 21370521043938, 21370621120003, 21370722224718, 21370823061802, 21370923044651, 21371023150639, 21371122133158, 21371222032252, 21380120140522),  # 2137
+    (21380219034948, 21380321020308, 21380420120750, 21380521102231, 21380621174454, 21380723043410, 21380823120739, 21380923103945, 21381023210146, 21381122192714, 21381222091615, 21390120195530),  # 2138
+    (21390219093626, 21390321074723, 21390420175149, 21390521160821, 21390621233325, 21390723102349, 21390823175621, 21390923162710, 21391024024858, 21391123011531, 21391222150602, 21400121014615),  # 2139
+    (21400219152704, 21400320133651, 21400419233931, 21400520215413, 21400621051752, 21400722160731, 21400822233837, 21400922220720, 21401023082818, 21401122065622, 21401221205025, 21410120073500),  # 2140
+    (21410218211932, 21410320193114, 21410420053348, 21410521034705, 21410621110929, 21410722215916, 21410823053142, 21410923040113, 21411023142201, 21411122125007, 21411222024455, 21420120133001),  # 2141
+    (21420219031358, 21420321012334, 21420420112238, 21420521093204, 21420621165118, 21420723033939, 21420823111343, 21420923094714, 21421023201120, 21421122183951, 21421222083252, 21430120191617),  # 2142
+    (21430219085954, 21430321071019, 21430420171034, 21430521152105, 21430621224147, 21430723093141, 21430823170609, 21430923153915, 21431024020242, 21431123003009, 21431222142136, 21440121010344),  # 2143
+    (21440219144741, 21440320130052, 21440419230540, 21440520212023, 21440621044248, 21440722153132, 21440822230310, 21440922213332, 21441023075602, 21441122062432, 21441221201753, 21450120070117),  # 2144
+    (21450218204501, 21450320185607, 21450420045718, 21450521030740, 21450621102532, 21450722211033, 21450823044027, 21450923031103, 21451023133520, 21451122120652, 21451222020334, 21460120124915),  # 2145
+    (21460219023304, 21460321004236, 21460420104218, 21460521085253, 21460621161311, 21460723030145, 21460823103502, 21460923090747, 21461023193156, 21461122180122, 21461222075528, 21470120183913),  # 2146
+    (21470219082213, 21470321063158, 21470420163239, 21470521144458, 21470621220738, 21470723085809, 21470823163144, 21470923150312, 21471024012523, 21471122235252, 21471222134528, 21480121002841),  # 2147
+    (21480219141212, 21480320122249, 21480419222347, 21480520203450, 21480621035453, 21480722144315, 21480822221541, 21480922204631, 21481023070834, 21481122053624, 21481221192948, 21490120061421),  # 2148
+    (21490218195945, 21490320181229, 21490420041505, 21490521022656, 21490621094710, 21490722203547, 21490823040937, 21490923024238, 21491023130645, 21491122113601, 21491222012922, 21500120121131),  # 2149
+    (21500219015247, 21500321000101, 21500420095958, 21500521080941, 21500621152900, 21500723021714, 21500823095204, 21500923082814, 21501023185606, 21501122172735, 21501222072058, 21510120180142),  # 2150
+    (21510219074043, 21510321054643, 21510420154416, 21510521135358, 21510621211504, 21510723080550, 21510823154119, 21510923141629, 21511024004324, 21511122231443, 21511222130837, 21520120235013),  # 2151
+)
+
+lunar_start = 1850
+
+lunar_months = (
+    (18500212, 0, '101001001101'),  # 1850
+    (18510201, 8, '1101001001011'),  # 1851
+    (18520220, 0, '101100101001'),  # 1852
+    (18530208, 0, '101101010101'),  # 1853
+    (18540129, 7, '0101011010101'),  # 1854
+    (18550217, 0, '001011011010'),  # 1855
+    (18560206, 0, '100101011101'),  # 1856
+    (18570126, 5, '0100101010111'),  # 1857
+    (18580214, 0, '010010011011'),  # 1858
+    (18590203, 0, '101001001011'),  # 1859
+    (18600123, 3, '1011001001011'),  # 1860
+    (18610210, 0, '011010101001'),  # 1861
+    (18620130, 8, '1010110101001'),  # 1862
+    (18630218, 0, '011010110101'),  # 1863
+    (18640208, 0, '001010110110'),  # 1864
+    (18650127, 5, '1001010110110'),  # 1865
+    (18660215, 0, '100100110111'),  # 1866
+    (18670205, 0, '010010010111'),  # 1867
+    (18680125, 4, '0110010010110'),  # 1868
+    (18690211, 0, '111001001010'),  # 1869
+    (18700131, 10, '1110101001010'),  # 1870
+    (18710219, 0, '110110101001'),  # 1871
+    (18720209, 0, '010110101101'),  # 1872
+    (18730129, 6, '0010101101101'),  # 1873
+    (18740217, 0, '001010101110'),  # 1874
+    (18750206, 0, '100100101110'),  # 1875
+    (18760126, 5, '1100100101101'),  # 1876
+    (18770213, 0, '110010010101'),  # 1877
+    (18780202, 0, '110101001010'),  # 1878
+    (18790122, 3, '1101101001010'),  # 1879
+    (18800210, 0, '101101101001'),  # 1880
+    (18810130, 7, '0101011011010'),  # 1881
+    (18820218, 0, '010101011011'),  # 1882
+    (18830208, 0, '001001011101'),  # 1883
+    (18840128, 5, '1001001011011'),  # 1884
+    (18850215, 0, '100100101011'),  # 1885
+    (18860204, 0, '101010010101'),  # 1886
+    (18870124, 4, '1101010010101'),  # 1887
+    (18880212, 0, '101101001010'),  # 1888
+    (18890131, 0, '101101010101'),  # 1889
+    (18900121, 2, '0101011010101'),  # 1890
+    (18910209, 0, '010101011011'),  # 1891
+    (18920130, 6, '0010010110111'),  # 1892
+    (18930217, 0, '001001010111'),  # 1893
+    (18940206, 0, '010100101011'),  # 1894
+    (18950126, 5, '1010100101010'),  # 1895
+    (18960213, 0, '111010010101'),  # 1896
+    (18970202, 0, '011010101010'),  # 1897
+    (18980122, 3, '1010110101010'),  # 1898
+    (18990210, 0, '101010110101'),  # 1899
+    (19000131, 8, '0100101101101'),  # 1900
+    (19010219, 0, '010010101110'),  # 1901
+    (19020208, 0, '101001010111'),  # 1902
+    (19030129, 5, '0101001001101'),  # 1903
+    (19040216, 0, '110100100110'),  # 1904
+    (19050204, 0, '110110010101'),  # 1905
+    (19060125, 4, '0110101010101'),  # 1906
+    (19070213, 0, '010101101010'),  # 1907
+    (19080202, 0, '100110101101'),  # 1908
+    (19090122, 2, '0100101011101'),  # 1909
+    (19100210, 0, '010010101110'),  # 1910
+    (19110130, 6, '1010010011011'),  # 1911
+    (19120218, 0, '101001001101'),  # 1912
+    (19130206, 0, '110100100101'),  # 1913
+    (19140126, 5, '1101010100101'),  # 1914
+    (19150214, 0, '101101010100'),  # 1915
+    (19160203, 0, '110101101010'),  # 1916
+    (19170123, 2, '1001011011010'),  # 1917
+    (19180211, 0, '100101011011'),  # 1918
+    (19190201, 7, '0100100110111'),  # 1919
+    (19200220, 0, '010010010111'),  # 1920
+    (19210208, 0, '101001001011'),  # 1921
+    (19220128, 5, '1011001001011'),  # 1922
+    (19230216, 0, '011010100101'),  # 1923
+    (19240205, 0, '011011010100'),  # 1924
+    (19250124, 4, '1010110110101'),  # 1925
+    (19260213, 0, '001010110110'),  # 1926
+    (19270202, 0, '100101010111'),  # 1927
+    (19280123, 2, '0100100101111'),  # 1928
+    (19290210, 0, '010010010111'),  # 1929
+    (19300130, 6, '0110010010110'),  # 1930
+    (19310217, 0, '110101001010'),  # 1931
+    (19320206, 0, '111010100101'),  # 1932
+    (19330126, 5, '0110110101001'),  # 1933
+    (19340214, 0, '010110101101'),  # 1934
+    (19350204, 0, '001010110110'),  # 1935
+    (19360124, 3, '1001001101110'),  # 1936
+    (19370211, 0, '100100101110'),  # 1937
+    (19380131, 7, '1100100101101'),  # 1938
+    (19390219, 0, '110010010101'),  # 1939
+    (19400208, 0, '110101001010'),  # 1940
+    (19410127, 6, '1101101001010'),  # 1941
+    (19420215, 0, '101101010101'),  # 1942
+    (19430205, 0, '010101101010'),  # 1943
+    (19440125, 4, '1010101011011'),  # 1944
+    (19450213, 0, '001001011101'),  # 1945
+    (19460202, 0, '100100101101'),  # 1946
+    (19470122, 2, '1100100101011'),  # 1947
+    (19480210, 0, '101010010101'),  # 1948
+    (19490129, 7, '1011010010101'),  # 1949
+    (19500217, 0, '011011001010'),  # 1950
+    (19510206, 0, '101101010101'),  # 1951
+    (19520127, 5, '0101010110101'),  # 1952
+    (19530214, 0, '010011011010'),  # 1953
+    (19540203, 0, '101001011011'),  # 1954
+    (19550124, 3, '0101001010111'),  # 1955
+    (19560212, 0, '010100101011'),  # 1956
+    (19570131, 8, '1010100101010'),  # 1957
+    (19580218, 0, '111010010101'),  # 1958
+    (19590208, 0, '011010101010'),  # 1959
+    (19600128, 6, '1010110101010'),  # 1960
+    (19610215, 0, '101010110101'),  # 1961
+    (19620205, 0, '010010110110'),  # 1962
+    (19630125, 4, '1010010101110'),  # 1963
+    (19640213, 0, '101001010111'),  # 1964
+    (19650202, 0, '010100100110'),  # 1965
+    (19660121, 3, '1110100100110'),  # 1966
+    (19670209, 0, '110110010101'),  # 1967
+    (19680130, 7, '0101101010101'),  # 1968
+    (19690217, 0, '010101101010'),  # 1969
+    (19700206, 0, '100101101101'),  # 1970
+    (19710127, 5, '0100101011101'),  # 1971
+    (19720215, 0, '010010101101'),  # 1972
+    (19730203, 0, '101001001101'),  # 1973
+    (19740123, 4, '1101001001101'),  # 1974
+    (19750211, 0, '110100100101'),  # 1975
+    (19760131, 8, '1101010100101'),  # 1976
+    (19770218, 0, '101101010100'),  # 1977
+    (19780207, 0, '101101101010'),  # 1978
+    (19790128, 6, '1001011011010'),  # 1979
+    (19800216, 0, '100101011011'),  # 1980
+    (19810205, 0, '010010011011'),  # 1981
+    (19820125, 4, '1010010010111'),  # 1982
+    (19830213, 0, '101001001011'),  # 1983
+    (19840202, 10, '1011001001011'),  # 1984
+    (19850220, 0, '011010100101'),  # 1985
+    (19860209, 0, '011011010100'),  # 1986
+    (19870129, 6, '1010110110100'),  # 1987
+    (19880217, 0, '101010110110'),  # 1988
+    (19890206, 0, '100101010111'),  # 1989
+    (19900127, 5, '0100100101111'),  # 1990
+    (19910215, 0, '010010010111'),  # 1991
+    (19920204, 0, '011001001011'),  # 1992
+    (19930123, 3, '0110101001010'),  # 1993
+    (19940210, 0, '111010100101'),  # 1994
+    (19950131, 8, '0110101100101'),  # 1995
+    (19960219, 0, '010110101100'),  # 1996
+    (19970207, 0, '101010110110'),  # 1997
+    (19980128, 5, '1001001101101'),  # 1998
+    (19990216, 0, '100100101110'),  # 1999
+    (20000205, 0, '110010010110'),  # 2000
+    (20010124, 4, '1101010010101'),  # 2001
+    (20020212, 0, '110101001010'),  # 2002
+    (20030201, 0, '110110100101'),  # 2003
+    (20040122, 2, '0101101010101'),  # 2004
+    (20050209, 0, '010101101010'),  # 2005
+    (20060129, 7, '1010101011011'),  # 2006
+    (20070218, 0, '001001011101'),  # 2007
+    (20080207, 0, '100100101101'),  # 2008
+    (20090126, 5, '1100100101011'),  # 2009
+    (20100214, 0, '101010010101'),  # 2010
+    (20110203, 0, '101101001010'),  # 2011
+    (20120123, 4, '1011010101010'),  # 2012
+    (20130210, 0, '101011010101'),  # 2013
+    (20140131, 9, '0101010110101'),  # 2014
+    (20150219, 0, '010010111010'),  # 2015
+    (20160208, 0, '101001011011'),  # 2016
+    (20170128, 6, '0101001010111'),  # 2017
+    (20180216, 0, '010100101011'),  # 2018
+    (20190205, 0, '101010010011'),  # 2019
+    (20200125, 4, '0111010010101'),  # 2020
+    (20210212, 0, '011010101010'),  # 2021
+    (20220201, 0, '101011010101'),  # 2022
+    (20230122, 2, '0100110110101'),  # 2023
+    (20240210, 0, '010010110110'),  # 2024
+    (20250129, 6, '1010010101110'),  # 2025
+    (20260217, 0, '101001001110'),  # 2026
+    (20270206, 0, '110100100110'),  # 2027
+    (20280126, 5, '1110100100110'),  # 2028
+    (20290213, 0, '110101010011'),  # 2029
+    (20300203, 0, '010110101010'),  # 2030
+    (20310123, 3, '0110101101010'),  # 2031
+    (20320211, 0, '100101101101'),  # 2032
+    (20330131, 11, '0100101011101'),  # 2033
+    (20340219, 0, '010010101101'),  # 2034
+    (20350208, 0, '101001001101'),  # 2035
+    (20360128, 6, '1101001001011'),  # 2036
+    (20370215, 0, '110100100101'),  # 2037
+    (20380204, 0, '110101010010'),  # 2038
+    (20390124, 5, '1101101010100'),  # 2039
+    (20400212, 0, '101101011010'),  # 2040
+    (20410201, 0, '010101101101'),  # 2041
+    (20420122, 2, '0100101011011'),  # 2042
+    (20430210, 0, '010010011011'),  # 2043
+    (20440130, 7, '1010010010111'),  # 2044
+    (20450217, 0, '101001001011'),  # 2045
+    (20460206, 0, '101010100101'),  # 2046
+    (20470126, 5, '1011010100101'),  # 2047
+    (20480214, 0, '011011010010'),  # 2048
+    (20490202, 0, '101011011010'),  # 2049
+    (20500123, 3, '0101010110110'),  # 2050
+    (20510211, 0, '100100110111'),  # 2051
+    (20520201, 8, '0100100101111'),  # 2052
+    (20530219, 0, '010010010111'),  # 2053
+    (20540208, 0, '011001001011'),  # 2054
+    (20550128, 6, '0110101001010'),  # 2055
+    (20560215, 0, '111010100101'),  # 2056
+    (20570204, 0, '011010110010'),  # 2057
+    (20580124, 4, '1010101101100'),  # 2058
+    (20590212, 0, '101010101110'),  # 2059
+    (20600202, 0, '100100101110'),  # 2060
+    (20610121, 3, '1100100101110'),  # 2061
+    (20620209, 0, '110010010110'),  # 2062
+    (20630129, 7, '1101010010101'),  # 2063
+    (20640217, 0, '110101001010'),  # 2064
+    (20650205, 0, '110110100101'),  # 2065
+    (20660126, 5, '0101101010101'),  # 2066
+    (20670214, 0, '010101101010'),  # 2067
+    (20680203, 0, '101001101101'),  # 2068
+    (20690123, 4, '0101001011101'),  # 2069
+    (20700211, 0, '010100101101'),  # 2070
+    (20710131, 8, '1010100101011'),  # 2071
+    (20720219, 0, '101010010101'),  # 2072
+    (20730207, 0, '101101001010'),  # 2073
+    (20740127, 6, '1011010101010'),  # 2074
+    (20750215, 0, '101011010101'),  # 2075
+    (20760205, 0, '010101011010'),  # 2076
+    (20770124, 4, '1010010111010'),  # 2077
+    (20780212, 0, '101001011011'),  # 2078
+    (20790202, 0, '010100101011'),  # 2079
+    (20800122, 3, '1010100100111'),  # 2080
+    (20810209, 0, '011010010011'),  # 2081
+    (20820129, 7, '0111001010011'),  # 2082
+    (20830217, 0, '011010101010'),  # 2083
+    (20840206, 0, '101011010101'),  # 2084
+    (20850126, 5, '0100110110101'),  # 2085
+    (20860214, 0, '010010110110'),  # 2086
+    (20870203, 0, '101001010111'),  # 2087
+    (20880124, 4, '0101001001110'),  # 2088
+    (20890210, 0, '110100010110'),  # 2089
+    (20900130, 8, '1110100100110'),  # 2090
+    (20910218, 0, '110101010010'),  # 2091
+    (20920207, 0, '110110101010'),  # 2092
+    (20930127, 6, '0110101101010'),  # 2093
+    (20940215, 0, '010101101101'),  # 2094
+    (20950205, 0, '010010101110'),  # 2095
+    (20960125, 4, '1010010011101'),  # 2096
+    (20970212, 0, '101000101101'),  # 2097
+    (20980201, 0, '110100010101'),  # 2098
+    (20990121, 2, '1101100100101'),  # 2099
+    (21000209, 0, '110101010010'),  # 2100
+    (21010129, 7, '1101101010010'),  # 2101
+    (21020217, 0, '101101011010'),  # 2102
+    (21030207, 0, '010101011101'),  # 2103
+    (21040128, 5, '0100101011011'),  # 2104
+    (21050215, 0, '010010011011'),  # 2105
+    (21060204, 0, '101001001011'),  # 2106
+    (21070124, 4, '1101001001011'),  # 2107
+    (21080212, 0, '101010100101'),  # 2108
+    (21090131, 9, '1011010100101'),  # 2109
+    (21100219, 0, '011011010010'),  # 2110
+    (21110208, 0, '101011010110'),  # 2111
+    (21120129, 6, '0101010110110'),  # 2112
+    (21130216, 0, '100100110111'),  # 2113
+    (21140206, 0, '010010010111'),  # 2114
+    (21150126, 4, '0110010010111'),  # 2115
+    (21160214, 0, '010101001011'),  # 2116
+    (21170202, 0, '011010100101'),  # 2117
+    (21180122, 3, '0110110100101'),  # 2118
+    (21190210, 0, '011010101010'),  # 2119
+    (21200130, 7, '1010101101010'),  # 2120
+    (21210217, 0, '101010101101'),  # 2121
+    (21220207, 0, '010100101110'),  # 2122
+    (21230127, 5, '1100100101110'),  # 2123
+    (21240215, 0, '101010010110'),  # 2124
+    (21250203, 0, '110101001010'),  # 2125
+    (21260123, 4, '1110101001010'),  # 2126
+    (21270211, 0, '110110010101'),  # 2127
+    (21280201, 11, '0101101010101'),  # 2128
+    (21290219, 0, '010101101010'),  # 2129
+    (21300208, 0, '101001101101'),  # 2130
+    (21310129, 6, '0101001011101'),  # 2131
+    (21320217, 0, '010100101101'),  # 2132
+    (21330205, 0, '101010001101'),  # 2133
+    (21340125, 5, '1101010010101'),  # 2134
+    (21350213, 0, '101100101010'),  # 2135
+    (21360202, 0, '101101010101'),  # 2136
+    (21370122, 2, '0101011010101'),  # 2137
+    (21380210, 0, '010101011010'),  # 2138
+    (21390130, 7, '1010010111010'),  # 2139
+    (21400218, 0, '101001011011'),  # 2140
+    (21410207, 0, '010100101011'),  # 2141
+    (21420127, 5, '1010100010111'),  # 2142
+    (21430215, 0, '011010001011'),  # 2143
+    (21440204, 0, '011100101001'),  # 2144
+    (21450123, 4, '1011010101010'),  # 2145
+    (21460211, 0, '011010110101'),  # 2146
+    (21470201, 11, '0010110110101'),  # 2147
+    (21480220, 0, '010010110110'),  # 2148
+    (21490208, 0, '101001010111'),  # 2149
+    (21500129, 6, '0101000101110'),  # 2150
+)
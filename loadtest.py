@@ -0,0 +1,342 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""HTTP接口的压力测试，不需要外网。
+
+按权重混合请求各接口，出生时间按接近实际人口的分布随机生成(可重复使用之前的出生时间，模拟缓存命中)。
+两种发送方式：
+    闭环：-c个并发，每个请求完成后再发下一个，共-n个请求或持续-d秒
+    开环：--rate为每秒到达的请求数(泊松到达)，不等前面的请求完成；延迟从计划的到达时间算起，
+          包含客户端排队的时间
+结果为JSON：各接口的吞吐、延迟(p50/p95/p99)、流式接口的首字节时间、状态码和错误率，
+可以保存下来与其他版本比较(compare)。
+
+    python loadtest.py run --serve -c 8 -n 500 --mix complete=5,bazi=3,shengxiao=1,complete-stream=1 -o new.json
+    python loadtest.py run --url http://127.0.0.1:5000 --rate 20 -d 30
+    python loadtest.py compare old.json new.json
+
+--serve在本进程中启动api_server；ai-stream、ai接口需要--ai-url指向OpenAI格式的AI服务，
+可以是本地的模拟服务(mock_llm.py)：
+
+    python mock_llm.py --port 8900 --ttft 0.3 --tps 50 --tokens 400
+    python loadtest.py run --serve -c 8 -n 200 --mix ai-stream=1 --ai-url http://127.0.0.1:8900/v1/chat/completions
+"""
+
+import argparse
+import calendar
+import collections
+import concurrent.futures
+import contextlib
+import json
+import logging
+import math
+import random
+import sys
+import threading
+import time
+
+import requests
+
+# 接口名 -> (路径, 是否流式)
+endpoints = {
+    'complete': ('/api/complete', False),
+    'bazi': ('/api/bazi', False),
+    'shengxiao': ('/api/shengxiao', False),
+    'complete-stream': ('/api/complete-stream', True),
+    'bazi-stream': ('/api/bazi-stream', True),
+    'ai': ('/api/ai-interpretation', False),
+    'ai-stream': ('/api/ai-interpretation-stream', True),
+}
+
+shengxiao_names = ["鼠", "牛", "虎", "兔", "龙", "蛇", "马", "羊", "猴", "鸡", "狗", "猪"]
+
+Sample = collections.namedtuple("Sample", "endpoint status latency ttfb size error")
+
+
+class Births:
+    """出生时间的分布：出生年近似正态(均值1988，标准差15，1930-2020)，月日时均匀，
+    公历占70%；repeat为重复使用之前出生时间的比例"""
+
+    def __init__(self, seed=0, repeat=0.2):
+        self.random = random.Random(seed)
+        self.repeat = repeat
+        self.seen = []
+        self.lock = threading.Lock()
+
+    def draw(self):
+        with self.lock:
+            if self.seen and self.random.random() < self.repeat:
+                return self.random.choice(self.seen)
+            year = min(max(int(self.random.gauss(1988, 15)), 1930), 2020)
+            month = self.random.randint(1, 12)
+            calendar_type = '公历' if self.random.random() < 0.7 else '农历'
+            days = calendar.monthrange(year, month)[1] if calendar_type == '公历' else 29
+            birth = {'birth_date': '%d-%02d-%02d' % (year, month, self.random.randint(1, days)),
+                     'birth_time': str(self.random.randint(0, 23)),
+                     'gender': self.random.choice('男女'), 'calendar_type': calendar_type}
+            self.seen.append(birth)
+            return birth
+
+
+def make_body(endpoint, birth, ai_url=None):
+    """接口的请求内容"""
+    if endpoint == 'shengxiao':
+        return {'shengxiao': shengxiao_names[(int(birth['birth_date'][:4]) - 1900) % 12]}
+    if endpoint in ('ai', 'ai-stream'):
+        return {
+            'birth_info': {'date': birth['birth_date'], 'time': birth['birth_time'], 'gender': birth['gender'],
+                           'calendar_type': birth['calendar_type'], 'shengxiao': '鼠'},
+            'shengxiao_analysis': {'year_zhi': '子', 'compatible': {'sanhe': [], 'liuhe': [], 'sanhui': []},
+                                   'incompatible': {'chong': [], 'xing': [], 'hai': [], 'po': []}},
+            'bazi_analysis': "出生 {birth_date} {birth_time}时 {gender}".format(**birth),
+            'ai_config': {'provider': 'custom', 'api_key': 'loadtest', 'api_url': ai_url},
+        }
+    return birth
+
+
+def parse_mix(text):
+    """'complete=5,bazi=3'形式的权重"""
+    mix = {}
+    for item in text.split(','):
+        name, _, weight = item.partition('=')
+        if name not in endpoints:
+            raise ValueError("未知的接口: {}，可选 {}".format(name, ', '.join(endpoints)))
+        mix[name] = float(weight or 1)
+    return mix
+
+
+class LoadTest:
+    """一次压力测试"""
+
+    def __init__(self, url, mix, births, ai_url=None, timeout=60):
+        self.url = url.rstrip('/')
+        self.names = list(mix)
+        self.weights = [mix[name] for name in self.names]
+        self.births = births
+        self.ai_url = ai_url
+        self.timeout = timeout
+        self.local = threading.local()
+        self.random = random.Random(births.random.random())
+        self.lock = threading.Lock()
+        self.samples = []
+
+    def _session(self):
+        if not hasattr(self.local, 'session'):
+            self.local.session = requests.Session()
+        return self.local.session
+
+    def choose(self):
+        with self.lock:
+            endpoint = self.random.choices(self.names, self.weights)[0]
+        return endpoint, make_body(endpoint, self.births.draw(), self.ai_url)
+
+    def request(self, endpoint, body, scheduled=None):
+        """发送一个请求并记录，scheduled为开环时计划的发送时间"""
+        path, stream = endpoints[endpoint]
+        start = scheduled or time.perf_counter()
+        ttfb = None
+        size = 0
+        status = None
+        error = None
+        try:
+            with self._session().post(self.url + path, json=body, stream=True, timeout=self.timeout) as response:
+                status = response.status_code
+                for chunk in response.iter_content(chunk_size=None):
+                    if ttfb is None:
+                        ttfb = time.perf_counter() - start
+                    size += len(chunk)
+                    if stream and b'"error"' in chunk:
+                        error = 'stream error'
+            if status >= 400:
+                error = 'HTTP {}'.format(status)
+        except requests.RequestException as e:
+            error = type(e).__name__
+        sample = Sample(endpoint, status, time.perf_counter() - start, ttfb if stream else None, size, error)
+        with self.lock:
+            self.samples.append(sample)
+        return sample
+
+    def run_closed(self, concurrency, count=None, duration=None):
+        """闭环：concurrency个并发，共count个请求或持续duration秒"""
+        remaining = [count]
+        deadline = time.perf_counter() + duration if duration else None
+
+        def worker():
+            while True:
+                with self.lock:
+                    if remaining[0] is not None:
+                        if remaining[0] <= 0:
+                            return
+                        remaining[0] -= 1
+                if deadline and time.perf_counter() >= deadline:
+                    return
+                self.request(*self.choose())
+
+        threads = [threading.Thread(target=worker) for _ in range(concurrency)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    def run_open(self, rate, concurrency, count=None, duration=None):
+        """开环：每秒rate个请求泊松到达，最多concurrency个同时发送，其余在客户端排队"""
+        start = time.perf_counter()
+        arrival = start
+        sent = 0
+        with concurrent.futures.ThreadPoolExecutor(concurrency) as executor:
+            while (count is None or sent < count) and (duration is None or arrival - start < duration):
+                delay = arrival - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                executor.submit(self.request, *self.choose(), scheduled=arrival)
+                sent += 1
+                arrival += self.random.expovariate(rate)
+
+
+def percentiles(values):
+    """p50/p95/p99/平均/最大，单位毫秒"""
+    if not values:
+        return None
+    values = sorted(values)
+
+    def rank(p):
+        return values[max(0, math.ceil(p / 100 * len(values)) - 1)] * 1000
+
+    return {'p50': round(rank(50), 2), 'p95': round(rank(95), 2), 'p99': round(rank(99), 2),
+            'mean': round(sum(values) / len(values) * 1000, 2), 'max': round(values[-1] * 1000, 2)}
+
+
+def summarize(samples, elapsed):
+    """各接口和总体的统计"""
+    def stats(items):
+        errors = [item for item in items if item.error]
+        return {
+            'count': len(items),
+            'throughput': round(len(items) / elapsed, 2) if elapsed else None,
+            'error_rate': round(len(errors) / len(items), 4) if items else 0,
+            'status': dict(sorted(collections.Counter(str(item.status) for item in items).items())),
+            'errors': dict(sorted(collections.Counter(item.error for item in errors).items())),
+            'latency_ms': percentiles([item.latency for item in items if not item.error]),
+            'ttfb_ms': percentiles([item.ttfb for item in items if item.ttfb is not None and not item.error]),
+            'bytes': sum(item.size for item in items),
+        }
+
+    groups = collections.defaultdict(list)
+    for item in samples:
+        groups[item.endpoint].append(item)
+    return {'elapsed': round(elapsed, 3), 'total': stats(samples),
+            'endpoints': {name: stats(items) for name, items in sorted(groups.items())}}
+
+
+def serve(host='127.0.0.1', port=0):
+    """在本进程的线程中启动api_server，返回(服务器, 地址)"""
+    from werkzeug.serving import make_server
+    import api_server
+    logging.getLogger('werkzeug').setLevel(logging.ERROR)
+    server = make_server(host, port, api_server.app, threaded=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, "http://{}:{}".format(host, server.server_port)
+
+
+def run(url=None, mix='complete=5,bazi=3,shengxiao=1,complete-stream=1', concurrency=4, count=None,
+        duration=None, rate=None, seed=0, repeat=0.2, ai_url=None, warmup=0, timeout=60):
+    """运行一次压力测试，返回结果dict；url为None时在本进程中启动api_server"""
+    if count is None and duration is None:
+        count = 100
+    server = None
+    if url is None:
+        server, url = serve()
+    try:
+        test = LoadTest(url, parse_mix(mix), Births(seed, repeat), ai_url, timeout)
+        if warmup:
+            test.run_closed(concurrency, count=warmup)
+            test.samples = []
+        start = time.perf_counter()
+        if rate:
+            test.run_open(rate, concurrency, count, duration)
+        else:
+            test.run_closed(concurrency, count, duration)
+        elapsed = time.perf_counter() - start
+    finally:
+        if server:
+            server.shutdown()
+    result = {'config': {'url': url if not server else 'local', 'mix': mix, 'concurrency': concurrency,
+                         'count': count, 'duration': duration, 'rate': rate, 'seed': seed, 'repeat': repeat,
+                         'warmup': warmup, 'mode': 'open' if rate else 'closed'}}
+    result.update(summarize(test.samples, elapsed))
+    return result
+
+
+def compare(old, new):
+    """两次结果的比较，返回文本行：各接口的吞吐和延迟，括号内为变化的百分比"""
+    def change(a, b):
+        return "{:+.1f}%".format((b - a) / a * 100) if a else "-"
+
+    row = "{:<16}{:>28}{:>28}{:>28}{:>28}{:>16}"
+    lines = [row.format('接口', '吞吐/秒', 'p50毫秒', 'p95毫秒', 'p99毫秒', '错误率')]
+    names = sorted(set(old['endpoints']) | set(new['endpoints'])) + ['total']
+    for name in names:
+        a = old['total'] if name == 'total' else old['endpoints'].get(name)
+        b = new['total'] if name == 'total' else new['endpoints'].get(name)
+        if not a or not b:
+            lines.append("{:<16}只在{}中".format(name, '新结果' if b else '旧结果'))
+            continue
+        cells = ["{} -> {} ({})".format(a['throughput'], b['throughput'], change(a['throughput'], b['throughput']))]
+        for p in ('p50', 'p95', 'p99'):
+            x = (a['latency_ms'] or {}).get(p)
+            y = (b['latency_ms'] or {}).get(p)
+            cells.append("{} -> {} ({})".format(x, y, change(x, y) if x and y else '-'))
+        cells.append("{} -> {}".format(a['error_rate'], b['error_rate']))
+        lines.append(row.format(name, *cells))
+    return lines
+
+
+def main():
+    parser = argparse.ArgumentParser(description="HTTP接口的压力测试",
+                                     formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+    commands = parser.add_subparsers(dest='action', required=True)
+    command = commands.add_parser('run', help="运行压力测试",
+                                  formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+    command.add_argument('--url', default="http://127.0.0.1:5000", help="服务地址")
+    command.add_argument('--serve', action='store_true', help="在本进程中启动api_server，忽略--url")
+    command.add_argument('--mix', default='complete=5,bazi=3,shengxiao=1,complete-stream=1',
+                         help="接口及权重，可选 " + ', '.join(endpoints))
+    command.add_argument('-c', '--concurrency', type=int, default=4, help="并发数")
+    command.add_argument('-n', '--count', type=int, default=None, help="请求数，与-d都没有时为100")
+    command.add_argument('-d', '--duration', type=float, default=None, help="持续秒数")
+    command.add_argument('--rate', type=float, default=None, help="开环：每秒到达的请求数")
+    command.add_argument('--seed', type=int, default=0, help="随机数种子")
+    command.add_argument('--repeat', type=float, default=0.2, help="重复使用之前出生时间的比例")
+    command.add_argument('--ai-url', default=None, help="ai、ai-stream使用的AI服务地址")
+    command.add_argument('--warmup', type=int, default=0, help="正式开始前的请求数，不计入结果")
+    command.add_argument('--timeout', type=float, default=60, help="单个请求的超时秒数")
+    command.add_argument('-o', '--output', default=None, help="结果的JSON文件，默认输出到标准输出")
+    command = commands.add_parser('compare', help="比较两次结果")
+    command.add_argument('old')
+    command.add_argument('new')
+    options = parser.parse_args()
+
+    if options.action == 'compare':
+        with open(options.old, encoding='utf-8') as f:
+            old = json.load(f)
+        with open(options.new, encoding='utf-8') as f:
+            new = json.load(f)
+        print('\n'.join(compare(old, new)))
+        return
+
+    # 本进程中的api_server的输出不与结果混在一起
+    with contextlib.redirect_stdout(sys.stderr if options.serve else sys.stdout):
+        result = run(None if options.serve else options.url, options.mix, options.concurrency, options.count,
+                     options.duration, options.rate, options.seed, options.repeat, options.ai_url, options.warmup,
+                     options.timeout)
+    text = json.dumps(result, ensure_ascii=False, indent=2, sort_keys=True)
+    if options.output:
+        with open(options.output, 'w', encoding='utf-8') as f:
+            f.write(text + '\n')
+    else:
+        print(text)
+    if result['total']['error_rate']:
+        print("错误率: {}".format(result['total']['error_rate']), file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""各阶段的耗时统计，以Prometheus的文本格式在/metrics输出。
+
+接口的各阶段(验证输入、历法换算、排盘引擎、生成文本、结构化排盘、生肖、查缓存)用span计时，
+计入bazi_stage_seconds直方图；AI服务按服务商统计首个内容片段和整个回复的耗时。
+每个请求计入bazi_http_requests_total和bazi_http_request_seconds(流式响应只计到发出响应头)。
+其他地方记录的统计(如各工作进程中断语规则的检查次数、命中次数和耗时)用add_collector在输出时取得。
+
+开启Server-Timing时，响应头列出本次请求中各阶段的耗时(同名阶段相加)，浏览器的开发者工具可以直接查看；
+发出响应头之后的阶段(流式响应的后续部分)不在其中。
+
+环境变量:
+    BAZI_SERVER_TIMING  为1时响应带Server-Timing头，默认0
+"""
+
+import bisect
+import collections
+import contextlib
+import os
+import threading
+import time
+
+# 直方图的上界(秒)
+default_buckets = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+# 名称: (类型, 说明)
+definitions = {
+    'bazi_stage_seconds': ('histogram', "接口各阶段的耗时"),
+    'bazi_cache_lookups_total': ('counter', "结果缓存的查询次数"),
+    'bazi_http_requests_total': ('counter', "按接口和状态码的请求数"),
+    'bazi_http_request_seconds': ('histogram', "请求的处理时间，流式响应只计到发出响应头"),
+    'bazi_ai_first_token_seconds': ('histogram', "流式调用AI服务到收到首个内容片段的时间"),
+    'bazi_ai_seconds': ('histogram', "调用AI服务的总时间"),
+    'bazi_ai_errors_total': ('counter', "调用AI服务出错的次数"),
+    'bazi_rule_checks_total': ('counter', "断语规则的检查次数，各工作进程合计"),
+    'bazi_rule_hits_total': ('counter', "断语规则的命中次数，各工作进程合计"),
+    'bazi_rule_seconds_total': ('counter', "检查断语规则的耗时，各工作进程合计"),
+}
+
+
+def _labels(labels, extra=()):
+    items = sorted(labels) + list(extra)
+    if not items:
+        return ''
+    return '{' + ','.join('{}="{}"'.format(name, str(value).replace('\\', '\\\\').replace('"', '\\"')
+                                           .replace('\n', '\\n')) for name, value in items) + '}'
+
+
+def _number(value):
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Metrics:
+    """计数器、直方图和当前请求的阶段耗时"""
+
+    def __init__(self, server_timing=False, buckets=default_buckets):
+        self.server_timing = server_timing
+        self.buckets = buckets
+        # 名称 -> {标签: 值}；直方图的值为[各桶的计数..., 总和, 次数]
+        self.values = {name: {} for name in definitions}
+        self.lock = threading.Lock()
+        self.current = threading.local()
+        self.collectors = []
+
+    def add_collector(self, collect):
+        """输出时调用collect()，返回{名称: {标签元组: 值}}，与自己记录的一起输出"""
+        self.collectors.append(collect)
+
+    def inc(self, name, n=1, **labels):
+        key = tuple(labels.items())
+        with self.lock:
+            series = self.values[name]
+            series[key] = series.get(key, 0) + n
+
+    def observe(self, name, seconds, **labels):
+        key = tuple(labels.items())
+        index = bisect.bisect_left(self.buckets, seconds)
+        with self.lock:
+            row = self.values[name].get(key)
+            if row is None:
+                row = self.values[name][key] = [0] * (len(self.buckets) + 2)
+            if index < len(self.buckets):
+                row[index] += 1
+            row[-2] += seconds
+            row[-1] += 1
+
+    @contextlib.contextmanager
+    def span(self, stage):
+        """计时一个阶段，计入bazi_stage_seconds和当前请求的阶段耗时"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            self.observe('bazi_stage_seconds', elapsed, stage=stage)
+            timings = getattr(self.current, 'timings', None)
+            if timings is not None:
+                timings[stage] += elapsed
+
+    def begin(self):
+        """请求开始：清空当前线程的阶段耗时"""
+        self.current.started = time.perf_counter()
+        self.current.timings = collections.Counter()
+
+    def end(self, endpoint, method, status):
+        """请求结束，返回本次请求的Server-Timing头，未开启时为None"""
+        started = getattr(self.current, 'started', None)
+        timings = getattr(self.current, 'timings', None)
+        self.current.started = self.current.timings = None
+        if started is None:
+            return None
+        elapsed = time.perf_counter() - started
+        self.inc('bazi_http_requests_total', endpoint=endpoint, method=method, status=status)
+        self.observe('bazi_http_request_seconds', elapsed, endpoint=endpoint)
+        if not self.server_timing:
+            return None
+        entries = ["{};dur={:.2f}".format(stage, seconds * 1000) for stage, seconds in timings.items()]
+        return ', '.join(entries + ["total;dur={:.2f}".format(elapsed * 1000)])
+
+    def render(self):
+        """Prometheus的文本格式"""
+        # 收集器可能要等工作进程，不在锁内调用
+        collected = collections.defaultdict(dict)
+        for collect in self.collectors:
+            for name, series in collect().items():
+                collected[name].update(series)
+        lines = []
+        with self.lock:
+            for name, (kind, description) in definitions.items():
+                lines.append("# HELP {} {}".format(name, description))
+                lines.append("# TYPE {} {}".format(name, kind))
+                for labels, value in sorted({**self.values[name], **collected[name]}.items()):
+                    if kind == 'counter':
+                        lines.append("{}{} {}".format(name, _labels(labels), _number(value)))
+                        continue
+                    count = 0
+                    for bound, n in zip(self.buckets, value):
+                        count += n
+                        lines.append("{}_bucket{} {}".format(name, _labels(labels, [('le', _number(bound))]), count))
+                    lines.append("{}_bucket{} {}".format(name, _labels(labels, [('le', '+Inf')]), value[-1]))
+                    lines.append("{}_sum{} {}".format(name, _labels(labels), _number(value[-2])))
+                    lines.append("{}_count{} {}".format(name, _labels(labels), value[-1]))
+        return '\n'.join(lines) + '\n'
+
+
+def open_metrics():
+    """按环境变量创建Metrics"""
+    return Metrics(server_timing=os.environ.get("BAZI_SERVER_TIMING") == "1")
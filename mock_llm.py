@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""本地的模拟AI服务，用于不联网时测试和压测AI接口。
+
+支持AIAnalysisAPI用到的几种格式：
+    .../chat/completions  OpenAI兼容格式(openai、deepseek、custom)，stream为true时返回SSE，以data: [DONE]结束
+    .../messages          Claude格式，stream为true时返回Claude的SSE事件
+    .../generate          {"response": ...}格式(custom支持的通用格式)
+提示词中要求返回JSON故事(含choices)时，内容为```json代码块中的故事，可用于命运轨迹接口。
+
+可以配置首个token的延迟、每秒token数、回复的token数和出错的比例；
+也可以在api_url的查询参数中按请求指定，如 http://127.0.0.1:8900/v1/chat/completions?ttft=0.5&tokens=50。
+GET /stats 返回请求数、连接数、发出的token数和注入的错误数。
+
+    python mock_llm.py --port 8900 --ttft 0.3 --tps 50 --tokens 400 --error-rate 0.01
+"""
+
+import argparse
+import collections
+import http.server
+import json
+import random
+import threading
+import time
+import urllib.parse
+
+# 生成回复用的文字，按两个字一个token切分
+corpus = ("日主得令而旺，印星透出，生扶有力。食神吐秀，才华外露，宜从事文化教育。财星有根，中年以后渐入佳境。"
+          "官杀不显，性情温和，少受拘束。大运行至火土之地，事业可望突破，需防冲动决策。感情方面宜晚婚，"
+          "配偶多为稳重踏实之人。健康上注意脾胃与心血管，作息规律为要。人生建议：稳中求进，广结善缘。")
+tokens = [corpus[i:i + 2] for i in range(0, len(corpus), 2)]
+
+Options = collections.namedtuple("Options", "ttft tps tokens error_rate error_status stream_error_rate")
+default_options = Options(ttft=0.0, tps=0.0, tokens=200, error_rate=0.0, error_status=500, stream_error_rate=0.0)
+
+
+def story_text(size):
+    """命运轨迹用的故事，size为故事正文的token数"""
+    story = {'title': '初入江湖', 'story': ''.join(tokens[i % len(tokens)] for i in range(size)),
+             'choices': [{'text': '稳中求进', 'consequence': '根基渐固', 'destiny_impact': 3},
+                         {'text': '放手一搏', 'consequence': '得失难料', 'destiny_impact': -2},
+                         {'text': '静观其变', 'consequence': '平稳度过', 'destiny_impact': 0}]}
+    return "```json\n" + json.dumps(story, ensure_ascii=False) + "\n```"
+
+
+def reply_pieces(prompt, size):
+    """回复按token切分的片段"""
+    if 'choices' in prompt and 'JSON' in prompt.upper():
+        text = story_text(size)
+        return [text[i:i + 2] for i in range(0, len(text), 2)]
+    return [tokens[i % len(tokens)] for i in range(size)]
+
+
+class Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_version = "MockLLM/1.0"
+
+    def log_message(self, *args):
+        pass
+
+    def setup(self):
+        super().setup()
+        self.server.provider.count('connections')
+
+    def do_GET(self):
+        if urllib.parse.urlsplit(self.path).path.rstrip('/') == '/stats':
+            self._send_json(200, self.server.provider.info())
+        else:
+            self._send_json(404, {'error': 'not found'})
+
+    def do_POST(self):
+        provider = self.server.provider
+        parts = urllib.parse.urlsplit(self.path)
+        body = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))) or b'{}')
+        options = provider.options_for(urllib.parse.parse_qs(parts.query))
+        provider.count('requests')
+        if parts.path.endswith('/messages'):
+            kind = 'claude'
+        elif parts.path.endswith('/generate'):
+            kind = 'generate'
+        else:
+            kind = 'openai'
+
+        if provider.chance(options.error_rate):
+            provider.count('errors')
+            self._send_json(options.error_status, {'error': {'message': '模拟的服务错误', 'type': 'mock_error'}})
+            return
+
+        messages = body.get('messages') or [{}]
+        prompt = str(messages[-1].get('content', ''))
+        pieces = reply_pieces(prompt, options.tokens)
+        if options.ttft:
+            time.sleep(options.ttft)
+        if body.get('stream'):
+            self._stream(kind, pieces, options)
+            return
+        if options.tps:
+            time.sleep(len(pieces) / options.tps)
+        provider.count('tokens', len(pieces))
+        text = ''.join(pieces)
+        if kind == 'claude':
+            result = {'id': 'msg_mock', 'type': 'message', 'role': 'assistant',
+                      'content': [{'type': 'text', 'text': text}], 'stop_reason': 'end_turn'}
+        elif kind == 'generate':
+            result = {'response': text}
+        else:
+            result = {'id': 'chatcmpl-mock', 'object': 'chat.completion', 'model': body.get('model'),
+                      'choices': [{'index': 0, 'message': {'role': 'assistant', 'content': text},
+                                   'finish_reason': 'stop'}]}
+        self._send_json(200, result)
+
+    def _send_json(self, status, data):
+        payload = json.dumps(data, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _chunk(self, text):
+        data = text.encode('utf-8')
+        self.wfile.write(b'%x\r\n%s\r\n' % (len(data), data))
+        self.wfile.flush()
+
+    def _stream(self, kind, pieces, options):
+        provider = self.server.provider
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream; charset=utf-8')
+        self.send_header('Transfer-Encoding', 'chunked')
+        self.end_headers()
+        # 流式中途出错时在随机位置断开
+        fail_at = provider.randrange(len(pieces)) if provider.chance(options.stream_error_rate) else None
+        if kind == 'claude':
+            self._chunk('event: message_start\ndata: {"type": "message_start"}\n\n')
+        for n, piece in enumerate(pieces):
+            if n == fail_at:
+                provider.count('stream_errors')
+                self.close_connection = True
+                return
+            if n and options.tps:
+                time.sleep(1 / options.tps)
+            if kind == 'claude':
+                event = {'type': 'content_block_delta', 'index': 0, 'delta': {'type': 'text_delta', 'text': piece}}
+                self._chunk('event: content_block_delta\ndata: ' + json.dumps(event, ensure_ascii=False) + '\n\n')
+            else:
+                event = {'id': 'chatcmpl-mock', 'object': 'chat.completion.chunk',
+                         'choices': [{'index': 0, 'delta': {'content': piece}, 'finish_reason': None}]}
+                self._chunk('data: ' + json.dumps(event, ensure_ascii=False) + '\n\n')
+            provider.count('tokens')
+        if kind == 'claude':
+            self._chunk('event: message_stop\ndata: {"type": "message_stop"}\n\n')
+        else:
+            self._chunk('data: [DONE]\n\n')
+        self.wfile.write(b'0\r\n\r\n')
+
+
+class MockProvider:
+    """模拟AI服务，start()后在后台线程中运行，可用作上下文管理器"""
+
+    def __init__(self, host='127.0.0.1', port=0, seed=0, **options):
+        self.options = default_options._replace(**options)
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.stats = collections.Counter()
+        self.server = http.server.ThreadingHTTPServer((host, port), Handler)
+        self.server.daemon_threads = True
+        self.server.provider = self
+
+    @property
+    def url(self):
+        """OpenAI兼容格式的地址"""
+        host, port = self.server.server_address[:2]
+        return "http://{}:{}/v1/chat/completions".format(host, port)
+
+    def options_for(self, query):
+        """查询参数覆盖默认配置"""
+        values = {name: type(getattr(self.options, name))(query[name][0])
+                  for name in self.options._fields if name in query}
+        return self.options._replace(**values)
+
+    def chance(self, rate):
+        with self.lock:
+            return rate > 0 and self.random.random() < rate
+
+    def randrange(self, n):
+        with self.lock:
+            return self.random.randrange(max(n, 1))
+
+    def count(self, name, n=1):
+        with self.lock:
+            self.stats[name] += n
+
+    def info(self):
+        with self.lock:
+            result = dict(self.options._asdict())
+            result.update({name: self.stats[name] for name in
+                           ('requests', 'connections', 'tokens', 'errors', 'stream_errors')})
+        return result
+
+    def start(self):
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="本地的模拟AI服务",
+                                     formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8900)
+    parser.add_argument('--ttft', type=float, default=default_options.ttft, help="首个token前的延迟秒数")
+    parser.add_argument('--tps', type=float, default=default_options.tps, help="每秒token数，0为不限")
+    parser.add_argument('--tokens', type=int, default=default_options.tokens, help="回复的token数")
+    parser.add_argument('--error-rate', type=float, default=default_options.error_rate, help="返回错误的比例")
+    parser.add_argument('--error-status', type=int, default=default_options.error_status, help="错误的状态码")
+    parser.add_argument('--stream-error-rate', type=float, default=default_options.stream_error_rate,
+                        help="流式回复中途断开的比例")
+    parser.add_argument('--seed', type=int, default=0)
+    options = parser.parse_args()
+    provider = MockProvider(options.host, options.port, options.seed, ttft=options.ttft, tps=options.tps,
+                            tokens=options.tokens, error_rate=options.error_rate, error_status=options.error_status,
+                            stream_error_rate=options.stream_error_rate)
+    print("模拟AI服务: {}".format(provider.url))
+    try:
+        provider.server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""出生时间换算为四柱和起运时间，带LRU缓存。
+
+convert()只查jieqi_data中的节气表和农历月表，不做天文计算：农历先按月表换成公历，
+年柱、月柱按节的时刻二分查找，日柱60天一循环，时柱用五鼠遁推出(23点后为夜子时，
+日柱不变、时干按次日)，起运时间按lunar_python的默认算法(三天折一年、一个时辰折十天)
+由出生时刻到前后节的距离算出。超出表的范围(1850-2150年)时改用lunar_python计算。
+
+排盘文本中出生前后的节气(get_jieqi)查同一节气表中的24个节气，命宫、胎元、星宿由四柱和日期推出，
+也不再创建lunar_python的对象。
+get_lunar()返回lunar_python的对象，用于超出表的范围时。
+两者都以(历法, 年, 月, 日, 时, 闰月)为键缓存，同一出生时间再次请求时不再计算。
+"""
+
+import bisect
+import collections
+import datetime
+import functools
+from calendar import monthrange
+
+from lunar_python import Lunar, Solar
+from lunar_python.util import LunarUtil
+
+from ganzhi import Gan, Zhi, gan_nums, zhi_nums, jiazis, jiazi_nums
+from jieqi import get_jie_table, get_jieqi_table, get_lunar_table, _day_num
+from shensha import xun_kongs
+
+CACHE_SIZE = 4096
+LUNAR_CACHE_SIZE = 512
+
+# solar为公历出生时刻，lunar为(农历年, 月, 日, 是否闰月)，gans、zhis为四柱，
+# yuns为(男, 女)的起运，见YunStart
+Birth = collections.namedtuple("Birth", "solar lunar gans zhis yuns")
+# 出生后几年几月几天起运，solar为起运时刻
+YunStart = collections.namedtuple("YunStart", "years months days solar")
+# 大运，第0项为起运前，干支为空
+DaYun = collections.namedtuple("DaYun", "ganzhi start_year start_age end_age")
+# 节气的名称和时刻
+JieQi = collections.namedtuple("JieQi", "name solar")
+
+
+def lunar_to_solar(year, month, day, leap=False):
+    """农历日期换算为公历日期，超出月表范围时返回None，日期不存在时抛出ValueError"""
+    lunar_start, table = get_lunar_table()
+    if not lunar_start <= year < lunar_start + len(table):
+        return None
+    first, leap_month, bits = table[year - lunar_start]
+    if not 1 <= month <= 12 or (leap and month != leap_month):
+        raise ValueError("农历{}年没有{}{}月".format(year, '闰' if leap else '', month))
+    # 闰月排在所闰月份之后
+    pos = month if leap else month - 1 + (0 < leap_month < month)
+    days = 29 + int(bits[pos])
+    if not 1 <= day <= days:
+        raise ValueError("农历{}年{}{}月只有{}天".format(year, '闰' if leap else '', month, days))
+    return first + datetime.timedelta(days=sum(29 + int(bit) for bit in bits[:pos]) + day - 1)
+
+
+@functools.lru_cache(maxsize=1)
+def _lunar_firsts():
+    return [first for first, _, _ in get_lunar_table()[1]]
+
+
+def solar_to_lunar(date):
+    """公历日期换算为(农历年, 月, 日, 是否闰月)，超出月表范围时返回None"""
+    lunar_start, table = get_lunar_table()
+    index = bisect.bisect_right(_lunar_firsts(), date) - 1
+    if index < 0:
+        return None
+    first, leap_month, bits = table[index]
+    offset = (date - first).days
+    for pos, bit in enumerate(bits):
+        if offset < 29 + int(bit):
+            month = pos if 0 < leap_month <= pos else pos + 1
+            return lunar_start + index, month, offset + 1, 0 < leap_month == pos
+        offset -= 29 + int(bit)
+    return None
+
+
+def _jie_index(moment):
+    """moment所在的节在节气表中的序号，超出范围时返回None"""
+    jie_start, table = get_jie_table()
+    index = bisect.bisect_right(table, moment) - 1
+    return index if 0 <= index < len(table) - 1 else None
+
+
+def get_pillars(moment, index=None):
+    """出生时刻的四柱，返回(天干, 地支)，超出节气表范围时返回None"""
+    index = _jie_index(moment) if index is None else index
+    if index is None:
+        return None
+    jie_start = get_jie_table()[0]
+    # 1864年是甲子年，节气表第11个节是次年小寒，仍属当年
+    year = (jie_start + index // 12 - 1864) % 60
+    month = index % 12
+    day = _day_num(moment.date())
+    time = (moment.hour + 1) // 2 % 12
+    # 五鼠遁，夜子时的时干按次日
+    time_gan = ((day + 1) % 5 * 2 if moment.hour == 23 else day % 5 * 2 + time) % 10
+    gans = (Gan[year % 10], Gan[(year % 5 * 2 + 2 + month) % 10], Gan[day % 10], Gan[time_gan])
+    zhis = (Zhi[year % 12], Zhi[(month + 2) % 12], Zhi[day % 12], Zhi[time])
+    return gans, zhis
+
+
+def _add_months(date, years, months):
+    # 与lunar_python的nextYear、nextMonth相同，先加年再加月，日期超出月末时取月末
+    year = date.year + years
+    date = date.replace(year=year, day=min(date.day, monthrange(year, date.month)[1]))
+    year, month = divmod(date.month - 1 + months, 12)
+    year, month = date.year + year, month + 1
+    return date.replace(year=year, month=month, day=min(date.day, monthrange(year, month)[1]))
+
+
+def get_yun_start(moment, forward, index=None):
+    """起运，返回YunStart，forward为大运顺排；超出节气表范围时返回None"""
+    index = _jie_index(moment) if index is None else index
+    if index is None:
+        return None
+    table = get_jie_table()[1]
+    start, end = (moment, table[index + 1]) if forward else (table[index], moment)
+
+    def zhi(item):
+        return 11 if item.hour == 23 else (item.hour + 1) // 2 % 12
+
+    hour_diff = zhi(end) - zhi(start)
+    day_diff = (end.date() - start.date()).days
+    if hour_diff < 0:
+        hour_diff += 12
+        day_diff -= 1
+    month_diff = hour_diff * 10 // 30
+    years, months = divmod(day_diff * 4 + month_diff, 12)
+    days = hour_diff * 10 - month_diff * 30
+    date = _add_months(moment.date(), years, months) + datetime.timedelta(days=days)
+    return YunStart(years, months, days, datetime.datetime.combine(date, moment.time()))
+
+
+def _from_lunar_python(solar, lunar):
+    ba = lunar.getEightChar()
+    gans = (ba.getYearGan(), ba.getMonthGan(), ba.getDayGan(), ba.getTimeGan())
+    zhis = (ba.getYearZhi(), ba.getMonthZhi(), ba.getDayZhi(), ba.getTimeZhi())
+    yuns = []
+    for gender in (1, 0):
+        yun = ba.getYun(gender)
+        item = yun.getStartSolar()
+        yuns.append(YunStart(yun.getStartYear(), yun.getStartMonth(), yun.getStartDay(),
+                             datetime.datetime(item.getYear(), item.getMonth(), item.getDay(), item.getHour())))
+    return Birth(solar=datetime.datetime(solar.getYear(), solar.getMonth(), solar.getDay(), solar.getHour()),
+                 lunar=(lunar.getYear(), abs(lunar.getMonth()), lunar.getDay(), lunar.getMonth() < 0),
+                 gans=gans, zhis=zhis, yuns=tuple(yuns))
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def _convert(calendar, year, month, day, hour, leap):
+    if calendar == '公历':
+        date = datetime.date(year, month, day)
+        lunar = solar_to_lunar(date)
+    else:
+        date = lunar_to_solar(year, month, day, leap)
+        lunar = (year, month, day, leap)
+    moment = date and datetime.datetime.combine(date, datetime.time(hour))
+    index = moment and _jie_index(moment)
+    if lunar is None or index is None:
+        return _from_lunar_python(*get_lunar(calendar, year, month, day, hour, leap)[:2])
+
+    gans, zhis = get_pillars(moment, index)
+    yang = gan_nums[gans[0]] % 2 == 0
+    return Birth(solar=moment, lunar=lunar, gans=gans, zhis=zhis,
+                 yuns=(get_yun_start(moment, yang, index), get_yun_start(moment, not yang, index)))
+
+
+def convert(calendar, year, month, day, hour, leap=False):
+    """出生时间换算为Birth。calendar为'公历'或'农历'，leap为农历闰月；日期不存在时抛出ValueError"""
+    return _convert(calendar, int(year), int(month), int(day), int(hour), bool(leap) and calendar != '公历')
+
+
+def get_dayuns(birth, gender='男', count=10):
+    """大运列表，与lunar_python的Yun.getDaYun()相同"""
+    start = birth.yuns[gender != '男'].solar.year
+    forward = (gan_nums[birth.gans[0]] % 2 == 0) == (gender == '男')
+    month = jiazi_nums[birth.gans[1] + birth.zhis[1]]
+    birth_year = birth.solar.year
+    dayuns = [DaYun('', birth_year, 1, start - birth_year)]
+    for index in range(1, count):
+        start_year = start + (index - 1) * 10
+        dayuns.append(DaYun(jiazis[(month + (index if forward else -index)) % 60], start_year,
+                            start_year - birth_year + 1, start_year - birth_year + 10))
+    return dayuns
+
+
+def get_ming_gong(gans, zhis):
+    """命宫，算法同lunar_python的EightChar.getMingGong()"""
+    # 寅月、寅时为1
+    total = (zhi_nums[zhis[1]] - 2) % 12 + (zhi_nums[zhis[3]] - 2) % 12 + 2
+    offset = (26 if total >= 14 else 14) - total
+    return Gan[((gan_nums[gans[0]] + 1) * 2 + offset - 1) % 10] + Zhi[(offset + 1) % 12]
+
+
+def get_tai_yuan(gans, zhis):
+    """胎元：月干进一位、月支进三位，同lunar_python的EightChar.getTaiYuan()"""
+    return Gan[(gan_nums[gans[1]] + 1) % 10] + Zhi[(zhi_nums[zhis[1]] + 3) % 12]
+
+
+def get_jieqi(date):
+    """date之前(含当天)和之后的节气(JieQi, JieQi)，按天比较，同lunar_python的getPrevJieQi(True)、
+    getNextJieQi(True)；超出节气表的范围时用lunar_python计算"""
+    moments, names = get_jieqi_table()
+    index = bisect.bisect_left(moments, datetime.datetime.combine(date + datetime.timedelta(days=1), datetime.time()))
+    if 0 < index < len(moments):
+        return JieQi(names[index - 1], moments[index - 1]), JieQi(names[index], moments[index])
+    lunar = Solar.fromYmd(date.year, date.month, date.day).getLunar()
+    result = []
+    for item in (lunar.getPrevJieQi(True), lunar.getNextJieQi(True)):
+        solar = item.getSolar()
+        result.append(JieQi(item.getName(), datetime.datetime(solar.getYear(), solar.getMonth(), solar.getDay(),
+                                                              solar.getHour(), solar.getMinute(), solar.getSecond())))
+    return tuple(result)
+
+
+def get_xiu(date):
+    """星宿和星宿歌，由日支和星期查lunar_python的表，同Lunar.getXiu()、getXiuSong()"""
+    xiu = LunarUtil.XIU[jiazis[_day_num(date)][1] + str(date.isoweekday() % 7)]
+    return xiu, LunarUtil.XIU_SONG[xiu]
+
+
+def get_xun_kong(gans, zhis):
+    """日柱的旬空，如甲子旬为'戌亥'"""
+    return xun_kongs[gans[2] + zhis[2]]
+
+
+@functools.lru_cache(maxsize=LUNAR_CACHE_SIZE)
+def _get_lunar(calendar, year, month, day, hour, leap):
+    if calendar == '公历':
+        solar = Solar.fromYmdHms(year, month, day, hour, 0, 0)
+        lunar = solar.getLunar()
+    else:
+        lunar = Lunar.fromYmdHms(year, -month if leap else month, day, hour, 0, 0)
+        solar = lunar.getSolar()
+    return solar, lunar, lunar.getEightChar()
+
+
+def get_lunar(calendar, year, month, day, hour, leap=False):
+    """lunar_python的(Solar, Lunar, EightChar)，参数同convert，返回的对象不要修改"""
+    return _get_lunar(calendar, int(year), int(month), int(day), int(hour), bool(leap) and calendar != '公历')
+
+
+def cache_info():
+    """两个缓存的命中统计"""
+    return {'convert': _convert.cache_info()._asdict(), 'lunar': _get_lunar.cache_info()._asdict()}
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""AI解读的提示词。
+
+以前把bazi.py的整段输出(一万多字的表格、分隔线和古籍摘录)直接放进提示词。
+现在由结构化的分析结果(report.Report和chart_struct)生成紧凑的命盘摘要：四柱与十神、五行与强弱、
+喜用忌神、格局、四柱关系、当前大运流年，剩余的字数按顺序放入命中的规则，总长度不超过上限。
+没有结构化结果时(如出生信息不完整)，把客户端发来的分析文本截断到同样的上限。
+
+估计的token数：汉字等非ASCII字符按每字1个，ASCII按每4个字符1个，只用于统计和比较。
+
+环境变量:
+    BAZI_PROMPT_MAX_CHARS  命盘摘要最多的字数，默认1200
+    BAZI_PROMPT_RULE_CHARS 每条规则最多的字数，默认60
+"""
+
+import math
+import os
+import re
+
+from report import classics
+
+# 表格一类的行：含制表符、连续空格或空的列表
+table_line = re.compile(r'\t| {2,}|\[\]')
+
+
+def estimate_tokens(text):
+    """估计的token数"""
+    ascii_chars = sum(1 for char in text if ord(char) < 128)
+    return len(text) - ascii_chars + math.ceil(ascii_chars / 4)
+
+
+def clip(text, max_chars):
+    """按行截断到max_chars以内"""
+    if len(text) <= max_chars:
+        return text
+    lines = []
+    size = 0
+    for line in text.splitlines():
+        if size + len(line) + 1 > max_chars:
+            break
+        lines.append(line)
+        size += len(line) + 1
+    return '\n'.join(lines)
+
+
+def key_rules(report, rule_chars=60):
+    """命中的规则中适合放进提示词的行：去掉表格、古籍摘录和重复的行"""
+    seen = set()
+    for hit in report.rules:
+        if hit.rule in classics:
+            continue
+        for line in hit.text.splitlines():
+            if table_line.search(line) or line.startswith(('(', '*')):
+                continue
+            line = line.strip().strip('-=').strip()
+            # 只有标题的行
+            if len(line) < 4 or line.endswith(('：', ':')) or line in seen:
+                continue
+            seen.add(line)
+            yield line[:rule_chars]
+
+
+def current_yun(report, year):
+    """当前的(大运, 流年)，出生年份不在大运中时大运为None"""
+    dayun = None
+    for row in report.dayuns:
+        if row.year <= year:
+            dayun = row
+    liunian = None
+    if dayun is not None:
+        liunian = next((row for row in dayun.liunians if row.year == year), None)
+    return dayun, liunian
+
+
+def _yun_text(row, start=True):
+    return "{}({}岁{} {}年) {}/{} {}".format(row.ganzhi, row.age, '起' if start else '', row.year, row.gan_shen,
+                                         row.zhi_shen, ' '.join(row.relations)).rstrip()
+
+
+def chart_summary(report, struct, year, max_chars=1200, rule_chars=60):
+    """紧凑的命盘摘要，report为bazi.analyze的Report，struct为chart_struct的结果(可以为None)"""
+    names = [pillar.name for pillar in report.pillars]
+    lines = ["四柱：{}（日主{}{}）".format(' '.join(a + b for a, b in zip(report.gans, report.zhis)), report.gans[2],
+                                    (struct or {}).get('day_master_element', ''))]
+    for pillar in report.pillars:
+        lines.append("{}柱 {}{}：干{} 支{} 藏{} {} {}{}".format(
+            pillar.name, pillar.gan, pillar.zhi, '日主' if pillar.gan_shen == '--' else pillar.gan_shen,
+            pillar.zhi_shen, ''.join(pillar.hidden),
+            pillar.status, pillar.nayin, (' 神煞' + ''.join(pillar.shens)) if pillar.shens else ''))
+    lines.append("五行：" + ' '.join("{}{}".format(name, score) for name, score in report.scores.items()))
+    extras = (struct or {}).get('extras', {})
+    strength = "强弱：{}（得分{}，中值29）".format(extras.get('strength', ''), report.strong)
+    if extras.get('yong_shen'):
+        strength += " 喜用{} 忌{}".format(''.join(extras['yong_shen']), ''.join(extras.get('ji_shen', [])))
+    lines.append(strength)
+    lines.append("格局：{}{}{}".format(report.ge or '无', (' 格' + ' '.join(report.all_ges)) if report.all_ges else '',
+                                    (' 局' + ' '.join(report.jus)) if report.jus else ''))
+    advice = (struct or {}).get('advice', {})
+    if advice.get('tiao_hou'):
+        lines.append("调候：" + advice['tiao_hou'])
+    if advice.get('jin_bu_huan'):
+        lines.append("金不换：" + ' '.join(advice['jin_bu_huan'].split()))
+    if report.relations:
+        lines.append("关系：" + '；'.join("{}{}{}{}".format(names[r.first], names[r.second], r.kind, ''.join(r.names))
+                                       for r in report.relations))
+    dayun, liunian = current_yun(report, year)
+    if dayun is not None:
+        lines.append("当前大运：" + _yun_text(dayun))
+        if liunian is not None:
+            lines.append("流年：" + _yun_text(liunian, start=False))
+    head = clip('\n'.join(lines), max_chars)
+
+    # 剩余的字数放入规则
+    size = len(head) + len("\n要点：")
+    rules = []
+    for line in key_rules(report, rule_chars):
+        if size + len(line) + 3 > max_chars:
+            break
+        rules.append("- " + line)
+        size += len(line) + 3
+    return head + ("\n要点：\n" + '\n'.join(rules) if rules else '')
+
+
+def _names(items):
+    return ', '.join(items) if items else '无'
+
+
+interpretation_template = """你是一位专业的命理学专家，请基于以下传统八字和生肖分析结果，为用户提供全面、专业且易懂的命理解读。
+
+## 基本信息：
+- 出生日期：{birth[date]} ({birth[calendar_type]})
+- 出生时辰：{birth[time]}点
+- 性别：{birth[gender]}
+- 生肖：{birth[shengxiao]}
+
+## 生肖分析结果：
+年支：{year_zhi}
+相合生肖：三合 {sanhe}；六合 {liuhe}；三会 {sanhui}
+不合生肖：相冲 {chong}；相刑 {xing}；相害 {hai}；相破 {po}
+
+## 八字排盘分析：
+{chart}
+
+请基于以上信息，从以下几个方面为用户提供专业解读：
+
+1. **性格特点分析**：根据八字五行和生肖特性，分析此人的性格特点、优缺点
+2. **事业运势**：分析事业发展方向、适合的职业类型、成功的关键因素
+3. **财运分析**：财富积累能力、理财建议、财运周期
+4. **感情婚姻**：感情模式、婚姻运势、与什么类型的人相配
+5. **健康建议**：根据五行分析可能的健康注意事项
+6. **人生建议**：基于命理特点给出的人生发展建议
+
+要求：
+- 语言通俗易懂，避免过于专业的术语
+- 结合现代生活实际，给出实用的建议
+- 保持客观中性，既不过分乐观也不悲观
+- 重点突出个人努力的重要性
+- 字数控制在800-1200字左右
+- 使用温和、积极的语调"""
+
+
+def interpretation_prompt(birth_info, shengxiao_analysis, chart):
+    """AI解读的提示词，chart为命盘摘要"""
+    compatible = shengxiao_analysis.get('compatible', {})
+    incompatible = shengxiao_analysis.get('incompatible', {})
+    return interpretation_template.format(
+        birth=birth_info, year_zhi=shengxiao_analysis.get('year_zhi', ''), chart=chart,
+        **{name: _names(compatible.get(name)) for name in ('sanhe', 'liuhe', 'sanhui')},
+        **{name: _names(incompatible.get(name)) for name in ('chong', 'xing', 'hai', 'po')})
+
+
+def prompt_options():
+    return dict(max_chars=int(os.environ.get("BAZI_PROMPT_MAX_CHARS", 1200)),
+                rule_chars=int(os.environ.get("BAZI_PROMPT_RULE_CHARS", 60)))
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""八字分析的结构化结果和输出格式(终端文本、JSON、Markdown)。
+
+bazi.analyze_pillars在输出文本的同时生成Report：终端文本按样式分段记录(颜色、推广链接)，
+规则部分的每条断语记为Hit(规则名和断语)。调用方按需选择render_text、render_json或render_markdown，
+都直接由这些结构生成，不必再从文本里过滤颜色和分隔线。
+"""
+
+import contextlib
+
+# 终端文本中带颜色部分的前后缀
+COLOR = '\033[1;36;40m'
+RESET = '\033[0m'
+
+# render_json、render_markdown可以选择的部分
+parts = ('pillars', 'relations', 'scores', 'ge', 'dayuns', 'rules')
+# 古籍摘录的来源，规则部分中来源为这些的是摘录而不是断语
+classics = ('穷通宝鉴', '三命通会')
+
+
+class Node:
+    """结果树节点的基类，子类用__slots__列出字段"""
+    __slots__ = ()
+
+    def __init__(self, **kwargs):
+        for name in self.__slots__:
+            setattr(self, name, kwargs.get(name))
+
+    def __repr__(self):
+        return "{}({})".format(type(self).__name__,
+                               ', '.join("{}={!r}".format(name, getattr(self, name)) for name in self.__slots__))
+
+    def as_dict(self):
+        return {name: plain(getattr(self, name)) for name in self.__slots__}
+
+
+def plain(value):
+    """Node及其列表、字典转为可以json序列化的值"""
+    if isinstance(value, Node):
+        return value.as_dict()
+    if isinstance(value, (list, tuple)):
+        return [plain(item) for item in value]
+    if isinstance(value, dict):
+        return {key: plain(item) for key, item in value.items()}
+    return value
+
+
+class Pillar(Node):
+    """一柱：name为年月日时，hidden为藏干及其十神，status为日主在该地支的十二长生"""
+    __slots__ = ('name', 'gan', 'zhi', 'gan_shen', 'zhi_shen', 'hidden', 'status', 'nayin', 'shens')
+
+
+class Relation(Node):
+    """四柱之间的关系，kind为'干'或'支'，first、second为柱的序号"""
+    __slots__ = ('kind', 'first', 'second', 'names')
+
+
+class YunRow(Node):
+    """大运或流年的一行，大运的liunians为其中的流年"""
+    __slots__ = ('age', 'year', 'ganzhi', 'gan_shen', 'zhi_shen', 'nayin', 'empty', 'relations', 'notes',
+                 'shens', 'liunians')
+
+
+class Hit(Node):
+    """规则部分的一条输出：rule为规则名，固定输出(调候、六亲、古籍摘录等)为其标题，text为断语"""
+    __slots__ = ('rule', 'text')
+
+
+class Report(Node):
+    """一次八字分析的完整结果
+
+    segments是终端输出的各段[(样式, 文本)]，样式为None、'color'(带颜色)或'link'(推广链接)，见Text；
+    rules是规则部分的输出，每项为一个Hit，来源为classics中的是《穷通宝鉴》《三命通会》的摘录。
+    """
+    __slots__ = ('gans', 'zhis', 'gender', 'pillars', 'relations', 'scores', 'gan_scores', 'strong', 'weak',
+                 'temps_scores', 'ge', 'all_ges', 'jus', 'dayuns', 'rules', 'segments')
+
+
+class Text:
+    """按样式分段记录的终端输出，可以作为print的file参数。
+
+    style()期间写入的内容为一段，样式外写入的内容合并为普通文本"""
+
+    def __init__(self):
+        self.segments = []
+        self.current = None
+
+    def write(self, text):
+        if self.current is None and self.segments and self.segments[-1][0] is None:
+            self.segments[-1][1] += text
+        elif self.current is None:
+            self.segments.append([None, text])
+        else:
+            self.segments[-1][1] += text
+
+    @contextlib.contextmanager
+    def style(self, name):
+        self.segments.append([name, ''])
+        self.current = name
+        try:
+            yield
+        finally:
+            self.current = None
+
+    def value(self):
+        return [(style, text) for style, text in self.segments if text]
+
+
+def render_text(report, color=True, links=True):
+    """终端文本，与python bazi.py的输出相同；color=False去掉颜色，links=False去掉推广链接"""
+    return ''.join(COLOR + text + RESET if style == 'color' and color else text
+                   for style, text in report.segments if links or style != 'link')
+
+
+def render_json(report, only=None):
+    """可以json序列化的dict，only为需要的部分(见parts)，默认全部"""
+    only = only or parts
+    result = {'gans': ''.join(report.gans), 'zhis': ''.join(report.zhis), 'gender': report.gender}
+    if 'pillars' in only:
+        result['pillars'] = plain(report.pillars)
+    if 'relations' in only:
+        result['relations'] = plain(report.relations)
+    if 'scores' in only:
+        result.update(scores=report.scores, gan_scores=report.gan_scores, strong=report.strong,
+                      weak=report.weak, temps_scores=report.temps_scores)
+    if 'ge' in only:
+        result.update(ge=report.ge, all_ges=report.all_ges, jus=report.jus)
+    if 'dayuns' in only:
+        result['dayuns'] = plain(report.dayuns)
+    if 'rules' in only:
+        result['rules'] = plain(report.rules)
+    return result
+
+
+def _md_line(line):
+    # 以#、=、-等开头的行在Markdown中会变成标题或列表，加上转义
+    return '\\' + line if line.startswith(tuple('#=-*+>|')) else line
+
+
+def _row(cells):
+    return "| " + " | ".join(str(item) for item in cells) + " |"
+
+
+def _yun_row(row, bold=False):
+    ganzhi = "**{}**".format(row.ganzhi) if bold else row.ganzhi
+    return _row(('' if row.age is None else row.age, row.year or '', ganzhi, row.gan_shen + ' ' + row.zhi_shen,
+                 row.nayin, ' '.join(row.relations), ' '.join(row.notes + row.shens)))
+
+
+def render_markdown(report, only=None):
+    """Markdown报告，only同render_json"""
+    only = only or parts
+    lines = ["# 八字分析：{} {}".format(' '.join(a + b for a, b in zip(report.gans, report.zhis)), report.gender), ""]
+    if 'pillars' in only:
+        lines += ["## 四柱", "", _row(('', '天干', '地支', '十神', '藏干', '长生', '纳音', '神煞')),
+                  _row(('---',) * 8)]
+        for pillar in report.pillars:
+            lines.append(_row((pillar.name, pillar.gan, pillar.zhi, pillar.gan_shen + ' ' + pillar.zhi_shen,
+                               ' '.join(pillar.hidden), pillar.status, pillar.nayin, ' '.join(pillar.shens))))
+        lines.append("")
+    if 'relations' in only and report.relations:
+        names = [pillar.name for pillar in report.pillars]
+        lines += ["## 关系", ""]
+        for relation in report.relations:
+            lines.append("- {}{}{}：{}".format(names[relation.first], names[relation.second], relation.kind,
+                                              ' '.join(relation.names)))
+        lines.append("")
+    if 'scores' in only:
+        lines += ["## 五行", "", _row(report.scores.keys()), _row(('---',) * len(report.scores)),
+                  _row(report.scores.values()), "",
+                  "强弱：{} 中值29 强根：{} 湿度：{}".format(report.strong, '无' if report.weak else '有',
+                                                   report.temps_scores), ""]
+    if 'ge' in only:
+        lines += ["## 格局", "", "格局：{} 格：{} 局：{}".format(report.ge or '无', ' '.join(report.all_ges) or '无',
+                                                         ' '.join(report.jus) or '无'), ""]
+    if 'dayuns' in only and report.dayuns:
+        lines += ["## 大运", "", _row(('年龄', '年份', '干支', '十神', '纳音', '关系', '备注')), _row(('---',) * 7)]
+        for dayun in report.dayuns:
+            lines.append(_yun_row(dayun, bold=True))
+            for liunian in dayun.liunians:
+                lines.append(_yun_row(liunian))
+        lines.append("")
+    if 'rules' in only:
+        lines += ["## 分析", ""]
+        for hit in report.rules:
+            lines += [_md_line(line.strip()) + "  " for line in hit.text.splitlines() if line.strip()]
+        lines.append("")
+    return "\n".join(lines)
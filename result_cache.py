@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""分析结果的两级缓存：内存LRU + SQLite。
+
+同样的出生信息得到的结果只与当前年份(流年、年龄)和排盘代码有关，所以键里带上
+引擎版本(影响结果的源文件的摘要，不含接口代码)，跨年时清空旧结果。内存层按条数淘汰，
+SQLite层在进程重启后仍然有效，多个进程可以共用一个文件，不同版本的进程各自命中自己的结果；
+旧版本的结果不再被读到，和其他结果一样在超过有效期或条数上限时按保存的先后删除。
+写入每batch条或interval秒后提交一次，其他进程要到提交后才能读到。
+
+环境变量:
+    BAZI_CACHE_SIZE  内存层条数，默认1024，0为不用内存层
+    BAZI_CACHE_DB    SQLite文件，默认为本目录下的result_cache.db，空字符串为不用磁盘层
+    BAZI_CACHE_TTL   结果的有效秒数，默认0为不过期(仍然跨年失效)
+    BAZI_CACHE_ROWS  SQLite层的条数上限，默认100000，0为不限
+"""
+
+import atexit
+import collections
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from ganzhi import get_current_year
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_PATH = os.path.join(BASE_DIR, "result_cache.db")
+
+# 影响分析结果的源文件；接口代码(api_server.py)不在其中，结构化排盘和提示词摘要在bazi_struct.py、prompts.py
+engine_files = ('bazi.py', 'datas.py', 'ganzhi.py', 'common.py', 'sizi.py', 'yue.py', 'rules.py', 'report.py',
+                'shensha.py', 'paipan.py', 'jieqi_data.py', 'bazi_struct.py', 'prompts.py')
+
+
+def engine_version(files=engine_files):
+    """排盘代码的版本，为源文件内容的摘要"""
+    digest = hashlib.md5()
+    for name in files:
+        path = os.path.join(BASE_DIR, name)
+        if os.path.exists(path):
+            with open(path, "rb") as f:
+                digest.update(f.read())
+    return digest.hexdigest()[:12]
+
+
+class ResultCache:
+    """两级缓存，键为可json序列化的元组，值为可json序列化的结果"""
+
+    def __init__(self, size=1024, path=None, ttl=0, version=None, rows=100000, batch=32, interval=1.0):
+        self.size = size
+        self.path = path
+        self.ttl = ttl
+        self.version = version or engine_version()
+        self.rows = rows
+        self.batch = batch
+        self.interval = interval
+        self.items = collections.OrderedDict()
+        self.lock = threading.Lock()
+        self.stats = collections.Counter()
+        self.year = self.current_year()
+        self.db = None
+        # 未提交的写入条数和到时提交的定时器
+        self.pending = 0
+        self.timer = None
+        if path:
+            self.db = sqlite3.connect(path, check_same_thread=False)
+            columns = [row[1] for row in self.db.execute("PRAGMA table_info(results)")]
+            if columns and 'version' not in columns:
+                # 旧的表没有版本列，里面的结果都作废
+                self.db.execute("DROP TABLE results")
+            self.db.execute("CREATE TABLE IF NOT EXISTS results "
+                            "(key TEXT PRIMARY KEY, version TEXT, year INTEGER, created REAL, value TEXT)")
+            self.db.execute("CREATE INDEX IF NOT EXISTS results_created ON results (created)")
+            # 其他版本的结果可能属于共用这个文件的其他进程，不在这里删除
+            self.db.execute("DELETE FROM results WHERE year != ?", (self.year,))
+            self._prune()
+            self.db.commit()
+            atexit.register(self.flush)
+
+    @staticmethod
+    def current_year():
+        return get_current_year()
+
+    def _key(self, key):
+        return json.dumps([self.version] + list(key), ensure_ascii=False)
+
+    def _check_year(self):
+        year = self.current_year()
+        if year != self.year:
+            self.year = year
+            self.items.clear()
+            if self.db:
+                self.db.execute("DELETE FROM results WHERE year != ?", (year,))
+                self._commit()
+            self.stats['rollovers'] += 1
+
+    def _prune(self):
+        # 删除过期的结果，超过条数上限时再删除最早保存的结果
+        if self.ttl:
+            expired = self.db.execute("DELETE FROM results WHERE created < ?", (time.time() - self.ttl,)).rowcount
+            self.stats['disk_evictions'] += max(expired, 0)
+        if not self.rows:
+            return
+        extra = self.db.execute("SELECT COUNT(*) FROM results").fetchone()[0] - self.rows
+        if extra > 0:
+            self.db.execute("DELETE FROM results WHERE key IN "
+                            "(SELECT key FROM results ORDER BY created LIMIT ?)", (extra,))
+            self.stats['disk_evictions'] += extra
+
+    def _commit(self):
+        self._prune()
+        self.db.commit()
+        self.pending = 0
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+
+    def _expired(self, created):
+        return self.ttl and time.time() - created > self.ttl
+
+    def get(self, key):
+        """取出结果，没有时返回None"""
+        key = self._key(key)
+        with self.lock:
+            self._check_year()
+            item = self.items.get(key)
+            if item is not None and self._expired(item[0]):
+                del self.items[key]
+                item = None
+            if item is not None:
+                self.items.move_to_end(key)
+                self.stats['memory_hits'] += 1
+                return item[1]
+            if self.db:
+                row = self.db.execute("SELECT created, value FROM results WHERE key = ? AND year = ?",
+                                      (key, self.year)).fetchone()
+                if row and not self._expired(row[0]):
+                    value = json.loads(row[1])
+                    self._remember(key, row[0], value)
+                    self.stats['disk_hits'] += 1
+                    return value
+            self.stats['misses'] += 1
+            return None
+
+    def _remember(self, key, created, value):
+        if self.size <= 0:
+            return
+        self.items[key] = (created, value)
+        self.items.move_to_end(key)
+        while len(self.items) > self.size:
+            self.items.popitem(last=False)
+            self.stats['evictions'] += 1
+
+    def put(self, key, value):
+        """保存结果"""
+        key = self._key(key)
+        created = time.time()
+        with self.lock:
+            self._check_year()
+            self._remember(key, created, value)
+            if self.db:
+                self.db.execute("INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?)",
+                                (key, self.version, self.year, created, json.dumps(value, ensure_ascii=False)))
+                self.pending += 1
+                if self.pending >= self.batch:
+                    self._commit()
+                elif self.timer is None:
+                    # 未提交时其他进程不能写，最多等interval秒
+                    self.timer = threading.Timer(self.interval, self.flush)
+                    self.timer.daemon = True
+                    self.timer.start()
+            self.stats['stores'] += 1
+
+    def flush(self):
+        """提交还没有写入文件的结果"""
+        with self.lock:
+            if self.db and self.pending:
+                self._commit()
+
+    def clear(self):
+        with self.lock:
+            self.items.clear()
+            if self.db:
+                self.db.execute("DELETE FROM results")
+                self._commit()
+
+    def info(self):
+        """命中统计"""
+        with self.lock:
+            result = {name: self.stats[name] for name in
+                      ('memory_hits', 'disk_hits', 'misses', 'stores', 'evictions', 'disk_evictions', 'rollovers')}
+            result.update(version=self.version, year=self.year, memory_size=len(self.items), memory_limit=self.size,
+                          disk_size=self.db.execute("SELECT COUNT(*) FROM results").fetchone()[0] if self.db else None)
+        return result
+
+
+def open_result_cache():
+    """按环境变量创建缓存"""
+    return ResultCache(size=int(os.environ.get("BAZI_CACHE_SIZE", 1024)),
+                       path=os.environ.get("BAZI_CACHE_DB", DEFAULT_PATH) or None,
+                       ttl=float(os.environ.get("BAZI_CACHE_TTL", 0)),
+                       rows=int(os.environ.get("BAZI_CACHE_ROWS", 100000)))
@@ -0,0 +1,1050 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""声明式的断语规则表和按关键字索引的规则分派。
+
+每条规则由条件和断语组成，条件可以是下列关键字，值为字符串或多个可选值的元组：
+    me: 日主    month: 月支    time: 时支    day: 日柱(如'甲子')    hour: 时柱    ge: 月令格局
+    month_shen/day_shen/time_shen: 月支、日支、时支的主气十神    female: 是否女命
+    gan_shen: 天干中有这些十神(全部)    shen: 四柱中有这些十神(全部)    zhi: 地支中有这些字(全部)
+另外可以用when(chart)给出其他条件。规则按第一个关键字建立索引，排盘时只检查
+日主、月支、日柱等对得上的候选规则，候选规则按表中的顺序输出，与原来的print顺序一致。
+
+规则可以有子规则(rules)，命中后依次检查，相当于嵌套的if；有each(chart)时对其给出的每一柱检查一遍子规则，
+子规则中的chart.seq为当前柱的序号。命中后除了输出断语，add_ge把格局加入chart.all_ges(建禄、阳刃、偏印等)，
+供后面的规则判断；after在子规则之后输出(分隔线，输出时after=True，不算断语)。
+end与print的end相同，link为推广链接(文本输出时可以去掉)。
+每条规则(包括子规则)记录检查次数、命中次数和耗时，见rule_stats()；多个线程同时排盘时在锁内累加。
+"""
+
+import collections
+import functools
+import threading
+import time as time_
+
+from common import *
+
+# 日主对应的各十神的天干和它们的禄(建)、刃(帝)、库，只与日主有关
+Stars = collections.namedtuple("Stars", "me_lu me_jue me_tai me_di shang shang_lu shang_di yin yin_lu xiao xiao_lu "
+                               "cai cai_lu cai_di piancai piancai_lu piancai_di guan guan_lu guan_di sha sha_lu sha_di "
+                               "jie shi shi_lu shi_di me_ku cai_ku guan_ku yin_ku shi_ku")
+
+# 规则用到的八字特征：shens为天干十神(日主为'--')加地支主气十神，shens2为天干十神加地支所有藏干的十神，
+# zhi_shen3为各地支藏干十神的字符串，zhi_6he等为相邻两柱的六合、六冲、干合、刑，jus为三合三会局，
+# ge为月令格局(分析到格局之后才有)，seq为each中的当前柱
+Chart = collections.namedtuple("Chart", "me gans zhis zhus gan_shens zhi_shens shens zhi_shens2 zhi_shen3 shens2 "
+                               "shen_zhus scores gan_scores weak statuses zhi_6he zhi_6chong gan_he zhi_xing "
+                               "all_shens all_shens_list jus all_ges female ge seq " + ' '.join(Stars._fields))
+
+# 建索引的优先顺序，越靠前越能区分
+index_keys = ('day', 'hour', 'ge', 'month_shen', 'day_shen', 'time_shen', 'me', 'month', 'time',
+              'gan_shen', 'shen', 'zhi', 'female')
+# 这些关键字要求全部出现，其他关键字为任选其一
+all_keys = ('gan_shen', 'shen', 'zhi')
+
+
+@functools.lru_cache(maxsize=None)
+def get_stars(me):
+    inverse = ten_deities[me].inverse
+    shang, yin, xiao, cai = inverse['伤'], inverse['印'], inverse['枭'], inverse['财']
+    piancai, guan, sha, shi = inverse['才'], inverse['官'], inverse['杀'], inverse['食']
+    return Stars(me_lu=inverse['建'], me_jue=inverse['绝'], me_tai=inverse['胎'], me_di=inverse['帝'],
+                 shang=shang, shang_lu=ten_deities[shang].inverse['建'], shang_di=ten_deities[shang].inverse['帝'],
+                 yin=yin, yin_lu=ten_deities[yin].inverse['建'], xiao=xiao, xiao_lu=ten_deities[xiao].inverse['建'],
+                 cai=cai, cai_lu=ten_deities[cai].inverse['建'], cai_di=ten_deities[cai].inverse['帝'],
+                 piancai=piancai, piancai_lu=ten_deities[piancai].inverse['建'],
+                 piancai_di=ten_deities[piancai].inverse['帝'],
+                 guan=guan, guan_lu=ten_deities[guan].inverse['建'], guan_di=ten_deities[guan].inverse['帝'],
+                 sha=sha, sha_lu=ten_deities[sha].inverse['建'], sha_di=ten_deities[sha].inverse['帝'],
+                 jie=inverse['劫'], shi=shi, shi_lu=ten_deities[shi].inverse['建'], shi_di=ten_deities[shi].inverse['帝'],
+                 me_ku=ten_deities[me]['库'][0], cai_ku=ten_deities[cai]['库'][0], guan_ku=ten_deities[guan]['库'][0],
+                 yin_ku=ten_deities[yin]['库'][0], shi_ku=ten_deities[shi]['库'][0])
+
+
+def new_chart(ge='', seq=None, **values):
+    """由排盘的中间结果生成Chart，日主的禄、刃、库等查表补上"""
+    return Chart(ge=ge, seq=seq, **values, **get_stars(values['me'])._asdict())
+
+
+def _as_tuple(value):
+    return value if isinstance(value, tuple) else (value,)
+
+
+# 保护各规则的calls、hits、seconds
+_stats_lock = threading.Lock()
+
+
+def _print(rule, text, after=False):
+    print(text, end=rule.end)
+
+
+class Rule:
+    """一条规则，text为断语或以chart为参数返回断语的函数，None时只检查子规则"""
+    __slots__ = ('name', 'text', 'keys', 'when', 'rules', 'each', 'add_ge', 'after', 'end', 'link',
+                 'order', 'calls', 'hits', 'seconds')
+
+    def __init__(self, name, text=None, when=None, rules=(), each=None, add_ge=None, after=None, end='\n',
+                 link=False, **keys):
+        unknown = set(keys) - set(index_keys)
+        if unknown:
+            raise ValueError("未知的规则条件: {}".format(', '.join(unknown)))
+        self.name = name
+        self.text = text
+        self.when = when
+        self.rules = rules
+        self.each = each
+        self.add_ge = add_ge
+        self.after = after
+        self.end = end
+        self.link = link
+        self.keys = {key: _as_tuple(value) for key, value in keys.items()}
+        self.order = 0
+        self.calls = 0
+        self.hits = 0
+        self.seconds = 0.0
+
+    def match(self, values, chart):
+        for key, value in self.keys.items():
+            if key in all_keys:
+                if not set(value) <= values[key]:
+                    return False
+            elif values[key] not in value:
+                return False
+        return self.when is None or bool(self.when(chart))
+
+    def check(self, values, chart, output, hits):
+        """检查规则，命中时输出断语、执行作用并检查子规则"""
+        start = time_.perf_counter()
+        matched = self.match(values, chart)
+        if matched:
+            if self.text is not None:
+                output(self, self.text(chart) if callable(self.text) else self.text)
+            if self.add_ge is not None:
+                chart.all_ges.append(self.add_ge)
+            hits.append(self)
+        elapsed = time_.perf_counter() - start
+        with _stats_lock:
+            self.calls += 1
+            self.hits += matched
+            self.seconds += elapsed
+        if not matched:
+            return
+        for seq in (self.each(chart) if self.each is not None else (chart.seq,)):
+            current = chart if seq == chart.seq else chart._replace(seq=seq)
+            for rule in self.rules:
+                rule.check(values, current, output, hits)
+        if self.after is not None:
+            output(self, self.after, after=True)
+
+
+def _walk(rules):
+    for rule in rules:
+        yield rule
+        yield from _walk(rule.rules)
+
+
+class RuleSet:
+    """一组规则编译成的索引，只索引第一层的规则"""
+
+    def __init__(self, name, rules):
+        self.name = name
+        self.rules = rules
+        self.index = collections.defaultdict(list)
+        self.always = []
+        for order, rule in enumerate(rules):
+            rule.order = order
+            for key in index_keys:
+                if key in rule.keys:
+                    # 需要全部出现的，只用第一个值索引
+                    values = rule.keys[key][:1] if key in all_keys else rule.keys[key]
+                    for value in values:
+                        self.index[(key, value)].append(rule)
+                    break
+            else:
+                self.always.append(rule)
+
+    def run(self, chart, output=_print):
+        """检查规则并用output(rule, text)输出命中的断语，返回命中的规则(包括子规则)"""
+        values = {
+            'me': chart.me, 'month': chart.zhis[1], 'time': chart.zhis[3],
+            'day': ''.join(chart.zhus[2]), 'hour': ''.join(chart.zhus[3]), 'ge': chart.ge,
+            'month_shen': chart.zhi_shens[1], 'day_shen': chart.zhi_shens[2], 'time_shen': chart.zhi_shens[3],
+            'gan_shen': set(chart.gan_shens), 'shen': set(chart.shens), 'zhi': set(chart.zhis), 'female': chart.female,
+        }
+        candidates = list(self.always)
+        for key in index_keys:
+            for value in (values[key] if key in all_keys else (values[key],)):
+                candidates.extend(self.index.get((key, value), ()))
+        candidates.sort(key=lambda rule: rule.order)
+
+        hits = []
+        for rule in candidates:
+            rule.check(values, chart, output, hits)
+        return hits
+
+
+def _gan(shen):
+    # 天干为shen的各柱
+    return lambda c: [seq for seq, item in enumerate(c.gan_shens) if item == shen]
+
+
+def _pillars(c):
+    return range(4)
+
+
+def _stars(table, zhis):
+    # table中在地支出现的字，按table的顺序
+    return [item for items in table for item in items if item in zhis]
+
+
+def _repeated(items, chars, low, high=None):
+    # items中第一个在chars中出现low(到high)次的字
+    return next((item for item in items if low <= chars.count(item) <= (high or low)), None)
+
+
+def _yangren(c):
+    return ten_deities[c.me].inverse['帝' if is_yang(c.me) else '冠']
+
+
+# 日支所在三合局对应的将星和华盖，年支或日支所在三合局的咸池
+jiangxings = {"申子辰": "子", "丑巳酉": "酉", "寅午戌": "午", "亥卯未": "卯"}
+huagais = {"申子辰": "辰", "丑巳酉": "丑", "寅午戌": "戌", "亥卯未": "未"}
+taohuas = {"申子辰": "酉", "丑巳酉": "午", "寅午戌": "卯", "亥卯未": "子"}
+
+
+def _sanhe(zhi, table):
+    return next(star for group, star in table.items() if zhi in group)
+
+
+def _taohua(c):
+    # 按顺序取第一个年支或日支所在的三合局；申子辰看四柱，其他只看年月时
+    for seq, (group, star) in enumerate(taohuas.items()):
+        if c.zhis.day in group or c.zhis[0] in group:
+            return star if star in (c.zhis if seq == 0 else c.zhis[:2] + c.zhis[3:]) else None
+    return None
+
+
+def _three(items):
+    # 连续三个天干，日主在第2或第3位
+    return lambda c: items in (tuple(c.gans)[:3], tuple(c.gans)[1:])
+
+
+rule_sets = {item.name: item for item in (
+    RuleSet('四柱', [
+        Rule("缺四生", "缺四生：一生不敢作为", when=lambda c: not set('寅申巳亥') & set(c.zhis)),
+        Rule("缺四正", "缺四柱地支缺四正，一生避是非", when=lambda c: not set('子午卯酉') & set(c.zhis)),
+        Rule("缺四库", "四柱地支缺四库，一生没有潜伏性凶灾。", when=lambda c: not set('辰戌丑未') & set(c.zhis)),
+        Rule("地上三奇", "地上三奇：白天生有申佳，需身强四柱有贵人。", me=('戊', '庚'), when=_three(('甲', '戊', '庚'))),
+        Rule("人间三奇", "人间三奇，需身强四柱有贵人。", me=('壬', '癸'), when=_three(('辛', '壬', '癸'))),
+        Rule("天上三奇", "天上三奇：晚上生有亥佳，需身强四柱有贵人。", me=('丙', '丁'), when=_three(('乙', '丙', '丁'))),
+        Rule("二重亡神", "二重亡神，先丧母；", when=lambda c: c.zhi_shens2.count('亡神') > 1),
+        Rule("时坐空亡", "时坐空亡，子息少。 母法P24-41 母法P79-4：损破祖业，后另再成就。", when=lambda c: get_empty(c.zhus[2], c.zhis.time)),
+        Rule("胎绝超过3个", "胎绝超过3个：夭或穷。母法P24-44 丁未 壬子 丙子 戊子", when=lambda c: c.zhis.count(c.me_jue) + c.zhis.count(c.me_tai) > 2),
+        Rule("阴日主时日支入比劫库", "阴日主时日支入比劫库：性格孤独，难发达。母法P28-112 甲申 辛未 辛丑 己丑 母法P55-11 为人孤独，且有灾疾", when=lambda c: not_yang(c.me) and zhi_ku(c.zhis[2], (c.me, c.jie)) and zhi_ku(c.zhis[3], (c.me, c.jie))),
+        Rule("月日时支没有财或偏财的禄旺", "月日时支没有财或偏财的禄旺。", when=lambda c: c.zhis[1:].count(c.piancai_lu) + c.zhis[1:].count(c.cai_lu) + c.zhis[1:].count(c.piancai_di) + c.zhis[1:].count(c.cai_di) == 0),
+        Rule("月日时支没有官的禄旺", "月日时支没有官的禄旺。", when=lambda c: c.zhis[1:].count(c.guan_lu) + c.zhis[1:].count(c.guan_di) == 0),
+        Rule("女命有辰无戌", "女命有辰无戌：孤。", female=True, when=lambda c: '辰' in c.zhis and '戌' not in c.zhis),
+        Rule("女命有戌无辰", "女命有戌无辰：带禄。", female=True, when=lambda c: '戌' in c.zhis and '辰' not in c.zhis),
+        Rule("四大空亡", "四大空亡：33岁以前身体不佳！", when=lambda c: emptie4s.get(c.zhus[2], 0) != 0 and c.scores[emptie4s.get(c.zhus[2], 0)] == 0),
+        Rule("神煞说明", lambda c: '\n'.join("{} : {}".format(item, shens_infos[item]) for item in c.all_shens),
+             when=lambda c: c.all_shens),
+        Rule("女命", "#" * 20 + " 女命", female=True, rules=[
+            Rule("二逢驿马", "二逢驿马，母家荒凉。P110 丙申 丙申 甲寅 丁卯", when=lambda c: c.all_shens_list.count('驿马') > 1),
+            Rule("年上伤官", "年上伤官：带疾生产。P110 戊寅 戊午 丁未 丁未", when=lambda c: c.gan_shens[0] == '伤'),
+        ]),
+    ]),
+    RuleSet('格局', [
+        Rule("地网", "地网：地支辰巳。天罗：戌亥。天罗地网全凶。", zhi=('辰', '巳')),
+        Rule("天罗", "天罗：戌亥。地网：地支辰巳。天罗地网全凶。", zhi=('戌', '亥')),
+        Rule("魁罡格", "魁罡格：基础96，日主庚辰,庚戌,壬辰, 戊戌，重叠方有力。日主强，无刑冲佳。\n"
+             "魁罡四柱曰多同，贵气朝来在此中，日主独逢冲克重，财官显露祸无穷。魁罡重叠是贵人，天元健旺喜临身，财官一见生灾祸，刑煞俱全定苦辛。",
+             day=('庚辰', '庚戌', '壬辰', '戊戌')),
+        Rule("金神格", "金神格：基础97，时柱乙丑、己巳、癸酉。只有甲和己日，甲日为主，甲子、甲辰最突出。月支通金火2局为佳命。不通可以选其他格",
+             hour=('乙丑', '己巳', '癸酉')),
+        Rule("六阴朝阳", "六阴朝阳格：基础98，辛日时辰为子。", me='辛', time='子'),
+        Rule("六乙鼠贵", "六阴朝阳格：基础99，乙日时辰为子。忌讳午冲，丑合，不适合有2个子。月支最好通木局，水也可以，不适合金火。申酉大运有凶，午也不行。夏季为伤官。入其他格以格局论。",
+             me='乙', time='子'),
+        Rule("从格", "有五行大于25分，需要考虑专格或者从格。\n从旺格：安居远害、退身避位、淡泊名利,基础94;从势格：日主无根。",
+             when=lambda c: max(c.scores.values()) > 25),
+        Rule("日时干邻支合", "日时干邻支合：连珠得合：妻贤子佳，与事业无关。母法总则P21-11", when=lambda c: c.zhi_6he[3] and abs(gan_nums[c.gans[3]] - gan_nums[c.gans[2]]) == 1),
+        Rule("日库各柱", None, each=_pillars, rules=[
+            Rule("财坐劫库", "财坐劫库，大破败。母法P61-4 戊寅 丙辰 壬辰 庚子", when=lambda c: c.zhis[c.seq] == c.me_ku and c.gan_shens[c.seq] in ('才', '财')),
+        ]),
+        Rule("日时天比地冲", "日时天比地冲：女为家庭辛劳，男艺术宗教。 母法P61-5 己丑 丙寅 甲辰 甲戌", when=lambda c: c.zhi_6chong[3] and c.gans[3] == c.me),
+        Rule("日时天克地刑", "日时天克地刑：破败祖业、自立发展、后无终局。 母法P61-7 己丑 丙寅 甲午 庚午", when=lambda c: c.zhi_xing[3] and gan_ke(c.me, c.gans[3])),
+        Rule("浮财坐印禄", "浮财坐印禄:破祖之后，自己也败。 母法P78-29 辛丑 丁酉 壬寅 庚子", when=lambda c: (c.cai, c.yin_lu) in c.zhus and c.cai not in c.zhi_shens2),
+        Rule("相邻两柱", None, each=lambda c: range(3), when=lambda c: not is_yang(c.me), rules=[
+            Rule("阴日主天克地刑", "阴日主天克地刑：孤独、双妻。 母法P61-7 己丑 丙寅 甲午 庚午", when=lambda c: c.zhi_xing[c.seq] and c.zhi_xing[c.seq + 1] and gan_ke(c.gans[c.seq], c.gans[c.seq + 1])),
+        ]),
+    ]),
+    RuleSet('建禄', [
+        Rule("建禄格", "建禄格：最好天干有财官。如果官杀不成格，有兄弟，且任性。有争财和理财的双重性格。如果创业独自搞比较好，如果合伙有完善的财务制度也可以。", month_shen="比", add_ge="建", rules=[
+            Rule("建禄年透比劫", "\t建禄年透比劫凶", when=lambda c: c.gan_shens[0] in '比劫'),
+            Rule("建禄财官双透", "\t建禄财官双透，吉", shen=('财', '官'),
+                 when=lambda c: c.gan_shens[0] not in '比劫' and '财' in c.gan_shens and '官' in c.gan_shens),
+            Rule("甲乙建禄", "\t甲乙建禄四柱劫财多，无祖财，克妻，一生不聚财，做事虚诈，为人大模大样，不踏实。乙财官多可为吉。甲壬申时佳；乙辛巳时佳；",
+                 me=('甲', '乙')),
+            Rule("丙建禄", "\t丙：己亥时辰佳；", me='丙'),
+            Rule("丁建禄", "\t丁：阴男克1妻，阳男克3妻。财官多可为吉。庚子时辰佳；", me='丁'),
+            Rule("戊建禄", "\t戊：四柱无财克妻，无祖业，后代多事端。如合申子辰，子息晚，有2子。甲寅时辰佳；", me='戊'),
+            Rule("己建禄", "\t己：即使官财出干成格，妻也晚。偏财、杀印成格为佳。乙丑时辰佳；", me='己'),
+            Rule("庚建禄", "\t庚：上半月生难有祖财，下半月较好，财格比官杀要好。丙戌时辰佳；", me='庚'),
+            Rule("辛建禄", "\t辛：干透劫财，妻迟财少；丁酉时辰佳；", me='辛'),
+            Rule("壬建禄", "\t 壬：戊申时辰佳；", me='壬'),
+            Rule("癸建禄", "\t 癸：己亥时辰佳", me='癸'),
+        ]),
+    ]),
+    RuleSet('日主', [
+        Rule("甲日辰戌多", "甲日：辰或戌多、性能急躁不能忍。", me='甲',
+             when=lambda c: c.zhis.count('辰') > 1 or c.zhis.count('戌') > 1),
+        Rule("甲子", "甲子：调候要火。", day='甲子'),
+        Rule("甲寅", "甲寅：有主见之人，需要财官旺支。", day='甲寅'),
+        Rule("甲辰", "甲辰：印库、性柔和而有实权。", day='甲辰'),
+        Rule("甲午", "甲午：一生有财、调候要水。", day='甲午'),
+        Rule("甲戌", "甲戌：自坐伤官，不易生财，为人仁善。", day='甲戌'),
+        Rule("冬金子月", "冬金子月，再有一子字，孤克。 母法P28-106 甲戌 丙子 庚子 丁丑", me=('庚', '辛'), month='子',
+             when=lambda c: c.zhis.count('子') > 1),
+    ]),
+    RuleSet('比肩', [
+        Rule("比肩", "比：同性相斥。讨厌自己。老是想之前有没有搞错。没有持久性，最多跟你三五年。 散财，月上比肩，做事没有定性，不看重钱，感情不持久。不怀疑人家，人心很好。善意好心惹麻烦。年上问题不大。", gan_shen="比", rules=[
+            Rule("比肩年月天干并现", "比肩年月天干并现：不是老大，出身平常。女仪容端庄，有自己的思想；不重视钱财,话多不能守秘。30随以前是非小人不断。", when=lambda c: c.gan_shens[0] == '比' and c.gan_shens[1] == '比'),
+            Rule("月柱干支比肩", "月柱干支比肩：争夫感情丰富。30岁以前钱不够花。", when=lambda c: c.gan_shens[1] == '比' and '比' in c.zhi_shen3[1]),
+            Rule("年干比", "年干比：上面有哥或姐，出身一般。", when=lambda c: c.gan_shens[0] == '比'),
+            Rule("基52女坐比透比", "基52女坐比透比:夫妻互恨 丙辰 辛卯 辛酉 甲午。", day_shen="比"),
+            Rule("天干2比", """----基51:天干2比
+        自我排斥，易后悔、举棋不定、匆促决定而有失；男倾向于群力，自己决策容易孤注一掷，小事谨慎，大事决定后不再重复考虑。
+        女有自己的思想、容貌佳，注意细节，喜欢小孩重过丈夫。轻视老公。对丈夫多疑心，容易吃醋冲动。
+        男不得女欢心.
+        难以保守秘密，不适合多言；
+        地支有根，一生小是非不断。没官杀制，无耐心。 END""", when=lambda c: c.gan_shens.count('比') > 1),
+            Rule("比肩过多基51", """----比肩过多基51：
+        女的爱子女超过丈夫；轻易否定丈夫。 换一种说法：有理想、自信、贪财、不惧内。男的双妻。
+        兄弟之间缺乏帮助。夫妻有时不太和谐。好友知交相处不会很久。
+        即使成好格局，也是劳累命，事必躬亲。除非有官杀制服。感情烦心。
+        基53：善意多言，引无畏之争；难以保守秘密，不适合多言；易犯无事忙的自我表现；不好意思拒绝他人;累积情绪而突然放弃。
+        比肩过多，女：你有帮夫运，多协助他的事业，多提意见，偶尔有争执，问题也不大。女：感情啰嗦
+        对人警惕性低，乐天知命;情感过程多有波折
+        """, when=lambda c: c.shens2.count('比') > 2 and '比' in c.zhi_shens, rules=[
+                Rule("比肩多无官杀", "基51: 比肩多，四柱无正官七杀，性情急躁。", when=lambda c: not '官' in c.shens and not '杀' in c.shens),
+                Rule("比劫并立比肩专位", "天干比劫并立，比肩地支专位，女命感情丰富，多遇争夫。基52", gan_shen="劫"),
+                Rule("年干为比", "年干为比，不是长子，父母缘较薄，晚婚。", when=lambda c: c.gan_shens[0] == '比'),
+                Rule("母法总则P21-6", "母法总则P21-6：时干为比，如日时地支冲，男的对妻子不利，女的为夫辛劳，九流艺术、宗教则关系不大。", when=lambda c: c.gan_shens[3] == '比'),
+                Rule("月干比", None, when=lambda c: c.gan_shens[1] == '比', rules=[
+                    Rule("月柱比坐食", "月柱比坐食，易得贵人相助。", month_shen="食"),
+                    Rule("月柱比坐伤", "月柱比坐伤，一生只有小财气，难富贵。", month_shen="伤"),
+                    Rule("月柱比坐比", "月柱比坐比，单亲家庭，一婚不能到头。地支三合或三会比，天干2比也如此。", month_shen="比"),
+                    Rule("月柱比坐财", "月柱比坐财，不利妻，也主父母身体不佳。因亲友、人情等招财物的无谓损失。", month_shen="财"),
+                    Rule("月柱比坐杀", "月柱比坐杀，稳重。", month_shen="杀"),
+                ]),
+            ]),
+            Rule("比肩各柱", None, each=_gan("比"), rules=[
+                Rule("比肩坐空亡", "基51:比肩坐空亡，不利父亲与妻。年不利父，月不利父和妻，在时则没有关系。甲戌 丙寅 甲子 己巳\n\t基52女：夫妻缘分偏薄，在年只是不利父，在月30岁以前夫妻缘薄 E", when=lambda c: c.zhis[c.seq] in empties[c.zhus[2]]),
+                Rule("比坐比-平吉", "比坐比-平吉：与官杀对立，无主权。养子：克偏财，泄正印。吉：为朋友尽力；凶：受兄弟朋友拖累。父缘分薄，自我孤僻，男多迟婚", when=lambda c: c.zhi_shens[c.seq] == '比'),
+                Rule("女比肩坐劫", "女比肩坐劫:夫妻互恨，基52丁丑 壬子 壬戌 壬寅。\n\t还有刑冲且为羊刃，女恐有不测之灾：比如车祸、开刀和意外等。基52丙午 庚子 丙戌 丙申\n比坐劫-大凶：为忌亲友受损，合作事业中途解散，与妻子不合。如年月3见比，父缘薄或已死别。", when=lambda c: c.zhi_shens[c.seq] == '劫', rules=[
+                    Rule("比肩坐绝", "比肩坐绝，兄弟不多，或者很难谋面。戊己和壬癸的准确率偏低些。", when=lambda c: ten_deities[c.gans[c.seq]][c.zhis[c.seq]] == '绝' and c.seq < 2),
+                ]),
+                Rule("比肩坐财", "比肩坐财：因亲人、人情等原因引起无谓损失。", when=lambda c: c.zhi_shens[c.seq] == '财'),
+                Rule("比肩坐杀", "比肩坐杀:稳重。", when=lambda c: c.zhi_shens[c.seq] == '杀'),
+                Rule("比肩坐偏印", "比肩坐偏印：三五年发达，后面守成。", when=lambda c: c.zhi_shens[c.seq] == '枭'),
+                Rule("比肩坐阳刃", "比肩坐阳刃：父亲先亡，基于在哪柱判断时间。基51：丙午 丙申 丙申 丁酉。E在年不利父，在其他有刀伤、车祸、意外灾害。\t基52女命年克父亲，月若30岁以前结婚不利婚姻", when=lambda c: c.zhi_shens[c.seq] == '劫' and gan_nums[c.me] % 2 == 0),
+                Rule("比劫并立又坐比劫", "天干比劫并立，比肩又坐比劫，女多遇争夫，个性强，不易协调。", gan_shen="劫", when=lambda c: c.zhi_shens[c.seq] in ('劫', '比')),
+                Rule("比肩坐刑", "比肩坐刑(注意不是半刑)，幼年艰苦，白手自立长。 甲申 己巳 甲寅 庚午 基51", when=lambda c: c.zhi_xing[c.seq], rules=[
+                    Rule("比肩坐刑劫", "比肩坐刑劫,兄弟不合、也可能与妻子分居。", when=lambda c: c.zhi_shens[c.seq] == '劫'),
+                ]),
+                Rule("比肩冲", "比肩冲，手足不和，基于柱定时间 甲申 己巳 甲寅 庚午 基51。女命忌讳比劫和合官杀，多为任性引发困难之事。", when=lambda c: c.zhi_6chong[c.seq]),
+            ]),
+        ]),
+        Rule("日支比", "日支比：1-39对家务事有家长式领导；钱来得不容易且有时有小损财。e 自我，如有刑冲，不喜归家！", day_shen="比"),
+        Rule("时支比", "时支比：子女为人公正倔强、行动力强，能得资产。", time_shen="比"),
+        Rule("月柱比", "月柱比：三十岁以前难有成就。冒进、不稳定。女友不持久、大男子主义。", when=lambda c: '比' in (c.gan_shens[1], c.zhi_shens[1])),
+        Rule("时柱比", "时柱比：与亲人意见不合。", when=lambda c: '比' in (c.gan_shens[3], c.zhi_shens[3])),
+        Rule("比劫大于2", "比劫大于2，男：感情阻碍、事业起伏不定。", when=lambda c: c.shens.count('比') + c.shens.count('劫') > 1),
+    ]),
+    RuleSet('日禄', [
+        Rule("日坐禄", None, when=lambda c: c.me_lu == c.zhis[2], rules=[
+            Rule("双禄带比印", "双禄带比印（专旺）、孤克之命。比论孤，劫论凶。母法总则P20-3。比禄印劫不可合见四位", when=lambda c: c.zhis.count(c.me_lu) > 1 and c.yin_lu in c.zhis and ('比' in c.gan_shens or '劫' in c.gan_shens)),
+            Rule("透比坐禄六合", None, gan_shen="比", when=lambda c: c.zhi_6he[2], rules=[
+                Rule("坐禄六合有印", "透比，坐禄六合，有印专旺：官非、残疾。六合近似劫财，如地支会印，法死。 母法总则P20-4", when=lambda c: c.yin_lu in c.zhis),
+                Rule("坐禄六合", "透比，坐禄六合，如地支会印，法死。 母法总则P20-4"),
+            ]),
+            Rule("日禄与正财干合支刑", "日禄与正财干合支刑：克妻子，即便是吉命，也无天伦之乐。 母法总则P22-21", when=lambda c: c.zhi_xing[3] and c.gan_he[3] and (c.gan_shens[3] == '财') or (c.zhi_xing[2] and c.gan_he[2] and c.zhi_xing[1] and c.gan_he[1] and (c.gan_shens[1] == '财'))),
+        ]),
+        Rule("禄有三", "禄有三，孤。 母法总则P23-36", when=lambda c: c.zhis.count(c.me_lu) > 2),
+        Rule("时支日库透财", None, when=lambda c: c.zhis[3] == c.me_ku, rules=[
+            Rule("时支日库坐偏财", "时支日库，透财：清高、艺术九流。 母法总则P59-5 己未 辛未 丁巳 庚戌 P61-8 丁未 壬寅 癸卯 丙辰", when=lambda c: '财' in c.gan_shens or '才' in c.gan_shens),
+            Rule("时支日库", "时支日库，坐偏财：吉祥近贵，但亲属淡薄。 母法总则P59-6 辛未 辛卯 丁酉 庚戌", when=lambda c: c.piancai_lu == c.zhis[2]),
+        ]),
+        Rule("时坐禄", None, when=lambda c: c.me_lu == c.zhis[3], rules=[
+            Rule("时禄伤官格", "时禄，伤官格，晚年吉。 母法总则P56-26 己未 丙寅 乙丑 己卯", gan_shen="伤", when=lambda c: '伤' in c.zhi_shens2),
+            Rule("杀坐时禄", "杀坐时禄：为人反复不定。 母法总则P56-28 己未 丙寅 乙丑 己卯", when=lambda c: '杀' == c.gan_shens[3]),
+        ]),
+        Rule("自坐劫库时杀格", None, when=lambda c: c.zhis[2] == c.me_ku, rules=[
+            Rule("自坐劫库正官格", "自坐劫库,时杀格，贵！母法总则P30-143 辛未 辛卯 壬辰 戊申 母法总则P55-14 P60-22", when=lambda c: c.gan_shens[3] == '杀' and '杀' in c.zhi_shen3[3]),
+            Rule("自坐劫库时财库", "自坐劫库,正官格，孤贵！母法总则P56-24 辛未 辛卯 壬辰 戊申 母法总则P55-14", when=lambda c: c.gan_shens[3] == '官' and '官' in c.zhi_shen3[3]),
+            Rule("自坐劫库时正财格", "自坐劫库,时财库，另有刃禄孤刑艺术，无者辛劳！母法总则P30-149 母法总则P56-17 56-18", when=lambda c: zhi_ku(c.zhis[3], (c.cai, c.piancai))),
+            Rule("自坐劫库猝亡", "自坐劫库，时正财格，双妻，丧妻。 母法总则P55-13 己酉 戊寅 壬辰 丁未 P61-6 乙酉 戊寅 壬辰 丁未", when=lambda c: c.gan_shens[3] == '财' and '财' in c.zhi_shen3[3]),
+            Rule("自坐劫库", "自坐劫库,即便吉，也会猝亡 母法总则P61-9 丁丑 甲辰 壬辰 辛亥", when=lambda c: (c.yin, c.me_lu) in c.zhus),
+        ]),
+    ]),
+    RuleSet('劫财', [
+        Rule("劫财", """劫财扶助，无微不至。劫财多者谦虚之中带有傲气。凡事先理情，而后情理。先细节后全局。性刚强、精明干练、女命不适合干透支藏。
+务实，不喜欢抽象性的空谈。不容易认错，比较倔。有理想，但是不够灵活。不怕闲言闲语干扰。不顾及别人面子。
+合作事业有始无终。太重细节。做小领导还是可以的。有志向，自信。杀或食透干可解所有负面。女命忌讳比劫和合官杀，多为任性引发困难之事。""", gan_shen="劫", rules=[
+            Rule("劫年月天干并现", "劫年月天干并现：喜怒形于色，30岁以前大失败一次。过度自信，精明反被精明误。", when=lambda c: c.gan_shens[0] == '劫' and c.gan_shens[1] == '劫'),
+            Rule("月干劫", None, when=lambda c: c.gan_shens[1] == '劫', rules=[
+                Rule("月柱干支劫", "月柱干支劫：与父亲无缘，30岁以前任性，早婚防分手，自我精神压力极其重。", when=lambda c: '劫' in c.zhi_shen3[1]),
+                Rule("月干劫坐财禄印旺", "月干劫：月支财禄，如地支2旺印，旺财不敌，官非、刑名意外。", when=lambda c: c.zhis[1] == c.cai_lu and c.zhis.count(c.yin_lu) > 1),
+            ]),
+            Rule("劫财过多", "----劫财过多, 婚姻不好", when=lambda c: c.shens2.count('劫') > 2),
+            Rule("日坐劫财", "日坐劫财，透天干。在年父早亡，在月夫妻关系不好。比如财产互相防范；鄙视对方；自己决定，哪怕对方不同意；老夫少妻；身世有差距；斤斤计较；敢爱敢恨的后遗症\n\t以上多针对女。男的一般有双妻。天干有杀或食可解。基54丁未 己酉 丙午 己丑", day_shen="劫"),
+        ]),
+        Rule("日主专位劫财", "日主专位劫财，壬子和丙午，晚婚。不透天干，一般是眼光高、独立性强。对配偶不利，互相轻视；若刑冲，做事立场不明遭嫉妒，但不会有大灾。女性婚后通常还有自己的事业,能办事。", when=lambda c: c.zhus[2] in (('壬', '子'), ('丙', '午'), ('戊', '午'))),
+        Rule("劫伤同柱", "同一柱中，劫财、阳刃伤官都有，外表华美，富屋穷人，婚姻不稳定，富而不久；年柱不利家长，月柱不利婚姻，时柱不利子女。伤官的狂妄。基55丙申 丁酉 甲子 丁卯", when=lambda c: ('劫', '伤') in c.shen_zhus or ('伤', '劫') in c.shen_zhus),
+        Rule("年干劫财", "年干劫财：家运不济。克父，如果坐劫财，通常少年失父；反之要看地支劫财根在哪一柱子。", when=lambda c: c.gan_shens[0] == '劫'),
+        Rule("月柱劫", "月柱劫：容易孤注一掷，30岁以前难稳定。男早婚不利。", when=lambda c: '劫' in (c.gan_shens[1], c.zhi_shens[1])),
+        Rule("时柱劫", "时柱劫：只要不是去经济大权还好。", when=lambda c: '劫' in (c.gan_shens[3], c.zhi_shens[3])),
+        Rule("日支劫", "日支劫：男的克妻，一说是家庭有纠纷，对外尚无重大损失。如再透月或时天干，有严重内忧外患。", day_shen="劫"),
+        Rule("阴干比劫印齐全", "阴干比劫印齐全，单身，可入道！", when=lambda c: '劫' in c.shens2 and '比' in c.zhi_shens and '印' in c.shens2 and not_yang(c.me)),
+        Rule("年阳刃", "年阳刃：得不到长辈福；不知足、施恩反怨。", when=lambda c: c.zhi_shens[0] == '劫' and is_yang(c.me)),
+        Rule("时阳刃", "时阳刃：与妻子不和，晚无结果，四柱再有比刃，有疾病与外灾。", time_shen="劫", when=lambda c: is_yang(c.me)),
+        Rule("阳刃格", "阳刃格：喜七杀或三四个官。基础90 甲戊庚逢冲多祸，壬丙逢冲还好。", month_shen="劫", when=lambda c: is_yang(c.me), add_ge="刃", rules=[
+            Rule("阳刃庚壬戊", "阳刃'庚', '壬','午'忌讳正财运。庚逢辛酉凶，丁酉吉，庚辰和丁酉六合不凶。壬逢壬子凶，戊子吉；壬午和戊子换禄不凶。", when=lambda c: c.me in ('庚', '壬', '戊')),
+            Rule("阳刃甲丙", "阳刃'甲', '丙',忌讳杀运，正财偏财财库运还好。甲：乙卯凶，辛卯吉；甲申与丁卯暗合吉。丙：丙午凶，壬午吉。丙子和壬午换禄不凶。", when=lambda c: not (c.me in ('庚', '壬', '戊'))),
+            Rule("阳刃格月干为劫", "阳刃格月干为劫：如果印禄位有2个，过旺，凶灾。不透劫财，有一印禄,食伤泄，仍然可以吉。 母法总则P20-1", when=lambda c: c.zhis.count(c.yin_lu) > 0 and c.gan_shens[1] == '劫'),
+            Rule("阳刃格时偏印", "阳刃格:时柱成偏印格，贫、夭、带疾。 母法总则P28-107 癸未 辛酉 庚寅 戊寅", when=lambda c: c.gan_shens[3] == '枭' and '枭' in c.zhi_shen3[3]),
+        ]),
+        Rule("双阳刃", "双阳刃，自坐印专位：刑妻、妨子。凶终、官非、意外灾害。母法总则P21-13", when=lambda c: c.zhi_shens.count('劫') > 1 and gan_nums[c.me] % 2 == 0 and c.zhis.day == c.yin_lu),
+        Rule("阳刃坐印透比劫", "阳刃，自坐印专位，透比或劫：刑妻。母法总则P36-8 己酉 丁卯 甲子 乙亥", when=lambda c: c.zhi_shens[1:].count('劫') > 0 and gan_nums[c.me] % 2 == 0 and c.zhis.day == c.yin_lu and ('劫' in c.gan_shens or '比' in c.gan_shens)),
+        Rule("日时禄刃全", "日时禄刃全，如没有官杀制，刑伤父母，妨碍妻子。母法总则P30-151 丁酉 癸卯 壬子 辛亥 母法总则P31-153 ", when=lambda c: c.zhis[2] in (c.me_lu, c.me_di) and c.zhis[3] in (c.me_lu, c.me_di)),
+        Rule("劫财各柱", None, each=_gan("劫"), rules=[
+            Rule("劫财坐财禄", "劫财坐财禄，如逢冲，大凶。先冲后合和稍缓解！母法总则P21-7 书上实例不准！", when=lambda c: c.zhis[c.seq] in (c.cai_lu, c.piancai_lu), rules=[
+                Rule("劫财坐六合财支", "劫财坐六合财支：久疾暗病！母法总则P28-113 乙未 丙戌 辛亥 庚寅！", when=lambda c: c.zhi_shens[c.seq] == '财' and c.zhi_6he[c.seq]),
+            ]),
+        ]),
+        Rule("月干劫坐财禄有2印禄", "月干劫坐财禄，有2印禄，劫透，财旺也败：官非、刑名、意外灾害！  母法总则P20-2", gan_shen="劫", when=lambda c: c.gan_shens[1] == '劫' and c.zhis[1] in (c.cai_lu, c.piancai_lu) and c.zhis.count(c.yin_lu) > 1),
+        Rule("自坐阳刃", None, when=lambda c: '劫' in c.zhi_shen3[2] and is_yang(c.me) and c.zhis[2] in zhengs, rules=[
+            Rule("坐阳刃时支财禄", "坐阳刃,时支财禄，吉祥但是妻子性格不受管制！母法总则P30-137 丁未 庚戌 壬子 乙巳", when=lambda c: c.zhis[3] in (c.cai_lu, c.piancai_lu)),
+            Rule("坐阳刃时支财库", "坐阳刃,时支财库，名利时进时退！母法总则P30-148 丙寅 壬寅 壬子 庚戌", when=lambda c: zhi_ku(c.zhis[3], (c.cai, c.piancai))),
+            Rule("坐阳刃时杀格", "坐阳刃,时杀格，贵人提携而富贵！母法总则P30-143 甲戌 丙寅 壬子 戊申", when=lambda c: c.gan_shens[3] == '杀' and '杀' in c.zhi_shen3[3]),
+        ]),
+    ]),
+    RuleSet('偏印', [
+        Rule("偏印", """----偏印在天干如成格：偏印在前，偏财(财次之)在后，有天月德就是佳命(偏印格在日时，不在月透天干也麻烦)。忌讳倒食，但是坐绝没有这能力。
+经典认为：偏印不能扶身，要身旺；偏印见官杀未必是福；喜伤官，喜财；忌日主无根；   女顾兄弟姐妹；男六亲似冰
+偏印格干支有冲、合、刑，地支是偏印的绝位也不佳。""", gan_shen="枭", rules=[
+            Rule("枭月重叠", "枭月重叠：福薄慧多，青年孤独，有文艺宗教倾向。", when=lambda c: c.gan_shens[1] == '枭' and '枭' in c.zhi_shen3[1]),
+            Rule("偏印根透2柱", "偏印根透2柱，孤独有色情之患难。做事有始无终，女声誉不佳！pd40", when=lambda c: c.zhi_shens2.count('枭') > 1),
+            Rule("偏印成格", "偏印成格基础89生财、配印；最喜偏财同时成格，偏印在前，偏财在后。最忌讳日时坐实比劫刃。", when=lambda c: c.zhi_shens2.count('枭'), add_ge="枭"),
+            Rule("偏印过多", """偏印过多，性格孤僻，表达太含蓄，要别人猜，说话有时带刺。偏悲观。有偏财和天月德贵人可以改善。有艺术天赋。做事大多有始无终。如四柱全阴，女性声誉不佳。
+对兄弟姐妹不错。男的因才干受子女尊敬。女的偏印多，子女不多。第1克伤食，第2艺术性。""", when=lambda c: c.shens2.count('枭') > 2, rules=[
+                Rule("女命偏印多", "女命偏印多，又与伤官同透，夫离子散。有偏财和天月德贵人可以改善。", gan_shen="伤"),
+            ]),
+            Rule("天干两个偏印", "天干两个偏印：迟婚，独身等，婚姻不好。三偏印，家族人口少，亲属不多建。基56甲午 甲戌 丙午 丙申", when=lambda c: c.gan_shens.count('枭') > 1),
+            Rule("偏印在年干支", "偏印在年，干支俱透，不利于长辈。偏母当令，正母无权，可能是领养，庶出、同父异母等。 基56乙卯 甲申 丁丑 丁未", when=lambda c: c.shen_zhus[0] == ('枭', '枭')),
+            Rule("月专位偏印", "月专位偏印：有手艺。坐衰其貌不扬。", when=lambda c: c.zhi_shen3[1] == ['枭']),
+        ]),
+        Rule("偏印各柱", None, each=lambda c: [seq for seq in range(4) if '枭' in (c.gan_shens[seq], c.zhi_shens[seq])], rules=[
+            Rule("偏印坐绝", "偏印坐绝，或者天干坐偏印为绝，难以得志。费力不讨好。基56辛酉 辛卯 丁巳 甲辰  丁卯 丁未 己丑 丁卯", when=lambda c: ten_deities[c.gans[c.seq]][c.zhis[c.seq]] == '绝'),
+            Rule("天干偏印", None, when=lambda c: c.gan_shens[c.seq] == '枭', rules=[
+                Rule("干支都与偏印", "干支都与偏印，克夫福薄！", when=lambda c: '枭' in c.zhi_shen3[c.seq]),
+                Rule("偏印坐比", "偏印坐比：劳心劳力，常遇阴折 pd41", when=lambda c: '比' in c.zhi_shen3[c.seq]),
+                Rule("偏印坐伤官", "偏印坐伤官：克夫丧子 pd41", when=lambda c: c.zhi_shens[c.seq] == '伤'),
+            ]),
+        ]),
+        Rule("偏印透年干-时支", "偏印透年干-时支，一直受家里影响。", time_shen="枭", when=lambda c: c.gan_shens[0] == '枭'),
+        Rule("偏印在年", "偏印在年：少有富贵家庭；有宗教素养，不喜享乐，第六感强。", when=lambda c: '枭' in (c.gan_shens[0], c.zhi_shens[0])),
+        Rule("偏印在月", "偏印在月：有慧少福，能舍己为人。", when=lambda c: '枭' in (c.gan_shens[1], c.zhi_shens[1]), rules=[
+            Rule("偏印专位在月支", "偏印专位在月支：比较适合音乐，艺术，宗教等。子午卯酉。22-30之间职业定型。基56：壬午 癸卯 丁丑 丁未", month_shen="枭", when=lambda c: c.zhis[1] in '子午卯酉', rules=[
+                Rule("干支偏印月柱", "干支偏印月柱，专位入格，有慧福浅，不争名利。基57:戊子 辛酉 癸未 丁巳", when=lambda c: c.gan_shens[1] == '枭'),
+            ]),
+        ]),
+        Rule("偏印在时", "偏印在时：女与后代分居；男50以前奠定基础，晚年享清福。", when=lambda c: '枭' in (c.gan_shens[3], c.zhi_shens[3])),
+        Rule("偏印在日支", "偏印在日支：家庭生活沉闷", when=lambda c: c.zhi_shens[2] == '枭' or c.zhis.day == c.xiao_lu, rules=[
+            Rule("偏印在日支冲刑", "偏印在日支(专位？),有冲刑：孤独。基57：甲午 癸酉 丁卯 丁未 母法总则P55-5： 辛丑 辛卯 癸酉 戊午 P77-13", when=lambda c: c.zhi_6chong[2] or c.zhi_xing[2]),
+            Rule("日专坐偏印", "日专坐偏印：丁卯和癸酉。婚姻不顺。又刑冲，因性格而起争端而意外伤害。 基56", when=lambda c: c.zhus[2] in (('丁', '卯'), ('癸', '酉'))),
+            Rule("日坐偏印日支绝", "日坐偏印，日支绝：无亲人依靠，贫乏。 母法总则P55-5：丙辰 丙申 丁卯 壬子。pd41 专位偏印：男女姻缘都不佳。", when=lambda c: c.zhis[3] == c.me_jue),
+            Rule("日坐偏印成格", "日坐偏印成格，时支阳刃：不利妻子，自身有疾病。 母法总则P55-6：甲子 甲戌 丙寅 甲午", gan_shen="枭", when=lambda c: is_yang(c.me) and c.zhis.time == c.me_di),
+            Rule("日坐偏印时干支劫", "日坐偏印，时干支劫：因自己性格而引灾。 母法总则P57-34：甲子 甲戌 丙寅 甲午", when=lambda c: c.gan_shens[3] == c.zhi_shens[3] == '劫'),
+            Rule("日坐偏印双阳刃", "日坐偏印，地支双阳刃：性格有极端倾向。 母法总则P57-35：甲申 庚午 丙寅 甲午", when=lambda c: c.zhis.count(c.me_di) > 1 and is_yang(c.me)),
+        ]),
+        Rule("时支偏印成格", None, time_shen="枭", gan_shen="枭", when=lambda c: c.zhis.time == c.xiao_lu, rules=[
+            Rule("时支偏印成格有财", "时支偏印成格有财：因机智引凶。 母法总则P60-18：甲申 乙亥 丁亥 癸卯", when=lambda c: '财' in c.shens2 or '才' in c.shens2),
+            Rule("时支偏印成格无财", "时支偏印成格无财：顽固引凶。 母法总则P60-17：甲子 乙亥 丁亥 癸卯", when=lambda c: not ('财' in c.shens2 or '才' in c.shens2)),
+        ]),
+    ]),
+    RuleSet('正印', [
+        Rule("正印", None, gan_shen="印", rules=[
+            Rule("基础82", "基础82，成格喜官杀、身弱、忌财克印。合印留财，见利忘义.透财官杀通关或印生比劫；合冲印若无他格或调候破格。日主强凶，禄刃一支可以食伤泄。", when=lambda c: '印' in c.zhi_shens2, add_ge="印"),
+            Rule("印月重叠", "印月重叠：女迟婚，月阳刃者离寡，能独立谋生，有修养的才女。", when=lambda c: c.gan_shens[1] == '印' and '印' in c.zhi_shen3[1]),
+            Rule("年干印为喜", "年干印为喜：出身于富贵之家。", when=lambda c: c.gan_shens[0] == '印'),
+            Rule("正印多的", "正印多的：聪明有谋略，比较含蓄，不害人，识时务。正印不怕日主死绝，反而怕太强。日主强，正印多，孤寂，不善理财。 pd41男的克妻，子嗣少。女的克母。", when=lambda c: c.shens2.count('印') > 2),
+            Rule("正印各柱", None, each=_gan("印"), rules=[
+                Rule("正印坐死绝", "正印坐死绝，或天干正印地支有冲刑，不利母亲。时柱不算。", when=lambda c: ten_deities[c.gans[c.seq]][c.zhis[c.seq]] in ('绝', '死') and c.seq < 3),
+                Rule("男正印坐正财", "男正印坐正财，夫妻不好。月柱正印坐正财专位，必离婚。在时柱，50多岁才有正常婚姻。(男) 基59 乙酉 己卯 庚子 丁亥  庚申 庚辰 庚午 己卯", when=lambda c: c.zhi_shens[c.seq] == '财'),
+                Rule("正印坐正印", "正印坐正印，专位，过于自信。基59：戊辰 乙卯 丙申 丙申。务实，拿得起放得下。女的话大多晚婚。母长寿；女子息迟，头胎恐流产。女四柱没有官杀，没有良缘。男的搞艺术比较好，经商则孤僻，不聚财。", when=lambda c: c.zhi_shens[c.seq] == '印'),
+                Rule("正印坐偏印专位", "正印坐偏印专位：基59壬寅 壬子 乙酉 甲申。有多种职业;家庭不吉：亲人有疾或者特别嗜好。子息迟;财务双关。明一套，暗一套。女的双重性格。", when=lambda c: c.zhi_shens[c.seq] == '枭' and len(zhi5[c.zhis[c.seq]]) == 1),
+                Rule("正印坐伤官", "正印坐伤官：适合清高的职业。不适合追逐名利，女的婚姻不好。基59辛未 丁酉 戊子 丙辰", when=lambda c: c.zhi_shens[c.seq] == '伤'),
+                Rule("正印坐阳刃", "正印坐阳刃，身心多伤，心疲力竭，偶有因公殉职。主要指月柱。工作看得比较重要。", when=lambda c: c.zhi_shens[c.seq] == '劫' and c.me in ('甲', '庚', '壬')),
+            ]),
+            Rule("正印、七杀、阳刃全", "正印、七杀、阳刃全：基60癸巳 庚申 甲寅 丁卯：女命宗教人，否则独身，清高，身体恐有隐疾，性格狭隘缺耐心。男小疾多，纸上谈兵，婚姻不佳，恐非婚生子女，心思细腻对人要求也高。", gan_shen="杀", when=lambda c: '劫' in c.zhi_shens and c.me in ('甲', '庚', '壬')),
+            Rule("身弱官杀和印都透天干", "身弱官杀和印都透天干，格局佳。", when=lambda c: '官' in c.gan_shens or '杀' in c.gan_shens),
+            Rule("单独正印主秀气、艺术、文才", "单独正印主秀气、艺术、文才。性格保守", when=lambda c: not ('官' in c.gan_shens or '杀' in c.gan_shens)),
+            Rule("正印多者", "正印多者，有比肩在天干，不怕财。有官杀在天干也不怕。财不强也没关系。", when=lambda c: '官' in c.gan_shens or '杀' in c.gan_shens or '比' in c.gan_shens),
+            Rule("正印怕财", "正印怕财。", when=lambda c: not ('官' in c.gan_shens or '杀' in c.gan_shens or '比' in c.gan_shens)),
+            Rule("印和财都透天干", "印和财都透天干，都有根，最好先财后印，一生吉祥。先印后财，能力不错，但多为他人奔波。(男)", gan_shen="财"),
+        ]),
+        Rule("月支印", "月支印：女命觉得丈夫不如自己，分居是常态，自己有能力。", month_shen="印", rules=[
+            Rule("月干支印", "月干支印：男权重于名，女命很自信，与夫平权。pd41:聪明有权谋，自我", when=lambda c: c.gan_shens[1] == '印', rules=[
+                Rule("月干支印格", "月干支印格，透比，有冲亡。", gan_shen="比"),
+            ]),
+        ]),
+        Rule("日坐印", None, day_shen="印", rules=[
+            Rule("坐印时偏财格", "坐印，时偏财格：他乡发迹，改弦易宗，妻贤子孝。 母法总则：P55-1 丁丑 丁未 甲子 戊辰", when=lambda c: c.gan_shens[3] == '才' and '才' in c.zhi_shen3[3]),
+            Rule("坐印时正财格", "坐印，时财正格：晚年发达，妻贤子不孝。 母法总则：P55-2 乙酉 丙申 甲子 己巳", when=lambda c: c.gan_shens[3] == '财' and ('财' in c.zhi_shen3[3] or c.zhis[3] in (c.cai_di, c.cai_lu))),
+        ]),
+        Rule("时支专位正印", "时支专位正印。男忙碌到老。女的子女各居一方。亲情淡薄。", time_shen="印", when=lambda c: c.zhis[3] in zhengs),
+        Rule("时柱正印格", "时柱正印格，不论男女，老年辛苦。女的到死都要控制家产。子女无缘。", when=lambda c: c.gan_shens[3] == '印' and '印' in c.zhi_shen3[3]),
+        Rule("印枭在年干月干", "印枭在年干月干，性格迂腐，故作清高，女子息迟，婚姻有阻碍。印枭在时干，不利母子，性格不和谐。", when=lambda c: c.gan_shens.count('印') + c.gan_shens.count('枭') > 1),
+        Rule("印或枭在月支", "印或枭在月支，有压制丈夫的心态。", when=lambda c: c.zhis[1] in (c.yin_lu, c.xiao_lu)),
+        Rule("印或枭在时支", "印或枭在时支，夫灾子寡。", when=lambda c: c.zhis[3] in (c.yin_lu, c.xiao_lu)),
+        Rule("自坐印库", None, when=lambda c: zhi_ku(c.zhis[2], (c.yin, c.xiao)), rules=[
+            Rule("母法总则P21-5", "母法总则P21-5: 日坐印库，又成印格，意外伤残，凶终。过旺。", when=lambda c: c.shens2.count('印') > 2),
+            Rule("自坐印库时阳刃", "自坐印库，时阳刃。带比禄印者贫，不带吉。 母法总则P21-14", time_shen="劫"),
+        ]),
+        Rule("月干支印透比", "月干支印，印旺，透比，旺而不久，冲亡。母法总则P21-8", month_shen="印", gan_shen="比", when=lambda c: c.zhis.count('印') > 1 and c.gan_shens[1] == '印'),
+        Rule("母法总则P22-18", "母法总则P22-18 自坐正印专旺，成财格，移他乡易宗，妻贤子孝。", when=lambda c: c.zhis[1] == c.yin_lu and ('财' in c.gan_shens and '财' in c.zhi_shens or ('才' in c.gan_shens and '才' in c.zhi_shens))),
+    ]),
+    RuleSet('偏财', [
+        Rule("偏财明现天干", """偏财明现天干，不论是否有根:财富外人可见;实际财力不及外观一半。没钱别人都不相信;协助他人常超过自己的能力
+偏财出天干，又与天月德贵人同一天干者。在年月有声明远扬的父亲，月时有聪慧的红颜知己。喜奉承。
+偏财透天干，四柱没有刑冲，长寿。女子为孝顺女，主要针对年月。时柱表示中年以后有自己的事业，善于理财。""", gan_shen="才", rules=[
+            Rule("财格基础80", "财格基础80:比劫用食伤通关或官杀制；身弱有比劫仍然用食伤通关。如果时柱坐实比劫，晚年破产。", when=lambda c: '才' in c.zhi_shens2, add_ge="才"),
+            Rule("偏财透天干", "偏财透天干，讲究原则，不拘小节。喜奉承，善于享受。财格基础80"),
+            Rule("年月比劫", "年月比劫，时干透出偏财。祖业凋零，再白手起家。有刑冲为千金散尽还复来", when=lambda c: '比' in c.gan_shens or ('劫' in c.gan_shens and c.gan_shens[3] == '才')),
+            Rule("偏财和七杀并位", "偏财和七杀并位，地支又有根，父子外合心不合。因为偏财生杀攻身。偏财七杀在日时，则为有难伺候的女朋友。 基62壬午 甲辰 戊寅 癸亥", gan_shen="杀", when=lambda c: '杀' in c.zhi_shens),
+            Rule("偏财根透年柱", "偏财根透年柱，家世良好，且能承受祖业。", when=lambda c: c.zhi_shens[0] == '才'),
+            Rule("偏财各柱", None, each=_pillars, rules=[
+                Rule("偏财坐阳刃劫财", "偏财坐阳刃劫财,可做父缘薄，也可幼年家贫。也可以父先亡，要参考第一大运。偏财坐专位阳刃劫财,父亲去他乡.基61壬午 壬寅 戊子 丁巳", when=lambda c: '劫' in c.zhi_shen3[c.seq] and c.zhis[c.seq] in zhengs),
+                Rule("偏财坐空亡", "偏财坐空亡，财官难求。", when=lambda c: get_empty(c.zhus[2], c.zhis[c.seq]) == '空'),
+            ]),
+        ]),
+        Rule("偏财多的人慷慨", """偏财多的人慷慨，得失看淡。花钱一般不会后悔。偏乐观，甚至是浮夸。生活习惯颠倒。适应能力强。有团队精神。得女性欢心。小事很少失信。
+乐善好施，有团队精神，女命偏财，听父亲的话。时柱偏财女，善于理财，中年以后有事业。""", when=lambda c: c.shens2.count('才') > 2),
+        Rule("日时地支坐专位偏财", "日时地支坐专位偏财。不见刑冲，时干不是比劫，大运也没有比劫刑冲，晚年发达。", when=lambda c: c.zhi_shens[2] == '才' and len(zhi5[c.zhis[2]]) == 1 or (c.zhi_shens[3] == '才' and len(zhi5[c.zhis[3]]) == 1)),
+    ]),
+    RuleSet('正财', [
+        Rule("财或偏财月重叠", "财或偏财月重叠：女职业妇女，有理财办事能力。因自己理财能力而影响婚姻。一财得所，红颜失配。男的双妻。", when=lambda c: c.gan_shens[0] in ('财', '才') and c.gan_shens[1] in ('财', '才') or (c.gan_shens[1] in ('财', '才') and ('财' in c.zhi_shen3[1] or '才' in c.zhi_shen3[1]))),
+        Rule("正财", None, gan_shen="财", rules=[
+            Rule("正财格", None, when=lambda c: '财' in c.zhi_shens2, add_ge="财"),
+            Rule("男日主合财星", "男日主合财星，夫妻恩爱。如果争合或天干有劫财，双妻。", when=lambda c: is_yang(c.me)),
+            Rule("财格基础80", "财格基础80:比劫用食伤通关或官杀制；身弱有比劫仍然用食伤通关。", when=lambda c: '财' in c.zhi_shens),
+            Rule("正官正财并行透出", "正官正财并行透出，(身强)出身书香门第。", gan_shen="官"),
+            Rule("官或杀与财并行透出", "官或杀与财并行透出，女压夫，财生官杀，老公压力大。", when=lambda c: '官' in c.gan_shens or '杀' in c.gan_shens),
+            Rule("年干正财若为喜", "年干正财若为喜，富裕家庭，但不利母亲。", when=lambda c: c.gan_shens[0] == '财'),
+            Rule("男财旺透官杀", "男财旺透官杀，女厌夫。", when=lambda c: '财' in c.zhi_shens and ('官' in c.gan_shens or '杀' in c.gan_shens)),
+            Rule("天干两正财", "天干两正财，财源多，大多做好几种生意，好赶潮流，人云亦云。有时会做自己外行的生意。", when=lambda c: c.gan_shens.count('财') > 1, rules=[
+                Rule("正财多而无根虚而不踏实", "正财多而无根虚而不踏实。重财不富。", when=lambda c: '财' not in c.zhi_shens2),
+            ]),
+        ]),
+        Rule("正财各柱", None, each=_gan("财"), rules=[
+            Rule("女柱有财+驿马", "女柱有财+驿马，动力持家。", when=lambda c: c.zhis[c.seq] in day_shens['驿马'][c.zhis.day] and c.seq != 2),
+            Rule("女柱有财+桃花", "女柱有财+桃花，不吉利。", when=lambda c: c.zhis[c.seq] in day_shens['桃花'][c.zhis.day] and c.seq != 2),
+            Rule("财坐空亡", "财坐空亡，不持久。", when=lambda c: c.zhis[c.seq] in empties[c.zhus[2]]),
+            Rule("男财坐绝或墓", "男财坐绝或墓，不利婚姻。", when=lambda c: ten_deities[c.gans[c.seq]][c.zhis[c.seq]] in ('绝', '墓')),
+        ]),
+        Rule("正财多者", "正财多者，为人端正，有信用，简朴稳重。", when=lambda c: c.shens2.count('财') > 2, rules=[
+            Rule("正财多而有根", "正财多而有根，日主不在生旺库，身弱惧内。", when=lambda c: '财' in c.zhi_shens2 and c.me not in c.zhi_shens2),
+        ]),
+        Rule("女命月支正财", "女命月支正财，有务实的婚姻观。", month_shen="财", female=True),
+        Rule("月令正财", "月令正财，无冲刑，有贤内助，但是母亲与妻子不和。生活简朴，多为理财人士。", month_shen="财"),
+        Rule("时支正财", "时支正财，一般两个儿子。", time_shen="财", when=lambda c: len(zhi5[c.zhis[3]]) == 1),
+        Rule("日支专位正财", "日支专位正财，得勤俭老婆。即戊子。日时专位支正财，又透正官，中年以后发达，独立富贵。", when=lambda c: c.zhus[2] in (('戊', '子'),) or c.zhus[3] in (('戊', '子'),)),
+        Rule("坐财官印", "坐财官印，只要四柱没有刑冲，大吉！", when=lambda c: c.zhus[2] in (('壬', '午'), ('癸', '巳'))),
+        Rule("女", "女('甲','戌'),('乙','亥'） 晚婚 -- 不准！", when=lambda c: c.zhus[2] in (('甲', '戌'), ('乙', '亥'))),
+        Rule("未必准确", "未必准确：时柱有正财，口快心直，不喜拖泥带水，刑冲则浮躁。阳刃也不佳.反之有美妻佳子", when=lambda c: '财' == c.gan_shens[3] or '财' == c.zhi_shens[3]),
+        Rule("四柱无财", "四柱无财，即便逢财运，也是虚名虚利. 男的晚婚", when=lambda c: not '财' in c.shens2 and not '才' in c.shens2),
+        Rule("自坐财禄", None, when=lambda c: c.zhis.day in (c.cai_lu, c.cai_di), rules=[
+            Rule("自坐财禄月时阳刃", "自坐财禄，月支或时支为阳刃，凶。无冲是非多，冲刑主病灾。 母法总则P22-15  母法总则P36-4 丙寅 戊戌 甲午 丁卯 P56-32 己未 丙寅 丙申 甲午", when=lambda c: (c.zhi_shens[1] == '劫' or c.zhi_shens[3] == '劫') and gan_nums[c.me] % 2 == 0),
+            Rule("自坐财禄透劫", "自坐财禄，透劫财，有阳刃，刑妻无结局。 母法总则P36-7 戊子 乙卯 甲午 乙亥", gan_shen="劫", when=lambda c: '劫' in c.zhi_shens and gan_nums[c.me] % 2 == 0),
+            Rule("火土代用财", "火土代用财，如果透财，多成多败，早年灰心。 母法总则P22-19 辛未 癸巳 甲午 戊辰", when=lambda c: c.me in ('甲', '乙') and ('戊' in c.gans or '己' in c.gans)),
+            Rule("财禄时干偏印", "财禄时干偏印：主亲属孤独 母法总则P31-158 丁丑 丙午 甲辰 己巳", when=lambda c: c.gan_shens[3] == '枭', rules=[
+                Rule("财禄时干偏印格", "财禄时干偏印格：财虽吉、人丁孤单、性格艺术化 母法总则P56-20 己巳 丙辰 甲午 壬申", when=lambda c: '枭' in c.zhi_shen3[3]),
+            ]),
+            Rule("坐财禄", "坐财禄，时支印禄：先难后易 母法总则P30-147 甲申 己巳 壬午 己酉 母法总则P55-16", when=lambda c: c.zhis[3] == c.yin_lu),
+        ]),
+        Rule("日主合财且进角合", "日主合财且进角合：一生吉祥、平安有裕！ 母法总则P22-22 丁丑 丙午 甲辰 己巳", when=lambda c: c.gan_he[3] and c.gan_shens[3] == '财' and jin_jiao(c.zhis[2], c.zhis[3]) or (c.gan_he[2] and c.gan_he[1] and (c.gan_shens[1] == '财') and jin_jiao(c.zhis[1], c.zhis[2]))),
+        Rule("日坐财", None, when=lambda c: c.zhis.day == c.cai_lu or c.zhi_shens[2] == '财', rules=[
+            Rule("日坐财时偏印格", "日坐财，时偏印格：他乡有成，为人敦厚。母法总则P55-4 甲寅 辛未 甲午 壬申", when=lambda c: c.gan_shens[3] == '枭' and ('枭' in c.zhi_shen3[3] or c.zhis[3] == c.xiao_lu)),
+            Rule("日坐财冲刑", "日坐财，有冲或刑：财吉而有疾。母法总则P55-10 丙寅 戊戌 甲午 甲子", when=lambda c: c.zhi_6chong[2] or c.zhi_xing[2]),
+        ]),
+        Rule("正财坐日库于时柱", "正财坐日库于时柱:孤独、难为父母，但事业有成。 母法总则P31-156 丁丑 丙午 甲辰 己巳", when=lambda c: c.gan_shens[3] == '财' and zhi_ku(c.zhis[3], (c.me, c.jie))),
+        Rule("自坐财库", None, when=lambda c: c.zhis[2] == c.cai_ku, rules=[
+            Rule("自坐财库时劫库", "自坐财库,时劫库：有财而孤单。 母法总则P30-136 丁丑 丙午 甲辰 己巳 母法总则P55-11 P61-5 甲子 己巳 壬戌 甲辰", when=lambda c: c.zhis[3] == c.me_ku),
+            Rule("自坐财库时财库", "自坐财库,时坐财库：妻有灾，妻反被妾制服。 母法总则P30-150 辛酉 乙未 壬戌 庚戌 母法总则P56-19", when=lambda c: c.zhis[2] == c.zhis[3]),
+            Rule("自坐财库时杀格", "自坐财库,时杀格，财生杀，凶！母法总则P30-147 甲寅 己巳 壬戌 戊申 有可能是时柱有杀就算。 母法总则P55-15", when=lambda c: c.gan_shens[3] == '杀' and '杀' in c.zhi_shen3[3]),
+        ]),
+        Rule("时坐财库", "时坐财库,伤官生财:财好，体弱，旺处寿倾倒！母法总则P59-8 戊申 辛酉 戊子 丙辰", gan_shen="伤", when=lambda c: zhi_ku(c.zhis[3], (c.cai, c.piancai)) and '伤' in c.zhi_shens),
+        Rule("时上正财格", "时上正财格:不必财旺，因妻致富。 母法总则P30-140 丙午 戊戌 壬寅 丁未 母法总则P60-21", when=lambda c: c.gan_shens[3] == '财' and '财' in c.zhi_shen3[3], rules=[
+            Rule("时上正财格坐比劫库", "时上正财格坐比劫库，克妻。 母法总则P30-141 丙午 戊戌 壬寅 丁未", when=lambda c: c.zhis[3] == c.me_ku),
+            Rule("时上正财格自坐财库", "时上正财格自坐财库，妻佳，中年丧妻，续弦也佳。 母法总则P30-142 庚子 辛巳 壬戌 丁未 P61-7", when=lambda c: c.zhis[2] == c.cai_ku),
+        ]),
+        Rule("时支财禄旺", None, when=lambda c: c.zhis[3] in (c.cai_di, c.cai_lu), rules=[
+            Rule("时财禄", "时财禄，天干日时双合，损妻家财。 母法总则P31-157 庚戌 戊寅 癸酉 戊午", when=lambda c: c.gan_he[3]),
+            Rule("时支正财时干伤成格", "时支正财时干伤成格：虽富有也刑克。 母法总则P59-1 丁丑 壬寅 丁巳 戊申", when=lambda c: '伤' == c.gan_shens[3] and '伤' in c.zhi_shens2),
+            Rule("时支正财禄月支伤墓", "时支正财禄，月支伤入墓：生财极为辛勤。 母法总则P59-4 甲子 戊辰 庚戌 己卯", when=lambda c: zhi_ku(c.zhis[1], (c.shi, c.shang)) and c.zhis[3] == c.cai_lu),
+        ]),
+        Rule("时支正财禄", None, when=lambda c: c.zhis[3] == c.cai_lu, rules=[
+            Rule("时支正财禄有冲刑", "时支正财禄有冲刑：得女伴且文学清贵。 母法总则P60-11 丁丑 辛亥 己巳 乙亥", when=lambda c: c.zhi_xing[3] or c.zhi_6chong[3]),
+            Rule("时支正财禄它支冲刑", "时支正财禄,它支有冲刑：刑妻、孤高、艺术、近贵人。 母法00总则P60-19 乙未 己丑 庚寅 己卯", when=lambda c: any(c.zhi_xing[:3]) or any(c.zhi_6chong[:3])),
+            Rule("时支正财禄财星多", "时支正财禄,天干财星多：孤雅、九流、表面风光。 母法总则P60-20 乙酉 乙酉 庚辰 己卯", when=lambda c: c.gan_shens.count('财') > 1),
+        ]),
+    ]),
+    RuleSet('正官', [
+        Rule("正官", None, gan_shen="官", rules=[
+            Rule("官若成格", "官若成格：忌伤；忌混杂；基础78。有伤用财通关或印制。混杂用合或者身官两停。日主弱则不可扶。", when=lambda c: '官' in c.zhi_shens2, add_ge="官", rules=[
+                Rule("官格透比或劫", "官格透比或劫：故做清高或有洁癖的文人。", when=lambda c: '比' in c.gan_shens or '劫' in c.gan_shens),
+                Rule("官格透伤", "官格透伤：表里不一。", gan_shen="伤"),
+                Rule("官格透财", "官格透财：聚财。", when=lambda c: '财' in c.gan_shens or '才' in c.gan_shens),
+                Rule("官格透印", "官格透印：人品清雅。", gan_shen="印"),
+                Rule("官独透成格", "官独透成格：敦厚人。", when=lambda c: not ('印' in c.gan_shens or '财' in c.gan_shens or '才' in c.gan_shens)),
+            ]),
+            Rule("官月重叠", "官月重叠：女易离婚，早婚不吉利。为人性格温和。", when=lambda c: c.gan_shens[0] == '官' and c.gan_shens[1] == '官' or (c.gan_shens[1] == '官' and '官' in c.zhi_shen3[1])),
+            Rule("官专位时坐地支", "官专位时坐地支，男有得力子息。", when=lambda c: c.gan_shens[3] == '官' and len(zhi5[c.zhis[3]]) == 1),
+            Rule("年干为官", "年干为官，身强有可能出身书香门第。", when=lambda c: c.gan_shens[0] == '官', rules=[
+                Rule("男命年干", "男命年干，时干都为官，对后代和头胎不利。", when=lambda c: c.gan_shens[3] == '官'),
+            ]),
+            Rule("官独透天干成格", "官独透天干成格，四柱无财或印，为老实人。", when=lambda c: not '财' in c.gan_shens and not '印' in c.gan_shens),
+            Rule("正官伤官通根透", "正官伤官通根透，又无其他格局，失策。尤其是女命，异地分居居多，婚姻不美满。基64:辛未 丁酉 甲戌 辛未 ", gan_shen="伤"),
+            Rule("年月干杀和偏官", "年月干杀和偏官，30以前婚姻不稳定。月时多为体弱多病。", gan_shen="杀"),
+            Rule("官印同根透", "官印同根透，无刑冲合，吉。", gan_shen="印", when=lambda c: '印' in c.zhi_shens2 and '官' in c.zhi_shens2, rules=[
+                Rule("财官印同根透", "财官印同根透，无刑冲合，吉。", gan_shen="财", when=lambda c: '财' in c.zhi_shens2),
+            ]),
+            Rule("官在月坐墓绝", "官在月坐墓绝，不是特殊婚姻就是迟婚。如果与天月德同柱，依然不错。丈夫在库中：1，老夫少妻；2，不为外人所知的亲密感情；3，特殊又合法的婚姻。", when=lambda c: c.gan_shens[1] == '官' in ten_deities[c.me][c.zhis[1]] in ('绝', '墓')),
+            Rule("月柱正官坐正官", "月柱正官坐正官，婚变。月柱不宜通。坐禄的。", month_shen="官", when=lambda c: c.gan_shens[1] == '官'),
+            Rule("正官各柱", None, each=_gan("官"), rules=[
+                Rule("天干正官", "天干正官，地支比肩或劫财，亲友之间不适合合作，但是他适合经营烂摊子。", when=lambda c: c.zhi_shens[c.seq] in ('劫', '比')),
+                Rule("正官坐七杀", "正官坐七杀，男命恐有诉讼之灾。女命婚姻不佳。月柱尤其麻烦，二度有感情纠纷。年不算，时从轻。 基64 壬子 壬子 丁丑 癸卯", when=lambda c: c.zhi_shens[c.seq] == '杀'),
+                Rule("官坐羊刃", "官坐羊刃：要杀才能制服阳刃，有力不从心之事情。 辛卯 丁酉 庚午 庚辰 基65", when=lambda c: c.zhi_shens[c.seq] == '劫' and gan_nums[c.me] % 2 == 0),
+                Rule("官坐印", "官坐印，无刑冲合，吉", when=lambda c: c.zhi_shens[c.seq] == '印'),
+            ]),
+        ]),
+        Rule("正官多者", "正官多者，虚名。为人性格温和，比较实在。做七杀看", gan_shen="官", when=lambda c: c.shens2.count('官') > 2 and '官' in c.zhi_shens2),
+        Rule("日坐正官专位", "日坐正官专位，淑女。 基65 庚申 癸未 丙子 乙未", when=lambda c: c.zhis.day == c.guan_lu or c.zhi_shens[2] == '官', rules=[
+            Rule("日坐正官", "日坐正官，时支阳刃：先富后败，再东山再起。 子平母法 P55-7", when=lambda c: is_yang(c.me) and c.zhis.time == c.me_di),
+        ]),
+        Rule("天干2官", "天干2官，女下有弟妹要照顾，一生为情所困。", when=lambda c: c.gan_shens.count('官') > 2),
+        Rule("月支正官", "月支正官，又成伤官格，难做真正夫妻。有实，无名。 基66辛丑 辛卯 戊子 辛酉", month_shen="官", when=lambda c: '伤' in c.zhi_shens2),
+    ]),
+    RuleSet('七杀', [
+        Rule("七杀是非多", "七杀是非多。但是对男人有时是贵格。比如毛主席等。成格基础85可杀生印或食制印、身杀两停、阳刃驾杀。", gan_shen="杀", rules=[
+            Rule("杀格", "杀格：喜食神制，要食在前，杀在后。阳刃驾杀：杀在前，刃在后。身杀两停：比如甲寅日庚申月。杀印相生，忌食同成格。", when=lambda c: '杀' in c.zhi_shens2, add_ge="杀", rules=[
+                Rule("杀格透比或劫", "杀格透比或劫：性急但还有分寸。", when=lambda c: '比' in c.gan_shens or '劫' in c.gan_shens),
+                Rule("杀格透官", "杀格透官：精明琐屑，不怕脏。", gan_shen="杀"),
+                Rule("杀格透食伤", "杀格透食伤：外表宁静，内心刚毅。", when=lambda c: '食' in c.gan_shens or '伤' in c.gan_shens),
+                Rule("杀格透印", "杀格透印：圆润、精明干练。", gan_shen="印"),
+            ]),
+            Rule("杀月干年干重叠", "杀月干年干重叠：不是老大，出身平常，多灾，为人不稳重。", when=lambda c: c.gan_shens[0] == '杀' and c.gan_shens[1] == '杀'),
+            Rule("杀月重叠", "杀月重叠：女易离婚，其他格一生多病。", when=lambda c: c.gan_shens[1] == '杀' and '杀' in c.zhi_shen3[1]),
+            Rule("年干七杀", "年干七杀，早年不好。或家里穷或身体不好。", when=lambda c: c.gan_shens[0] == '杀', rules=[
+                Rule("年月天干七杀", "年月天干七杀，家庭复杂。", when=lambda c: c.gan_shens[1] == '杀'),
+            ]),
+            Rule("官和杀同见天干不佳", "官和杀同见天干不佳。女在年干月干，30以前婚姻不佳，或体弱多病。基65 甲寅 乙亥 戊子 丙辰", gan_shen="官"),
+            Rule("月柱都是七杀", "月柱都是七杀，克得太过。有福不会享。六亲福薄。时柱没关系。", month_shen="杀", when=lambda c: c.gan_shens[1] == '杀', rules=[
+                Rule("七杀年月浮现天干", "七杀年月浮现天干，性格好变，不容易定下来。30岁以前不行。", when=lambda c: '杀' not in c.zhi_shens2),
+            ]),
+            Rule("七杀地支有根时要有阳刃强为佳", "七杀地支有根时要有阳刃强为佳。杀身两停。", when=lambda c: '杀' in c.zhi_shens and '劫' in c.zhi_shens),
+            Rule("月时天干为七杀", "月时天干为七杀：体弱多病", when=lambda c: c.gan_shens[1] == '杀' and c.gan_shens[3] == '杀'),
+            Rule("七杀年干时干", "七杀年干时干：男头胎麻烦（概率），女婚姻有阻碍。", when=lambda c: c.gan_shens[0] == '杀' and c.gan_shens[3] == '杀'),
+            Rule("七杀在时干", "七杀在时干，固执有毅力。基67", when=lambda c: c.gan_shens[3] == '杀'),
+            Rule("身弱杀生印", "身弱杀生印，不少是精明练达的商人。", gan_shen="印"),
+            Rule("财生杀", "财生杀，如果不是身弱有印，不佳。", when=lambda c: '财' in c.gan_shens or '才' in c.gan_shens, rules=[
+                Rule("财生杀各支", None, each=_pillars, rules=[
+                    Rule("杀财同根", "杀不喜与财同根透出，这样杀的力量太强。",
+                         when=lambda c: {c.sha, c.cai} in set(zhi5[c.zhis[c.seq]])),
+                ]),
+            ]),
+        ]),
+        Rule("七杀各柱", None, each=lambda c: [seq for seq in range(4) if '杀' in (c.gan_shens[seq], c.zhi_shens[seq])], rules=[
+            Rule("七杀坐七杀", "七杀坐七杀，六亲福薄。", when=lambda c: c.gan_shens[c.seq] == '杀' and '杀' in c.zhi_shen3[c.seq] and c.seq != 3),
+            Rule("七杀坐空亡", "七杀坐空亡，女命夫缘薄。 基68 壬申 庚戌 甲子 丙寅", when=lambda c: get_empty(c.zhus[2], c.zhis[c.seq]) == '空'),
+            Rule("七杀坐食", "七杀坐食：易有错误判断。", when=lambda c: c.zhis[c.seq] == '食'),
+            Rule("七杀坐刑或对冲", "七杀坐刑或对冲，夫妻不和。", when=lambda c: c.zhi_xing[c.seq] or c.zhi_6chong[c.seq]),
+        ]),
+        Rule("杀多者如果无制", "杀多者如果无制，性格刚强。打抱不平，不易听人劝。女的喜欢佩服的人。", when=lambda c: c.shens2.count('杀') > 2),
+        Rule("天元坐杀", "天元坐杀：乙酉，己卯，如无食神，阳刃，性急，聪明，对人不信任。如果七杀还透出月干无制，体弱多病，甚至夭折。如果在时干，晚年不好。", day_shen="杀", when=lambda c: len(zhi5[c.zhis[2]]) == 1),
+        Rule("七杀坐桃花", "七杀坐桃花，如有刑冲，引感情引祸。忌讳午运。", when=lambda c: c.zhus[2] in (('丁', '卯'), ('丁', '亥'), ('丁', '未')) and c.zhis.time == '子'),
+        Rule("天干2杀", "天干2杀，不是老大、性格浮躁不持久。", when=lambda c: c.gan_shens.count('杀') > 2),
+        Rule("女地支有杀的禄", "女地支有杀的禄：丈夫条件还可以。对外性格急，对丈夫还算顺从。", female=True, when=lambda c: ten_deities[c.shang].inverse['建'] in c.zhis),
+        Rule("自坐绝", "########## 自坐绝", when=lambda c: c.zhis[2] == c.me_jue, rules=[
+            Rule("自己坐绝（天元坐杀）", "自己坐绝（天元坐杀）：日支与它支合化、双妻，子息迟。母法总则P21-9 P56-30 d第10点暂未编码。", when=lambda c: c.zhi_6he[2]),
+            Rule("自己坐绝支", "自己坐绝支，绝支合会，先贫后富。母法总则P57-3 母法总则P23-33"),
+            Rule("日主日时绝", "日主日时绝，旺达则有刑灾。母法总则P57-2 母法总则P24-43 戊午 癸亥 乙酉 乙酉", when=lambda c: c.zhis[3] == c.zhis[2]),
+            Rule("日主月日时绝", "日主月日时绝，旺达则有刑灾，平常人不要紧。母法总则P57-1", when=lambda c: c.zhis[3] == c.zhis[2] == c.zhis[1]),
+            Rule("自坐绝比劫多", "自坐绝，地支比劫大于1，旺衰巨变，凶：母法总则P22-16。 母法总则P36-5月支或时支都为阳刃，凶。", when=lambda c: c.zhi_shens.count('比') + c.zhi_shens.count('劫') > 1),
+            Rule("日主月日绝", "日主月日绝，有格也疾病夭。母法总则P23-35", when=lambda c: c.zhis[1] == c.me_jue),
+            Rule("母法总则P59-2", " 母法总则P59-2  自坐绝，月支财禄:身弱财旺有衰困时，克妻子。书上例子不对", when=lambda c: c.zhis[3] == c.cai_lu),
+            Rule("母法总则P59-3", " 母法总则P59-3  自坐绝，月支偏财禄:有困顿时娶背景不佳妻。书上例子不对", when=lambda c: c.zhis[3] == c.cai_di),
+        ]),
+        Rule("时坐绝", "########## 自己时坐绝: 母法总则P57-4: 若成伤官格，难求功名，适合艺术九流。", when=lambda c: c.zhis[3] == c.me_jue, rules=[
+            Rule("母法总则P57-5", "母法总则P57-5: 自时支坐绝，自坐枭: 不是生意人，清贫艺术九流人士。", day_shen="枭"),
+            Rule("母法总则P57-6", " 母法总则P57-6  自时支坐绝，月支坐财:先富，晚年大败，刑破。 癸未 庚申 丁巳 庚子", when=lambda c: c.zhis[1] in (c.cai_di, c.cai_lu)),
+            Rule("母法总则P28-114", " 母法总则P28-114  自时支坐绝，月支帝:刑妻克子。 甲子 癸酉 辛丑 辛卯 -- 阴干也算阳刃？", when=lambda c: c.zhis[1] in (c.me_lu, c.me_di)),
+            Rule("母法总则P57-8", " 母法总则P57-8  自时支坐绝，时支财:中年发后无作为。 甲子 癸酉 辛丑 辛卯", when=lambda c: c.zhis[3] in (c.cai_di, c.cai_lu)),
+        ]),
+        Rule("自坐杀禄", "自坐杀禄，时支为官杀库，一生有疾，生计平常。 母法总则P21-12 母法总则P55-8 甲子 丙寅 乙酉 己丑 P56-31", when=lambda c: c.zhis[2] == c.sha_lu and zhi_ku(c.zhis[3], (c.guan, c.sha))),
+        Rule("时支杀禄带刑冲", "时支杀禄带刑冲：纵然吉命也带疾不永寿。 母法总则P60-15 乙未 乙酉 戊申 甲寅", when=lambda c: c.zhis[3] == c.sha_lu and (c.zhi_xing[3] or c.zhi_6chong[3])),
+        Rule("七杀时柱坐财禄旺", "七杀时柱坐财禄旺：性格严肃。 母法总则P59-7 母法总则P79-3 双妻，子息迟。 ", when=lambda c: c.gan_shens[3] == '杀' and c.zhis[3] in (c.cai_di, c.cai_lu)),
+        Rule("时支杀禄", None, when=lambda c: c.zhis[3] == c.sha_lu, rules=[
+            Rule("七杀时禄旺", "七杀时禄旺：遇刑冲寿夭带疾。 母法总则P28-118 冲别的柱也算？ 乙未 戊寅 辛丑 甲午 ", when=lambda c: c.zhi_6chong[3] or c.zhi_xing[3]),
+            Rule("七杀时月禄旺", "七杀时月禄旺：体疾。 母法总则P28-119 甲寅 庚午 辛丑 甲午  母法总则P60-16", when=lambda c: c.zhis[1] == c.sha_lu),
+        ]),
+        Rule("自坐七杀入墓", "自坐七杀入墓：地支都为库，孤独艺术。 母法总则P57-33  丙辰 戊戌 乙丑 庚辰", when=lambda c: zhi_ku(c.zhis[2], (c.guan, c.sha)) and set(c.zhis).issubset(set('辰戌丑未'))),
+        Rule("七杀透干", "七杀透干，地支双根，不论贫富，亲属离散。母法总则P79-6 乙未 丙戌 戊寅 甲寅", gan_shen="杀", when=lambda c: c.zhi_shens.count('杀') > 1),
+        Rule("杀局", None, when=lambda c: '杀' in c.jus + c.all_ges, rules=[
+            Rule("杀局透比或劫", "杀格透比或劫：性急但还有分寸。", when=lambda c: '比' in c.gan_shens or '劫' in c.gan_shens),
+            Rule("杀局透官", "杀格透官：精明琐屑，不怕脏。", gan_shen="杀"),
+            Rule("杀局透食伤", "杀格透食伤：外表宁静，内心刚毅。", when=lambda c: '食' in c.gan_shens or '伤' in c.gan_shens),
+            Rule("杀局透印", "杀格透印：圆润、精明干练。", gan_shen="印"),
+        ]),
+    ]),
+    RuleSet('食神', [
+        Rule("食神", None, gan_shen="食", rules=[
+            Rule("食神成格的情况下", """食神成格的情况下，寿命比较好。食神和偏财格比较长寿。食神厚道，为人不慷慨。食神有口福。成格基础84，喜财忌偏印(只能偏财制)。
+食神无财一生衣食无忧，无大福。有印用比劫通关或财制。""", when=lambda c: '食' in c.zhi_shens2, add_ge="食"),
+            Rule("食月重叠", "食月重叠：生长安定环境，性格仁慈、无冲刑长寿。女早年得子。无冲刑偏印者是佳命。", when=lambda c: c.gan_shens[0] == '食' and c.gan_shens[1] == '食' or (c.gan_shens[1] == '食' and '食' in c.zhi_shen3[1])),
+            Rule("男的食神碰到偏印", "男的食神碰到偏印，身体不好。怕偏印，正印要好一点。四柱透出偏财可解。", gan_shen="枭", rules=[
+                Rule("食神不宜与劫财、偏印齐出干", "食神不宜与劫财、偏印齐出干。体弱多病。基69", gan_shen="劫"),
+                Rule("食神不宜与杀、偏印齐成格", "食神不宜与杀、偏印齐成格。体弱多病。", gan_shen="杀"),
+            ]),
+            Rule("食神天透地藏", "食神天透地藏，女命阳日主适合社会性职业，阴日主适合上班族。", when=lambda c: '食' in c.zhi_shens),
+            Rule("食神多", "食神多，要食伤生财才好，无财难发。", when=lambda c: not '财' in c.gan_shens and not '才' in c.gan_shens),
+            Rule("食伤混杂", "食伤混杂：食神和伤官同透天干：志大才疏。", gan_shen="伤"),
+            Rule("食神制杀", "食神制杀，杀不是主格，施舍后后悔。", gan_shen="杀"),
+            Rule("食神各柱", None, each=_gan("食"), rules=[
+                Rule("食神坐阳刃", "食神坐阳刃，辛劳。基69 戊申 戊午 丙子 丙申", when=lambda c: c.zhi_shens[c.seq] == '劫'),
+            ]),
+        ]),
+        Rule("食神四个及以上的为多", "食神四个及以上的为多，做伤官处理。食神多，要食伤生财才好，无财难发。", when=lambda c: c.shens2.count('食') > 2, rules=[
+            Rule("食神带比劫", "食神带比劫，好施舍，乐于做社会服务。", when=lambda c: '劫' in c.gan_shens or '比' in c.gan_shens),
+        ]),
+        Rule("食神与七杀同一柱", "食神与七杀同一柱，易怒。食神制杀，最好食在前。有一定概率。基69辛未 丁酉 乙未 戊寅", when=lambda c: ('杀', '食') in c.shen_zhus or ('食', '杀') in c.shen_zhus),
+        Rule("女命最怕食神偏印同一柱", "女命最怕食神偏印同一柱。不利后代，时柱尤其重要。基69庚午 己卯 丁未 丁未", when=lambda c: ('枭', '食') in c.shen_zhus or ('食', '枭') in c.shen_zhus),
+        Rule("日支食神专位容易发胖", "日支食神专位容易发胖，有福。只有2日：癸卯，己酉。男命有有助之妻。", when=lambda c: '食' in c.zhi_shen3[2] and c.zhis[2] in zhengs),
+        Rule("自坐食神时支杀", "自坐食神，时支杀专，二者不出天干，多成败，最后失局。", day_shen="食", when=lambda c: c.zhi_shens[2] == '杀'),
+        Rule("自坐食神", "自坐食神，相敬相助，即使透枭也无事，不过心思不定，做事毅力不足，也可能假客气。专位容易发胖，有福。", day_shen="食"),
+        Rule("自坐食", "自坐食，时支专杀不透干：多成败，终局失制。母法总则P56-22 丙子 庚寅 己酉 丁卯", when=lambda c: c.zhis[2] == c.shi_lu and c.zhis[3] == c.sha_lu and c.sha not in c.gan_shens),
+        Rule("时支食神逢偏印", "时支食神逢偏印：体弱，慢性病，女的一婚不到头。", when=lambda c: '食' in c.zhi_shen3[3] and '枭' in c.zhi_shen3[3] + c.gan_shens[3]),
+        Rule("自坐食伤库", "自坐食伤库：总觉得钱不够。", when=lambda c: c.zhis[2] in kus and c.zhi_shen3[2][2] in ('食', '伤')),
+        Rule("年柱食", "年柱食：可三代同堂。", when=lambda c: '食' in (c.gan_shens[0], c.zhi_shens[0])),
+        Rule("时食库", "时食库，月食当令，孤克。", when=lambda c: zhi_ku(c.zhis[3], (c.shi, c.shang)) and ('食' in c.zhi_shen3[1] or '伤' in c.zhi_shen3[1])),
+        Rule("坐食伤库时支官", "坐食伤库：时支官，发达时接近寿终。 母法总则P60-13 乙丑 丙戌 庚辰 壬午", when=lambda c: zhi_ku(c.zhis[2], (c.shi, c.shang)) and c.zhis[3] == c.guan_lu),
+        Rule("坐食伤库月支食伤", "坐食伤库：月支食伤当令，吉命而孤克。 母法总则P60-14 甲戌 丙子 辛卯 壬辰", when=lambda c: zhi_ku(c.zhis[3], (c.shi, c.shang)) and c.zhis[1] in (c.shi_di, c.shi_lu)),
+    ]),
+    RuleSet('伤官', [
+        Rule("伤官有才华", "伤官有才华，但是清高。要生财，或者印制。", gan_shen="伤", rules=[
+            Rule("食神重成伤官", """食神重成伤官，不适合伤官配印。金水、土金、木火命造更高。火土要调候，容易火炎土燥。伤官和七杀的局不适合月支为库。
+伤官成格基础87生财、配印。不考虑调候逆用比顺用好，调候更重要。生正财用偏印，生偏财用正印。
+伤官配印，如果透杀，透财不佳。伤官七杀同时成格，不透财为上好命局。""", when=lambda c: '伤' in c.zhi_shens2, add_ge="伤"),
+            Rule("父母兄弟均无缘", "父母兄弟均无缘。孤苦，性刚毅好掌权。30岁以前有严重感情苦重，适合老夫少妻，继室先同居后结婚。", when=lambda c: c.gan_shens[0] == '伤' and c.gan_shens[1] == '伤' or (c.gan_shens[1] == '伤' and '伤' in c.zhi_shen3[1])),
+            Rule("伤官配印", "伤官配印，无财，有手艺，但是不善于理财。有一定个性", gan_shen="印", when=lambda c: '财' not in c.gan_shens),
+            Rule("年月天干都浮现伤官", "年月天干都浮现伤官，亲属少。", when=lambda c: c.gan_shens[0] == '伤' and c.gan_shens[1] == '伤' and not '伤' in c.zhi_shens2),
+            Rule("月柱", "月柱：伤官坐专位伤官，夫缘不定。假夫妻。比如老板和小蜜。", month_shen="伤", when=lambda c: len(zhi5[c.zhis[1]]) == 1 and c.gan_shens[1] == '伤'),
+            Rule("伤官各柱", None, each=_gan("伤"), rules=[
+                Rule("伤官地支坐阳刃", "伤官地支坐阳刃，力不从心 基70己酉 丁卯 甲午 辛未。背禄逐马，克官劫财。影响15年。伤官坐劫财：只适合纯粹之精明商人或严谨掌握财之人。", when=lambda c: c.zhi_shens[c.seq] == '劫'),
+            ]),
+        ]),
+        Rule("伤官多", None, when=lambda c: c.shens2.count('伤') > 2, rules=[
+            Rule("女命伤官多", "女命伤官多，即使不入伤官格，也缘分浅，多有苦情。", female=True),
+            Rule("天干2伤官", "天干2伤官：性骄，六亲不靠。婚前诉说家人，婚后埋怨老公。30岁以前为婚姻危机期。", when=lambda c: c.gan_shens.count('伤') > 2),
+        ]),
+        Rule("女命婚姻宫伤官", "女命婚姻宫伤官：强势克夫。男的对妻子不利。只有庚子日。", day_shen="伤", when=lambda c: len(zhi5[c.zhis[2]]) == 1),
+        Rule("伤官坐时禄", "伤官坐时禄：六亲不靠，无冲刑晚年发，有冲刑不发。 母法P27-96己未 壬申 己亥 庚午, 可以参三命。", when=lambda c: c.gan_shens[3] == '伤' and c.me_lu == c.zhis[3]),
+        Rule("月支时支食伤当令", "月支时支食伤当令：日主无根，泄尽日主，凶。 母法P28-104 甲午 乙亥 庚戌 丙子  母法P60-104", when=lambda c: c.zhis[3] in (c.shang_lu, c.shang_di) and c.zhis[1] in (c.shang_lu, c.shang_di)),
+        Rule("女命地支伤官禄", "女命地支伤官禄：婚姻受不得穷。", female=True, when=lambda c: ten_deities[c.shang].inverse['建'] in c.zhis),
+    ]),
+    RuleSet('贵人', [
+        Rule("天乙贵人", lambda c: "| 天乙贵人： " + ' '.join(_stars(tianyis[c.me], c.zhis)), end=' ',
+             when=lambda c: _stars(tianyis[c.me], c.zhis)),
+        Rule("玉堂贵人", lambda c: "| 玉堂贵人： " + ' '.join(_stars(yutangs[c.me], c.zhis)), end=' ',
+             when=lambda c: _stars(yutangs[c.me], c.zhis)),
+        Rule("天罗", lambda c: "| 天罗：{}".format(c.zhis.day), end=' ',
+             when=lambda c: nayins[c.zhus[0]][-1] == '火' and c.zhis.day in '戌亥'),
+        Rule("地网", lambda c: "| 地网：{}".format(c.zhis.day), end=' ',
+             when=lambda c: nayins[c.zhus[0]][-1] in '水土' and c.zhis.day in '辰巳'),
+        Rule("学堂各柱", None, each=_pillars, rules=[
+            Rule("学堂", lambda c: "学堂: {} \t".format(c.zhis[c.seq]), end=' ', when=lambda c: c.statuses[c.seq] == '长', rules=[
+                Rule("正学堂", lambda c: "正学堂: {} \t".format(nayins[c.zhus[c.seq]]), end=' ',
+                     when=lambda c: nayins[c.zhus[c.seq]][-1] == ten_deities[c.me]['本']),
+            ]),
+        ]),
+        Rule("词馆各柱", None, each=_pillars, rules=[
+            Rule("词馆", lambda c: "| 词馆: {}".format(c.zhis[c.seq]), end=' ', when=lambda c: c.statuses[c.seq] == '建', rules=[
+                Rule("正词馆", lambda c: "- 正词馆: {}".format(nayins[c.zhus[c.seq]]), end=' ',
+                     when=lambda c: nayins[c.zhus[c.seq]][-1] == ten_deities[c.me]['本']),
+            ]),
+        ]),
+        # 原来只看月柱(库与月柱比较，实际上不会成立)，保持一致
+        Rule("库", lambda c: "库： " + c.me_ku, end=' ', when=lambda c: c.me_ku in c.zhis, rules=[
+            Rule("库各柱", None, each=lambda c: [seq for seq in range(4) if c.me_ku == c.zhus[1]], rules=[
+                Rule("库中有财", "库中有财，其人必丰厚", when=lambda c: nayins[c.zhus[c.seq]][-1] == ten_deities[c.me]['克']),
+                Rule("绝处无依", lambda c: "{} {}\n绝处无依，其人必滞".format(c.zhus[c.seq], ten_deities[c.me]['被克']),
+                     when=lambda c: nayins[c.zhus[c.seq]][-1] == ten_deities[c.me]['被克']),
+            ]),
+        ]),
+    ]),
+    RuleSet('出身', [
+        Rule("出身不错", "出身: 不错", when=lambda c: c.cai in c.gans[:2] and c.guan in c.gans[:2]),
+        Rule("出身一般", "出身: 一般", when=lambda c: not (c.cai in c.gans[:2] and c.guan in c.gans[:2])),
+    ]),
+    RuleSet('月令', [
+        Rule("食神格", """
+****食神分析****: 格要日主食神俱生旺，无冲破。有财辅助财有用。  食神可生偏财、克杀
+ 阳日食神暗官星，阴日食神暗正印。食神格人聪明、乐观、优雅、多才多艺。食居先，煞居后，功名显达。
+======================================
+
+    喜:身旺 宜行财乡 逢食看财  忌:身弱 比 倒食(偏印)  一名进神　　二名爵星　　三名寿星
+    月令建禄最佳，时禄次之，更逢贵人运
+    """, ge="食", after="\n" + "-" * 120, rules=[
+            Rule("食神过多", "食神过多:食神重见，变为伤官，令人少子，纵有，或带破拗性. 行印运", when=lambda c: c.shens.count('食') > 2, end=' '),
+            Rule("祖父荫业丰隆", "祖父荫业丰隆", when=lambda c: set(('财', '食')) in set(c.gan_shens[:2] + c.zhi_shens[:2]), end=' '),
+            Rule("妻男获福", "妻男获福，怕母子俱衰绝，两皆无成", when=lambda c: set(('财', '食')) in set(c.gan_shens[2:] + c.zhi_shens[2:]), end=' '),
+            Rule("财多则不清", "财多则不清，富而已", when=lambda c: c.shens.count('财') > 1, end=' '),
+            Rule("食神入墓", None, each=_pillars, rules=[
+                Rule("食入墓", "食入墓，即是伤官入墓，住寿难延。", when=lambda c: c.gan_shens[c.seq] == '食' and ten_deities[c.gans[c.seq]][c.zhis[c.seq]] == '墓'),
+            ]),
+            Rule("食神空亡", None, each=_pillars, rules=[
+                Rule("大忌空亡", "大忌空亡，更有官煞显露，为太医师巫术数九流之士，若食神逢克，又遇空亡，则不贵，再行死绝或枭运，则因食上气上生灾，翻胃噎食，缺衣食，忍饥寒而已", when=lambda c: (c.gan_shens[c.seq] == '食' or c.zhi_shens[c.seq] == '食') and get_empty(c.zhus[2], c.zhis[c.seq])),
+            ]),
+            Rule("倒食分析", None, when=lambda c: '枭' in c.shens and c.me not in ['庚', '辛', '壬'] and ten_deities[c.me] != '建', rules=[
+                Rule("倒食", """倒食:凡命带倒食，福薄寿夭，若有制合没事，主要为地支为天干的杀;日支或者偏印的坐支为日主的建禄状态。偏印和日支的主要成分天干合
+凡命有食遇枭，犹尊长之制我，不得自由，作事进退悔懒，有始无终，财源屡成屡败，容貌欹斜，身品琐小，胆怯心虚，凡事无成，克害六亲，幼时克母，长大伤妻子
+身旺遇此方为福""", when=lambda c: ten_deities[c.me]['合'] not in zhi5[c.zhis.day]),
+            ]),
+        ]),
+        Rule("伤官格", """
+****伤官分析****: 喜:身旺,财星,印绶,伤尽 忌:身弱,无财,刑冲,入墓枭印　
+ 多材艺，傲物气高，心险无忌惮，多谋少遂，弄巧成拙，常以天下之人不如己，而人亦惮之、恶之。 一名剥官神　　二名羊刃煞
+ 身旺用财，身弱用印。用印不忌讳官煞。用印者须去财方能发福
+官星隐显，伤之不尽，岁运再见官星，官来乘旺，再见刑冲破害，刃煞克身，身弱财旺，必主徒流死亡，五行有救，亦残疾。若四柱无官而遇伤煞重者，运入官乡，岁君又遇，若不目疾，必主灾破。
+娇贵伤不起、谨慎过头了略显胆小，节俭近于吝啬
+======================================""", ge="伤", after="\n" + "-" * 120, rules=[
+            Rule("伤官生财", "伤官生财", when=lambda c: '财' in c.shens or '才' in c.shens),
+            Rule("伤官无财", "伤官无财，主贫穷", when=lambda c: not ('财' in c.shens or '才' in c.shens)),
+            Rule("印能制伤", "印能制伤，所以为贵，反要伤官旺，身稍弱，始为秀气;印旺极深，不必多见，偏正叠出，反为不秀，故伤轻身重而印绶多见，贫穷之格也。", when=lambda c: '印' in c.shens or '枭' in c.shens, rules=[
+                Rule("财印相克", "财印相克，本不并用，只要干头两清而不相碍；又必生财者，财太旺而带印，佩印者印太重而带财，调停中和，遂为贵格", when=lambda c: '财' in c.shens or '才' in c.shens),
+            ]),
+            Rule("伤官格调候", lambda c: str(shang_guans[ten_deities[c.me]['本']]) + "\n" + '金水独宜，然要财印为辅，不可伤官并透。若冬金用官，而又化伤为财，则尤为极秀极贵。若孤官无辅，或官伤并透，则发福不大矣。', when=lambda c: '官' in c.shens),
+            Rule("煞因伤而有制", "煞因伤而有制，两得其宜，只要无财，便为贵格", when=lambda c: '杀' in c.shens),
+            Rule("年干伤官最重", "年干伤官最重，谓之福基受伤，终身不可除去，若月支更有，甚于伤身七煞", when=lambda c: c.gan_shens[0] == '伤'),
+            Rule("伤官入墓", None, each=_pillars, rules=[
+                Rule("伤官格食入墓", "食入墓，即是伤官入墓，住寿难延。", when=lambda c: c.gan_shens[c.seq] == '伤' and ten_deities[c.gans[c.seq]][c.zhis[c.seq]] == '墓'),
+            ]),
+            Rule("伤官空亡", None, each=_pillars, rules=[
+                Rule("伤官格大忌空亡", "大忌空亡，更有官煞显露，为太医师巫术数九流之士，若食神逢克，又遇空亡，则不贵，再行死绝或枭运，则因食上气上生灾，翻胃噎食，缺衣食，忍饥寒而已", when=lambda c: (c.gan_shens[c.seq] == '食' or c.zhi_shens[c.seq] == '食') and get_empty(c.zhus[2], c.zhis[c.seq])),
+            ]),
+        ]),
+        Rule("劫财格", """
+****劫财(阳刃)分析****：阳刃冲合岁君,勃然祸至。身弱不作凶。
+======================================""", ge="劫", after="-" * 120, rules=[
+            Rule("劫财阳刃", "劫财阳刃,切忌时逢,岁运并临,灾殃立至,独阳刃以时言,重于年月日也。", when=lambda c: '劫' == c.gan_shens[3] or '劫' == c.zhi_shens[3]),
+        ]),
+        Rule("财格", """
+****财分析 **** 喜:旺,印,食,官 忌:比 羊刃 空绝 冲合   财星,天马星,催官星,壮志神""", ge=("财", "才"), after="-" * 120, rules=[
+            Rule("财喜根深", """财喜根深，不宜太露，然透一位以清用，格所最喜，不为之露。即非月令用神，若寅透乙、卯透甲之类，一亦不为过，太多则露矣。
+财旺生官，露亦不忌，盖露不忌，盖露以防劫，生官则劫退，譬如府库钱粮，有官守护，即使露白，谁敢劫之？""", when=lambda c: c.gan_shens.count('财') + c.gan_shens.count('才') > 1),
+            Rule("有伤官", "有伤官，财不能生官", gan_shen="伤"),
+            Rule("有财用食生者", "有财用食生者，身强而不露官，略带一位比劫，益觉有情", when=lambda c: '食' in c.shens, rules=[
+                Rule("注意印食冲突", "注意印食冲突", when=lambda c: '印' in c.shens or '枭' in 'shens'),
+            ]),
+            Rule("比不吉", "比不吉，但是伤官食神可化!", when=lambda c: '比' in c.shens),
+            Rule("不论合煞制煞", "不论合煞制煞，运喜食伤身旺之方!", when=lambda c: '杀' in c.shens),
+            Rule("岁带正马", "岁带正马：月令有财或伤食，不犯刑冲分夺，旺祖业丰厚。同类月令且带比，或遇运行伤劫 贫", when=lambda c: '财' == c.zhi_shens[0]),
+            Rule("时带正马", "时带正马：无冲刑破劫，主招美妻，得外来财物，生子荣贵，财产丰厚，此非父母之财，乃身外之财，招来产业，宜俭不宜奢。", when=lambda c: '财' == c.zhi_shens[3]),
+            Rule("天元坐财", "天元坐财：喜印食 畏官煞，喜月令旺 ", when=lambda c: '财' == c.zhi_shens[2] and c.me not in ('壬', '癸')),
+            Rule("财旺生官", "财旺生官:若月令财无损克，亦主登科", when=lambda c: '官' not in c.shens and '伤' not in c.shens and '食' not in c.shens),
+            Rule("财\u3000不重叠多见\u3000财多身弱", "财\u3000不重叠多见\u3000财多身弱，柱无印助; 若财多身弱，柱无印助不为福。", when=lambda c: c.shens.count('财') > 2 and '劫' not in c.shens and '比' not in c.shens and '比' not in c.shens and '印' not in c.shens),
+            Rule("先财后印", "先财后印，反成其福，先印后财，反成其辱是也?", when=lambda c: '印' in c.shens),
+            Rule("官星显露", "官星显露，别无伤损，或更食生印助日主健旺，富贵双全", gan_shen="官"),
+            Rule("财不宜明露", "财不宜明露", gan_shen="财", when=lambda c: '劫' not in c.shens and '比' not in c.shens),
+            Rule("财星各柱", None, each=_pillars, rules=[
+                Rule("天干正财", None, when=lambda c: c.gan_shens[c.seq] == '财', rules=[
+                    Rule("财星入墓", "财星入墓，必定刑妻", when=lambda c: ten_deities[c.gans[c.seq]][c.zhis[c.seq]] == '墓'),
+                    Rule("财遇长生", "财遇长生，田园万顷", when=lambda c: ten_deities[c.gans[c.seq]][c.zhis[c.seq]] == '长'),
+                ]),
+            ]),
+            Rule("切忌有姊妹兄弟分夺", "切忌有姊妹兄弟分夺，柱无官星，祸患百出。", when=lambda c: '官' not in c.shens and ('劫' in c.shens or '比' in c.shens)),
+            Rule("兄弟辈出", "兄弟辈出: 纵入官乡，发福必渺.", when=lambda c: c.shens.count('比') + c.shens.count('劫') > 1),
+            Rule("偏财空亡", None, each=_pillars, rules=[
+                Rule("空亡", "空亡 官将不成，财将不住", when=lambda c: (c.zhi_shens[c.seq] == '才' or ten_deities[c.me][c.zhis[c.seq]] == '才') and get_empty(c.zhus[2], c.zhis[c.seq])),
+            ]),
+        ]),
+        Rule("财库", "财临库墓: 一生财帛丰厚，因财致官, 天干透土更佳", when=lambda c: ten_deities[ten_deities[c.me].inverse['财']]['库'][-1] in c.zhis),
+        Rule("财少身强", "财少身强，柱有比劫，不为福", when=lambda c: c.shens.count('财') < 2 and ('劫' in c.shens or '比' in c.shens)),
+        Rule("正官格", """
+**** 官分析 ****
+ 喜:身旺 财印   忌：身弱 偏官 伤官 刑冲 泄气 贪合 入墓
+一曰正官 二曰禄神 最忌刑冲破害、伤官七煞，贪合忘官，劫财比等等，遇到这些情况便成为破格 财印并存要分开
+运：财旺印衰喜印，忌食伤生财；旺印财衰喜财，喜食伤生财；带伤食用印制；
+带煞伤食不碍。劫合煞财运可行，伤食可行，身旺，印绶亦可行；伤官合煞，则伤食与财俱可行，而不宜逢印
+======================================""", ge="官", after="\n" + "-" * 120, rules=[
+            Rule("官多变杀", "官多变杀，以干为准", when=lambda c: c.shens.count('官') > 1),
+            Rule("官星通过天干显露出来", "官星通过天干显露出来，又得到财、印两方面的扶持，四柱中又没有伤煞，行运再引到官乡，是大富大贵的命。", when=lambda c: '财' in c.shens and '印' in c.shens and '伤' not in c.shens and '杀' not in c.shens),
+            Rule("有财辅助", "有财辅助", when=lambda c: '财' in c.shens or '才' in c.shens),
+            Rule("有印辅助\u3000正官带伤食而用印制", "有印辅助\u3000正官带伤食而用印制，运喜官旺印旺之乡，财运切忌。若印绶叠出，财运亦无害矣。", when=lambda c: '印' in c.shens or '枭' in c.shens),
+            Rule("又曰凡论官星", "又曰凡论官星，略见一位食神坐实，便能损局，有杀则无妨。惟月令隐禄，见食却为三奇之贵。因为食神和官相合。", when=lambda c: '食' in c.shens),
+            Rule("伤官需要印或偏印来抑制", "伤官需要印或偏印来抑制，\u3000有杀也无妨", when=lambda c: '伤' in c.shens),
+            Rule("伤官合煞", "伤官需要印或偏印来抑制。用劫合煞，则财运可行，伤食可行，身旺，印绶亦可行，只不过复露七煞。若命用伤官合煞，则伤食与财俱可行，而不宜逢印矣。", when=lambda c: '杀' in c.shens),
+            Rule("凡用官", "凡用官，日干自坐财印，终显", when=lambda c: c.zhi_shens[2] in ('财', '印')),
+            Rule("自坐伤、煞", "自坐伤、煞，终有节病", when=lambda c: c.zhi_shens[2] in ('伤', '杀')),
+            Rule("天福贵人", "天福贵人:主科名巍峨，官职尊崇，多掌丝纶文翰之美!", when=lambda c: (c.guan, ten_deities[c.guan].inverse['建']) in c.zhus),
+            Rule("天元作禄", lambda c: '天元作禄: 日主与官星并旺,才是贵命。大多不贵即富,即使是命局中有缺点,行到好的大运时,便能一发如雷。' + "\n" + str(tianyuans[ten_deities[c.me]['本']]), when=lambda c: c.guan in zhi5[c.zhis[2]]),
+            Rule("岁德正官", "岁德正官: 必生宦族,或荫袭祖父之职,若月居财官分野,运向财官旺地,日主健旺,贵无疑矣。凡年干遇官,福气最重,发达必早。", when=lambda c: c.gan_shens[0] == '官' or c.zhi_shens[0] == '官'),
+            Rule("时上正官", "时上正官: 正官有用不须多，多则伤身少则和，日旺再逢生印绶，定须平步擢高科。", when=lambda c: c.gan_shens[0] == '官' or c.zhi_shens[0] == '官'),
+        ]),
+        Rule("官库", "官临库墓", when=lambda c: ten_deities[ten_deities[c.me].inverse['官']]['库'][-1] in c.zhis, rules=[
+            Rule("官印禄库", "官印禄库: 有官库，且库中有财", when=lambda c: lu_ku_cai[c.me] in c.zhis),
+        ]),
+        Rule("七杀格", """
+杀(偏官)分析 **** 喜:身旺  印绶  合煞  食制 羊刃  比  逢煞看印及刃  以食为引   忌：身弱  财星  正官  刑冲  入墓
+一曰偏官 二曰七煞 三曰五鬼 四曰将星 五曰孤极星 原有制伏,煞出为福,原无制伏,煞出为祸   性情如虎，急躁如风,尤其是七杀为丙、丁火时。
+坐长生、临官、帝旺,更多带比同类相扶,则能化鬼为官,化煞为权,行运引至印乡,必发富贵。倘岁运再遇煞地,祸不旋踵。
+七杀喜酒色而偏争好斗、爱轩昂而扶弱欺强
+======================================""", ge="杀", after="\n" + "-" * 120, rules=[
+            Rule("逢煞看财", "逢煞看财,如身强煞弱,有财星则吉,身弱煞强,有财引鬼盗气,非贫则夭;", when=lambda c: '财' in c.shens),
+            Rule("如果比比自己弱", "如果比比自己弱，可以先挨杀。", when=lambda c: '比' in c.shens),
+            Rule("有食神透制", "有食神透制,即《经》云:一见制伏,却为贵本", when=lambda c: '食' in c.shens, rules=[
+                Rule("煞用食制", "煞用食制，不要露财透印，以财能转食生煞，而印能去食护煞也。然而财先食后，财生煞而食以制之，或印先食后，食太旺而印制，则格成大贵。", when=lambda c: '财' in c.shens or '印' in c.shens or '才' in c.shens or ('枭' in c.shens)),
+            ]),
+            Rule("有阳刃配合", "有阳刃配合,即《经》云:煞无刃不显,逢煞看刃是也。", when=lambda c: '劫' in c.shens),
+            Rule("印", "印: 则煞生印，印生身", when=lambda c: '印' in c.shens),
+            Rule("七煞重逢", "七煞重逢", when=lambda c: c.shens.count('杀') > 1, rules=[
+                Rule("弃命从煞", """弃命从煞，须要会煞从财.四柱无一点比印绶方论，如遇运扶身旺，与煞为敌，从煞不专，故为祸患
+阴干从地支，煞纯者多贵，以阴柔能从物也。阳干从地支，煞纯者亦贵，但次于阴，以阳不受制也。
+水火金土皆从，惟阳木不能从，死木受斧斤，反遭其伤故也。
+古歌曰：五阳坐日全逢煞，弃命相从寿不坚，如是五阴逢此地，身衰煞旺吉堪言。""", when=lambda c: c.weak),
+            ]),
+            Rule("为人心多性急", "为人心多性急，阴险怀毒，僭伪谋害，不近人情", when=lambda c: '杀' == c.zhi_shens[2]),
+            Rule("时杀", """ 时杀：月制干强，其煞反为权印。《经》云：时上偏官身要强，阳刃、冲刑煞敢当，制多要行煞旺运，煞多制少必为殃。
+ 一位为妙，年、月、日重见，反主辛苦劳碌。若身旺，煞制太过，喜行煞旺运，或三合煞运，如无制伏，要行制伏运方发。但忌身弱，纵得运扶持发福，运过依旧不济。
+《独步》云：时上一位，贵藏在支中，是日，主要旺强名利，方有气。
+《古歌》云：时上偏官喜刃冲，身强制伏禄丰隆。正官若也来相混，身弱财多主困穷。
+时上偏官一位强，日辰自旺喜非常。有财有印多财禄，定是天生作栋梁。
+煞临子位，必招悖逆之儿。""", when=lambda c: '杀' == c.zhi_shens[3] or '杀' == c.gan_shens[3]),
+            Rule("年上七煞", """ 年上七煞：出身寒微，命有贵子。
+岁煞一位不宜制，四柱重见却宜制，日主生旺，制伏略多，喜行煞旺地，制伏太过，或煞旺身衰，官煞混杂，岁运如之，碌碌之辈。若制伏不及，运至身衰煞旺乡，必生祸患。
+《独步》云：时上一位，贵藏在支中，是日，主要旺强名利，方有气。
+《古歌》云：时上偏官喜刃冲，身强制伏禄丰隆。正官若也来相混，身弱财多主困穷。
+时上偏官一位强，日辰自旺喜非常。有财有印多财禄，定是天生作栋梁。""", when=lambda c: '杀' == c.zhi_shens[0]),
+            Rule("官煞混杂", "官煞混杂：身弱多夭贫", when=lambda c: '官' in c.shens),
+            Rule("七煞长生", None, each=_pillars, rules=[
+                Rule("七煞遇长生乙位", "七煞遇长生乙位，女招贵夫。", when=lambda c: c.gan_shens[c.seq] == '杀' and ten_deities[c.gans[c.seq]][c.zhis[c.seq]] == '长'),
+            ]),
+        ]),
+        Rule("正印格", """
+印分析 **** 喜:食神 天月德 七煞 逢印看煞 以官为引   忌： 刑冲 伤官 死墓 辰戊印怕木 丑未印不怕木
+一曰正印 二曰魁星 三曰孙极星
+以印绶多者为上,月最要,日时次之,年干虽重,须归禄月、日、时,方可取用,若年露印,月日时无,亦不济事。
+======================================""", ge="印", after="\n" + "-" * 120, rules=[
+            Rule("官能生印", "官能生印。身旺印强，不愁太过，只要官星清纯", when=lambda c: '官' in c.shens),
+            Rule("喜七煞", "喜七煞,但煞不可太多,多则伤身。原无七煞,行运遇之则发;原有七煞,行财运,或印绶死绝,或临墓地,皆凶。", when=lambda c: '杀' in c.shens),
+            Rule("伤食", "伤食：身强印旺，恐其太过，泄身以为秀气；若印浅身轻，而用层层伤食，则寒贫之局矣。", when=lambda c: '伤' in c.shens or '食' in c.shens),
+            Rule("有印多而用财者", "有印多而用财者，印重身强，透财以抑太过，权而用之，只要根深，无防财破。 若印轻财重，又无劫财以救，则为贪财破印，贫贱之局也。", when=lambda c: '财' in c.shens or '才' in c.shens),
+            Rule("印绶复遇拱禄、专禄、归禄、鼠", "印绶复遇拱禄、专禄、归禄、鼠贵、夹贵、时贵等格,尤为奇特,但主少子或无子,印绶多者清孤。", when=lambda c: c.shens.count('印') > 1),
+            Rule("化印为劫", "化印为劫；弃之以就财官", when=lambda c: '劫' in c.shens),
+        ]),
+        Rule("偏印格", """
+印分析 **** 喜:食神 天月德 七煞 逢印看煞 以官为引   忌： 刑冲 伤官 死墓 辰戊印怕木 丑未印不怕木
+一曰正印 二曰魁星 三曰孙极星
+以印绶多者为上,月最要,日时次之,年干虽重,须归禄月、日、时,方可取用,若年露印,月日时无,亦不济事。
+======================================""", ge="枭", after="\n" + "-" * 120, rules=[
+            Rule("偏印格官能生印", "官能生印。身旺印强，不愁太过，只要官星清纯", when=lambda c: '官' in c.shens),
+            Rule("偏印格喜七煞", "喜七煞,但煞不可太多,多则伤身。原无七煞,行运遇之则发;原有七煞,行财运,或印绶死绝,或临墓地,皆凶。", when=lambda c: '杀' in c.shens),
+            Rule("偏印格伤食", "伤食：身强印旺，恐其太过，泄身以为秀气；若印浅身轻，而用层层伤食，则寒贫之局矣。", when=lambda c: '伤' in c.shens or '食' in c.shens),
+            Rule("偏印格弃印就财", "弃印就财。", when=lambda c: '财' in c.shens or '才' in c.shens),
+            Rule("偏印格印绶复遇拱禄、专禄、归禄、鼠", "印绶复遇拱禄、专禄、归禄、鼠贵、夹贵、时贵等格,尤为奇特,但主少子或无子,印绶多者清孤。", when=lambda c: c.shens.count('印') > 1),
+            Rule("偏印格化印为劫", "化印为劫；弃之以就财官", when=lambda c: '劫' in c.shens),
+        ]),
+    ]),
+    RuleSet('三字', [
+        Rule("三字干", lambda c: "三字干： {} -- {}".format(_repeated(Gan, c.gans, 3), gan3[_repeated(Gan, c.gans, 3)]),
+             when=lambda c: _repeated(Gan, c.gans, 3)),
+        Rule("四字干", lambda c: "四字干： {} -- {}".format(_repeated(Gan, c.gans, 4), gan4[_repeated(Gan, c.gans, 4)]),
+             when=lambda c: _repeated(Gan, c.gans, 4)),
+        Rule("三字支", lambda c: "三字支： {} -- {}".format(_repeated(Zhi, c.zhis, 3, 4), zhi3[_repeated(Zhi, c.zhis, 3, 4)]),
+             when=lambda c: _repeated(Zhi, c.zhis, 3, 4)),
+    ]),
+    RuleSet('神煞', [
+        Rule("羊刃", lambda c: "\n羊刃: {} {}".format(c.me, _yangren(c)), when=lambda c: _yangren(c) in c.zhis, rules=[
+            Rule("羊刃参考", "======================参考：https://www.jianshu.com/p/c503f7b3ed04", link=True),
+            Rule("羊刃重重又见禄", "羊刃重重又见禄，富贵饶金玉。 官、印相助福相资。",
+                 when=lambda c: ten_deities[c.me].inverse['冠']),
+            Rule("劳累命", "劳累命！", when=lambda c: not ten_deities[c.me].inverse['冠']),
+        ]),
+        Rule("将星", lambda c: """
+
+将星: 常欲吉星相扶，贵煞加临乃为吉庆。
+=========================
+理愚歌》云：将星若用亡神临，为国栋梁臣。言吉助之为贵，更夹贵库墓纯粹而
+    不杂者，出将入相之格也，带华盖、正印而不夹库，两府之格也；只带库墓而带正印，员郎
+    以上，既不带墓又不带正印，止有华盖，常调之禄也；带华印而正建驿马，名曰节印，主旌节
+    之贵；若岁干库同库为两重福，主大贵。
+""" + str([(c.zhis.day, _sanhe(c.zhis.day, jiangxings))]),
+             when=lambda c: _sanhe(c.zhis.day, jiangxings) in c.zhis[:2] + c.zhis[3:]),
+        Rule("华盖", """
+
+华盖: 多主孤寡，总贵亦不免孤独，作僧道艺术论。
+=========================
+《理愚歌》云：华盖虽吉亦有妨，或为孽子或孤孀。填房入赘多阙口，炉钳顶笠拔缁黄。
+    又云：华盖星辰兄弟寡，天上孤高之宿也；生来若在时与胎，便是过房庶出者。""",
+             when=lambda c: _sanhe(c.zhis.day, huagais) in c.zhis[:2] + c.zhis[3:]),
+        Rule("咸池", lambda c: """
+
+咸池(桃花): 墙里桃花，煞在年月；墙外桃花，煞在日时；
+=========================
+一名败神，一名桃花煞，其神之奸邪淫鄙，如生旺则美容仪，耽酒色，疏财好欢，
+    破散家业，唯务贪淫；如死绝，落魄不检，言行狡诈，游荡赌博，忘恩失信，私滥奸淫，
+    靡所不为；与元辰并，更临生旺者，多得匪人为妻；与贵人建禄并，多因油盐酒货得生，
+    或因妇人暗昧之财起家，平生有水厄、痨瘵之疾，累遭遗失暗昧之灾。此人入命，有破无成，
+    非为吉兆，妇人尤忌之。
+    咸池非吉煞，日时与水命遇之尤凶。
+""" + str([_taohua(c)]) + ' ' + str(c.zhis), when=_taohua),
+        Rule("禄各柱", None, each=lambda c: [seq for seq in range(4) if c.zhus[seq] in lu_types[c.me]], rules=[
+            Rule("禄分析", lambda c: "\n\n禄分析:\n=========================\n{} {}".format(
+                c.zhus[c.seq], lu_types[c.me][c.zhus[c.seq]])),
+        ]),
+        Rule("文星贵人", lambda c: "文星贵人:  {} {}".format(c.me, wenxing[c.me]), when=lambda c: wenxing[c.me] in c.zhis),
+        Rule("天印贵人", lambda c: "天印贵人: 此号天印贵，荣达受皇封 {} {}".format(c.me, tianyin[c.me]),
+             when=lambda c: tianyin[c.me] in c.zhis),
+    ]),
+    RuleSet('十神', [
+        # yinyang返回全角符号，这里与原来的判断保持一致
+        Rule("阳杀", "阳杀:话多,热情外向,异性缘好", shen='杀', when=lambda c: yinyang(c.me) == '+'),
+        Rule("阴杀", "阴杀:话少,性格柔和", shen='杀', when=lambda c: yinyang(c.me) != '+'),
+        Rule("印才官", "印,偏财,官:三奇 怕正财", shen=('印', '才', '官')),
+        Rule("才杀", "男:因女致祸、因色致祸; 女:赔货", shen=('才', '杀')),
+        Rule("才枭", "偏印因偏财而不懒！", shen=('才', '枭')),
+    ]),
+)}
+
+
+def run_rules(name, chart, output=_print):
+    """运行名为name的一组规则"""
+    return rule_sets[name].run(chart, output)
+
+
+def rule_stats():
+    """各规则(包括子规则)的统计：[{'set', 'name', 'calls', 'hits', 'seconds'}]，按耗时从大到小排列"""
+    result = []
+    with _stats_lock:
+        for rule_set in rule_sets.values():
+            for rule in _walk(rule_set.rules):
+                result.append({'set': rule_set.name, 'name': rule.name, 'calls': rule.calls,
+                               'hits': rule.hits, 'seconds': rule.seconds})
+    return sorted(result, key=lambda item: -item['seconds'])
+
+
+def reset_stats():
+    with _stats_lock:
+        for rule_set in rule_sets.values():
+            for rule in _walk(rule_set.rules):
+                rule.calls = rule.hits = 0
+                rule.seconds = 0.0
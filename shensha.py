@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""神煞的统一查法。
+
+每个神煞由查法和表组成：以年支、月支、日支、日干或日柱查表，得到会被冲到的天干地支。
+天干地支编为22位(天干0-9，地支10-21)，某个神煞在某种命局下的目标就是一个位图；
+反过来，对每个干支记下命中的神煞位图，四柱、大运、流年的神煞都只需按位或。
+命局只由(年支, 月支, 日支, 日主)决定，对应的位图有缓存。
+
+bazi_shensha是bazi.py和预计算表用的神煞(datas中的year_shens等)，
+core_shensha是api_server的核心神煞。
+"""
+
+import collections
+import functools
+
+from ganzhi import Gan, Zhi, jiazis
+from datas import year_shens, month_shens, day_shens, g_shens
+
+# 位序：天干0-9，地支10-21
+symbols = tuple(Gan) + tuple(Zhi)
+symbol_bits = {item: 1 << seq for seq, item in enumerate(symbols)}
+
+# 日柱所在旬的空亡，如甲子旬为戌亥
+xun_kongs = {item: Zhi[(10 - seq // 10 * 2) % 12] + Zhi[(11 - seq // 10 * 2) % 12] for seq, item in enumerate(jiazis)}
+
+# 四柱的神煞，masks为各柱的神煞位图，gan_masks为其中由天干命中的部分
+Natal = collections.namedtuple("Natal", "masks gan_masks")
+
+
+def _targets_mask(targets):
+    mask = 0
+    for item in targets:
+        mask |= symbol_bits[item]
+    return mask
+
+
+class ShenshaSet:
+    """一组神煞
+
+    definitions中每项为(名称, 查法, 表)，查法为'year'、'month'、'day'(年支、月支、日支)、
+    'me'(日主)或'xun'(日柱)，可以是几种查法的元组，命中其一即可；表的值为目标干支组成的字符串。
+    skip_self为True时，按年支、日支查的神煞不算在年柱、日柱自身上。
+    """
+
+    def __init__(self, definitions, skip_self=False):
+        self.names = tuple(name for name, _, _ in definitions)
+        self.keys = [keys if isinstance(keys, tuple) else (keys,) for _, keys, _ in definitions]
+        self.tables = [{value: _targets_mask(targets) for value, targets in table.items()}
+                       for _, _, table in definitions]
+        self.skip_self = skip_self
+        # 柱的序号 -> 不计入该柱的神煞
+        self.self_masks = [0, 0, 0, 0]
+        if skip_self:
+            for n, keys in enumerate(self.keys):
+                for key, pillar in (('year', 0), ('day', 2)):
+                    if key in keys:
+                        self.self_masks[pillar] |= 1 << n
+
+    def names_of(self, mask):
+        """位图对应的神煞名称，按定义的顺序"""
+        return [name for n, name in enumerate(self.names) if mask >> n & 1]
+
+    @functools.lru_cache(maxsize=4096)
+    def targets(self, year_zhi, month_zhi, day_zhi, me):
+        """各神煞在该命局下的目标干支位图"""
+        values = {'year': year_zhi, 'month': month_zhi, 'day': day_zhi, 'me': me, 'xun': me + day_zhi}
+        return tuple(functools.reduce(int.__or__, (table.get(values[key], 0) for key in keys), 0)
+                     for keys, table in zip(self.keys, self.tables))
+
+    @functools.lru_cache(maxsize=4096)
+    def index(self, year_zhi, month_zhi, day_zhi, me):
+        """各干支命中的神煞位图，返回{干支: 位图}"""
+        result = dict.fromkeys(symbols, 0)
+        for n, target in enumerate(self.targets(year_zhi, month_zhi, day_zhi, me)):
+            for item in symbols:
+                if target & symbol_bits[item]:
+                    result[item] |= 1 << n
+        return result
+
+    def lookup(self, gans, zhis, gan, zhi):
+        """大运、流年等干支gan zhi在四柱gans zhis下的神煞位图"""
+        index = self.index(zhis[0], zhis[1], zhis[2], gans[2])
+        return index[gan] | index[zhi]
+
+    def natal(self, gans, zhis):
+        """四柱自身的神煞，返回Natal"""
+        index = self.index(zhis[0], zhis[1], zhis[2], gans[2])
+        gan_masks = [index[gan] & ~self.self_masks[i] for i, gan in enumerate(gans)]
+        masks = [gan_masks[i] | index[zhi] & ~self.self_masks[i] for i, zhi in enumerate(zhis)]
+        return Natal(masks, gan_masks)
+
+
+bazi_shensha = ShenshaSet(
+    [(name, 'year', table) for name, table in year_shens.items()]
+    + [(name, 'month', table) for name, table in month_shens.items()]
+    + [(name, 'day', table) for name, table in day_shens.items()]
+    + [(name, 'me', table) for name, table in g_shens.items()],
+    skip_self=True)
+
+# api_server原有的口径：桃花、驿马年支日支都查，羊刃、文昌的个别日主与g_shens不同
+core_shensha = ShenshaSet([
+    ("天乙贵人", 'me', g_shens['天乙']),
+    ("桃花", ('year', 'day'), day_shens['桃花']),
+    ("驿马", ('year', 'day'), day_shens['驿马']),
+    ("空亡", 'xun', xun_kongs),
+    ("羊刃", 'me', {"甲": "卯", "乙": "辰", "丙": "午", "戊": "午", "庚": "酉", "壬": "子"}),
+    ("文昌", 'me', {"甲": "巳", "乙": "午", "丙": "申", "戊": "申", "丁": "酉", "己": "酉",
+                  "庚": "亥", "辛": "子", "壬": "寅", "癸": "卯"}),
+])
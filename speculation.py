@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""命运轨迹故事的预生成。
+
+每一轮只有几个固定的选项，玩家阅读当前故事时，后台按每个选项预先生成下一轮的故事。
+玩家选择后，与所选选项的提示词相同的预生成已经完成时直接返回，还在生成时从中途接着输出
+(已生成的部分立即发出)，其他选项的预生成被取消。
+
+每个选项的结果(命运值的变化、年龄的增长)在故事生成时就已确定(见destiny_sessions.set_story)，
+所以预生成的提示词与玩家真正选择后的提示词相同，按提示词的摘要匹配。
+后台生成使用有上限的线程池，每轮最多预生成的选项数和每个会话预生成的总次数都有限制；
+等待执行的预生成已满时不再开始新的预生成。每个预生成开始时不等待地占用AI接口的一个并发名额
+(见admission.py)，没有空闲名额时跳过，玩家选择后按正常请求生成，所以后台生成不会超出AI接口的并发数。
+已被玩家选中(adopt)的预生成不再占用名额：选择它的请求已经占着一个名额，还在排队的预生成开始时直接生成。
+各会话的预生成按会话存储的条数和有效期淘汰(最久未用的先淘汰)，淘汰时取消未完成的预生成。
+
+环境变量:
+    BAZI_SPECULATE           为1时会话默认开启预生成，默认0；会话设置中的speculate优先
+    BAZI_SPECULATE_WORKERS   同时进行的预生成数，默认4
+    BAZI_SPECULATE_QUEUE     等待执行的预生成数的上限，默认16
+    BAZI_SPECULATE_BRANCHES  每轮最多预生成的选项数，默认4
+    BAZI_SPECULATE_BUDGET    每个会话最多预生成的次数，默认30
+"""
+
+import collections
+import concurrent.futures
+import os
+import threading
+import time
+
+from ai_cache import Flight
+
+CANCELLED = "预生成已取消"
+SKIPPED = "AI接口没有空闲名额，跳过预生成"
+
+
+class Branch:
+    """一个选项的预生成"""
+
+    def __init__(self, key):
+        self.key = key
+        self.flight = Flight()
+        self.cancelled = False
+        # 已被玩家选中，生成时使用选择它的请求的名额
+        self.adopted = False
+        self.future = None
+
+
+class Speculator:
+    """按会话管理预生成"""
+
+    def __init__(self, workers=4, branches=4, budget=30, enabled=False, queue_size=16, size=1000, ttl=7 * 86400,
+                 limiter=None):
+        self.workers = workers
+        self.branches = branches
+        self.budget = budget
+        self.enabled = enabled
+        self.queue_size = queue_size
+        self.size = size
+        self.ttl = ttl
+        self.limiter = limiter
+        self.executor = concurrent.futures.ThreadPoolExecutor(workers, thread_name_prefix="speculate")
+        # 会话 -> (开始的时间, {键: Branch})，按最近使用的顺序
+        self.sessions = collections.OrderedDict()
+        # 已提交还没有结束的预生成数(包括正在执行的)
+        self.pending = 0
+        # 取消还没执行的预生成时，_done在持有锁的线程中被调用
+        self.lock = threading.RLock()
+        self.stats = collections.Counter()
+
+    def active(self, session):
+        """会话是否开启预生成"""
+        return bool(session['settings'].get('speculate', self.enabled))
+
+    def start(self, session, branches, generate):
+        """为会话开始预生成，branches为[(键, 提示词)]，generate(提示词)生成内容片段。
+        返回开始的个数，会话的speculated随之增加，调用者需要保存会话"""
+        self.cancel(session['id'])
+        spent = session.get('speculated', 0)
+        branches = branches[:max(0, min(self.branches, self.budget - spent))]
+        with self.lock:
+            if branches and self.pending + len(branches) > self.queue_size:
+                # 等待执行的已满，这一轮不预生成
+                self.stats['dropped'] += len(branches)
+                branches = []
+            self.pending += len(branches)
+        if not branches:
+            return 0
+        table = {}
+        for key, prompt in branches:
+            branch = table[key] = Branch(key)
+            branch.future = self.executor.submit(self._run, branch, generate, prompt)
+            branch.future.add_done_callback(self._done)
+        with self.lock:
+            self.sessions[session['id']] = (time.time(), table)
+            self.sessions.move_to_end(session['id'])
+            self._expire()
+            self.stats['started'] += len(table)
+        session['speculated'] = spent + len(table)
+        return len(table)
+
+    def _done(self, future):
+        with self.lock:
+            self.pending -= 1
+
+    def _expire(self):
+        # 超过会话存储的条数或有效期的会话，取消其预生成
+        now = time.time()
+        while self.sessions:
+            session_id, (started, table) = next(iter(self.sessions.items()))
+            if len(self.sessions) <= self.size and not (self.ttl and now - started > self.ttl):
+                break
+            del self.sessions[session_id]
+            for branch in table.values():
+                self._cancel(branch)
+            self.stats['expired'] += 1
+
+    def _run(self, branch, generate, prompt):
+        if branch.cancelled:
+            return
+        started = None
+        with self.lock:
+            # 与adopt互斥：被选中之后不会再因为没有名额而跳过
+            if self.limiter is not None and not branch.adopted:
+                started = self.limiter.try_acquire()
+                if started is None:
+                    self.stats['skipped'] += 1
+                    branch.flight.finish(SKIPPED)
+                    return
+        try:
+            self._generate(branch, generate, prompt)
+        finally:
+            if started is not None:
+                self.limiter.release(started)
+
+    def _generate(self, branch, generate, prompt):
+        error = None
+        pieces = generate(prompt)
+        try:
+            for piece in pieces:
+                if branch.cancelled:
+                    error = CANCELLED
+                    break
+                branch.flight.add(piece)
+        except Exception as e:
+            error = str(e)
+        finally:
+            if hasattr(pieces, 'close'):
+                pieces.close()
+        branch.flight.finish(error)
+
+    def _cancel(self, branch):
+        branch.cancelled = True
+        if branch.future.cancel():
+            branch.flight.finish(CANCELLED)
+        self.stats['cancelled'] += 1
+
+    def adopt(self, session_id, key):
+        """玩家已选择：返回与key相同的预生成(Flight，可能还在生成)，并取消会话的其他预生成；
+        没有或已出错时返回None"""
+        with self.lock:
+            _, table = self.sessions.pop(session_id, (None, {}))
+            branch = table.pop(key, None)
+            for other in table.values():
+                self._cancel(other)
+            if branch is None or branch.flight.error:
+                self.stats['misses'] += 1
+                return None
+            branch.adopted = True
+            self.stats['served' if branch.flight.done else 'adopted'] += 1
+        return branch.flight
+
+    def cancel(self, session_id):
+        """取消会话的所有预生成"""
+        with self.lock:
+            _, table = self.sessions.pop(session_id, (None, {}))
+            for branch in table.values():
+                self._cancel(branch)
+
+    def info(self):
+        with self.lock:
+            result = {'enabled': self.enabled, 'workers': self.workers, 'branches': self.branches,
+                      'budget': self.budget, 'queue_size': self.queue_size, 'pending': self.pending,
+                      'sessions': len(self.sessions)}
+            result.update({name: self.stats[name] for name in ('started', 'served', 'adopted', 'misses', 'cancelled',
+                                                               'dropped', 'skipped', 'expired')})
+        return result
+
+
+def open_speculator(sessions=None, limiter=None):
+    """按环境变量创建Speculator，各会话的预生成按会话存储sessions的条数和有效期淘汰，
+    limiter为AI接口的Limiter(不限制时为None)"""
+    options = {'size': sessions.size, 'ttl': sessions.ttl} if sessions is not None else {}
+    return Speculator(workers=int(os.environ.get("BAZI_SPECULATE_WORKERS", 4)),
+                      branches=int(os.environ.get("BAZI_SPECULATE_BRANCHES", 4)),
+                      budget=int(os.environ.get("BAZI_SPECULATE_BUDGET", 30)),
+                      enabled=os.environ.get("BAZI_SPECULATE") == "1",
+                      queue_size=int(os.environ.get("BAZI_SPECULATE_QUEUE", 16)),
+                      limiter=limiter, **options)
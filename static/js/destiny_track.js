@@ -1,5 +1,6 @@
 // 游戏状态
         let gameState = {
+            sessionId: null, // 服务端会话ID，提示词和游戏进度保存在服务端
             baziData: null,
             currentAge: 0,
             currentStage: '童年',
@@ -134,15 +135,23 @@
                 gameState.settings.storyStyle = storyStyle;
                 gameState.settings.startTime = startTime;
 
-                // 根据开始时间设置初始年龄
-                if (storyStyle === 'realistic' && startTime === 'current') {
-                    // 计算当前年龄（简化计算，假设生日已过）
-                    const birthYear = parseInt(gameState.baziData.birth_info.date.split('-')[0]);
-                    const currentYear = new Date().getFullYear();
-                    gameState.currentAge = currentYear - birthYear;
-                } else {
-                    gameState.currentAge = 0;
+                // 建立服务端会话，初始年龄由服务端根据开始时间计算
+                const sessionResponse = await fetch('/api/destiny-session', {
+                    method: 'POST',
+                    headers: {
+                        'Content-Type': 'application/json',
+                    },
+                    body: JSON.stringify({
+                        bazi_data: gameState.baziData,
+                        settings: gameState.settings
+                    })
+                });
+                const sessionResult = await sessionResponse.json();
+                if (!sessionResponse.ok) {
+                    throw new Error(sessionResult.error || `HTTP错误: ${sessionResponse.status}`);
                 }
+                gameState.sessionId = sessionResult.session_id;
+                applySessionState(sessionResult.state);
 
                 console.log('游戏设置:', gameState.settings);
                 console.log('初始年龄:', gameState.currentAge);
@@ -164,6 +173,15 @@
             }
         }
         
+        // 用服务端返回的状态更新年龄、命运值和事件数
+        function applySessionState(state) {
+            gameState.currentAge = state.age;
+            gameState.destinyScore = state.destiny_score;
+            gameState.eventCount = state.event_count;
+            updateGameStats();
+            updateCurrentStage();
+        }
+        
         // 显示八字信息
         function displayBaziInfo() {
             const baziInfo = document.getElementById('baziInfo');
@@ -420,8 +438,8 @@
             alert('AI配置保存成功！');
         }
         
-        // 生成下一个故事
-        async function generateNextStory() {
+        // 生成下一个故事，choiceIndex为上一个故事中玩家所选的选项
+        async function generateNextStory(choiceIndex = null) {
             try {
                 // 检查AI配置
                 if (!aiConfig || !aiConfig.api_key) {
@@ -450,19 +468,16 @@
                 `;
                 choicesSection.style.display = 'none';
                 
-                // 构建AI提示词
-                const prompt = buildStoryPrompt();
-                
-                // 使用流式API
+                // 使用流式API，提示词由服务端按会话生成，只发送所选的选项
                 const response = await fetch('/api/destiny-story-stream', {
                     method: 'POST',
                     headers: {
                         'Content-Type': 'application/json',
                     },
                     body: JSON.stringify({
-                        prompt: prompt,
+                        session_id: gameState.sessionId,
                         ai_config: aiConfig,
-                        game_state: gameState
+                        choice: choiceIndex
                     })
                 });
                 
@@ -506,6 +521,10 @@
                                     throw new Error(parsed.error);
                                 }
 
+                                if (parsed.state) {
+                                    applySessionState(parsed.state);
+                                }
+
                                 if (parsed.content) {
                                     fullContent += parsed.content;
                                 }
@@ -606,7 +625,7 @@
                 const baseImpact = choice.destiny_impact || 0;
                 const randomVariation = Math.floor(Math.random() * 8) - 4; // -4 到 +4
                 choice.destiny_impact = Math.max(-15, Math.min(15, baseImpact + randomVariation));
-                choice.choiceIndex = index; // 保存原始索引
+                choice.choiceIndex = storyData.choices.indexOf(choice); // 保存原始索引
             });
 
             // 检查是否应该结束游戏
@@ -652,173 +671,6 @@
             }
         }
         
-        // 构建故事提示词
-        function buildStoryPrompt() {
-            const birthInfo = gameState.baziData.birth_info;
-            const baziAnalysis = gameState.baziData.bazi_analysis;
-            const shengxiaoAnalysis = gameState.baziData.shengxiao_analysis;
-            const currentStage = lifeStages[Math.floor(gameState.currentAge / 10)] || lifeStages[0];
-            const storyStyle = gameState.settings.storyStyle;
-            const startTime = gameState.settings.startTime;
-            
-            // 根据故事风格生成不同的背景设定
-            let styleContext = '';
-            let styleRequirements = '';
-            
-            switch (storyStyle) {
-                case 'realistic':
-                    const birthYear = parseInt(birthInfo.date.split('-')[0]);
-                    let currentYear;
-
-                    if (startTime === 'current') {
-                        // 从现在开始：当前年份 + 游戏中经过的年龄
-                        currentYear = new Date().getFullYear() + (gameState.currentAge - (new Date().getFullYear() - birthYear));
-                    } else {
-                        // 从出生开始：出生年份 + 当前游戏年龄
-                        currentYear = birthYear + gameState.currentAge;
-                    }
-
-                    styleContext = `
-## 故事背景设定：
-- 故事风格：现实写实
-- 时代背景：${currentYear}年
-- 历史环境：请结合${currentYear}年前后的真实历史事件和社会背景
-- 开始时间：${startTime === 'birth' ? '从出生开始' : '从现在开始'}
-- 当前实际年龄：${gameState.currentAge}岁`;
-
-                    styleRequirements = `
-- 故事必须基于真实的历史事件和社会背景
-- 融入${currentYear}年代的时代特色（科技、文化、政治环境等）
-- 事件要符合当时的社会现实和历史可能性
-- 如果涉及重大历史事件，要保持历史准确性
-- 故事不必过于玄乎，随机事件不应太统一类型，大事件也有可能是黑天鹅事件，比如疫情、地震、经济危机、战争、科技变革等
-- 重要：故事中提到的年龄必须与当前游戏年龄(${gameState.currentAge}岁)保持一致`;
-                    break;
-                    
-                case 'fantasy':
-                    styleContext = `
-## 故事背景设定：
-- 故事风格：奇幻冒险
-- 世界观：命理法则化为魔法力量的奇幻世界
-- 八字对应：五行成为魔法元素，十神化为天赋技能
-- 神煞系统：古代神煞成为神秘力量的源泉`;
-                    
-                    styleRequirements = `
-- 将八字命理概念融入奇幻元素（如五行魔法、命格天赋等）
-- 创造充满想象力的奇幻场景和生物
-- 保持命理学逻辑的同时，增加魔法冒险元素
-- 故事要有奇幻色彩但仍体现人生选择的重要性`;
-                    break;
-                    
-                case 'historical':
-                    styleContext = `
-## 故事背景设定：
-- 故事风格：古代传奇
-- 时代背景：中国古代传统社会
-- 文化环境：传统命理学盛行的时代
-- 社会结构：古代的家族、官场、江湖体系`;
-                    
-                    styleRequirements = `
-- 故事发生在中国古代，体现传统文化和社会制度
-- 融入古代的科举、家族、师承等社会元素
-- 使用符合古代背景的语言风格和情节设定
-- 强调传统命理学在古代社会中的作用和影响`;
-                    break;
-                    
-                case 'modern':
-                    styleContext = `
-## 故事背景设定：
-- 故事风格：都市传说
-- 时代背景：现代都市
-- 科技环境：命理与现代科技的神秘融合
-- 社会背景：现代都市中隐藏的命理秘密`;
-                    
-                    styleRequirements = `
-- 故事设定在现代都市环境中
-- 将传统命理学与现代科技巧妙结合
-- 创造都市传说般的神秘氛围
-- 体现现代人生活中的命理元素和选择`;
-                    break;
-            }
-            
-            return `你是一位精通命理学的游戏剧情设计师，请基于以下八字信息为用户创建一个命运轨迹游戏的情节。
-
-## 用户八字信息：
-- 出生日期：${birthInfo.date} (${birthInfo.calendar_type})
-- 出生时辰：${birthInfo.time}点
-- 性别：${birthInfo.gender}
-- 生肖：${birthInfo.shengxiao}
-
-## 八字分析：
-${baziAnalysis}
-
-## 生肖分析：
-年支：${shengxiaoAnalysis.year_zhi}
-相合生肖：${JSON.stringify(shengxiaoAnalysis.compatible)}
-相冲生肖：${JSON.stringify(shengxiaoAnalysis.incompatible)}
-
-${styleContext}
-
-## 当前游戏状态：
-- 当前年龄：${gameState.currentAge}岁
-- 人生阶段：${currentStage.name} (${currentStage.description})
-- 命运值：${gameState.destinyScore}
-- 已发生事件：${gameState.eventCount}个
-
-## 历史选择记录：
-${gameState.choiceHistory.length > 0 ? gameState.choiceHistory.map((choice, index) => `${index + 1}. ${choice}`).join('\n') : '暂无历史选择'}
-
-## 任务要求：
-请创建一个符合用户命理特征的人生情节，包含：
-
-1. **情节描述**：根据用户的八字特点和当前年龄阶段，描述一个具体的人生事件或情况
-2. **3-4个选择项**：提供3-4个不同的应对方式，体现不同的人生态度和价值观
-
-## 重要注意事项：
-- 故事中提到的年龄必须严格与当前游戏年龄(${gameState.currentAge}岁)保持一致
-- 不要在故事中出现与当前年龄不符的描述
-- 如果是0岁，应该描述婴儿时期的事件
-- 如果是成年人，不要描述童年场景
-
-## 故事风格要求：
-${styleRequirements}
-
-## 输出格式：
-请严格按照以下JSON格式输出：
-
-\`\`\`json
-{
-  "title": "情节标题",
-  "story": "详细的故事描述，要生动有趣，符合命理特征和故事风格",
-  "choices": [
-    {
-      "text": "选择1的描述",
-      "consequence": "这个选择可能带来的结果",
-      "destiny_impact": 5
-    },
-    {
-      "text": "选择2的描述", 
-      "consequence": "这个选择可能带来的结果",
-      "destiny_impact": -3
-    },
-    {
-      "text": "选择3的描述",
-      "consequence": "这个选择可能带来的结果", 
-      "destiny_impact": 0
-    }
-  ]
-}
-\`\`\`
-
-要求：
-- 故事要符合用户的八字命理特征和选择的故事风格
-- 选择要有明确的后果预示
-- destiny_impact范围在-10到+10之间，但不应固定顺序和数值，要随机分布
-- 语言要生动有趣，适合游戏体验
-- 体现命理学中的因果关系
-- **关键要求：故事中的年龄描述必须与当前游戏年龄(${gameState.currentAge}岁)完全一致，不得出现年龄错误**`;
-        }
-        
         // 做出选择
         async function makeChoice(choiceIndex, choiceText, destinyImpact, storyTitle, choiceId) {
             try {
@@ -841,15 +693,10 @@ ${styleRequirements}
                     }
                 }
 
-                // 记录选择
+                // 记录选择，命运值和年龄的变化由服务端计算
                 gameState.choiceHistory.push(choiceText);
-                gameState.destinyScore += destinyImpact;
-                gameState.eventCount++;
-                gameState.currentAge += Math.floor(Math.random() * 3) + 1; // 随机增加1-3岁
 
                 // 更新显示
-                updateGameStats();
-                updateCurrentStage();
                 updateHistoryDisplay();
                 updateStageEventCounts();
 
@@ -867,7 +714,7 @@ ${styleRequirements}
 
                 // 延迟后生成下一个故事
                 setTimeout(async () => {
-                    await generateNextStory();
+                    await generateNextStory(choiceIndex);
                 }, 1500);
 
             } catch (error) {
@@ -995,37 +842,39 @@ ${styleRequirements}
         }
         
         // 修改历史选择
-        function modifyChoice(eventIndex) {
+        async function modifyChoice(eventIndex) {
             if (confirm('确定要修改这个选择吗？这将重置后续所有事件，游戏将从此节点重新开始。')) {
                 closeHistoryModal();
                 
-                // 重置游戏状态到指定事件之前
-                const targetEvent = gameState.storyHistory[eventIndex];
-                
-                // 保留到指定事件的所有状态
-                gameState.storyHistory = gameState.storyHistory.slice(0, eventIndex + 1);
-                gameState.choiceHistory = gameState.choiceHistory.slice(0, eventIndex);
-                
-                // 恢复到该事件时的状态
-                gameState.currentAge = targetEvent.age;
-                gameState.eventCount = eventIndex;
-                
-                // 重新计算命运值（基于保留的选择）
-                gameState.destinyScore = 100;
-                for (let i = 0; i < gameState.choiceHistory.length; i++) {
-                    // 这里简化处理，实际应该记录每个选择的影响值
-                    const randomImpact = Math.floor(Math.random() * 6) - 2; // -2 到 +3
-                    gameState.destinyScore += randomImpact;
+                try {
+                    // 服务端的会话回到该事件，命运值按记录的影响值恢复
+                    const response = await fetch(`/api/destiny-session/${gameState.sessionId}/rewind`, {
+                        method: 'POST',
+                        headers: {
+                            'Content-Type': 'application/json',
+                        },
+                        body: JSON.stringify({ event: eventIndex })
+                    });
+                    const result = await response.json();
+                    if (!response.ok) {
+                        throw new Error(result.error || `HTTP错误: ${response.status}`);
+                    }
+                    
+                    // 保留到指定事件的所有状态
+                    gameState.storyHistory = gameState.storyHistory.slice(0, eventIndex + 1);
+                    gameState.choiceHistory = gameState.choiceHistory.slice(0, eventIndex);
+                    applySessionState(result.state);
+                    
+                    // 更新显示
+                    updateHistoryDisplay();
+                    updateStageEventCounts();
+                    
+                    // 恢复该事件原来的选择
+                    restoreEventChoices(result.state.current, eventIndex);
+                } catch (error) {
+                    console.error('修改选择失败:', error);
+                    alert(`修改选择失败: ${error.message}`);
                 }
-                
-                // 更新显示
-                updateGameStats();
-                updateCurrentStage();
-                updateHistoryDisplay();
-                updateStageEventCounts();
-                
-                // 重新生成该事件的选择
-                restoreEventChoices(targetEvent, eventIndex);
             }
         }
         
@@ -1041,52 +890,7 @@ ${styleRequirements}
                 </div>
             `;
             
-            // 重新生成选择（模拟原始选择）
-            const choices = [
-                {
-                    text: "积极应对，寻求最佳解决方案",
-                    consequence: "可能带来正面影响",
-                    destiny_impact: Math.floor(Math.random() * 6) + 2
-                },
-                {
-                    text: "谨慎处理，避免冒险",
-                    consequence: "保持现状，小幅改善",
-                    destiny_impact: Math.floor(Math.random() * 4) - 1
-                },
-                {
-                    text: "随遇而安，顺其自然",
-                    consequence: "影响不确定",
-                    destiny_impact: Math.floor(Math.random() * 4) - 2
-                },
-                {
-                    text: "另辟蹊径，寻找新机会",
-                    consequence: "有风险但可能有回报",
-                    destiny_impact: Math.floor(Math.random() * 8) - 3
-                }
-            ];
-            
-            // 随机选择2-4个选项
-            const choiceCount = Math.floor(Math.random() * 3) + 2;
-            const selectedChoices = choices.sort(() => Math.random() - 0.5).slice(0, choiceCount);
-            
-            const choicesSection = document.getElementById('choicesSection');
-            const choicesList = document.getElementById('choicesList');
-            
-            choicesList.innerHTML = selectedChoices.map((choice, index) => {
-                const choiceId = `restore_choice_${Date.now()}_${index}`;
-                const safeText = choice.text.replace(/'/g, "\\'").replace(/"/g, '\\"');
-                const safeTitle = storyData.title.replace(/'/g, "\\'").replace(/"/g, '\\"');
-                return `
-                    <button class="choice-button" id="${choiceId}" onclick="makeChoice(${index}, '${safeText}', ${choice.destiny_impact}, '${safeTitle}', '${choiceId}')">
-                        <span class="choice-number">${index + 1}</span>
-                        ${choice.text}
-                        <br>
-                        <small style="opacity: 0.8; margin-left: 35px;">预期影响: ${choice.consequence}</small>
-                    </button>
-                `;
-            }).join('');
-            
-            choicesSection.style.display = 'block';
+            displayChoices(storyData);
         }
         
         // 结束游戏并生成完整故事总结
@@ -1107,19 +911,16 @@ ${styleRequirements}
                     </div>
                 `;
                 
-                // 构建总结提示词
-                const summaryPrompt = buildSummaryPrompt();
-                
-                // 调用AI生成总结
+                // 调用AI生成总结，提示词由服务端按会话生成
                 const response = await fetch('/api/destiny-story-stream', {
                     method: 'POST',
                     headers: {
                         'Content-Type': 'application/json',
                     },
                     body: JSON.stringify({
-                        prompt: summaryPrompt,
+                        session_id: gameState.sessionId,
                         ai_config: aiConfig,
-                        game_state: gameState
+                        action: 'summary'
                     })
                 });
                 
@@ -1211,59 +1012,15 @@ ${styleRequirements}
             }
         }
         
-        // 构建总结提示词
-        function buildSummaryPrompt() {
-            const birthInfo = gameState.baziData.birth_info;
-            const baziAnalysis = gameState.baziData.bazi_analysis;
-            
-            // 组织人生事件
-            const lifeEvents = gameState.storyHistory.map((story, index) => {
-                const choice = gameState.choiceHistory[index];
-                return `**${story.age}岁 - ${story.title}**\n${story.story}\n${choice ? `选择：${choice}` : ''}`;
-            }).join('\n\n');
-            
-            return `你是一位德高望重的命理大师，现在需要为一个人的完整人生做出总结和盖棺定论。
-
-## 基本信息：
-- 出生日期：${birthInfo.date}
-- 性别：${birthInfo.gender}
-- 生肖：${birthInfo.shengxiao}
-
-## 八字分析：
-${baziAnalysis}
-
-## 人生轨迹：
-${lifeEvents}
-
-## 人生数据：
-- 最终年龄：${gameState.currentAge}岁
-- 命运值：${gameState.destinyScore}
-- 经历事件：${gameState.eventCount}个
-- 故事风格：${gameState.settings.storyStyle}
-
-## 任务要求：
-请基于以上信息，写一篇深刻的人生总结，包含：
-
-1. **人生回顾**：总结这个人的主要人生阶段和关键事件
-2. **性格特点**：基于八字分析和人生选择，分析其性格特征
-3. **成就与遗憾**：客观评价人生的成功和不足
-4. **人生感悟**：从命理角度分析人生的因果关系
-5. **盖棺定论**：给出最终的人生评价和启示
-
-## 写作要求：
-- 语言优美，富有哲理
-- 结合命理学知识，体现因果关系
-- 既要客观公正，又要充满人文关怀
-- 篇幅适中，约500-800字
-- 以第三人称叙述，语调庄重而温暖
-
-请以纯文本形式输出，不需要JSON格式。`;
-        }
-        
         // 重置游戏
         function resetGame() {
             if (confirm('确定要重新开始游戏吗？所有进度将丢失。')) {
+                // 删除旧的服务端会话，重新开始时建立新的会话
+                if (gameState.sessionId) {
+                    fetch(`/api/destiny-session/${gameState.sessionId}`, { method: 'DELETE' });
+                }
                 gameState = {
+                    sessionId: null,
                     baziData: gameState.baziData, // 保留八字数据
                     currentAge: 0,
                     currentStage: '童年',
@@ -1,4 +1,4 @@
-const LAYOUT_VERSION = '7';
+const LAYOUT_VERSION = '8';
 console.log('layout version', LAYOUT_VERSION);
 
 document.getElementById('analysisForm').addEventListener('submit', function (e) {
@@ -23,28 +23,8 @@ document.getElementById('analysisForm').addEventListener('submit', function (e)
     document.getElementById('submitBtn').disabled = true;
     document.getElementById('submitBtn').textContent = '分析中...';
 
-    // 调用API
-    fetch('/api/complete', {
-        method: 'POST',
-        headers: {
-            'Content-Type': 'application/json',
-        },
-        body: JSON.stringify(data)
-    })
-        .then(response => response.json())
-        .then(result => {
-            document.getElementById('loading').style.display = 'none';
-
-            if (result.success) {
-                displayResults(result);
-            } else {
-                let errorMsg = result.error || '分析失败，请重试';
-                if (result.debug_info) {
-                    errorMsg += `\n\n调试信息:\n命令: ${result.debug_info.command}\n返回码: ${result.debug_info.return_code}\n错误: ${result.debug_info.stderr}`;
-                }
-                displayError(errorMsg);
-            }
-        })
+    // 调用流式API：排盘表格先显示，完整分析到达后再补全
+    streamCompleteAnalysis(data)
         .catch(error => {
             document.getElementById('loading').style.display = 'none';
             displayError('网络错误：' + error.message);
@@ -55,6 +35,56 @@ document.getElementById('analysisForm').addEventListener('submit', function (e)
         });
 });
 
+async function streamCompleteAnalysis(data) {
+    const response = await fetch('/api/complete-stream', {
+        method: 'POST',
+        headers: {
+            'Content-Type': 'application/json',
+        },
+        body: JSON.stringify(data)
+    });
+
+    if (!response.ok) {
+        const result = await response.json().catch(() => ({}));
+        document.getElementById('loading').style.display = 'none';
+        displayError(result.error || '分析失败，请重试');
+        return;
+    }
+
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+
+    while (true) {
+        const { done, value } = await reader.read();
+        if (done) break;
+
+        buffer += decoder.decode(value, { stream: true });
+        const events = buffer.split('\n\n');
+        buffer = events.pop();
+
+        for (const event of events) {
+            if (!event.startsWith('data: ')) continue;
+            const parsed = JSON.parse(event.slice(6));
+
+            if (parsed.error) {
+                document.getElementById('loading').style.display = 'none';
+                displayError(parsed.error);
+                return;
+            }
+
+            if (parsed.section === 'chart') {
+                // 出生信息、生肖和四柱排盘不需要等完整分析
+                document.getElementById('loading').style.display = 'none';
+                displayResults({ ...parsed.data, bazi_analysis: '' });
+            } else if (parsed.section === 'complete') {
+                // 完整分析文本用于复制和AI解读
+                currentAnalysisData = parsed.data;
+            }
+        }
+    }
+}
+
 function displayResults(data) {
     // 保存数据到全局变量供复制功能使用
     currentAnalysisData = data;
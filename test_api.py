@@ -7,7 +7,6 @@ import subprocess
 import sys
 import datetime
 import os
-import re
 
 def check_dependencies():
     """检查依赖是否安装"""
@@ -21,12 +20,6 @@ def check_dependencies():
         print("请运行: pip install lunar-python")
         return False
 
-def clean_ansi_codes(text):
-    """清理ANSI颜色控制字符"""
-    # 匹配ANSI转义序列的正则表达式
-    ansi_escape = re.compile(r'\x1b\[[0-9;]*m')
-    return ansi_escape.sub('', text)
-
 def save_bazi_result(result):
     """保存八字分析结果到MD文件"""
     try:
@@ -41,9 +34,7 @@ def save_bazi_result(result):
         filename = f"bazi_analysis_{birth_info['date']}_{birth_info['time']}_{birth_info['gender']}_{timestamp}.md"
         filepath = os.path.join(output_dir, filename)
         
-        # 清理分析结果中的ANSI颜色代码
-        clean_analysis = clean_ansi_codes(result['analysis'])
-        
+        # 接口返回的是format=markdown的报告
         # 构建MD内容
         md_content = f"""# 八字分析报告
 
@@ -55,9 +46,7 @@ def save_bazi_result(result):
 
 ## 详细分析
 
-```
-{clean_analysis}
-```
+{result['analysis']}
 
 ---
 *本报告由八字分析API生成*
@@ -98,6 +87,642 @@ def test_bazi_script():
         print(f"错误: {e}")
         return False
 
+def test_bazi_engine():
+    """进程内调用 bazi.analyze，多次调用结果应一致"""
+    from bazi import analyze
+    first = analyze(1990, 1, 1, 8)
+    other = analyze(1985, 5, 20, 14, '女', '公历')
+    again = analyze(1990, 1, 1, 8)
+    print(f"四柱: {' '.join(a + b for a, b in zip(first.gans, first.zhis))}")
+    assert first.text.startswith("-" * 120)
+    assert first.gans == again.gans and first.scores == again.scores
+    assert other.gender == '女' and "女命" in other.text
+
+def test_batch_scores():
+    """批量计算的分数应与 bazi.analyze 一致"""
+    from bazi import analyze
+    from batch_scores import encode, batch_scores, elements
+    result = analyze(1990, 1, 1, 8)
+    scores = batch_scores(encode([[a + b for a, b in zip(result.gans, result.zhis)]] * 3))
+    assert list(scores.scores[2]) == [result.scores[item] for item in elements]
+    assert scores.strong[0] == result.strong and scores.weak[1] == result.weak
+    assert scores.temps_scores[0] == result.temps_scores
+
+def test_chart_index():
+    """预计算表的下标与四柱一一对应"""
+    from chart_table import chart_index, chart_pillars, COUNT
+    assert chart_pillars(chart_index(('甲','丙','戊','壬'), ('子','寅','辰','子'))) == (('甲','丙','戊','壬'), ('子','寅','辰','子'))
+    assert chart_pillars(chart_index(('戊','庚','壬','壬'), ('申','申','戌','子')))[0][3] == '壬'   # 夜子时
+    assert all(chart_index(*chart_pillars(index)) == index for index in range(0, COUNT, 997))
+
+def test_chart_table(tmp_path):
+    """预计算表：生成一个年柱的部分，查表结果与现场分析相同，引擎版本不符时不能打开"""
+    from bazi import analyze_pillars, Gans, Zhis
+    from chart_table import ChartTable, build, chart_pillars, YEAR_SIZE
+    from report import render_json
+    from paipan import convert
+    from bazi_struct import chart_struct
+    path = str(tmp_path / "chart_table.bin")
+    year = 6
+    build(path, processes=0, years=[year])
+    table = ChartTable(path)
+    for index in range(year * YEAR_SIZE, (year + 1) * YEAR_SIZE, 389):
+        gans, zhis = Gans(*chart_pillars(index)[0]), Zhis(*chart_pillars(index)[1])
+        result = analyze_pillars(gans, zhis)
+        record = table.lookup(gans, zhis)
+        assert (record.scores, record.gan_scores, record.strong, record.weak, record.temps_scores, record.ge) \
+            == (result.scores, result.gan_scores, result.strong, result.weak, result.temps_scores, result.ge)
+        served = analyze_pillars(gans, zhis, record=record)
+        assert served.text == result.text and render_json(served.report) == render_json(result.report)
+    birth = convert('公历', 1990, 6, 15, 8)   # 庚午年
+    assert chart_struct(birth, '女', table=table) == chart_struct(birth, '女')
+    table.close()
+    try:
+        ChartTable(path, version='0' * 12)
+        assert False
+    except ValueError:
+        pass
+
+def test_report():
+    """结构化结果和各种输出格式"""
+    from bazi import analyze
+    from report import render_text, render_json, render_markdown
+    result = analyze(1990, 1, 1, 8)
+    report = result.report
+    assert render_text(report) == result.text
+    text = render_text(report, color=False, links=False)
+    assert 'http' not in text and 'pythontesting' not in text and '\x1b' not in text
+    assert [pillar.gan + pillar.zhi for pillar in report.pillars] == ['己巳', '丁丑', '壬辰', '甲辰']
+    data = render_json(report, ['pillars', 'ge'])
+    assert set(data) == {'gans', 'zhis', 'gender', 'pillars', 'ge', 'all_ges', 'jus'}
+    assert json.dumps(render_json(report), ensure_ascii=False)
+    assert render_markdown(report).startswith("# 八字分析：己巳 丁丑 壬辰 甲辰")
+    assert len(report.dayuns) == 9 and len(report.dayuns[1].liunians) == 10
+    # 规则部分按命中的规则记录，不含颜色、分隔线和推广链接
+    rules = render_json(report, ['rules'])['rules']
+    assert rules[0]['rule'] == '调候' and any(item['rule'] == '穷通宝鉴' for item in rules)
+    assert all('\x1b' not in item['text'] and 'http' not in item['text'] and item['text'].strip('-= \n')
+               for item in rules)
+    assert text.count(rules[-1]['text']) == 1
+
+def test_rules():
+    """规则表按日柱、时柱等索引，只检查对得上的规则，子规则也有统计"""
+    from bazi import analyze_pillars, Gans, Zhis
+    from rules import rule_stats, reset_stats
+    reset_stats()
+    result = analyze_pillars(Gans(*'庚甲庚乙'), Zhis(*'辰申辰丑'))
+    stats = {(item['set'], item['name']): item for item in rule_stats()}
+    assert stats[('格局', '六阴朝阳')]['calls'] == 0 and stats[('格局', '魁罡格')]['hits'] == 1
+    assert stats[('建禄', '建禄格')]['hits'] == 1 and '建' in result.all_ges
+    assert stats[('建禄', '庚建禄')]['hits'] == 1 and stats[('建禄', '辛建禄')]['calls'] == 1
+    assert stats[('建禄', '辛建禄')]['hits'] == 0 and "建禄格：" in result.text
+    # 多个线程同时排盘时计数不丢失
+    import threading
+    reset_stats()
+    threads = [threading.Thread(target=lambda: [analyze_pillars(Gans(*'庚甲庚乙'), Zhis(*'辰申辰丑'))
+                                                for _ in range(5)]) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert {(item['set'], item['name']): item for item in rule_stats()}[('格局', '魁罡格')]['hits'] == 20
+
+def test_birth_times():
+    """四柱反查出生时间"""
+    from bazi import analyze
+    from jieqi import get_birth_times, find_birth_times
+    result = analyze(1990, 1, 1, 8, '男', '公历')
+    assert (1990, 1, 1, 7, 0, 0) in get_birth_times(result.gans, result.zhis, 1900, 2100)
+    results = list(find_birth_times([("甲丙戊壬", "子寅辰子"), ("乙丁己癸", "丑卯巳酉")]))
+    assert results[0][2] == [(1864, 3, 4, 0, 0, 0), (1924, 2, 19, 0, 0, 0)] and results[1][2] == []
+
+def test_paipan():
+    """查表排盘、表头的命宫胎元和节气与lunar_python一致"""
+    import paipan
+    for calendar, year, month, day, hour, leap in [('公历', 1990, 1, 1, 8, False), ('公历', 1985, 6, 15, 23, False),
+                                                   ('农历', 2023, 2, 15, 10, True), ('公历', 1849, 6, 1, 8, False)]:
+        birth = paipan.convert(calendar, year, month, day, hour, leap)
+        solar, lunar, ba = paipan.get_lunar(calendar, year, month, day, hour, leap)
+        assert ''.join(birth.gans + birth.zhis) == ''.join(ba.toString().split()[i][j] for j in range(2) for i in range(4))
+        assert birth.yuns[0].solar.strftime("%Y-%m-%d") == ba.getYun(1).getStartSolar().toYmd()
+        assert [item.ganzhi for item in paipan.get_dayuns(birth, '女')] == [item.getGanZhi() for item in ba.getYun(0).getDaYun()]
+        # 排盘文本的表头：命宫、胎元、前后节气、星宿
+        assert paipan.get_ming_gong(birth.gans, birth.zhis) == ba.getMingGong()
+        assert paipan.get_tai_yuan(birth.gans, birth.zhis) == ba.getTaiYuan()
+        prev_jieqi, next_jieqi = paipan.get_jieqi(birth.solar.date())
+        assert (prev_jieqi.name, str(prev_jieqi.solar)) == (lunar.getPrevJieQi(True).getName(),
+                                                            lunar.getPrevJieQi(True).getSolar().toYmdHms())
+        assert (next_jieqi.name, str(next_jieqi.solar)) == (lunar.getNextJieQi(True).getName(),
+                                                            lunar.getNextJieQi(True).getSolar().toYmdHms())
+        assert paipan.get_xiu(birth.solar.date()) == (lunar.getXiu(), lunar.getXiuSong())
+    assert paipan.cache_info()['convert']['currsize'] > 0
+
+def test_shensha():
+    """神煞位图"""
+    from shensha import bazi_shensha, core_shensha
+    gans, zhis = ('甲', '丙', '戊', '壬'), ('子', '寅', '辰', '子')
+    natal = bazi_shensha.natal(gans, zhis)
+    # 将星按日支查，不算在日柱自身
+    assert '将星' in bazi_shensha.names_of(natal.masks[0]) and '将星' not in bazi_shensha.names_of(natal.masks[2])
+    assert bazi_shensha.names_of(bazi_shensha.lookup(gans, zhis, '丁', '丑')) == ['天德', '天乙']
+    assert core_shensha.names_of(core_shensha.natal(gans, zhis).masks[1]) == ['驿马']
+
+def test_result_cache(tmp_path):
+    """结果缓存：内存LRU淘汰后从SQLite取回，跨年失效"""
+    from result_cache import ResultCache
+    cache = ResultCache(size=1, path=str(tmp_path / "cache.db"))
+    cache.put(('bazi', 1990, 1, 1, 8), {"analysis": "甲"})
+    cache.put(('bazi', 1990, 1, 2, 8), "乙")
+    assert cache.get(('bazi', 1990, 1, 1, 8)) == {"analysis": "甲"} and cache.get(('bazi', 1, 1, 1, 1)) is None
+    info = cache.info()
+    assert info['disk_hits'] == 1 and info['misses'] == 1 and info['evictions'] == 2
+    cache.current_year = lambda: cache.year + 1
+    assert cache.get(('bazi', 1990, 1, 2, 8)) is None and cache.info()['disk_size'] == 0
+
+def test_result_cache_disk_limits(tmp_path):
+    """结果缓存的SQLite层：超过条数上限删除最早的结果，不同版本共用文件，过期的结果启动时删除，批量提交"""
+    import time
+    from result_cache import ResultCache
+    path = str(tmp_path / "cache.db")
+    cache = ResultCache(size=0, path=path, version='v1', rows=3, batch=2, interval=0.05)
+    for day in range(1, 6):
+        cache.put(('bazi', 1990, 1, day, 8), day)
+    assert cache.pending == 1
+    time.sleep(0.3)
+    assert cache.pending == 0 and cache.info()['disk_size'] == 3 and cache.info()['disk_evictions'] == 2
+    assert cache.get(('bazi', 1990, 1, 1, 8)) is None and cache.get(('bazi', 1990, 1, 5, 8)) == 5
+    assert ResultCache(size=0, path=path, version='v1').info()['disk_size'] == 3
+    other = ResultCache(size=0, path=path, version='v2')
+    assert other.info()['disk_size'] == 3 and other.get(('bazi', 1990, 1, 5, 8)) is None
+    assert cache.get(('bazi', 1990, 1, 5, 8)) == 5
+    time.sleep(0.1)
+    assert ResultCache(size=0, path=path, version='v2', ttl=0.05).info()['disk_size'] == 0
+
+def test_worker_pool():
+    """常驻工作进程与直接计算结果相同，超时后重启工作进程，重启失败时之后补上"""
+    from workers import WorkerPool, InlineBackend, JobTimeout
+    pool = WorkerPool(processes=1, queue_size=1, timeout=30)
+    try:
+        assert pool.run('analyze', 1990, 1, 1, 8).text == InlineBackend().run('analyze', 1990, 1, 1, 8).text
+        from bazi import convert
+        birth = convert('公历', 1990, 1, 1, 8)
+        names = [name for name, data in pool.stream('iter_birth', birth, '男')]
+        assert names == [name for name, data in InlineBackend().stream('iter_birth', birth, '男')]
+        assert names[0] == 'pillars' and names[-1] == 'result'
+        # 规则统计在工作进程中，每个进程取一次
+        stats = pool.collect('rule_stats')
+        assert len(stats) == 1 and sum(item['calls'] for item in stats[0]) > 0
+        # 中途停止读取时重启工作进程，不把未读完的结果留给下一个任务
+        next(iter(pool.stream('iter_birth', birth, '男')))
+        pool.timeout = 0.0001
+        try:
+            pool.run('analyze', 1991, 1, 1, 8)
+            assert False
+        except JobTimeout:
+            pass
+        pool.timeout = 30
+        assert pool.run('analyze', 1990, 1, 1, 8).gans.day == '壬' and pool.info()['restarts'] == 2
+        # 重新启动失败时不把杀掉的进程放回空闲队列，下次分派时补上
+        spawn, pool.timeout = pool._spawn, 0.0001
+        pool._spawn = lambda: 1 / 0
+        try:
+            pool.run('analyze', 1991, 1, 1, 8)
+            assert False
+        except JobTimeout:
+            pass
+        assert pool.info()['idle'] == 0 and pool.info()['lost'] == 1 and pool.info()['spawn_errors'] == 1
+        pool._spawn, pool.timeout = spawn, 30
+        assert pool.run('analyze', 1990, 1, 1, 8).gans.day == '壬' and pool.info()['lost'] == 0
+    finally:
+        pool.close()
+
+def test_batch(monkeypatch):
+    """批量接口：NDJSON逐行输出，单条出错不影响其他记录；每条记录占一个排盘名额，结果不写入缓存"""
+    import api_server
+    from admission import Limiter
+    from result_cache import ResultCache
+    monkeypatch.setattr(api_server, 'result_cache', ResultCache(size=16))
+    limiter = Limiter('chart', 1, queue_size=0, timeout=0)
+    monkeypatch.setitem(api_server.limiters, 'chart', limiter)
+    client = api_server.app.test_client()
+    body = '{"id": "a", "birth_date": "1990-01-01"}\n\n{"birth_date": "1990/01/01"}\nnot json\n'
+    response = client.post('/api/bazi/batch?parts=pillars', data=body, content_type='application/x-ndjson')
+    lines = sorted((json.loads(line) for line in response.data.decode('utf-8').splitlines()), key=lambda x: x['index'])
+    assert response.mimetype == 'application/x-ndjson' and [line['success'] for line in lines] == [True, False, False]
+    assert lines[0]['id'] == 'a' and 'pillars' in lines[0]['analysis'] and '第4行' in lines[2]['error']
+    assert limiter.info()['admitted'] == 1 and limiter.info()['active'] == 0
+    assert api_server.result_cache.info()['stores'] == 0 and api_server.result_cache.info()['misses'] == 1
+    # 名额已满时该条记录出错，带retry_after
+    limiter.acquire()
+    line = json.loads(client.post('/api/bazi/batch', json=[{'birth_date': '1990-01-01'}]).data)
+    assert line['success'] is False and line['retry_after'] >= 1
+    assert client.post('/api/bazi/batch?format=xml', json=[]).status_code == 400
+
+def test_complete(monkeypatch):
+    """完整分析：只换算一次，大运按性别，生肖按农历年，结构化排盘与只按换算结果生成的相同"""
+    import api_server
+    import bazi
+    from paipan import convert, get_dayuns
+    from result_cache import ResultCache
+    client = api_server.app.test_client()
+    calls = []
+    counted = lambda *args: calls.append(args) or convert(*args)
+    monkeypatch.setattr(api_server, 'result_cache', ResultCache(size=16))
+    monkeypatch.setattr(api_server, 'convert', counted)
+    monkeypatch.setattr(bazi, 'convert', counted)
+    result = client.post('/api/complete', json={'birth_date': '1985-01-24', 'birth_time': '11', 'gender': '女',
+                                                'calendar_type': '公历'}).get_json()
+    assert len(calls) == 1
+    assert result['birth_info']['shengxiao'] == '鼠' and result['shengxiao_analysis']['year_zhi'] == '子'
+    birth = convert('公历', 1985, 1, 24, 11)
+    dayuns = get_dayuns(birth, '女')
+    assert [item['gan_zhi'] for item in result['bazi_struct']['da_yun']] == [item.ganzhi for item in dayuns]
+    assert result['bazi_struct'] == api_server.chart_struct(birth, '女')
+    assert client.post('/api/complete', json={'birth_date': '1985-01-24', 'gender': 'x'}).status_code == 400
+
+def test_complete_stream(monkeypatch):
+    """流式完整分析：排盘最先发出，各部分算完即发，最后的complete与/api/complete相同；命中缓存时直接发出"""
+    import api_server
+    import bazi
+    from bazi import convert
+    from result_cache import ResultCache
+    monkeypatch.setattr(api_server, 'result_cache', ResultCache(size=16))
+    client = api_server.app.test_client()
+    data = {'birth_date': '1990-01-01', 'birth_time': '8', 'gender': '女'}
+
+    def stream():
+        response = client.post('/api/complete-stream', json=data)
+        return [json.loads(line[6:]) for line in response.data.decode('utf-8').splitlines() if line]
+    events = stream()
+    names = [event.get('section') for event in events]
+    dayuns = len(bazi.analyze_birth(convert('公历', 1990, 1, 1, 8), '女').report.dayuns)
+    assert names == ['chart', 'pillars', 'relations', 'ge', 'classics'] + ['dayun'] * dayuns + ['rules', 'complete', None]
+    assert events[0]['data']['bazi_struct'] == events[-2]['data']['bazi_struct']
+    assert events[-2]['data'] == client.post('/api/complete', json=data).get_json()
+    cached = stream()
+    assert [event.get('section') for event in cached] == ['chart', 'complete', None]
+    assert cached[1]['data'] == events[-2]['data']
+
+def test_http_cache():
+    """压缩和条件请求：GET的完整分析压缩后带ETag，相同时返回304；流式响应不压缩；带版本号的静态文件长期缓存"""
+    import gzip
+    import api_server
+    client = api_server.app.test_client()
+    url = '/api/complete?birth_date=1990-01-01&birth_time=8&gender=女'
+    response = client.get(url, headers={'Accept-Encoding': 'gzip'})
+    assert response.headers['Content-Encoding'] == 'gzip' and response.headers['Vary'] == 'Accept-Encoding'
+    body = json.loads(gzip.decompress(response.data))
+    assert body == client.post('/api/complete', json={'birth_date': '1990-01-01', 'birth_time': '8',
+                                                      'gender': '女'}).get_json()
+    etag = response.headers['ETag']
+    assert etag.endswith('-gzip"') and response.headers['Cache-Control'] == 'no-cache'
+    response = client.get(url, headers={'Accept-Encoding': 'gzip', 'If-None-Match': etag})
+    assert response.status_code == 304 and response.data == b''
+    plain = client.get(url)
+    assert 'Content-Encoding' not in plain.headers and plain.get_json() == body and plain.headers['ETag'] != etag
+    response = client.post('/api/complete-stream', json={'birth_date': '1990-01-01'}, headers={'Accept-Encoding': 'gzip'})
+    assert 'Content-Encoding' not in response.headers and response.data.startswith(b'data: ')
+    response = client.get('/static/libs/marked.min.js?v=9.1.6', headers={'Accept-Encoding': 'gzip'})
+    assert 'immutable' in response.headers['Cache-Control'] and response.headers['Content-Encoding'] == 'gzip'
+    with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'static/libs/marked.min.js'), 'rb') as f:
+        assert gzip.decompress(response.data) == f.read()
+    response.close()
+    response = client.get('/static/libs/marked.min.js?v=9.1.6', headers={'Accept-Encoding': 'gzip',
+                                                                          'If-None-Match': response.headers['ETag']})
+    assert response.status_code == 304
+    response.close()
+
+def test_deterministic_etag():
+    """输出与字符串哈希无关：不同的PYTHONHASHSEED、不用磁盘缓存时，/api/complete的ETag相同"""
+    script = ("import api_server\n"
+              "client = api_server.app.test_client()\n"
+              "for date, time, gender in (('1990-01-01', 8, '女'), ('1985-01-24', 11, '男'), ('2003-07-15', 23, '男')):\n"
+              "    url = '/api/complete?birth_date=%s&birth_time=%d&gender=%s&calendar_type=公历' % (date, time, gender)\n"
+              "    print(client.get(url).headers['ETag'])\n")
+    etags = []
+    for seed in ('1', '2'):
+        env = dict(os.environ, PYTHONHASHSEED=seed, BAZI_CACHE_DB='', BAZI_AI_CACHE_DB='', BAZI_SESSION_DB='')
+        result = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True, env=env,
+                                cwd=os.path.dirname(os.path.abspath(__file__)))
+        assert result.returncode == 0, result.stderr
+        etags.append(result.stdout.split())
+    assert len(etags[0]) == 3 and etags[0] == etags[1]
+
+def test_admission():
+    """准入控制：超过并发数的请求排队，队列已满时接口返回429和Retry-After"""
+    import threading
+    import api_server
+    from admission import Limiter, Rejected
+    limiter = Limiter('test', 1, queue_size=1, timeout=5)
+    started = limiter.acquire()
+    waiter = threading.Thread(target=lambda: limiter.release(limiter.acquire()))
+    waiter.start()
+    while not limiter.waiting:
+        pass
+    try:
+        limiter.acquire()
+        assert False
+    except Rejected as e:
+        assert e.retry_after >= 1
+    limiter.release(started)
+    waiter.join()
+    info = limiter.info()
+    assert info['admitted'] == 2 and info['queued'] == 1 and info['rejected'] == 1 and info['active'] == 0
+
+    chart = api_server.limiters['chart']
+    slots = [chart.acquire() for _ in range(chart.limit)]
+    queue_size, chart.queue_size = chart.queue_size, 0
+    try:
+        response = api_server.app.test_client().post('/api/bazi', json={'birth_date': '1990-01-01'})
+        assert response.status_code == 429 and int(response.headers['Retry-After']) >= 1
+    finally:
+        chart.queue_size = queue_size
+        for started in slots:
+            chart.release(started)
+
+def test_loadtest():
+    """压力测试：本进程中启动服务，统计各接口的延迟和流式接口的首字节时间"""
+    import loadtest
+    result = loadtest.run(mix='bazi=1,shengxiao=1,complete-stream=1', concurrency=2, count=9, seed=1)
+    assert result['total']['count'] == 9 and result['total']['error_rate'] == 0
+    for name, stats in result['endpoints'].items():
+        assert stats['latency_ms']['p50'] <= stats['latency_ms']['p99']
+        assert (stats['ttfb_ms'] is not None) == (name == 'complete-stream')
+    assert loadtest.compare(result, result)[-1].startswith('total')
+
+def test_metrics(monkeypatch):
+    """耗时统计：Server-Timing列出各阶段，/metrics为Prometheus格式的直方图和计数器，AI服务按服务商统计"""
+    import re
+    import api_server
+    from mock_llm import MockProvider
+    from result_cache import ResultCache
+    client = api_server.app.test_client()
+    monkeypatch.setattr(api_server, 'result_cache', ResultCache(size=16))
+    api_server.metrics.server_timing = True
+    try:
+        response = client.post('/api/complete', json={'birth_date': '1971-02-03', 'birth_time': '5', 'gender': '女'})
+        stages = [entry.split(';')[0] for entry in response.headers['Server-Timing'].split(', ')]
+        assert stages[0] == 'validate' and stages[-1] == 'total'
+        assert {'cache', 'convert', 'shengxiao', 'struct', 'engine', 'render'} <= set(stages)
+    finally:
+        api_server.metrics.server_timing = False
+    assert 'Server-Timing' not in client.get('/health').headers
+
+    provider = MockProvider(error_rate=1).start()
+    try:
+        ai_config = {'provider': 'openai', 'api_key': 'k', 'api_url': provider.url, 'model': 'm'}
+        birth_info = {'date': '1971-02-03', 'calendar_type': '公历', 'time': 5, 'gender': '女', 'shengxiao': '猪'}
+        response = client.post('/api/ai-interpretation', json={'birth_info': birth_info, 'shengxiao_analysis': {},
+                                                               'bazi_analysis': '四柱', 'ai_config': ai_config})
+        assert response.status_code == 500
+    finally:
+        provider.stop()
+    response = client.get('/metrics')
+    assert response.mimetype == 'text/plain'
+    text = response.data.decode('utf-8')
+    assert '# TYPE bazi_stage_seconds histogram' in text
+    assert 'bazi_http_requests_total{endpoint="/api/complete",method="POST",status="200"}' in text
+    assert 'bazi_ai_errors_total{mode="call",provider="openai"}' in text
+    counts = [int(n) for n in re.findall(r'^bazi_stage_seconds_bucket\{stage="engine",le="[^"]+"\} (\d+)$', text, re.M)]
+    total = re.search(r'^bazi_stage_seconds_count\{stage="engine"\} (\d+)$', text, re.M)
+    assert counts == sorted(counts) and counts[-1] == int(total.group(1)) > 0
+    # 各规则的统计合计后输出，没有检查过的规则不输出
+    from rules import rule_stats
+    checks = re.findall(r'^bazi_rule_checks_total\{rule="[^"]+",set="[^"]+"\} (\d+)$', text, re.M)
+    assert checks and all(int(n) > 0 for n in checks) and len(checks) < len(rule_stats())
+    assert 'bazi_rule_seconds_total{rule=' in text
+
+def test_ai_client():
+    """AI客户端：同一服务商的请求复用连接"""
+    from ai_client import ProviderClient
+    from mock_llm import MockProvider
+    with MockProvider(tokens=2) as provider:
+        client = ProviderClient(connect_timeout=1, read_timeout=5)
+        for _ in range(3):
+            assert client.post('openai', provider.url, json={}).json()['choices'][0]['message']['content'] == '日主得令'
+        assert provider.info()['connections'] == 1 and client.info()['requests'] == {'openai': 3}
+        client.close()
+
+def test_ai_cache():
+    """AI解读缓存：同时的两个流式请求只调用一次AI服务，之后的请求从缓存重放"""
+    import threading
+    import api_server
+    from mock_llm import MockProvider
+    api_server.ai_cache.clear()
+    provider = MockProvider(ttft=0.05, tps=20, tokens=2).start()
+    payload = {
+        'birth_info': {'date': '1990-01-01', 'calendar_type': '公历', 'time': 8, 'gender': '男', 'shengxiao': '马'},
+        'shengxiao_analysis': {'year_zhi': '午', 'compatible': {'sanhe': [], 'liuhe': [], 'sanhui': []},
+                               'incompatible': {'chong': [], 'xing': [], 'hai': [], 'po': []}},
+        'bazi_analysis': '四柱：己巳 丙子 丙寅 壬辰',
+        'ai_config': {'provider': 'custom', 'api_key': 'k', 'api_url': provider.url},
+    }
+
+    def events(response):
+        return [json.loads(line[6:]) for line in response.data.decode('utf-8').splitlines() if line]
+
+    try:
+        results = []
+
+        def stream():
+            client = api_server.app.test_client()
+            results.append(events(client.post('/api/ai-interpretation-stream', json=payload)))
+
+        threads = [threading.Thread(target=stream) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert provider.info()['requests'] == 1
+        assert results[0] == results[1] == [{'content': '日主'}, {'content': '得令'}, {'done': True}]
+        client = api_server.app.test_client()
+        response = client.post('/api/ai-interpretation-stream', json=payload)
+        assert response.headers['X-AI-Cache'] == 'hit' and events(response)[0] == {'content': '日主得令'}
+        payload['birth_info']['time'] = '8'
+        result = client.post('/api/ai-interpretation', json=payload).get_json()
+        assert result['interpretation'] == '日主得令' and result['cache'] == 'hit'
+        assert result['prompt_tokens'] == int(response.headers['X-Prompt-Tokens']) > 0
+        assert provider.info()['requests'] == 1
+    finally:
+        provider.stop()
+
+    # 键包含实际请求的地址和提示词；跟随的请求等待超时时返回错误
+    key = api_server.AIAnalysisAPI.interpretation_key('提示词', {'provider': 'openai'})
+    assert key == api_server.AIAnalysisAPI.interpretation_key(
+        '提示词', {'provider': 'openai', 'api_url': 'https://api.openai.com/v1/chat/completions'})
+    assert key != api_server.AIAnalysisAPI.interpretation_key('提示词', {'provider': 'openai', 'api_url': 'http://x'})
+    assert key != api_server.AIAnalysisAPI.interpretation_key('提示词2', {'provider': 'openai'})
+    flight, leader = api_server.ai_flights.begin(key)
+    timeout = api_server.ai_client.timeout
+    api_server.ai_client.timeout = (1, 0.05)
+    try:
+        content, error, source = api_server.AIAnalysisAPI.cached_interpretation(key, lambda: {'content': 'x'})
+        assert leader and content is None and error and source == 'shared'
+    finally:
+        api_server.ai_client.timeout = timeout
+        api_server.ai_flights.end(key, 'done')
+
+def test_mock_llm():
+    """模拟AI服务：Claude格式、命运轨迹故事、注入错误和流式中途断开"""
+    import api_server
+    from mock_llm import MockProvider
+    with MockProvider(tokens=20) as provider:
+        messages_url = provider.url.replace('/chat/completions', '/messages')
+        result = api_server.AIAnalysisAPI._call_claude('解读', {'api_key': 'k', 'api_url': messages_url})
+        assert result['success'] and len(result['content']) == 40
+        result = api_server.AIAnalysisAPI._call_custom('解读', {'api_key': 'k', 'api_url': provider.url + '?error_rate=1'})
+        assert result['error'].startswith('自定义API错误: 500')
+        client = api_server.app.test_client()
+        payload = {'prompt': '请严格按照以下JSON格式输出，包含choices', 'game_state': {},
+                   'ai_config': {'provider': 'custom', 'api_key': 'k', 'api_url': provider.url}}
+        story = client.post('/api/destiny-story', json=payload).get_json()['story']
+        assert story['title'] and len(story['choices']) == 3
+        payload['ai_config']['api_url'] += '?stream_error_rate=1'
+        lines = client.post('/api/destiny-story-stream', json=payload).data.decode('utf-8').splitlines()
+        assert 'error' in json.loads(lines[-2][6:]) and provider.info()['stream_errors'] == 1
+        assert provider.info()['errors'] == 1
+
+def test_destiny_session():
+    """命运轨迹会话：每轮只发送选项，提示词长度不随轮数增长，可回退，重启后从SQLite恢复，并发保存不互相覆盖"""
+    import os
+    import tempfile
+    import api_server
+    import destiny_sessions
+    from mock_llm import MockProvider
+    client = api_server.app.test_client()
+    bazi_data = {'birth_info': {'date': '1990-01-01', 'calendar_type': '公历', 'time': 8, 'gender': '男',
+                                'shengxiao': '马'},
+                 'bazi_analysis': '四柱：己巳 丙子 丙寅 壬辰', 'shengxiao_analysis': {'year_zhi': '午'}}
+    result = client.post('/api/destiny-session', json={'bazi_data': bazi_data}).get_json()
+    session_id = result['session_id']
+    assert result['state']['age'] == 0 and result['state']['current'] is None
+    with MockProvider(tokens=20) as provider:
+        body = {'session_id': session_id, 'ai_config': {'provider': 'custom', 'api_key': 'k', 'api_url': provider.url}}
+        for turn in range(8):
+            body['choice'] = None if turn == 0 else turn % 3
+            lines = client.post('/api/destiny-story-stream', json=body).data.decode('utf-8').splitlines()
+            events = [json.loads(line[6:]) for line in lines if line]
+            assert events[0]['state']['event_count'] == turn and events[-1]['done']
+            assert len(events[-1]['state']['current']['choices']) == 3
+        assert provider.info()['requests'] == 8
+        body.update(action='summary')
+        result = client.post('/api/destiny-story', json=body).get_json()
+        assert result['success'] and result['summary'] and result['state']['event_count'] == 7
+    state = client.get('/api/destiny-session/' + session_id).get_json()['state']
+    assert state['destiny_score'] == 100 + sum(turn['impact'] for turn in state['turns'])
+    session = dict(api_server.destiny_sessions.get(session_id))
+    sizes = [len(destiny_sessions.story_prompt(dict(session, turns=state['turns'] * n))) for n in (1, 20, 40)]
+    assert sizes[0] < sizes[1] and sizes[2] - sizes[1] < 10
+    state = client.post('/api/destiny-session/%s/rewind' % session_id, json={'event': 2}).get_json()['state']
+    assert state['event_count'] == 2 and state['age'] == state['current']['age']
+    assert client.post('/api/destiny-session/%s/rewind' % session_id, json={'event': 5}).status_code == 400
+
+    path = os.path.join(tempfile.mkdtemp(), 'sessions.db')
+    store = destiny_sessions.SessionStore(size=1, backend=destiny_sessions.SQLiteBackend(path))
+    session = destiny_sessions.new_session(bazi_data, {'storyStyle': 'fantasy'})
+    store.put(session)
+    restarted = destiny_sessions.SessionStore(backend=destiny_sessions.SQLiteBackend(path))
+    assert restarted.get(session['id']) == session and restarted.info()['loads'] == 1
+    # 同一会话的两个请求各自取出副本，后保存的一个因版本不符而失败
+    first, second = restarted.get(session['id']), restarted.get(session['id'])
+    first['age'] = 5
+    assert first is not second and second['age'] == 0
+    restarted.put(first)
+    try:
+        restarted.put(second)
+        assert False
+    except destiny_sessions.SessionError as e:
+        assert e.status == 409
+    assert restarted.get(session['id'])['age'] == 5 and restarted.info()['conflicts'] == 1
+    client.delete('/api/destiny-session/' + session_id)
+    assert client.get('/api/destiny-session/' + session_id).status_code == 404
+
+def test_speculation():
+    """预生成：选择时接着还在生成的分支输出或直接返回已完成的分支，其他分支被取消；队列、并发名额和会话数有上限"""
+    import threading
+    import time
+    import api_server
+    from mock_llm import MockProvider
+    client = api_server.app.test_client()
+    bazi_data = {'birth_info': {'date': '1990-01-01', 'calendar_type': '公历', 'time': 8, 'gender': '男',
+                                'shengxiao': '马'}, 'bazi_analysis': '四柱：己巳 丙子 丙寅 壬辰'}
+    session_id = client.post('/api/destiny-session', json={'bazi_data': bazi_data,
+                                                           'settings': {'speculate': True}}).get_json()['session_id']
+    before = api_server.speculator.info()
+    with MockProvider(tokens=20, tps=400) as provider:
+        body = {'session_id': session_id, 'ai_config': {'provider': 'custom', 'api_key': 'k', 'api_url': provider.url}}
+
+        def play(choice):
+            body['choice'] = choice
+            response = client.post('/api/destiny-story-stream', json=body)
+            events = [json.loads(line[6:]) for line in response.data.decode('utf-8').splitlines() if line]
+            assert events[-1]['done'] and len(events[-1]['story_data']['choices']) == 3
+            return response.headers.get('X-Speculative')
+
+        assert play(None) is None
+        assert play(1) == 'adopted'
+        flights = [branch.flight for branch in api_server.speculator.sessions[session_id][1].values()]
+        while not all(flight.done for flight in flights):
+            time.sleep(0.02)
+        assert play(0) == 'served'
+        client.delete('/api/destiny-session/' + session_id)
+        after = api_server.speculator.info()
+        assert after['started'] - before['started'] == 9 and after['cancelled'] - before['cancelled'] == 7
+        assert provider.info()['requests'] <= 1 + 9
+
+    # 等待执行的已满时不再预生成；AI接口没有空闲名额时跳过；超过会话数的最久未用的会话被取消
+    from admission import Limiter
+    from speculation import Speculator, SKIPPED
+    release = threading.Event()
+    blocked = lambda prompt: iter([release.wait(5) and 'x'])
+    limiter = Limiter('ai', 1)
+    speculator = Speculator(workers=1, queue_size=3, size=1, limiter=limiter)
+    sessions = [{'id': str(n), 'settings': {}} for n in range(3)]
+    assert speculator.start(sessions[0], [('a', ''), ('b', '')], blocked) == 2
+    assert speculator.start(sessions[1], [('a', ''), ('b', '')], blocked) == 0
+    assert speculator.start(sessions[2], [('a', '')], blocked) == 1
+    info = speculator.info()
+    assert info['dropped'] == 2 and info['expired'] == 1 and info['sessions'] == 1
+    assert limiter.try_acquire() is None
+    release.set()
+    flight = speculator.adopt('2', 'a')
+    assert flight.wait(5) == ('x', None)
+    while speculator.info()['pending']:
+        time.sleep(0.01)
+    started = limiter.try_acquire()
+    speculator.start(sessions[0], [('a', '')], blocked)
+    speculator.executor.shutdown(wait=True)
+    limiter.release(started)
+    assert speculator.info()['skipped'] == 1 and speculator.adopt('0', 'a') is None
+    assert limiter.info()['background'] == 2
+
+    # 选中还在排队的预生成：AI接口没有空闲名额时也照常生成(使用选择它的请求的名额)
+    release = threading.Event()
+    limiter = Limiter('ai', 1)
+    held = limiter.try_acquire()
+    speculator = Speculator(workers=1, limiter=limiter)
+    speculator.executor.submit(release.wait, 5)
+    assert speculator.start({'id': 'q', 'settings': {}}, [('a', '')], lambda prompt: iter(['x'])) == 1
+    flight = speculator.adopt('q', 'a')
+    release.set()
+    assert flight.wait(5) == ('x', None) and speculator.info()['skipped'] == 0
+    limiter.release(held)
+    speculator.executor.shutdown(wait=True)
+
+def test_prompts():
+    """AI解读的提示词：由结构化结果生成不超过上限的命盘摘要，出生信息不完整时截断客户端的文本"""
+    import api_server
+    from prompts import clip, estimate_tokens, prompt_options
+    birth_info = {'date': '1990-01-01', 'calendar_type': '公历', 'time': 8, 'gender': '男', 'shengxiao': '马'}
+    shengxiao_analysis = api_server.ShengxiaoAPI.get_shengxiao_info('马')
+    raw = api_server.BaziAPI.run_bazi_analysis('1990-01-01', '8', '男', '公历')['output']
+    chart = api_server.AIAnalysisAPI.chart_text(birth_info, raw)
+    assert chart.startswith('四柱：己巳 丙子 丙寅 壬辰') and '当前大运' in chart and '格局：' in chart
+    assert len(chart) <= prompt_options()['max_chars'] < len(raw)
+    prompt, tokens = api_server.AIAnalysisAPI.build_prompt(birth_info, shengxiao_analysis, raw)
+    assert chart in prompt and '三合 虎, 狗' in prompt and tokens == estimate_tokens(prompt) < estimate_tokens(raw) / 4
+    assert api_server.AIAnalysisAPI.chart_text(dict(birth_info, date='1990-13-01'), raw) == clip(raw, 1200)
+
 def test_api():
     """测试API服务"""
     base_url = "http://localhost:5000"
@@ -143,7 +768,8 @@ def test_api():
     bazi_data = {
         "birth_date": "1990-01-01",
         "birth_time": "8",
-        "gender": "男"
+        "gender": "男",
+        "format": "markdown"
     }
     try:
         response = requests.post(
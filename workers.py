@@ -0,0 +1,352 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""排盘的执行后端。
+
+inline: 在请求线程中直接计算(默认)。
+pool:   预先启动的常驻工作进程，已导入bazi、datas、sizi、yue等，请求通过管道分派。
+        同时排队的请求数有上限，超过时抛出PoolBusy；等待空闲进程和计算分别计时，
+        单个任务超时(JobTimeout)时杀掉该进程并重新启动一个，不影响其他请求。
+        重新启动失败时池中少一个进程，之后分派任务时再补上。
+
+任务按名称分派(见jobs)，参数和返回值需要能pickle。批量任务用imap_unordered，
+同时进行的任务数不超过后端的并发数，输入和结果都不会整批留在内存里。
+返回生成器的任务(iter_birth)用stream调用，工作进程每生成一项就发回一项，超时按相邻两项之间计算。
+collect在每个工作进程中各运行一次任务，用于汇总各进程的规则统计(rule_stats)。
+
+环境变量:
+    BAZI_BACKEND      inline 或 pool，默认inline
+    BAZI_WORKERS      工作进程数，默认CPU数
+    BAZI_QUEUE_SIZE   工作进程都忙时最多排队的请求数，默认32
+    BAZI_JOB_TIMEOUT  单个任务从发给工作进程起的超时秒数，默认30
+    BAZI_QUEUE_TIMEOUT  等待空闲工作进程的超时秒数，默认与BAZI_JOB_TIMEOUT相同
+"""
+
+import collections
+import concurrent.futures
+import multiprocessing
+import os
+import queue
+import threading
+import time
+import types
+
+
+class PoolBusy(Exception):
+    """排队的请求已满"""
+
+
+class JobTimeout(Exception):
+    """任务超时"""
+
+
+class JobError(Exception):
+    """任务在工作进程中出错，消息为原来的异常"""
+
+
+# 两种分析任务都按四柱查预计算表(chart_table.py)，每个进程打开一次
+def _analyze(year, month, day, hour, gender='男', calendar='农历', leap=False):
+    from bazi import analyze
+    from chart_table import shared_chart_table
+    return analyze(year, month, day, hour, gender, calendar, leap, shared_chart_table())
+
+
+def _analyze_birth(birth, gender='男'):
+    from bazi import analyze_birth
+    from chart_table import shared_chart_table
+    return analyze_birth(birth, gender, shared_chart_table())
+
+
+def _iter_birth(birth, gender='男'):
+    from bazi import iter_birth
+    from chart_table import shared_chart_table
+    return iter_birth(birth, gender, shared_chart_table())
+
+
+def _rule_stats():
+    from rules import rule_stats
+    return rule_stats()
+
+
+# 可以分派的任务
+jobs = {
+    'analyze': _analyze,
+    'analyze_birth': _analyze_birth,
+    'iter_birth': _iter_birth,
+    'rule_stats': _rule_stats,
+}
+
+
+class InlineBackend:
+    """在当前线程中直接计算"""
+    name = 'inline'
+    concurrency = 1
+
+    def run(self, job, *args):
+        try:
+            return jobs[job](*args)
+        except Exception as e:
+            raise JobError(str(e)) from e
+
+    def stream(self, job, *args):
+        try:
+            yield from jobs[job](*args)
+        except Exception as e:
+            raise JobError(str(e)) from e
+
+    def collect(self, job, *args):
+        return [self.run(job, *args)]
+
+    def info(self):
+        return {'backend': self.name}
+
+    def close(self):
+        pass
+
+
+def _worker_main(conn):
+    # 先导入排盘用到的模块，之后的任务不再有导入开销
+    import bazi  # noqa: F401
+    while True:
+        try:
+            job, args = conn.recv()
+        except EOFError:
+            return
+        try:
+            result = jobs[job](*args)
+            if isinstance(result, types.GeneratorType):
+                # 生成器任务逐项发回(None, 项)，最后发回(True, None)
+                for item in result:
+                    conn.send((None, item))
+                result = None
+            conn.send((True, result))
+        except Exception as e:
+            conn.send((False, "{}: {}".format(type(e).__name__, e)))
+
+
+Worker = collections.namedtuple("Worker", "process conn")
+
+
+class WorkerPool:
+    """常驻工作进程池"""
+    name = 'pool'
+
+    def __init__(self, processes=None, queue_size=32, timeout=30, queue_timeout=None, context=None):
+        self.processes = processes or os.cpu_count() or 1
+        self.queue_size = queue_size
+        self.timeout = timeout
+        self.queue_timeout = timeout if queue_timeout is None else queue_timeout
+        self.context = multiprocessing.get_context(context)
+        # 正在计算和排队的请求总数不超过processes + queue_size
+        self.slots = threading.BoundedSemaphore(self.processes + queue_size)
+        self.idle = queue.Queue()
+        self.lock = threading.Lock()
+        self.stats = collections.Counter()
+        # 重新启动失败、还没有补上的进程数
+        self.lost = 0
+        for _ in range(self.processes):
+            self.idle.put(self._spawn())
+
+    @property
+    def concurrency(self):
+        return self.processes
+
+    def _spawn(self):
+        conn, child = self.context.Pipe()
+        process = self.context.Process(target=_worker_main, args=(child,), daemon=True)
+        process.start()
+        child.close()
+        return Worker(process, conn)
+
+    def _count(self, name):
+        with self.lock:
+            self.stats[name] += 1
+
+    def _restart(self, worker):
+        """杀掉工作进程并启动新的，启动失败时返回None"""
+        worker.process.kill()
+        worker.process.join()
+        worker.conn.close()
+        self._count('restarts')
+        try:
+            return self._spawn()
+        except Exception:
+            with self.lock:
+                self.stats['spawn_errors'] += 1
+                self.lost += 1
+            return None
+
+    def _replenish(self):
+        # 补上重新启动失败的进程
+        with self.lock:
+            lost, self.lost = self.lost, 0
+        for _ in range(lost):
+            try:
+                self.idle.put(self._spawn())
+            except Exception:
+                with self.lock:
+                    self.stats['spawn_errors'] += 1
+                    self.lost += 1
+
+    def run(self, job, *args):
+        """在空闲的工作进程中运行任务，返回结果"""
+        if not self.slots.acquire(blocking=False):
+            self._count('rejected')
+            raise PoolBusy("排队的请求已满({})".format(self.queue_size))
+        try:
+            if self.lost:
+                self._replenish()
+            try:
+                worker = self.idle.get(timeout=self.queue_timeout)
+            except queue.Empty:
+                self._count('timeouts')
+                raise JobTimeout("等待工作进程超时({}秒)".format(self.queue_timeout))
+            try:
+                worker.conn.send((job, args))
+                if not worker.conn.poll(self.timeout):
+                    # 先取下这个进程，重新启动失败时不放回空闲队列
+                    dead, worker = worker, None
+                    worker = self._restart(dead)
+                    self._count('timeouts')
+                    raise JobTimeout("任务超时({}秒)".format(self.timeout))
+                ok, value = worker.conn.recv()
+            except (EOFError, OSError):
+                # 工作进程意外退出
+                dead, worker = worker, None
+                worker = self._restart(dead)
+                raise JobError("工作进程异常退出")
+            finally:
+                if worker is not None:
+                    self.idle.put(worker)
+        finally:
+            self.slots.release()
+        self._count('jobs')
+        if not ok:
+            self._count('errors')
+            raise JobError(value)
+        return value
+
+    def stream(self, job, *args):
+        """在空闲的工作进程中运行生成器任务，逐项生成结果。
+        中途不再读取时(客户端断开)，这个进程还在发送，重新启动它而不是放回空闲队列"""
+        if not self.slots.acquire(blocking=False):
+            self._count('rejected')
+            raise PoolBusy("排队的请求已满({})".format(self.queue_size))
+        worker = None
+        finished = False
+        try:
+            if self.lost:
+                self._replenish()
+            try:
+                worker = self.idle.get(timeout=self.queue_timeout)
+            except queue.Empty:
+                self._count('timeouts')
+                raise JobTimeout("等待工作进程超时({}秒)".format(self.queue_timeout))
+            worker.conn.send((job, args))
+            while True:
+                try:
+                    if not worker.conn.poll(self.timeout):
+                        dead, worker = worker, None
+                        worker = self._restart(dead)
+                        finished = True
+                        self._count('timeouts')
+                        raise JobTimeout("任务超时({}秒)".format(self.timeout))
+                    ok, value = worker.conn.recv()
+                except (EOFError, OSError):
+                    dead, worker = worker, None
+                    worker = self._restart(dead)
+                    finished = True
+                    raise JobError("工作进程异常退出")
+                if ok is None:
+                    yield value
+                    continue
+                finished = True
+                self._count('jobs')
+                if not ok:
+                    self._count('errors')
+                    raise JobError(value)
+                return
+        finally:
+            if worker is not None and not finished:
+                worker = self._restart(worker)
+            if worker is not None:
+                self.idle.put(worker)
+            self.slots.release()
+
+    def collect(self, job, *args):
+        """在每个工作进程中运行一次任务(如各进程的规则统计)，返回结果的列表。
+        依次取下空闲的进程，全部取到后再放回，同一进程不会运行两次；
+        合计等待超过queue_timeout后不再等其余的进程，超时或出错的进程不计入结果"""
+        taken = []
+        results = []
+        deadline = time.monotonic() + self.queue_timeout
+        try:
+            for _ in range(self.processes):
+                try:
+                    worker = self.idle.get(timeout=max(0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+                try:
+                    worker.conn.send((job, args))
+                    if not worker.conn.poll(self.timeout):
+                        dead, worker = worker, None
+                        worker = self._restart(dead)
+                        continue
+                    ok, value = worker.conn.recv()
+                except (EOFError, OSError):
+                    dead, worker = worker, None
+                    worker = self._restart(dead)
+                    continue
+                finally:
+                    if worker is not None:
+                        taken.append(worker)
+                if ok:
+                    results.append(value)
+        finally:
+            for worker in taken:
+                self.idle.put(worker)
+        return results
+
+    def info(self):
+        with self.lock:
+            result = {'backend': self.name, 'processes': self.processes, 'queue_size': self.queue_size,
+                      'timeout': self.timeout, 'queue_timeout': self.queue_timeout, 'idle': self.idle.qsize(),
+                      'lost': self.lost}
+            result.update(self.stats)
+        return result
+
+    def close(self):
+        while not self.idle.empty():
+            worker = self.idle.get()
+            worker.conn.close()
+            worker.process.join(1)
+            if worker.process.is_alive():
+                worker.process.kill()
+
+
+def imap_unordered(func, items, window):
+    """在线程中对items逐项调用func，最多window项同时进行，按完成的先后生成结果。
+    items只在有空位时才向后取，可以是读取上传数据的生成器"""
+    items = iter(items)
+    pending = set()
+    with concurrent.futures.ThreadPoolExecutor(window) as executor:
+        while True:
+            for item in items:
+                pending.add(executor.submit(func, item))
+                if len(pending) >= window:
+                    break
+            if not pending:
+                return
+            done, pending = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+
+
+def open_backend():
+    """按环境变量创建执行后端"""
+    if os.environ.get("BAZI_BACKEND", "inline") == "pool":
+        return WorkerPool(processes=int(os.environ.get("BAZI_WORKERS", 0)) or None,
+                          queue_size=int(os.environ.get("BAZI_QUEUE_SIZE", 32)),
+                          timeout=float(os.environ.get("BAZI_JOB_TIMEOUT", 30)),
+                          queue_timeout=float(os.environ["BAZI_QUEUE_TIMEOUT"])
+                          if os.environ.get("BAZI_QUEUE_TIMEOUT") else None)
+    return InlineBackend()